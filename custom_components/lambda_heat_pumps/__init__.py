@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import asyncio
+import os
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
@@ -21,9 +22,27 @@ from .coordinator import LambdaDataUpdateCoordinator
 from .services import async_setup_services, async_unload_services
 from .utils import generate_base_addresses, ensure_lambda_config
 from .reset_manager import ResetManager
-from .migration import async_migrate_entry, async_remove_duplicate_entity_suffixes
-from .module_auto_detect import auto_detect_modules, update_entry_with_detected_modules
-from .const import AUTO_DETECT_RETRIES, AUTO_DETECT_RETRY_DELAY
+from .migration import (
+    async_migrate_entry,
+    async_migration_fingerprint_matches,
+    async_remove_duplicate_entity_suffixes,
+)
+from .config_service import async_get_config_service
+from .module_auto_detect import (
+    FALLBACK_MODULE_COUNTS,
+    auto_detect_modules,
+    invalidate_detection_cache,
+    load_detection_cache,
+    module_cache_key,
+    save_detection_cache,
+    update_entry_with_detected_modules,
+)
+from .const import (
+    AUTO_DETECT_RETRIES,
+    AUTO_DETECT_RETRY_DELAY,
+    AUTO_DETECT_BACKGROUND_TIMEOUT,
+    AUTO_DETECT_CACHE_FILE,
+)
 from .modbus_utils import wait_for_stable_connection
 
 _LOGGER = logging.getLogger(__name__)
@@ -105,9 +124,9 @@ async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             _LOGGER.info("RELOAD: Setting up entry again...")
             # skip_auto_detect=True: Dieser Pfad wird ausschließlich durch den
             # Options-Flow-Update-Listener ausgelöst (entry.options geändert).
-            # Die Modul-Hardware hat sich dabei nicht geändert, daher ist der
-            # 38s-verzögerte Hintergrund-Modbus-Scan hier unnötig und blockiert
-            # nur den globalen Modbus-Lock für die neue Coordinator-Generation.
+            # Die Modul-Hardware hat sich dabei nicht geändert, daher ist die
+            # Hintergrund-Modul-Erkennung (Cache bzw. Proben im Coordinator-Zyklus)
+            # hier unnötig.
             setup_ok = await async_setup_entry(hass, entry, skip_auto_detect=True)
             if not setup_ok:
                 _LOGGER.error("RELOAD: Failed to setup entry during reload")
@@ -124,6 +143,21 @@ async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             _LOGGER.info("RELOAD: Reload lock released for entry %s", entry_id)
 
 
+def _module_cache_path(coordinator) -> str:
+    """Pfad des Modul-Detection-Caches im Config-Verzeichnis der Integration."""
+    return os.path.join(coordinator._config_path, AUTO_DETECT_CACHE_FILE)
+
+
+async def _save_module_cache(hass: HomeAssistant, coordinator, entry: ConfigEntry, detected: dict) -> None:
+    """Erkannte Modulanzahl cachen; Fehler beim Schreiben brechen die Erkennung nicht ab."""
+    try:
+        await hass.async_add_executor_job(
+            save_detection_cache, _module_cache_path(coordinator), module_cache_key(entry), detected
+        )
+    except Exception as ex:
+        _LOGGER.debug("AUTO-DETECT: Could not write module detection cache: %s", ex)
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, skip_auto_detect: bool = False
 ) -> bool:
@@ -144,13 +178,19 @@ async def async_setup_entry(
 
     _LOGGER.debug("Setting up Lambda integration with config: %s", entry.data)
 
-    # Config-Cache invalidieren (M-07): Bei jedem Setup/Reload die gecachte
-    # lambda_wp_config.yaml verwerfen, damit Änderungen sofort wirksam werden.
-    hass.data.pop("_lambda_config_cache", None)
+    # Config-Cache invalidieren (M-07): Bei jedem Setup/Reload die geparste
+    # lambda_wp_config.yaml verwerfen (Änderungen im Betrieb erkennt der
+    # Config-Service zusätzlich über die mtime).
+    async_get_config_service(hass).invalidate()
     hass.data.pop("_lambda_migration_done", None)
 
-    # Ensure lambda_wp_config.yaml exists (create from template if missing)
-    await ensure_lambda_config(hass)
+    if await async_migration_fingerprint_matches(hass, entry):
+        # Entry-Version, Template, Registry-Schema und lambda_wp_config.yaml
+        # unverändert seit der letzten Prüfung: kein Anlegen/Migrieren nötig
+        hass.data["_lambda_migration_done"] = True
+    else:
+        # Ensure lambda_wp_config.yaml exists (create from template if missing)
+        await ensure_lambda_config(hass)
 
     # --- Intelligente Auto-Detection mit Performance-Optimierungen ---
     # Erstelle einen Coordinator für beide Zwecke (Auto-Detection + Produktivbetrieb)
@@ -178,34 +218,35 @@ async def async_setup_entry(
             # Bestehende Config: Auto-Detection im Hintergrund (non-blocking)
             _LOGGER.info("Using existing module counts, starting background auto-detection")
 
-            # Zuverlässige Reload-Erkennung: hass.data wird beim Unload geleert,
-            # daher ist es keine brauchbare Quelle für diese Information (H-04).
-            is_reload = entry.entry_id in _previously_setup_entries
-
             async def background_auto_detect():
                 try:
                     _LOGGER.info("AUTO-DETECT: Background auto-detection started (coordinator_id=%s)", id(coordinator))
 
-                    if is_reload:
-                        # RELOAD: 38 Sekunden Verzögerung für stabile Verbindung
-                        _LOGGER.info("AUTO-DETECT: Reload detected - waiting 38 seconds for coordinator to complete initial read cycles...")
-                        await asyncio.sleep(38)  # 38 Sekunden warten
-                        _LOGGER.info("AUTO-DETECT: 38 seconds elapsed, starting auto-detection...")
+                    # Routine-Neustart: gecachtes Ergebnis (gleicher Controller + Firmware) verwenden
+                    detected = await hass.async_add_executor_job(
+                        load_detection_cache, _module_cache_path(coordinator), module_cache_key(entry)
+                    )
+                    if detected is not None:
+                        _LOGGER.info("AUTO-DETECT: Using cached module detection: %s", detected)
                     else:
-                        # ERSTER START: Sofort starten (Config Flow)
-                        _LOGGER.info("AUTO-DETECT: First startup detected - starting auto-detection immediately...")
+                        # Proben laufen im Coordinator-Zyklus nach den regulären Reads
+                        # (ersetzt die frühere feste 38s-Wartezeit bei Reloads)
+                        _LOGGER.info("AUTO-DETECT: No valid cache, probing modules in coordinator cycles...")
+                        detected = await asyncio.wait_for(
+                            coordinator.async_detect_modules(), timeout=AUTO_DETECT_BACKGROUND_TIMEOUT
+                        )
+                        await _save_module_cache(hass, coordinator, entry, detected)
 
-                    # Zusätzlich: Warte auf stabile Verbindung vor Auto-Detection
-                    _LOGGER.info("AUTO-DETECT: Waiting for stable connection before starting...")
-                    await wait_for_stable_connection(coordinator)
-                    _LOGGER.info("AUTO-DETECT: Connection stable, starting module detection...")
-
-                    detected = await auto_detect_modules(coordinator.client, coordinator.slave_id)
                     updated = await update_entry_with_detected_modules(hass, entry, detected)
                     if updated:
                         _LOGGER.info("AUTO-DETECT: Background auto-detection updated module counts: %s (coordinator_id=%s)", detected, id(coordinator))
                     else:
                         _LOGGER.info("AUTO-DETECT: Background auto-detection: no module count changes needed (coordinator_id=%s)", id(coordinator))
+                except asyncio.TimeoutError:
+                    _LOGGER.warning(
+                        "AUTO-DETECT: Background auto-detection not completed within %ss, keeping module counts (coordinator_id=%s)",
+                        AUTO_DETECT_BACKGROUND_TIMEOUT, id(coordinator),
+                    )
                 except Exception as ex:
                     _LOGGER.warning("AUTO-DETECT: Background auto-detection failed: %s (coordinator_id=%s)", ex, id(coordinator))
 
@@ -239,7 +280,18 @@ async def async_setup_entry(
                 _LOGGER.info("AUTO-DETECT: Attempt %d/%d (coordinator_id=%s)", attempt + 1, AUTO_DETECT_RETRIES, id(coordinator))
                 if await coordinator.client.connect():
                     _LOGGER.info("AUTO-DETECT: Connected, starting module detection (coordinator_id=%s)", id(coordinator))
-                    detected_counts = await auto_detect_modules(coordinator.client, coordinator.slave_id)
+                    try:
+                        detected_counts = await auto_detect_modules(coordinator.client, coordinator.slave_id)
+                    except asyncio.TimeoutError:
+                        # Probe-Plan unvollständig: Fallback-Werte verwenden, aber nicht
+                        # cachen – der nächste Start prüft im Hintergrund erneut
+                        _LOGGER.warning(
+                            "AUTO-DETECT: Auto-detection timed out, using fallback values (coordinator_id=%s)",
+                            id(coordinator),
+                        )
+                        detected_counts = dict(FALLBACK_MODULE_COUNTS)
+                    else:
+                        await _save_module_cache(hass, coordinator, entry, detected_counts)
                     updated = await update_entry_with_detected_modules(hass, entry, detected_counts)
                     if updated:
                         _LOGGER.info("AUTO-DETECT: Config entry updated with detected module counts: %s (coordinator_id=%s)", detected_counts, id(coordinator))
@@ -325,10 +377,11 @@ async def async_setup_entry(
         # innerhalb dieses Setup-Laufs entstanden sind.
         await async_remove_duplicate_entity_suffixes(hass, entry.entry_id)
 
-        # Starte den ersten Datenupdate NACH Platform-Setup (damit Entitäten bereits registriert sind)
-        _LOGGER.info("PRODUCTION: Starting first data update (coordinator_id=%s)", id(coordinator))
-        await coordinator.async_refresh()
-        _LOGGER.info("PRODUCTION: First data update completed (coordinator_id=%s)", id(coordinator))
+        # Gestufter erster Datenupdate NACH Platform-Setup (damit Entitäten bereits registriert sind):
+        # kritische Register sofort, alle übrigen Batches im Hintergrund
+        _LOGGER.info("PRODUCTION: Starting staged first data update (coordinator_id=%s)", id(coordinator))
+        await coordinator.async_startup_refresh()
+        _LOGGER.info("PRODUCTION: Critical data loaded, full update continues in background (coordinator_id=%s)", id(coordinator))
 
         # Set up services (only once, regardless of number of entries)
         if not hass.services.has_service(DOMAIN, "read_modbus_register"):
@@ -388,13 +441,15 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # in modbus_utils.py fehl, statt den globalen Modbus-Lock minutenlang für
         # die neue Coordinator-Generation zu blockieren (siehe Fix für "Sensoren
         # ohne Werte nach Config-Änderung").
+        # Geteilte Verbindung (mehrere Unit-IDs am selben Gateway): nur die
+        # Referenz freigeben, geschlossen wird beim letzten Nutzer.
         coordinator = entry_data.get("coordinator")
         if coordinator is not None and getattr(coordinator, "client", None) is not None:
             try:
-                coordinator.client.close()
-                _LOGGER.debug("🧹 UNLOAD: Closed Modbus client early (coordinator_id=%s)", id(coordinator))
+                coordinator.release_client()
+                _LOGGER.debug("🧹 UNLOAD: Released Modbus client early (coordinator_id=%s)", id(coordinator))
             except Exception:
-                _LOGGER.debug("UNLOAD: Error closing Modbus client early", exc_info=True)
+                _LOGGER.debug("UNLOAD: Error releasing Modbus client early", exc_info=True)
             finally:
                 coordinator.client = None
 
@@ -477,5 +532,16 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         return False
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Beim Entfernen des Entries den Modul-Detection-Cache des Controllers verwerfen."""
+    cache_path = os.path.join(hass.config.config_dir, "lambda_heat_pumps", AUTO_DETECT_CACHE_FILE)
+    try:
+        await hass.async_add_executor_job(
+            invalidate_detection_cache, cache_path, module_cache_key(entry)
+        )
+    except Exception as ex:
+        _LOGGER.debug("Could not invalidate module detection cache: %s", ex)
+
+
 # Export für Home Assistant
-__all__ = ['async_migrate_entry']
\ No newline at end of file
+__all__ = ['async_migrate_entry']
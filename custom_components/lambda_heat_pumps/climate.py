@@ -117,6 +117,16 @@ class LambdaClimateEntity(CoordinatorEntity, ClimateEntity):
         # Setze Icon aus Template (zentrale Steuerung)
         self._attr_icon = get_entity_icon(self._template)
 
+    @property
+    def available(self) -> bool:
+        """Während des gestuften Erststarts erst verfügbar, wenn der Sollwert gelesen wurde."""
+        if not super().available:
+            return False
+        if getattr(self.coordinator, "startup_complete", True):
+            return True
+        data = self.coordinator.data
+        return bool(data) and self._target_temperature_key in data
+
     @property
     def current_temperature(self):
         if self.coordinator.data is None:
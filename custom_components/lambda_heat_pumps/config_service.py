@@ -0,0 +1,320 @@
+"""Zentraler Config-Service für ``lambda_wp_config.yaml``.
+
+Bisher wurde die Datei im Executor gelesen, aber ``yaml.safe_load`` lief im
+Event-Loop; ``_load_sensor_overrides`` las dieselbe Datei ein zweites Mal, und
+der Cache in ``hass.data`` wurde nur beim Reload verworfen.
+
+``LambdaConfigService`` (ein Service pro HA-Instanz, ``async_get_config_service``):
+
+- liest, parst und validiert die Datei vollständig im Executor
+  (``read_config_file`` → ``LambdaConfig``),
+- liefert allen Verbrauchern (Coordinator, Offsets, Overrides,
+  ``get_int32_register_order``) dasselbe Ergebnis ohne weiteres I/O,
+- prüft solange Listener registriert sind alle ``CONFIG_WATCH_INTERVAL``
+  Sekunden die mtime und benachrichtigt die Listener nach einer Änderung.
+  Eine fehlerhafte Änderung (YAML-Fehler) behält die zuletzt gültige Config.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from datetime import timedelta
+from typing import Any, Callable, TypedDict
+
+import yaml
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import CONFIG_WATCH_INTERVAL, LAMBDA_WP_CONFIG_FILE
+
+_LOGGER = logging.getLogger(__name__)
+
+_SERVICE_KEY = "_lambda_config_service"
+
+# Modi mit elektrischem und thermischem Energy-Sensor (stby hat nur elektrisch)
+_THERMAL_MODES = ("heating", "hot_water", "cooling", "defrost")
+
+
+class LambdaConfig(TypedDict):
+    """Validierte ``lambda_wp_config.yaml`` (Dict-kompatibel für bestehende Verbraucher)."""
+
+    disabled_registers: set[int]
+    sensors_names_override: dict[str, str]
+    cycling_offsets: dict[str, dict[str, float]]
+    energy_consumption_sensors: dict[str, Any]
+    energy_consumption_offsets: dict[str, dict[str, float]]
+    modbus: dict[str, Any]
+    state_write_gating: dict[str, Any]
+    int32_register_order: str
+
+
+def default_config() -> LambdaConfig:
+    return LambdaConfig(
+        disabled_registers=set(),
+        sensors_names_override={},
+        cycling_offsets={},
+        energy_consumption_sensors={},
+        energy_consumption_offsets={},
+        modbus={},
+        state_write_gating={},
+        int32_register_order="high_first",
+    )
+
+
+def resolve_int32_register_order(modbus_config: dict) -> str:
+    """``modbus.int32_register_order`` (bzw. altes ``int32_byte_order``) → "high_first"/"low_first"."""
+    register_order = modbus_config.get("int32_register_order")
+    if register_order is None:
+        # Rückwärtskompatibilität: Alte Config migrieren
+        old_byte_order = modbus_config.get("int32_byte_order")
+        if old_byte_order is not None:
+            _LOGGER.info(
+                "Migration: int32_byte_order gefunden, verwende Wert für int32_register_order. "
+                "Bitte migrieren Sie Ihre Config zu modbus.int32_register_order"
+            )
+            register_order = old_byte_order
+        else:
+            register_order = "high_first"  # Standard
+
+    # Rückwärtskompatibilität: Konvertiere alte Werte
+    if register_order == "big":
+        register_order = "high_first"
+        _LOGGER.info(
+            "Veralteter Wert 'big' verwendet. Bitte aktualisieren Sie Ihre Config auf 'high_first'"
+        )
+    elif register_order == "little":
+        register_order = "low_first"
+        _LOGGER.info(
+            "Veralteter Wert 'little' verwendet. Bitte aktualisieren Sie Ihre Config auf 'low_first'"
+        )
+
+    if register_order not in ("high_first", "low_first"):
+        _LOGGER.warning("Ungültige int32_register_order: %s, verwende 'high_first'", register_order)
+        return "high_first"
+    return register_order
+
+
+def _validate_offsets(raw: Any, section: str, invalid_value: float) -> dict:
+    """Offsets ``{device: {offset_type: number}}``; ungültige Werte werden ersetzt."""
+    if not raw:
+        return {}
+    try:
+        offsets = raw
+        for device, device_offsets in offsets.items():
+            if not isinstance(device_offsets, dict):
+                _LOGGER.warning("Invalid %s format for device %s", section, device)
+                continue
+            for offset_type, value in device_offsets.items():
+                if not isinstance(value, (int, float)):
+                    _LOGGER.warning(
+                        "Invalid %s value for %s.%s: %s", section, device, offset_type, value
+                    )
+                    offsets[device][offset_type] = invalid_value
+        return offsets
+    except (AttributeError, TypeError, KeyError) as e:
+        _LOGGER.error("Invalid %s format: %s", section, e)
+        return {}
+
+
+def _warn_unpaired_energy_offsets(energy_consumption_offsets: dict) -> None:
+    """Warnen, wenn pro Modus nur der elektrische oder nur der thermische Offset gesetzt ist."""
+    for device, offsets in energy_consumption_offsets.items():
+        if not isinstance(offsets, dict):
+            continue
+        for mode in _THERMAL_MODES:
+            elec_key = f"{mode}_energy_total"
+            therm_key = f"{mode}_thermal_energy_total"
+            elec_val = float(offsets.get(elec_key, 0.0))
+            therm_val = float(offsets.get(therm_key, 0.0))
+            if elec_val != 0.0 and therm_val == 0.0:
+                _LOGGER.warning(
+                    "energy_consumption_offsets [%s]: %s is set (%.4f) but %s is 0 or missing — "
+                    "thermal energy sensor will not receive an offset. "
+                    "Add %s: <value> if a thermal offset is intended.",
+                    device, elec_key, elec_val, therm_key, therm_key,
+                )
+            elif therm_val != 0.0 and elec_val == 0.0:
+                _LOGGER.warning(
+                    "energy_consumption_offsets [%s]: %s is set (%.4f) but %s is 0 or missing — "
+                    "electrical energy sensor will not receive an offset. "
+                    "Add %s: <value> if an electrical offset is intended.",
+                    device, therm_key, therm_val, elec_key, elec_key,
+                )
+
+
+def parse_lambda_config(raw: Any) -> LambdaConfig:
+    """YAML-Inhalt (bereits geladen) validieren. Leere/ungültige Wurzel → Default-Config."""
+    if not raw or not isinstance(raw, dict):
+        if raw:
+            _LOGGER.error("lambda_wp_config.yaml: top level must be a mapping, using default configuration")
+        else:
+            _LOGGER.warning("lambda_wp_config.yaml is empty, using default configuration")
+        return default_config()
+
+    disabled_registers = set()
+    if "disabled_registers" in raw:
+        try:
+            disabled_registers = set(int(x) for x in raw["disabled_registers"] or ())
+        except (ValueError, TypeError) as e:
+            _LOGGER.error("Invalid disabled_registers format: %s", e)
+            disabled_registers = set()
+
+    sensors_names_override = {}
+    if "sensors_names_override" in raw:
+        try:
+            for override in raw["sensors_names_override"] or ():
+                if "id" in override and "override_name" in override:
+                    sensors_names_override[override["id"]] = override["override_name"]
+        except (TypeError, KeyError) as e:
+            _LOGGER.error("Invalid sensors_names_override format: %s", e)
+            sensors_names_override = {}
+
+    cycling_offsets = _validate_offsets(raw.get("cycling_offsets"), "cycling_offsets", 0)
+    energy_consumption_offsets = _validate_offsets(
+        raw.get("energy_consumption_offsets"), "energy_consumption_offsets", 0.0
+    )
+    _warn_unpaired_energy_offsets(energy_consumption_offsets)
+
+    # State-Write-Gating (Deadband / Precision / Max-Silence)
+    state_write_gating = raw.get("state_write_gating") or {}
+    if not isinstance(state_write_gating, dict):
+        _LOGGER.error("Invalid state_write_gating format: %s", state_write_gating)
+        state_write_gating = {}
+
+    modbus = raw.get("modbus") or {}
+    if not isinstance(modbus, dict):
+        _LOGGER.error("Invalid modbus format: %s", modbus)
+        modbus = {}
+
+    return LambdaConfig(
+        disabled_registers=disabled_registers,
+        sensors_names_override=sensors_names_override,
+        cycling_offsets=cycling_offsets,
+        energy_consumption_sensors=raw.get("energy_consumption_sensors") or {},
+        energy_consumption_offsets=energy_consumption_offsets,
+        modbus=modbus,
+        state_write_gating=state_write_gating,
+        int32_register_order=resolve_int32_register_order(modbus),
+    )
+
+
+def config_mtime(path: str) -> float | None:
+    """mtime der Config-Datei (None, wenn sie fehlt). Blocking I/O."""
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def read_config_file(path: str) -> tuple[float | None, LambdaConfig]:
+    """Datei lesen, parsen und validieren. Blocking I/O – im Executor aufrufen.
+
+    Raises:
+        yaml.YAMLError / OSError: Datei vorhanden, aber nicht lesbar bzw. ungültig.
+    """
+    mtime = config_mtime(path)
+    if mtime is None:
+        _LOGGER.warning("lambda_wp_config.yaml not found, using default configuration")
+        return None, default_config()
+    with open(path, "r", encoding="utf-8") as f:
+        raw = yaml.safe_load(f)
+    return mtime, parse_lambda_config(raw)
+
+
+class LambdaConfigService:
+    """Einmal geparste Config mit mtime-basiertem Hot-Reload."""
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        self.hass = hass
+        self.path = path
+        self._config: LambdaConfig | None = None
+        self._mtime: float | None = None
+        self._listeners: list[Callable[[LambdaConfig], None]] = []
+        self._unsub_watch = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._config is not None
+
+    async def async_get(self) -> LambdaConfig:
+        """Aktuelle Config (beim ersten Aufruf bzw. nach ``invalidate`` aus der Datei)."""
+        if self._config is None:
+            await self.async_reload()
+        return self._config
+
+    async def async_reload(self) -> bool:
+        """Datei neu einlesen. True, wenn eine neue Config übernommen wurde."""
+        try:
+            mtime, config = await self.hass.async_add_executor_job(read_config_file, self.path)
+        except Exception as e:
+            _LOGGER.error("Error loading configuration from lambda_wp_config.yaml: %s", e)
+            if self._config is not None:
+                return False  # zuletzt gültige Config behalten
+            mtime, config = None, default_config()
+        self._mtime = mtime
+        self._config = config
+        _LOGGER.debug(
+            "Loaded Lambda config: %d disabled registers, %d sensor overrides, "
+            "%d cycling device offsets, %d energy consumption device offsets",
+            len(config["disabled_registers"]),
+            len(config["sensors_names_override"]),
+            len(config["cycling_offsets"]),
+            len(config["energy_consumption_offsets"]),
+        )
+        return True
+
+    async def async_check_for_changes(self) -> bool:
+        """mtime prüfen; bei Änderung neu laden und Listener benachrichtigen."""
+        mtime = await self.hass.async_add_executor_job(config_mtime, self.path)
+        if self._config is not None and mtime == self._mtime:
+            return False
+        if not await self.async_reload():
+            self._mtime = mtime  # fehlerhafte Version nicht in jedem Intervall erneut melden
+            return False
+        _LOGGER.info("lambda_wp_config.yaml changed, configuration reloaded")
+        for listener in list(self._listeners):
+            try:
+                listener(self._config)
+            except Exception as e:
+                _LOGGER.error("Error applying reloaded configuration: %s", e)
+        return True
+
+    def invalidate(self) -> None:
+        """Beim nächsten ``async_get`` neu aus der Datei lesen."""
+        self._config = None
+        self._mtime = None
+
+    @callback
+    def async_add_listener(self, listener: Callable[[LambdaConfig], None]) -> Callable[[], None]:
+        """Listener für geänderte Configs registrieren; startet die mtime-Überwachung."""
+        self._listeners.append(listener)
+        if self._unsub_watch is None:
+            self._unsub_watch = async_track_time_interval(
+                self.hass, self._async_watch, timedelta(seconds=CONFIG_WATCH_INTERVAL)
+            )
+
+        @callback
+        def _remove() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+            if not self._listeners and self._unsub_watch is not None:
+                self._unsub_watch()
+                self._unsub_watch = None
+
+        return _remove
+
+    async def _async_watch(self, _now) -> None:
+        await self.async_check_for_changes()
+
+
+def async_get_config_service(hass: HomeAssistant) -> LambdaConfigService:
+    """Der Config-Service dieser HA-Instanz (wird beim ersten Zugriff angelegt)."""
+    service = hass.data.get(_SERVICE_KEY)
+    if service is None:
+        service = LambdaConfigService(
+            hass, os.path.join(hass.config.config_dir, LAMBDA_WP_CONFIG_FILE)
+        )
+        hass.data[_SERVICE_KEY] = service
+    return service
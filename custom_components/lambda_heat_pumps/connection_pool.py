@@ -0,0 +1,135 @@
+"""Geteilte Modbus-TCP-Verbindungen pro Gateway (``host:port``).
+
+Bisher öffnete jeder Coordinator einen eigenen ``AsyncModbusTcpClient``, auch
+wenn mehrere Config Entries verschiedene Unit-IDs (``slave_id``) hinter
+demselben Gateway ansprechen. Viele Gateways erlauben nur wenige TCP-Clients,
+und jeder Reconnect kostet einen Handshake.
+
+``ModbusConnectionPool`` hält pro ``host:port`` genau einen Client:
+
+- ``async_acquire`` liefert den gemeinsamen Client (verbindet beim ersten
+  Nutzer bzw. nach Verbindungsverlust) und zählt den Nutzer,
+- ``release`` gibt die Referenz zurück; der letzte Nutzer schließt die
+  Verbindung (Unload/Reload einzelner Entries lässt die anderen unberührt).
+
+Die Unit-ID wird pro Request mitgegeben. Da ``modbus_utils`` pro Client-Objekt
+einen Lock hält, laufen alle Requests einer geteilten Verbindung automatisch
+über dieselbe Warteschlange (keine Transaction-ID-Konflikte zwischen Entries).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Callable
+
+from .const import LAMBDA_MODBUS_CONNECT_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+_POOL_KEY = "_lambda_connection_pool"
+
+
+def connection_key(host: str, port: int) -> str:
+    """Pool-Schlüssel einer Verbindung."""
+    return f"{host}:{port}"
+
+
+def _default_client_factory(host: str, port: int) -> Any:
+    from pymodbus.client import AsyncModbusTcpClient
+
+    return AsyncModbusTcpClient(host=host, port=port, timeout=LAMBDA_MODBUS_CONNECT_TIMEOUT)
+
+
+class _PooledConnection:
+    __slots__ = ("client", "owners", "connects")
+
+    def __init__(self) -> None:
+        self.client = None
+        self.owners: set[int] = set()
+        self.connects = 0
+
+
+class ModbusConnectionPool:
+    """Referenzgezählte Modbus-TCP-Clients, einer pro ``host:port``."""
+
+    def __init__(self, client_factory: Callable[[str, int], Any] | None = None) -> None:
+        self._client_factory = client_factory or _default_client_factory
+        self._connections: dict[str, _PooledConnection] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def async_acquire(self, host: str, port: int, owner: Any) -> Any:
+        """Gemeinsamen, verbundenen Client für ``owner`` liefern.
+
+        Raises:
+            ConnectionError: wenn keine Verbindung aufgebaut werden kann
+        """
+        key = connection_key(host, port)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            pooled = self._connections.setdefault(key, _PooledConnection())
+            client = pooled.client
+            if client is None or not getattr(client, "connected", False):
+                if client is None:
+                    client = pooled.client = self._client_factory(host, port)
+                pooled.connects += 1
+                if not await client.connect():
+                    if not pooled.owners:
+                        self._close(key)
+                    raise ConnectionError(f"Failed to connect to {key}")
+                _LOGGER.debug(
+                    "Modbus connection %s established (users: %d)", key, len(pooled.owners) + 1
+                )
+            elif id(owner) not in pooled.owners:
+                _LOGGER.debug(
+                    "Sharing Modbus connection %s (users: %d)", key, len(pooled.owners) + 1
+                )
+            pooled.owners.add(id(owner))
+            return client
+
+    def release(self, host: str, port: int, owner: Any) -> None:
+        """Referenz von ``owner`` freigeben; der letzte Nutzer schließt die Verbindung."""
+        key = connection_key(host, port)
+        pooled = self._connections.get(key)
+        if pooled is None:
+            return
+        pooled.owners.discard(id(owner))
+        if not pooled.owners:
+            self._close(key)
+
+    def _close(self, key: str) -> None:
+        pooled = self._connections.pop(key, None)
+        if pooled is None or pooled.client is None:
+            return
+        try:
+            close = getattr(pooled.client, "close", None)
+            if callable(close):
+                close()
+            _LOGGER.debug("Closed shared Modbus connection %s", key)
+        except Exception as ex:
+            _LOGGER.debug("Error closing Modbus connection %s: %s", key, ex)
+
+    def users(self, host: str, port: int) -> int:
+        """Anzahl der Nutzer einer Verbindung."""
+        pooled = self._connections.get(connection_key(host, port))
+        return len(pooled.owners) if pooled else 0
+
+    def stats(self) -> dict[str, dict]:
+        """Offene Verbindungen mit Nutzerzahl, Status und Anzahl Verbindungsaufbauten."""
+        return {
+            key: {
+                "users": len(pooled.owners),
+                "connected": bool(getattr(pooled.client, "connected", False)),
+                "connects": pooled.connects,
+            }
+            for key, pooled in self._connections.items()
+        }
+
+
+def get_connection_pool(hass) -> ModbusConnectionPool:
+    """Der Verbindungs-Pool dieser HA-Instanz (wird beim ersten Zugriff angelegt)."""
+    pool = hass.data.get(_POOL_KEY)
+    if not isinstance(pool, ModbusConnectionPool):
+        pool = ModbusConnectionPool()
+        hass.data[_POOL_KEY] = pool
+    return pool
@@ -5,6 +5,13 @@ from __future__ import annotations
 # Retry-Parameter für automatische Modulerkennung
 AUTO_DETECT_RETRIES = 3
 AUTO_DETECT_RETRY_DELAY = 5  # Sekunden
+# Auto-Detection im Coordinator-Zyklus (niedrige Priorität, nach den regulären Reads)
+AUTO_DETECT_PROBES_PER_CYCLE = 8  # Proben pro Update-Zyklus
+AUTO_DETECT_PROBE_TIMEOUT = 2.0  # Sekunden pro Probe
+AUTO_DETECT_BACKGROUND_TIMEOUT = 300  # Sekunden, danach bleiben die bisherigen Modul-Anzahlen
+# Cache des Ergebnisses (Controller + Firmware), erneuter Scan nach Ablauf
+AUTO_DETECT_CACHE_FILE = "module_detection_cache.json"
+AUTO_DETECT_CACHE_MAX_AGE = 30 * 24 * 3600  # Sekunden
 
 # PV Surplus mode options
 PV_SURPLUS_MODE_OPTIONS = {
@@ -77,24 +84,82 @@ FIRMWARE_VERSION = {
 # are outsourced to const_mapping.py
 
 
+# lambda_wp_config.yaml: zentraler Config-Service (config_service.py) prüft die mtime
+LAMBDA_WP_CONFIG_FILE = "lambda_wp_config.yaml"
+CONFIG_WATCH_INTERVAL = 30  # Sekunden zwischen zwei mtime-Prüfungen (Hot-Reload)
+
 # Default update interval for Modbus communication (in seconds)
 # Lambda requires 1 minute timeout, so we use 30 seconds to stay well below
 DEFAULT_UPDATE_INTERVAL = 30
 
+# Gestufter Erststart: diese Sensoren (Betriebszustände, Klima-Temperaturen) werden
+# vor dem Abschluss des Setups gelesen, alle übrigen Register im Hintergrund nachgeladen.
+STARTUP_CRITICAL_SENSORS = {
+    "hp": ("error_state", "state", "operating_state"),
+    "boil": ("operating_state", "actual_high_temperature", "target_high_temperature"),
+    "hc": (
+        "operating_state",
+        "room_device_temperature",
+        "target_room_temperature",
+        "set_cooling_mode_room_temperature",
+    ),
+}
+STARTUP_CRITICAL_TIMEOUT = 15  # Sekunden für den kritischen Read (inkl. Verbindungsaufbau)
+
 # Default interval for writing room temperature and PV surplus (in seconds)
 # Changed from 30 to 41 to avoid timing collisions with coordinator reads (30s)
 DEFAULT_WRITE_INTERVAL = 9
 
+# Ereignisgesteuerte Writes (Raumtemperatur 5004+, PV-Überschuss 102), siehe write_scheduler.py
+EXTERNAL_WRITE_MIN_INTERVAL = DEFAULT_WRITE_INTERVAL  # Mindestabstand zweier Writes desselben Registers (s)
+EXTERNAL_WRITE_KEEPALIVE = 30  # Auffrischung ohne Wertänderung (s), Lambda-Timeout liegt bei 1 Minute
+ROOM_TEMPERATURE_WRITE_THRESHOLD = 1  # Rohwert-Einheiten (0.1 °C)
+PV_SURPLUS_WRITE_THRESHOLD = 50  # W
+# Deadline pro Entry für Service-Arbeit (Writes/Service-Calls); Entries laufen pro Verbindung parallel
+SERVICE_ENTRY_DEADLINE = 30
+
 # Default interval for fast modbus communication für state change detection (in seconds)
 # 
 DEFAULT_FAST_UPDATE_INTERVAL = 2
 
+# Fleet-Scheduler: max. gleichzeitig laufende Zyklen über alle Controller/Verbindungen
+# (Slot erst nach stabiler Verbindung, freigegeben spätestens nach FLEET_SLOT_MAX_HOLD Sekunden)
+FLEET_MAX_CONCURRENT_CYCLES = 2
+FLEET_SLOT_MAX_HOLD = 5.0
+
+# Diagnose: Anzahl gemerkter Update-Zyklen bzw. Messwerte (Fast-Poll-Jitter, Persist-Writes)
+PERF_TRACE_CYCLES = 10
+PERF_TRACE_SAMPLES = 200
+
+# Service profile_update_cycles: Standard- und Maximalanzahl profilierter Voll-Zyklen
+PROFILE_DEFAULT_CYCLES = 5
+PROFILE_MAX_CYCLES = 50
+
+# Persist-Journal (cycle_energy_persist): Delta-Records werden angehängt und
+# periodisch atomar in den Snapshot (cycle_energy_persist.json) kompaktiert
+PERSIST_JOURNAL_SUFFIX = ".journal"
+PERSIST_JOURNAL_MAX_RECORDS = 120  # Kompaktierung nach N Delta-Records (~1h bei 30s Debounce)
+PERSIST_JOURNAL_MAX_BYTES = 256 * 1024  # oder sobald das Journal größer als 256 KiB ist
+
+# Hot-Path-Logging (Update-Zyklus): gesampelte Zeilen höchstens 1x pro Schlüssel und Intervall (s)
+HOT_PATH_LOG_INTERVAL = 60
+
+# State-Write-Gating: Entities schreiben ihren State nur bei Änderung jenseits
+# der Deadband oder spätestens nach DEFAULT_STATE_MAX_SILENCE Sekunden
+DEFAULT_STATE_MAX_SILENCE = 300
+# Default-Deadband pro Einheit für Sensoren ohne "deadband" im Template
+# (Template-Key und YAML haben Vorrang)
+STATE_DEADBAND_BY_UNIT = {
+    "°C": 0.15,  # ±0.1 °C Rauschen unterdrücken, 0.2 °C Änderungen durchlassen
+}
+
 # Lambda-specific Modbus configuration
 LAMBDA_MODBUS_TIMEOUT = 60  # Lambda requires 1 minute timeout
 LAMBDA_MODBUS_UNIT_ID = 1   # Lambda Unit ID
 LAMBDA_MODBUS_PORT = 502    # Standard Modbus TCP port
 LAMBDA_MAX_RETRIES = 3      # Maximum retry attempts
 LAMBDA_RETRY_DELAY = 5      # Delay between retries in seconds
+LAMBDA_MODBUS_CONNECT_TIMEOUT = 10  # Client-Timeout der (geteilten) TCP-Verbindung
 
 DEFAULT_HEATING_CIRCUIT_MIN_TEMP = 15
 DEFAULT_HEATING_CIRCUIT_MAX_TEMP = 35
@@ -109,6 +174,10 @@ BASE_ADDRESSES = {
     "hc": 5000,  # Heating circuits start at 5000
 }
 
+# Register-Datentypen (Templates "data_type") und Obergrenze für den Range-Read-Service
+REGISTER_DATA_TYPES = ("uint16", "int16", "int32")
+MAX_RANGE_READ_REGISTERS = 500
+
 # Individual Read Registers
 # These registers are read individually instead of in batches due to known issues
 # Format for registers >= 1000: "{first_digit}n{remaining_digits}" (e.g., "5n07" matches 5007, 5107, 5207, etc.)
@@ -137,6 +206,8 @@ ENERGY_PERIOD_CONFIG = {
 #   (Konsistenz in LambdaCOPSensor.restore_state).
 # - COP daily/monthly/yearly: lesen nur aus Energy-Sensoren, keine eigene Baseline → kein Reset-Fehler.
 # - Cycling (daily, 2h, 4h, monthly, yearly): eigener Zähler pro Periode, Reset auf 0 – kein yesterday-Fehler.
+# Baselines (Total zu Periodenbeginn) liegen zentral in der Rollup-Tabelle des Coordinators
+# (rollup_table.RollupBaselineTable, persistiert als "rollup_baselines" in cycle_energy_persist.json).
 
 # Reihenfolge der Perioden beim Inkrement der Energy-Sensoren (utils.increment_energy_consumption_counter)
 ENERGY_INCREMENT_PERIODS = ["total", "daily", "monthly", "yearly", "2h", "4h", "hourly"]
@@ -271,6 +342,21 @@ LAMBDA_WP_CONFIG_TEMPLATE = """# Lambda WP configuration
 #    cooling_thermal_energy_total: 45.2     # Example: HP2 already produced 45.2 kWh cooling (thermal)
 #    defrost_thermal_energy_total: 12.1     # Example: HP2 already produced 12.1 kWh defrost (thermal)
 
+# State write gating (reduces recorder database growth and event-bus traffic)
+# Entities only write their state when the value moved at least "deadband"
+# away from the last written value, or after max_silence_seconds at the latest.
+# Keys are sensor ids with device prefix (hp1_flow_line_temperature) or
+# template ids without prefix (flow_line_temperature). Default deadband for
+# °C sensors is 0.15; deadband 0 writes every change.
+# Example:
+#state_write_gating:
+#  max_silence_seconds: 300
+#  deadband:
+#    flow_line_temperature: 0.3
+#    hp1_ambient_temperature: 0
+#  precision:
+#    flow_line_temperature: 1
+
 # Modbus configuration
 # Register order for 32-bit registers (int32 sensors)
 # This refers to the order of 16-bit registers when combining to 32-bit values (Register/Word Order),
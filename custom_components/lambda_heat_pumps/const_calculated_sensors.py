@@ -22,6 +22,14 @@ CALCULATED_SENSOR_TEMPLATES = {
             "{{% set power = states('sensor.{full_entity_prefix}_compressor_power_consumption_accumulated') | float(1) %}}"
             "{{{{ (thermal / power) | round(2) if power > 0 else 0 }}}}"
         ),
+        # Gleiche Formel nativ (template_eval.py) – ohne Jinja-Rendering pro Zyklus
+        "native": {
+            "inputs": {
+                "thermal": ("sensor.{full_entity_prefix}_compressor_thermal_energy_output_accumulated", 0),
+                "power": ("sensor.{full_entity_prefix}_compressor_power_consumption_accumulated", 1),
+            },
+            "expr": ("div_pos", "thermal", "power", 0),
+        },
     },
     # COP Sensoren werden jetzt als echte Python-Sensoren (LambdaCOPSensor) erstellt
     # und nicht mehr als Template-Sensoren. Siehe sensor.py für die Implementierung.
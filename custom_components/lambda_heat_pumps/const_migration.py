@@ -49,6 +49,9 @@ MIGRATION_VERSION = MigrationVersion.get_latest().value
 MIGRATION_BACKUP_DIR = "lambda_heat_pumps/backup"
 MIGRATION_BACKUP_RETENTION_DAYS = 30
 
+# Migrations-Fingerprint (schneller Start ohne Datei-I/O, siehe migration_fingerprint.py)
+MIGRATION_FINGERPRINT_FILE = "lambda_heat_pumps/migration_fingerprint.json"
+
 # Backup-Datei-Präfixe
 BACKUP_PREFIX_REGISTRY = "core"
 BACKUP_PREFIX_CONFIG = "lambda_wp_config"
@@ -63,6 +63,7 @@ HP_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.01,
         "precision": 1,
+        "deadband": 0.15,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "Hp",
@@ -76,6 +77,7 @@ HP_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.01,
         "precision": 1,
+        "deadband": 0.15,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "Hp",
@@ -89,6 +91,7 @@ HP_SENSOR_TEMPLATES = {
         "unit": "l/h",
         "scale": 1,
         "precision": 1,
+        "deadband": 20,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "Hp",
@@ -101,6 +104,7 @@ HP_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.01,
         "precision": 1,
+        "deadband": 0.15,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "Hp",
@@ -114,6 +118,7 @@ HP_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.01,
         "precision": 1,
+        "deadband": 0.15,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "Hp",
@@ -127,6 +132,7 @@ HP_SENSOR_TEMPLATES = {
         "unit": "l/min",
         "scale": 0.01,
         "precision": 1,
+        "deadband": 0.2,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "Hp",
@@ -151,6 +157,7 @@ HP_SENSOR_TEMPLATES = {
         "unit": "kW",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0.2,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "Hp",
@@ -164,6 +171,7 @@ HP_SENSOR_TEMPLATES = {
         "unit": "W",
         "scale": 1,
         "precision": 0,
+        "deadband": 20,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "Hp",
@@ -201,6 +209,7 @@ HP_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "Hp",
@@ -214,6 +223,7 @@ HP_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "Hp",
@@ -227,6 +237,7 @@ HP_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "Hp",
@@ -303,6 +314,7 @@ HP_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.01,
         "precision": 2,
+        "deadband": 0.15,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "Hp",
@@ -316,6 +328,7 @@ HP_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.01,
         "precision": 2,
+        "deadband": 0.15,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "Hp",
@@ -329,6 +342,7 @@ HP_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.01,
         "precision": 2,
+        "deadband": 0.15,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "Hp",
@@ -342,6 +356,7 @@ HP_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.01,
         "precision": 2,
+        "deadband": 0.15,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "Hp",
@@ -355,6 +370,7 @@ HP_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.01,
         "precision": 2,
+        "deadband": 0.15,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "Hp",
@@ -574,6 +590,7 @@ BOIL_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0.15,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "boil",
@@ -587,6 +604,7 @@ BOIL_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0.15,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "boil",
@@ -600,6 +618,7 @@ BOIL_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "boil",
@@ -613,6 +632,7 @@ BOIL_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0.15,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "boil",
@@ -680,6 +700,7 @@ BUFF_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0.15,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "buff",
@@ -693,6 +714,7 @@ BUFF_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0.15,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "buff",
@@ -706,6 +728,7 @@ BUFF_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "buff",
@@ -731,6 +754,7 @@ BUFF_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "buff",
@@ -744,6 +768,7 @@ BUFF_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "buff",
@@ -769,6 +794,7 @@ BUFF_SENSOR_TEMPLATES = {
         "unit": "kW",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "buff",
@@ -782,6 +808,7 @@ BUFF_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "buff",
@@ -823,6 +850,7 @@ SOL_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0.15,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "sol",
@@ -836,6 +864,7 @@ SOL_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0.15,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "sol",
@@ -849,6 +878,7 @@ SOL_SENSOR_TEMPLATES = {
         "unit": "kW",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0.2,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "sol",
@@ -875,6 +905,7 @@ SOL_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "sol",
@@ -888,6 +919,7 @@ SOL_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "sol",
@@ -929,6 +961,7 @@ HC_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0.15,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "hc",
@@ -942,6 +975,7 @@ HC_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0.15,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "hc",
@@ -955,6 +989,7 @@ HC_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "hc",
@@ -968,6 +1003,7 @@ HC_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "hc",
@@ -993,6 +1029,7 @@ HC_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "hc",
@@ -1006,6 +1043,7 @@ HC_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "hc",
@@ -1019,6 +1057,7 @@ HC_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "hc",
@@ -1032,6 +1071,7 @@ HC_SENSOR_TEMPLATES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "hc",
@@ -1045,6 +1085,7 @@ HC_SENSOR_TEMPLATES = {
          "unit": "°C",
          "scale": 0.1,
          "precision": 1,
+         "deadband": 0,
          "data_type": "int16",
          "firmware_version": 3,
          "device_type": "hc",
@@ -1195,6 +1236,7 @@ SENSOR_TYPES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0.15,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "main",
@@ -1208,6 +1250,7 @@ SENSOR_TYPES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0.15,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "main",
@@ -1221,6 +1264,7 @@ SENSOR_TYPES = {
         "unit": "°C",
         "scale": 0.1,
         "precision": 1,
+        "deadband": 0.15,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "main",
@@ -1258,6 +1302,7 @@ SENSOR_TYPES = {
         "unit": "W",
         "scale": 1,
         "precision": 0,
+        "deadband": 20,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "main",
@@ -1271,6 +1316,7 @@ SENSOR_TYPES = {
         "unit": "W",
         "scale": 1,
         "precision": 0,
+        "deadband": 20,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "main",
@@ -1284,6 +1330,7 @@ SENSOR_TYPES = {
         "unit": "W",
         "scale": 1,
         "precision": 0,
+        "deadband": 0,
         "data_type": "int16",
         "firmware_version": 1,
         "device_type": "main",
@@ -4,9 +4,10 @@ from __future__ import annotations
 from datetime import timedelta
 import logging
 import os
-import yaml
 import json
 import asyncio
+import contextlib
+import weakref
 # import aiofiles  # Unused import removed
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
@@ -15,20 +16,20 @@ from homeassistant.helpers.update_coordinator import (
     UpdateFailed,
 )
 from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
-from homeassistant.helpers.event import async_track_time_interval, async_call_later
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from .const import (
+    DOMAIN,
     SENSOR_TYPES,
     HP_SENSOR_TEMPLATES,
-    BOIL_SENSOR_TEMPLATES,
-    BUFF_SENSOR_TEMPLATES,
-    SOL_SENSOR_TEMPLATES,
-    HC_SENSOR_TEMPLATES,
     DEFAULT_UPDATE_INTERVAL,
     DEFAULT_FAST_UPDATE_INTERVAL,
     CALCULATED_SENSOR_TEMPLATES,
     LAMBDA_MODBUS_UNIT_ID,
     LAMBDA_MODBUS_PORT,
     INDIVIDUAL_READ_REGISTERS,
+    AUTO_DETECT_PROBES_PER_CYCLE,
+    STARTUP_CRITICAL_SENSORS,
+    STARTUP_CRITICAL_TIMEOUT,
 )
 from .utils import (
     load_disabled_registers,
@@ -38,7 +39,6 @@ from .utils import (
     to_signed_32bit,
     increment_cycling_counter,
     get_firmware_version_int,
-    get_compatible_sensors,
     normalize_name_prefix,
     detect_sensor_change,
     get_stored_sensor_id,
@@ -47,6 +47,25 @@ from .utils import (
     store_thermal_sensor_id,
 )
 from .modbus_utils import async_read_holding_registers, combine_int32_registers, wait_for_stable_connection
+from .persist_store import PersistJournalStore
+from .cop_engine import COPEngine
+from .entity_address_index import EntityAddressIndex
+from .rollup_table import RollupBaselineTable
+from .register_plan import plan_register_batches
+from .register_catalog import get_register_catalog
+from .config_service import async_get_config_service
+from .module_auto_detect import ModuleProbe, probe_module_slot
+from .fleet_scheduler import get_fleet_scheduler
+from .connection_pool import get_connection_pool
+from .perf_trace import (
+    BATCH_MODE_BATCH,
+    BATCH_MODE_FAILED,
+    BATCH_MODE_FALLBACK,
+    BATCH_MODE_INDIVIDUAL,
+    PerfTrace,
+)
+from .profiling import CycleProfiler
+from .log_utils import HotPathLogger, lazy
 import time
 
 _LOGGER = logging.getLogger(__name__)
@@ -82,6 +101,8 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
         if self.debug_mode:
             _LOGGER.setLevel(logging.DEBUG)
         self.client = None
+        # Eine TCP-Verbindung pro Gateway (host:port), geteilt über alle Unit-IDs
+        self._connection_pool = get_connection_pool(hass)
         self.config_entry_id = entry.entry_id
         self._config_dir = hass.config.config_dir
         self._config_path = os.path.join(self._config_dir, "lambda_heat_pumps")
@@ -104,6 +125,8 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
         self._sensor_ids = {}  # {hp_index: sensor_entity_id} für Sensor-Wechsel-Erkennung (elektrisch)
         self._thermal_sensor_ids = {}  # {hp_index: sensor_entity_id} für Thermik-Sensor-Wechsel-Erkennung
         self._energy_sensor_states = {}  # {entity_id: {state, energy_value, yesterday_value, ...}} aus cycle_energy_persist
+        self._energy_state_cache = {}  # {entity_id: serialisierter Persist-Eintrag} - wiederverwendet für unveränderte Entities
+        self._energy_dirty_entities = set()  # Entities, deren interne Werte sich seit dem letzten Persist geändert haben
         self._energy_unit_cache = {}  # {hp_index: unit_string} - Memory-only cache for performance
         self._energy_first_value_seen = {}  # {hp_index: bool} - In-Memory Flag für Zero-Value Protection
         self._last_thermal_energy_reading = {}  # {hp_index: last_kwh_value} for thermal
@@ -114,6 +137,19 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
         self._persist_file = os.path.join(
             self._config_path, "cycle_energy_persist.json"
         )
+        # Snapshot + Append-only-Journal (Delta-Records pro Flush, atomare Kompaktierung)
+        self._persist_store = PersistJournalStore(self._persist_file)
+        # Zentrale COP-Berechnung: Energy-Sensoren melden Werte, COPs werden 1x pro Zyklus publiziert
+        self.cop_engine = COPEngine(hass)
+        # Perioden-Baselines (Total zu Periodenbeginn) aller Energy-/Cycling-Perioden-Sensoren
+        self.rollup_baselines = RollupBaselineTable()
+        # Laufende Hintergrund-Auto-Detection (Proben am Ende der Update-Zyklen)
+        self._module_probe = None
+        self._module_probe_future = None
+        # Deadband/Precision/Max-Silence-Overrides aus lambda_wp_config.yaml (state_write_gating)
+        self.state_write_gating = {}
+        # StateWriteGates der Entities (create_state_gate(registry=...)), für den YAML-Hot-Reload
+        self.state_gates = weakref.WeakSet()
 
         # Entity-based polling control - simplified approach
         self._enabled_addresses = set()  # Aktuell aktivierte Register-Adressen
@@ -121,10 +157,12 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
         
         # Int32 Register Order Support (Issue #22)
         self._int32_register_order = "high_first"  # Default value
-        self._entity_address_mapping = {}  # Initialize entity address mapping
+        # Reverse-Index Entity-ID/Unique-ID -> Adresse (einmal gebaut, Registry-Events inkrementell)
+        self._address_index: EntityAddressIndex | None = None
+        self._entity_address_mapping = {}  # entity_id -> address (aus dem Index)
         self._entity_registry = None  # Initialize entity registry reference
         self._registry_listener = None  # Initialize registry listener reference
-        self._registry_update_cancel = None  # Debounce cancel handle
+        self._unsub_config_listener = None  # Hot-Reload der lambda_wp_config.yaml
 
         # Dynamische Batch-Read-Fehlerbehandlung
         self._batch_failures = {}  # Dict: (start_addr, count) -> failure_count
@@ -142,14 +180,40 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
         # Flag für Initialisierung - verhindert Flankenerkennung beim ersten Update
         self._initialization_complete = False
 
+        # Gestufter Erststart: bis zum ersten vollständigen Update werden Teil-Daten
+        # publiziert und Entities erst verfügbar, sobald ihr Wert vorliegt
+        self.startup_complete = False
+        self._startup_fill_task = None
+        self._startup_done = asyncio.Event()
+
+        # Nur ein voller Zyklus gleichzeitig (Startup-Fill, Timer, Service-Refresh):
+        # wer wartet, übernimmt das Ergebnis des gerade abgeschlossenen Zyklus
+        self._full_update_lock = asyncio.Lock()
+        self._full_update_generation = 0
+        self._full_update_result: dict | None = None
+
         # Fast polling for edge detection (HP_STATE / HP_OPERATING_STATE only)
         self._full_update_running = False  # True while _async_update_data holds Modbus
         self._unsub_fast_poll = None
 
+        # Fleet-Scheduler (mehrere Controller in einer HA-Instanz): Phasenversatz,
+        # globales Limit gleichzeitiger Zyklen und fleet-weite Zykluszeiten
+        self._fleet = get_fleet_scheduler(hass)
+        self._fleet_member = self._fleet.register(f"{self._name_prefix}@{self.host}:{self.port}")
+        self._fleet_phase_pending = True  # Versatz einmalig vor dem ersten regulären Zyklus
+        self._fleet_cycle = None  # Laufender voller Zyklus (FleetCycle), Slot ab stabiler Verbindung
+        # Messwerte für die Diagnose (Batch-Zeiten, Fast-Poll-Jitter, Persist-Writes)
+        self.perf_trace = PerfTrace()
+        # Gesampeltes Hot-Path-Logging pro Entry (Schlüssel gelten nur für diesen Controller)
+        self._hot_log = HotPathLogger(_LOGGER)
+        # On-Demand-Profiling (Service profile_update_cycles), sonst None
+        self._profiler: CycleProfiler | None = None
+
         # Persist File I/O Optimierung
         self._persist_dirty = False  # Dirty-Flag für Änderungen
         self._persist_last_write = 0  # Timestamp des letzten Schreibens
         self._persist_debounce_seconds = 30  # Max 1x pro 30 Sekunden schreiben
+        self._persist_lock = asyncio.Lock()  # Ein Persist (Prepare + Commit) gleichzeitig
         
         # Globale Register-Deduplizierung für bessere Performance
         self._global_register_cache = {}  # Cache für bereits gelesene Register pro Update-Zyklus
@@ -244,15 +308,12 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
 
         def _load_and_normalize():
             try:
-                with open(self._persist_file) as f:
-                    content = f.read().strip()
+                # Snapshot laden und Journal-Records darauf abspielen
+                data = self._persist_store.load()
 
-                if not content:
-                    _LOGGER.warning("Persist file %s is empty, using defaults", self._persist_file)
+                if not data:
                     return {}
 
-                data = json.loads(content)
-
                 # Normalisiere last_operating_states-Schlüssel zu Strings
                 if isinstance(data.get("last_operating_states"), dict):
                     data["last_operating_states"] = {
@@ -269,6 +330,7 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
 
             except json.JSONDecodeError as e:
                 _LOGGER.error("Corrupted persist file %s: %s — backing up and starting fresh", self._persist_file, e)
+                self._persist_store.reset()
                 try:
                     backup_file = self._persist_file + ".backup"
                     with open(self._persist_file, "r") as src, open(backup_file, "w") as dst:
@@ -280,6 +342,7 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
 
             except Exception as e:
                 _LOGGER.error("Error reading persist file %s: %s", self._persist_file, e)
+                self._persist_store.reset()
                 return {}
 
         return await self.hass.async_add_executor_job(_load_and_normalize)
@@ -288,80 +351,92 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
         """Persist counter data and state information to file using optimized I/O with debouncing."""
         import time
 
-        # Prüfe Dirty-Flag - nur schreiben wenn sich etwas geändert hat
-        if not self._persist_dirty:
-            _LOGGER.debug("No changes to persist, skipping write")
-            return
+        # Prepare/Commit/Kompaktierung serialisieren: überlappende Aufrufe (Zyklus,
+        # Shutdown, Services) würden sonst gegen denselben Shadow-Stand diffen
+        # bzw. das Journal parallel zur Kompaktierung beschreiben
+        async with self._persist_lock:
+            # Prüfe Dirty-Flag - nur schreiben wenn sich etwas geändert hat
+            if not (self._persist_dirty or self.rollup_baselines.dirty):
+                _LOGGER.debug("No changes to persist, skipping write")
+                return
 
-        current_time = time.time()
+            current_time = time.time()
 
-        # Debouncing: Max 1x pro 30 Sekunden schreiben (außer bei force=True beim Shutdown)
-        if not force and current_time - self._persist_last_write < self._persist_debounce_seconds:
-            _LOGGER.debug("Persist write debounced (last write %.1fs ago)",
-                         current_time - self._persist_last_write)
-            return
-        
-        # Stelle sicher, dass alle Schlüssel konsistent sind
-        # Verwende separate Normalisierungsmethoden für semantisch unterschiedliche State-Typen
-        normalized_operating_states = self._normalize_operating_states(
-            getattr(self, "_last_operating_state", {})
-        )
-        normalized_states = self._normalize_states(
-            getattr(self, "_last_state", {})
-        )
-        
-        # Prüfe ob sensor_ids/thermal_sensor_ids in der Datei existieren, falls im Speicher leer
-        sensor_ids_to_save = getattr(self, "_sensor_ids", {})
-        thermal_sensor_ids_to_save = getattr(self, "_thermal_sensor_ids", {})
-        if (not sensor_ids_to_save or not thermal_sensor_ids_to_save) and os.path.exists(self._persist_file):
+            # Debouncing: Max 1x pro 30 Sekunden schreiben (außer bei force=True beim Shutdown)
+            if not force and current_time - self._persist_last_write < self._persist_debounce_seconds:
+                _LOGGER.debug("Persist write debounced (last write %.1fs ago)",
+                             current_time - self._persist_last_write)
+                return
 
-            def _read_existing_sensor_ids():
-                try:
-                    with open(self._persist_file) as f:
-                        existing_data = json.loads(f.read())
-                        out_sensor = sensor_ids_to_save or existing_data.get("sensor_ids", {})
-                        out_thermal = thermal_sensor_ids_to_save or existing_data.get("thermal_sensor_ids", {})
-                        return out_sensor, out_thermal
-                except Exception:
-                    return sensor_ids_to_save, thermal_sensor_ids_to_save
-
-            sensor_ids_to_save, thermal_sensor_ids_to_save = await self.hass.async_add_executor_job(_read_existing_sensor_ids)
-
-        # Energy-Sensor-States aus Entities sammeln (electrical + thermal, alle Perioden)
-        energy_sensor_states_to_save = self._collect_energy_sensor_states()
-
-        data = {
-            "version": 1,
-            "heating_cycles": self._heating_cycles,
-            "heating_energy": self._heating_energy,
-            "last_operating_states": normalized_operating_states,
-            "energy_last_operating_states": self._normalize_operating_states(
-                getattr(self, "_energy_last_operating_state", {})
-            ),
-            "last_states": normalized_states,
-            "energy_consumption": self._energy_consumption,
-            "last_energy_readings": self._last_energy_reading,
-            "last_thermal_energy_readings": getattr(self, "_last_thermal_energy_reading", {}),
-            "energy_offsets": self._energy_offsets,
-            "sensor_ids": sensor_ids_to_save,
-            "thermal_sensor_ids": thermal_sensor_ids_to_save,
-            "energy_sensor_states": energy_sensor_states_to_save,
-        }
+            # Stelle sicher, dass alle Schlüssel konsistent sind
+            # Verwende separate Normalisierungsmethoden für semantisch unterschiedliche State-Typen
+            normalized_operating_states = self._normalize_operating_states(
+                getattr(self, "_last_operating_state", {})
+            )
+            normalized_states = self._normalize_states(
+                getattr(self, "_last_state", {})
+            )
 
-        def _write_data():
-            os.makedirs(os.path.dirname(self._persist_file), exist_ok=True)
-            with open(self._persist_file, "w") as f:
-                json.dump(data, f, indent=2)  # Mit Indentation für bessere Lesbarkeit
+            # sensor_ids/thermal_sensor_ids: falls im Speicher leer, den zuletzt persistierten
+            # Stand aus dem Journal-Store übernehmen (kein erneutes Lesen der Datei)
+            sensor_ids_to_save = getattr(self, "_sensor_ids", {}) or self._persist_store.get_section("sensor_ids", {})
+            thermal_sensor_ids_to_save = (
+                getattr(self, "_thermal_sensor_ids", {})
+                or self._persist_store.get_section("thermal_sensor_ids", {})
+            )
 
-        # Schreibe als Background-Task (non-blocking)
-        try:
-            await self.hass.async_add_executor_job(_write_data)
-            self._persist_last_write = current_time
-            self._persist_dirty = False  # Reset Dirty-Flag nach erfolgreichem Schreiben
-            _LOGGER.debug("Persist file written successfully")
-        except Exception as e:
-            _LOGGER.error("Failed to write persist file: %s", e)
-            # Dirty-Flag bleibt True für nächsten Versuch
+            # Energy-Sensor-States aus Entities sammeln (electrical + thermal, alle Perioden)
+            energy_sensor_states_to_save = self._collect_energy_sensor_states()
+
+            data = {
+                "version": 1,
+                "heating_cycles": self._heating_cycles,
+                "heating_energy": self._heating_energy,
+                "last_operating_states": normalized_operating_states,
+                "energy_last_operating_states": self._normalize_operating_states(
+                    getattr(self, "_energy_last_operating_state", {})
+                ),
+                "last_states": normalized_states,
+                "energy_consumption": self._energy_consumption,
+                "last_energy_readings": self._last_energy_reading,
+                "last_thermal_energy_readings": getattr(self, "_last_thermal_energy_reading", {}),
+                "energy_offsets": self._energy_offsets,
+                "sensor_ids": sensor_ids_to_save,
+                "thermal_sensor_ids": thermal_sensor_ids_to_save,
+                "energy_sensor_states": energy_sensor_states_to_save,
+                "rollup_baselines": self.rollup_baselines.to_dict(),
+            }
+
+            # Delta gegen den zuletzt geschriebenen Stand bilden (nur im Speicher);
+            # geschrieben wird ein kleiner Journal-Record oder periodisch ein atomarer Snapshot
+            write = self._persist_store.prepare_write(data)
+            if write is None:
+                self._persist_last_write = current_time
+                self._persist_dirty = False
+                self.rollup_baselines.dirty = False
+                _LOGGER.debug("Persist data unchanged, nothing written")
+                return
+
+            # Dirty-Flags schon vor dem Commit zurücksetzen: Änderungen während des
+            # Schreibens gehören zum nächsten Persist und gehen nicht verloren
+            self._persist_dirty = False
+            self.rollup_baselines.dirty = False
+
+            # Schreibe als Background-Task (non-blocking)
+            try:
+                write_started = time.perf_counter()
+                written = await self.hass.async_add_executor_job(self._persist_store.commit, write)
+                self.perf_trace.record_persist_write(
+                    write.kind, (time.perf_counter() - write_started) * 1000, written
+                )
+                self._persist_last_write = current_time
+                _LOGGER.debug("Persist %s written successfully (%d bytes)", write.kind, written)
+            except Exception as e:
+                _LOGGER.error("Failed to write persist file: %s", e)
+                # Wieder dirty; nächster Versuch schreibt den kompletten Snapshot
+                self._persist_dirty = True
+                self.rollup_baselines.dirty = True
+                self._persist_store.invalidate()
 
     def mark_initialization_complete(self) -> None:
         """Markiere die Initialisierung als abgeschlossen - ermöglicht Flankenerkennung."""
@@ -370,40 +445,63 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.info("Coordinator-Initialisierung abgeschlossen - Flankenerkennung aktiviert")
 
     def _collect_energy_sensor_states(self):
-        """Sammle State + Attribute aller Energy-Consumption-Entities für Persist (electrical + thermal)."""
-        out = {}
+        """Sammle State + Attribute der Energy-Consumption-Entities für Persist (electrical + thermal).
+
+        Serialisiert werden nur Entities aus dem Dirty-Set (bzw. noch nicht gecachte);
+        für alle anderen wird der zuletzt erzeugte Eintrag wiederverwendet.
+        """
         try:
             comp = self.hass.data.get("lambda_heat_pumps", {}).get(self.entry.entry_id, {})
             entities = comp.get("energy_entities", {})
+            cache = self._energy_state_cache
+            dirty = self._energy_dirty_entities
+            self._energy_dirty_entities = set()
+
+            # Entfernte Entities (z. B. nach Reload) aus dem Cache nehmen
+            for entity_id in [eid for eid in cache if eid not in entities]:
+                del cache[entity_id]
+
             for entity_id, ent in entities.items():
-                if not hasattr(ent, "_energy_value"):
+                if entity_id in cache and entity_id not in dirty:
                     continue
-                state_val = ent.native_value
-                if state_val is None:
-                    continue
-                energy_val = round(getattr(ent, "_energy_value", 0), 2)
-                yesterday_val = round(getattr(ent, "_yesterday_value", 0), 2)
-                prev_monthly_val = round(getattr(ent, "_previous_monthly_value", 0), 2)
-                prev_yearly_val = round(getattr(ent, "_previous_yearly_value", 0), 2)
-                # Konsistenz: Basis-Wert darf nicht größer als energy_value sein (Periodenwert wäre sonst negativ)
-                if "_daily" in entity_id and yesterday_val > energy_val:
-                    yesterday_val = energy_val
-                if "_monthly" in entity_id and prev_monthly_val > energy_val:
-                    prev_monthly_val = energy_val
-                if "_yearly" in entity_id and prev_yearly_val > energy_val:
-                    prev_yearly_val = energy_val
-                applied_offset_val = round(getattr(ent, "_applied_offset", 0.0), 4)
-                attrs = {
-                    "energy_value": energy_val,
-                    "yesterday_value": yesterday_val,
-                    "previous_monthly_value": prev_monthly_val,
-                    "previous_yearly_value": prev_yearly_val,
-                    "applied_offset": applied_offset_val,
-                }
-                out[entity_id] = {"state": round(float(state_val), 2), "attributes": attrs}
+                entry = self._serialize_energy_entity(entity_id, ent)
+                if entry is None:
+                    cache.pop(entity_id, None)
+                else:
+                    cache[entity_id] = entry
+            return dict(cache)
         except Exception as e:
             _LOGGER.debug("Collect energy_sensor_states: %s", e)
-        return out
+            return dict(self._energy_state_cache)
+
+    @staticmethod
+    def _serialize_energy_entity(entity_id, ent):
+        """Erzeuge den Persist-Eintrag für eine Energy-Entity (oder None, wenn kein Wert vorliegt)."""
+        if not hasattr(ent, "_energy_value"):
+            return None
+        state_val = ent.native_value
+        if state_val is None:
+            return None
+        energy_val = round(getattr(ent, "_energy_value", 0), 2)
+        yesterday_val = round(getattr(ent, "_yesterday_value", 0), 2)
+        prev_monthly_val = round(getattr(ent, "_previous_monthly_value", 0), 2)
+        prev_yearly_val = round(getattr(ent, "_previous_yearly_value", 0), 2)
+        # Konsistenz: Basis-Wert darf nicht größer als energy_value sein (Periodenwert wäre sonst negativ)
+        if "_daily" in entity_id and yesterday_val > energy_val:
+            yesterday_val = energy_val
+        if "_monthly" in entity_id and prev_monthly_val > energy_val:
+            prev_monthly_val = energy_val
+        if "_yearly" in entity_id and prev_yearly_val > energy_val:
+            prev_yearly_val = energy_val
+        applied_offset_val = round(getattr(ent, "_applied_offset", 0.0), 4)
+        attrs = {
+            "energy_value": energy_val,
+            "yesterday_value": yesterday_val,
+            "previous_monthly_value": prev_monthly_val,
+            "previous_yearly_value": prev_yearly_val,
+            "applied_offset": applied_offset_val,
+        }
+        return {"state": round(float(state_val), 2), "attributes": attrs}
 
     def get_energy_sensor_persisted_state(self, entity_id):
         """Liefert den aus cycle_energy_persist geladenen State für eine Entity (oder None)."""
@@ -413,6 +511,11 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
         """Markiert Persist als geändert, damit Energy-States beim nächsten Schreibzyklus mit gespeichert werden."""
         self._persist_dirty = True
 
+    def mark_energy_entity_dirty(self, entity_id: str) -> None:
+        """Registriert eine Energy-Entity, deren interne Werte sich geändert haben (für den nächsten Persist)."""
+        self._energy_dirty_entities.add(entity_id)
+        self._persist_dirty = True
+
     async def _load_offsets_and_persisted(self):
         # Lade Offsets aus lambda_wp_config.yaml über das zentrale Config-System
         from .utils import load_lambda_config
@@ -422,6 +525,7 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.info("Loaded config keys: %s", list(config.keys()))
             self._cycling_offsets = config.get("cycling_offsets", {})
             self._energy_offsets = config.get("energy_consumption_offsets", {})
+            self.state_write_gating = config.get("state_write_gating", {})
             # Lade und validiere Energy Sensor Konfigurationen
             raw_energy_sensor_configs = config.get("energy_consumption_sensors", {})
             
@@ -448,8 +552,8 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
             self._energy_offsets = {}
             self._energy_sensor_configs = {}
 
-        # Lade persistierte Zählerstände (falls vorhanden) mit Reparatur-Funktion
-        if os.path.exists(self._persist_file):
+        # Lade persistierte Zählerstände (Snapshot + Journal, falls vorhanden) mit Reparatur-Funktion
+        if self._persist_store.exists():
             data = await self._repair_and_load_persist_file()
         else:
             data = {}
@@ -467,6 +571,9 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
         self._sensor_ids = data.get("sensor_ids", {})
         self._thermal_sensor_ids = data.get("thermal_sensor_ids", {})
         self._energy_sensor_states = data.get("energy_sensor_states", {})
+        # Perioden-Baselines in einem Schritt laden (vor dem Hinzufügen der Entities)
+        loaded_baselines = self.rollup_baselines.load(data.get("rollup_baselines", {}))
+        _LOGGER.debug("Loaded %d rollup baselines", loaded_baselines)
         # Energy Offsets werden bereits aus der Config geladen
 
         # last_energy_reading: Bei Sensor-Wechsel sofort auf None setzen (bevor es verwendet wird),
@@ -752,6 +859,12 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
             self.sensor_overrides = await self._load_sensor_overrides()
             _LOGGER.debug("Loaded sensor name overrides: %s", self.sensor_overrides)
 
+            # Änderungen an lambda_wp_config.yaml (mtime) ohne Reload übernehmen
+            if self._unsub_config_listener is None:
+                self._unsub_config_listener = async_get_config_service(self.hass).async_add_listener(
+                    self._apply_reloaded_config
+                )
+
             # Initialize HA started flag
             self._ha_started = False
 
@@ -853,50 +966,18 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
             if address not in unique_addresses:
                 unique_addresses[address] = sensor_info
 
-        # Sort addresses for potential batch optimization
-        sorted_addresses = sorted(unique_addresses.keys())
-
-        # Group addresses for batch reading, avoiding INT32 boundaries and mixed types
-        batches = []
-        current_batch = []
-        current_type = None
-        last_addr = None
-
         def get_type(addr):
             return unique_addresses[addr].get("data_type", "uint16")
 
-        for addr in sorted_addresses:
-            dtype = get_type(addr)
-            # If INT32, always treat as a pair (addr, addr+1)
-            if dtype == "int32":
-                # If current batch is not empty, flush it first
-                if current_batch:
-                    batches.append(current_batch)
-                    current_batch = []
-                    current_type = None
-                # Add both registers as a single batch
-                batches.append([addr, addr + 1])
-                last_addr = addr + 1
-                continue
-            # For INT16/UINT16, group only if consecutive and same type
-            if (
-                not current_batch
-                or addr != last_addr + 1
-                or current_type != dtype
-                or len(current_batch) >= 100  # Modbus max 125 holding regs; 100 = safe margin
-            ):
-                if current_batch:
-                    batches.append(current_batch)
-                current_batch = [addr]
-                current_type = dtype
-            else:
-                current_batch.append(addr)
-            last_addr = addr
-        if current_batch:
-            batches.append(current_batch)
+        # Group addresses for batch reading, avoiding INT32 boundaries and mixed types
+        batches = plan_register_batches(unique_addresses)
 
         # Read batches
         for batch in batches:
+            # Gestufter Erststart: bereits gelesene Werte sofort publizieren
+            self._publish_partial(data)
+            batch_started = time.perf_counter()
+            mode = BATCH_MODE_INDIVIDUAL
             try:
                 # If batch is a single INT32 (2 addresses), handle as such
                 if len(batch) == 2 and get_type(batch[0]) == "int32":
@@ -936,6 +1017,7 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
                     continue
 
                 _LOGGER.debug("Reading batch: start=%s, count=%s", start_addr, count)
+                mode = BATCH_MODE_BATCH
                 result = await async_read_holding_registers(
                     self.client,
                     start_addr,
@@ -944,6 +1026,7 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
                 )
 
                 if hasattr(result, "isError") and result.isError():
+                    mode = BATCH_MODE_FAILED
                     # Erhöhe Fehlerzähler
                     self._batch_failures[batch_key] = self._batch_failures.get(batch_key, 0) + 1
                     
@@ -1019,6 +1102,7 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
                     self._individual_read_addresses.remove(batch_key)
                     _LOGGER.info("Batch reads restored for %s-%s", start_addr, start_addr + count - 1)
             except Exception as ex:
+                mode = BATCH_MODE_FALLBACK
                 _LOGGER.info(
                     "❌ MODBUS READ FAILED: Batch read error, addresses=%s, error=%s, caller=_async_update_data",
                     f"{batch[0]}-{batch[-1]}", ex
@@ -1027,6 +1111,10 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
                     await self._read_single_register(
                         addr, address_list[addr], sensor_mapping, data
                     )
+            finally:
+                self.perf_trace.record_batch(
+                    batch[0], len(batch), mode, (time.perf_counter() - batch_started) * 1000
+                )
         return data
 
     async def _read_single_register(self, address, sensor_info, sensor_mapping, data):
@@ -1035,9 +1123,6 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
             sensor_id = sensor_mapping[address]
             count = 2 if sensor_info.get("data_type") == "int32" else 1
 
-            _LOGGER.debug(
-                f"Address {address} polling status: enabled=True (entity-based)"
-            )
             result = await async_read_holding_registers(
                 self.client,
                 address,
@@ -1046,7 +1131,7 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
             )
 
             if hasattr(result, "isError") and result.isError():
-                _LOGGER.debug("Error reading register %s: %s", address, result)
+                self._hot_log.debug_sampled(("read_error", address), "Error reading register %s: %s", address, result)
                 return
 
             if count == 2:
@@ -1062,10 +1147,178 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
 
             data[sensor_id] = value
             self._global_register_cache[address] = value
-            _LOGGER.debug("Cached register %s = %s", address, value)
+            self._hot_log.debug_sampled(("cached", address), "Cached register %s = %s", address, value)
+
+        except Exception as ex:
+            self._hot_log.warning_limited(
+                ("read_failed", address),
+                "MODBUS READ FAILED: address=%s, error=%s, caller=_async_update_data",
+                address,
+                ex,
+            )
+
+    async def async_startup_refresh(self) -> None:
+        """Gestufter Erststart: kritische Register lesen, den Rest im Hintergrund nachladen.
 
+        Ersetzt das blockierende ``async_refresh()`` im Setup. Gelesen werden nur
+        ``STARTUP_CRITICAL_SENSORS`` (Betriebszustände, Temperaturen der
+        Klima-Entities), begrenzt auf ``STARTUP_CRITICAL_TIMEOUT``. Das erste
+        vollständige Update läuft anschließend als Hintergrund-Task und
+        publiziert seine Werte batchweise.
+        """
+        try:
+            critical = await asyncio.wait_for(
+                self._read_critical_registers(), timeout=STARTUP_CRITICAL_TIMEOUT
+            )
+            _LOGGER.info("STARTUP: %d critical values read (coordinator_id=%s)", len(critical), id(self))
+        except asyncio.TimeoutError:
+            critical = {}
+            _LOGGER.warning(
+                "STARTUP: Critical registers not read within %ss, continuing in background (coordinator_id=%s)",
+                STARTUP_CRITICAL_TIMEOUT, id(self),
+            )
         except Exception as ex:
-            _LOGGER.warning("MODBUS READ FAILED: address=%s, error=%s, caller=_async_update_data", address, ex)
+            critical = {}
+            _LOGGER.warning("STARTUP: Critical register read failed: %s (coordinator_id=%s)", ex, id(self))
+        self._publish_partial(critical)
+
+        self._startup_fill_task = self.entry.async_create_background_task(
+            self.hass, self._async_startup_fill(), f"{DOMAIN}_startup_fill_{self.entry.entry_id}"
+        )
+
+    async def async_wait_startup_complete(self) -> None:
+        """Warten, bis das erste vollständige Update (Startup-Fill) abgeschlossen ist."""
+        await self._startup_done.wait()
+
+    async def _read_critical_registers(self) -> dict:
+        """Nur die Register aus ``STARTUP_CRITICAL_SENSORS`` lesen (ein globaler Batch)."""
+        await wait_for_stable_connection(self)
+        self._global_register_cache = {}
+        self._global_register_requests = {}
+        catalog = get_register_catalog(get_firmware_version_int(self.entry))
+        counts = {
+            "hp": self.entry.data.get("num_hps", 1),
+            "boil": self.entry.data.get("num_boil", 1),
+            "hc": self.entry.data.get("num_hc", 1),
+        }
+        for device_type, sensor_ids in STARTUP_CRITICAL_SENSORS.items():
+            for module in catalog.slices(device_type, counts[device_type]):
+                for sensor_id, address, sensor_info in module.registers:
+                    if sensor_id not in sensor_ids or not self.is_address_enabled_by_entity(address):
+                        continue
+                    self._add_register_request(address, sensor_info, f"{device_type}{module.idx}_{sensor_id}")
+        return await self._read_all_registers_globally()
+
+    async def _async_startup_fill(self) -> None:
+        """Erstes vollständiges Update im Hintergrund; danach normaler Betrieb."""
+        try:
+            await self.async_refresh()
+        finally:
+            self.startup_complete = True
+            self._startup_done.set()
+            self.async_update_listeners()
+            _LOGGER.info(
+                "STARTUP: First full data update finished (success=%s, coordinator_id=%s)",
+                self.last_update_success, id(self),
+            )
+
+    @callback
+    def _publish_partial(self, values: dict) -> None:
+        """Teil-Daten während des gestuften Erststarts an die Entities weitergeben."""
+        if self.startup_complete or not values:
+            return
+        self.data = {**(self.data or {}), **values}
+        self.async_update_listeners()
+
+    async def async_detect_modules(self) -> dict:
+        """Modul-Auto-Detection anfordern und auf das Ergebnis warten.
+
+        Die Proben laufen am Ende der nächsten Update-Zyklen (höchstens
+        AUTO_DETECT_PROBES_PER_CYCLE pro Zyklus), konkurrieren also nicht mit
+        den regulären Reads um den Bus.
+        """
+        if self._module_probe_future is None or self._module_probe_future.done():
+            self._module_probe = ModuleProbe()
+            self._module_probe_future = self.hass.loop.create_future()
+        return await asyncio.shield(self._module_probe_future)
+
+    async def _run_module_probes(self) -> None:
+        """Nächste Portion des Probe-Plans ausführen (falls eine Auto-Detection angefordert ist)."""
+        probe = self._module_probe
+        if probe is None:
+            return
+        for module_type, module_idx, address in probe.next_probes(AUTO_DETECT_PROBES_PER_CYCLE):
+            found = await probe_module_slot(self.client, self.slave_id, address)
+            probe.record(module_type, module_idx, found)
+        if not probe.done:
+            return
+        detected = probe.detected()
+        _LOGGER.info("Auto-detected modules: %s", detected)
+        self._module_probe = None
+        if self._module_probe_future is not None and not self._module_probe_future.done():
+            self._module_probe_future.set_result(detected)
+
+    def _decode_registers(self, registers, sensor_info):
+        """Register-Rohwerte (1 bzw. 2 bei INT32) in den skalierten Wert umrechnen."""
+        if sensor_info.get("data_type") == "int32":
+            register_order = (
+                sensor_info.get("register_order")
+                or sensor_info.get("byte_order")
+                or self._int32_register_order
+            )
+            value = to_signed_32bit(combine_int32_registers(list(registers[:2]), register_order))
+        else:
+            value = registers[0]
+            if sensor_info.get("data_type") == "int16":
+                value = to_signed_16bit(value)
+        if "scale" in sensor_info:
+            value = value * sensor_info["scale"]
+        return value
+
+    async def async_read_register_range(self, address_info: dict) -> dict:
+        """Diagnose-Read über den Batch-Planer (ohne Register-Cache und Entity-Filter).
+
+        Args:
+            address_info: ``{address: {"data_type": ..., "scale": ...}}``
+
+        Returns:
+            ``{"values": {address: value}, "errors": {address: str}, "transactions": int}``
+        """
+        values: dict = {}
+        errors: dict = {}
+        transactions = 0
+        slave_id = self.entry.data.get("slave_id", 1)
+
+        async def _read(start, count):
+            nonlocal transactions
+            transactions += 1
+            result = await async_read_holding_registers(self.client, start, count, slave_id)
+            if hasattr(result, "isError") and result.isError():
+                raise Exception(f"Modbus error: {result}")
+            return result.registers
+
+        for batch in plan_register_batches(address_info):
+            if address_info[batch[0]].get("data_type") == "int32":
+                addresses = [batch[0]]
+            else:
+                addresses = batch
+            count = len(batch)
+            try:
+                registers = await _read(batch[0], count)
+                for offset, addr in enumerate(addresses):
+                    values[addr] = self._decode_registers(registers[offset:], address_info[addr])
+                continue
+            except Exception as ex:
+                if len(addresses) == 1:
+                    errors[addresses[0]] = str(ex)
+                    continue
+            # Batch fehlgeschlagen: einzeln lesen, damit der Rest des Blocks geliefert wird
+            for addr in addresses:
+                try:
+                    values[addr] = self._decode_registers(await _read(addr, 1), address_info[addr])
+                except Exception as ex:
+                    errors[addr] = str(ex)
+        return {"values": values, "errors": errors, "transactions": transactions}
 
     async def _read_general_sensors_batch(self, data):
         """Read general sensors using global register collection."""
@@ -1140,7 +1393,7 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
             await self._update_entity_address_mapping()
 
             # Register listener for entity registry changes via event bus
-            self.hass.bus.async_listen(
+            self._registry_listener = self.hass.bus.async_listen(
                 "entity_registry_updated", self._on_entity_registry_changed
             )
 
@@ -1154,120 +1407,65 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Failed to setup entity registry monitoring: %s", str(e))
             raise
 
+    def _build_entity_address_index(self) -> EntityAddressIndex:
+        """Kandidaten (Entity-ID-Schreibweisen, Unique-IDs) -> Adresse einmalig aus den Templates bauen."""
+        index = EntityAddressIndex()
+        name_prefix = normalize_name_prefix(self.entry.data.get("name", ""))
+        catalog = get_register_catalog(get_firmware_version_int(self.entry))
+
+        counts = [
+            ("hp", self.entry.data.get("num_hps", 1)),
+            ("boil", self.entry.data.get("num_boil", 1)),
+            ("buff", self.entry.data.get("num_buff", 0)),
+            ("sol", self.entry.data.get("num_sol", 0)),
+            ("hc", self.entry.data.get("num_hc", 1)),
+        ]
+        for prefix, count in counts:
+            for module in catalog.slices(prefix, count):
+                idx = module.idx
+                for sensor_id, address, _sensor_info in module.registers:
+                    # Entity-IDs (legacy und neues Format), danach Unique-IDs
+                    index.add_candidate(f"sensor.{name_prefix}_{prefix}{idx}_{sensor_id}", address)
+                    index.add_candidate(f"sensor.{name_prefix}_{prefix.upper()}{idx}_{sensor_id}", address)
+                    index.add_candidate(f"sensor.{name_prefix}{prefix}{idx}_{sensor_id}", address)
+                    index.add_candidate(f"{name_prefix}_{prefix}{idx}_{sensor_id}", address)
+                    index.add_candidate(f"{prefix}{idx}_{sensor_id}", address)
+
+        # Also add general sensors (SENSOR_TYPES)
+        for sensor_id, sensor_info in SENSOR_TYPES.items():
+            index.add_candidate(f"sensor.{name_prefix}_{sensor_id}", sensor_info["address"])
+            index.add_candidate(f"{name_prefix}_{sensor_id}", sensor_info["address"])
+
+        return index
+
     async def _update_entity_address_mapping(self):
-        """Update the mapping of entity_id to register address."""
+        """Initialer Abgleich des Adress-Index mit der Entity-Registry (vollständig)."""
         if not self._entity_registry:
             return
 
         try:
-            # Get all entities for this integration
+            if self._address_index is None:
+                self._address_index = self._build_entity_address_index()
+                self._entity_address_mapping = self._address_index.entity_addresses
+            index = self._address_index
             entities = self._entity_registry.entities
 
-            # Reset mappings
-            self._entity_address_mapping.clear()
+            index.clear_entities()
             self._enabled_addresses.clear()
 
-            # Get device counts from config
-            num_hps = self.entry.data.get("num_hps", 1)
-            num_boil = self.entry.data.get("num_boil", 1)
-            num_buff = self.entry.data.get("num_buff", 0)
-            num_sol = self.entry.data.get("num_sol", 0)
-            num_hc = self.entry.data.get("num_hc", 1)
-
-            # Get firmware version for sensor filtering
-            fw_version = get_firmware_version_int(self.entry)
-
-            # Templates for each device type
-            templates = [
-                (
-                    "hp",
-                    num_hps,
-                    get_compatible_sensors(HP_SENSOR_TEMPLATES, fw_version),
-                ),
-                (
-                    "boil",
-                    num_boil,
-                    get_compatible_sensors(BOIL_SENSOR_TEMPLATES, fw_version),
-                ),
-                (
-                    "buff",
-                    num_buff,
-                    get_compatible_sensors(BUFF_SENSOR_TEMPLATES, fw_version),
-                ),
-                (
-                    "sol",
-                    num_sol,
-                    get_compatible_sensors(SOL_SENSOR_TEMPLATES, fw_version),
-                ),
-                ("hc", num_hc, get_compatible_sensors(HC_SENSOR_TEMPLATES, fw_version)),
-            ]
-
-            # Build mapping for each device type
-            for prefix, count, template in templates:
-                for idx in range(1, count + 1):
-                    base_address = generate_base_addresses(prefix, count)[idx]
-                    for sensor_id, sensor_info in template.items():
-                        address = base_address + sensor_info["relative_address"]
-
-                        # Create potential entity IDs (both legacy and new format)
-                        name_prefix = normalize_name_prefix(
-                            self.entry.data.get("name", "")
-                        )
-                        potential_entity_ids = [
-                            f"sensor.{name_prefix}_{prefix}{idx}_{sensor_id}",
-                            f"sensor.{name_prefix}_{prefix.upper()}{idx}_{sensor_id}",
-                            f"sensor.{name_prefix}{prefix}{idx}_{sensor_id}",
-                        ]
-
-                        # Check if any variant exists and is enabled
-                        for entity_id in potential_entity_ids:
-                            if entity_id in entities:
-                                entity = entities[entity_id]
-                                self._entity_address_mapping[entity_id] = address
-
-                                # Check if entity is enabled (not disabled)
-                                if not entity.disabled:
-                                    self._enabled_addresses.add(address)
-                                    _LOGGER.debug(
-                                        "Entity %s (address %d) is enabled",
-                                        entity_id,
-                                        address,
-                                    )
-                                else:
-                                    _LOGGER.debug(
-                                        "Entity %s (address %d) is disabled",
-                                        entity_id,
-                                        address,
-                                    )
-                                break
-
-            # Also add general sensors (SENSOR_TYPES)
-            for sensor_id, sensor_info in SENSOR_TYPES.items():
-                address = sensor_info["address"]
-                entity_id = f"sensor.{name_prefix}_{sensor_id}"
-
-                if entity_id in entities:
-                    entity = entities[entity_id]
-                    self._entity_address_mapping[entity_id] = address
-
-                    if not entity.disabled:
-                        self._enabled_addresses.add(address)
-                        _LOGGER.debug(
-                            "General entity %s (address %d) is enabled",
-                            entity_id,
-                            address,
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "General entity %s (address %d) is disabled",
-                            entity_id,
-                            address,
-                        )
+            for entity_id in index.candidate_entity_ids():
+                entity = entities.get(entity_id)
+                if entity is None:
+                    continue
+                address = index.resolve(entity_id)
+                if index.apply(entity_id, address, not entity.disabled):
+                    self._enabled_addresses.add(address)
 
             _LOGGER.debug(
-                "Updated entity mappings: %d entities, %d enabled addresses",
+                "Updated entity mappings: %d entities, %d enabled addresses (%d index keys)",
                 len(self._entity_address_mapping),
                 len(self._enabled_addresses),
+                len(index),
             )
 
         except Exception as e:
@@ -1275,29 +1473,51 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
 
     @callback
     def _on_entity_registry_changed(self, event):
-        """Handle entity registry changes with debounce to avoid excessive Modbus reads."""
+        """Registry-Event inkrementell anwenden: nur die betroffene Entity und ihre Adresse."""
+        index = self._address_index
+        if index is None:
+            return
         try:
             data = event.data
             entity_id = data.get("entity_id")
-            _name_prefix = normalize_name_prefix(self.entry.data.get("name", ""))
-            if entity_id and _name_prefix and entity_id.startswith(
-                f"sensor.{_name_prefix}_"
-            ):
-                _LOGGER.debug("Entity registry change for %s: %s", entity_id, data)
+            if not entity_id or not entity_id.startswith("sensor."):
+                return
 
-                # Cancel pending update if one is already scheduled
-                if self._registry_update_cancel is not None:
-                    self._registry_update_cancel()
-                    self._registry_update_cancel = None
+            action = data.get("action")
+            if action == "remove":
+                address, still_enabled = index.remove(entity_id)
+                if address is not None and not still_enabled:
+                    self._enabled_addresses.discard(address)
+                    _LOGGER.debug("Entity %s removed - address %d no longer polled", entity_id, address)
+                return
 
-                @callback
-                def _delayed_update(_now):
-                    self._registry_update_cancel = None
-                    self.hass.async_create_task(self._update_entity_address_mapping())
+            old_entity_id = data.get("old_entity_id")
+            if old_entity_id:
+                index.rename(old_entity_id, entity_id)
 
-                self._registry_update_cancel = async_call_later(
-                    self.hass, 0.25, _delayed_update
-                )
+            registry_entry = self._entity_registry.async_get(entity_id) if self._entity_registry else None
+            if registry_entry is None:
+                return
+            address = index.resolve(entity_id)
+            if address is None:
+                # Umbenannte Entity dieser Integration: über die Unique-ID zuordnen
+                if registry_entry.config_entry_id != self.entry.entry_id:
+                    return
+                address = index.resolve(None, registry_entry.unique_id)
+                if address is None:
+                    return
+
+            if index.apply(entity_id, address, not registry_entry.disabled):
+                self._enabled_addresses.add(address)
+            else:
+                self._enabled_addresses.discard(address)
+            _LOGGER.debug(
+                "Entity registry %s for %s (address %d): enabled=%s",
+                action,
+                entity_id,
+                address,
+                not registry_entry.disabled,
+            )
 
         except Exception as e:
             _LOGGER.error("Error handling entity registry change: %s", str(e))
@@ -1305,13 +1525,7 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
     def is_address_enabled_by_entity(self, address: int) -> bool:
         """Check if a register address should be polled based on entity state."""
         # Use simple enabled addresses set from entity lifecycle methods
-        is_enabled = address in self._enabled_addresses
-
-        _LOGGER.debug(
-            "Address %d polling status: enabled=%s (entity-based)", address, is_enabled
-        )
-
-        return is_enabled
+        return address in self._enabled_addresses
 
     def is_register_disabled(self, address: int) -> bool:
         """Check if a register is disabled."""
@@ -1319,35 +1533,16 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error("disabled_registers not initialized")
             return False
 
-        # Debug: Ausgabe der Typen und Inhalte
-        _LOGGER.debug(
-            "Check if address %r (type: %s) is in disabled_registers: %r (types: %r)",
-            address,
-            type(address),
-            self.disabled_registers,
-            {type(x) for x in self.disabled_registers},
-        )
-
         is_disabled = is_register_disabled(address, self.disabled_registers)
         if is_disabled:
-            _LOGGER.debug(
-                "Register %d is disabled (in set: %s)",
-                address,
-                self.disabled_registers,
-            )
-        else:
-            _LOGGER.debug(
-                "Register %d is not disabled (checked against set: %s)",
-                address,
-                self.disabled_registers,
+            self._hot_log.debug_sampled(
+                ("register_disabled", address), "Register %d is disabled", address
             )
         return is_disabled
 
     async def _connect(self) -> None:
-        """Connect to the Modbus device."""
+        """Connect to the Modbus device (shared connection per host:port, see connection_pool.py)."""
         try:
-            from pymodbus.client import AsyncModbusTcpClient
-
             if (
                 self.client
                 and hasattr(self.client, "connected")
@@ -1357,16 +1552,12 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
                 return
 
             _LOGGER.info("🔌 MODBUS CONNECT: Starting connection to %s:%s (coordinator_id=%s)", self.host, self.port, id(self))
-            self.client = AsyncModbusTcpClient(
-                host=self.host, port=self.port, timeout=10
-            )
-
-            if not await self.client.connect():
-                msg = f"Failed to connect to {self.host}:{self.port}"
-                _LOGGER.warning("MODBUS CONNECT: Failed to connect to %s:%s", self.host, self.port)
-                raise UpdateFailed(msg)
+            self.client = await self._connection_pool.async_acquire(self.host, self.port, self)
 
-            _LOGGER.info("MODBUS CONNECT: Successfully connected to %s:%s (coordinator_id=%s)", self.host, self.port, id(self))
+            _LOGGER.info(
+                "MODBUS CONNECT: Successfully connected to %s:%s (users=%d, coordinator_id=%s)",
+                self.host, self.port, self._connection_pool.users(self.host, self.port), id(self),
+            )
 
         except Exception as e:
             _LOGGER.warning("MODBUS CONNECT: Failed to connect to %s:%s, error=%s (coordinator_id=%s)", self.host, self.port, e, id(self))
@@ -1374,6 +1565,17 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
             msg = f"Connection failed: {e}"
             raise UpdateFailed(msg) from e
 
+    def release_client(self) -> None:
+        """Give the shared connection back to the pool (the last user closes it)."""
+        if self.client is None:
+            return
+        try:
+            self._connection_pool.release(self.host, self.port, self)
+        except Exception as ex:
+            _LOGGER.debug("Error releasing Modbus connection: %s", ex)
+        finally:
+            self.client = None
+
     def _cycling_entities_ready(self) -> bool:
         """Check whether cycling counter entities are registered and ready."""
         try:
@@ -1532,8 +1734,12 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
         """Fast poll: read HP_OPERATING_STATE (1003) and compressor_unit_rating (1010) for edge detection.
 
         Runs on fast_update_interval (default 2s). Serialized with the full update
-        via _modbus_lock. Skips this cycle if the lock is already held.
+        via _modbus_lock. Skips this cycle if the lock is already held; it never
+        waits for or skips because of the fleet-wide limit (no fleet slot needed).
         """
+        self.perf_trace.record_fast_tick(
+            self.entry.options.get("fast_update_interval", DEFAULT_FAST_UPDATE_INTERVAL)
+        )
         if not self._initialization_complete or self.hass.is_stopping or self.client is None:
             return
 
@@ -1541,6 +1747,17 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.debug("Fast poll skipped: full update in progress")
             return
 
+        async with self._fleet.cycle(self._fleet_member, "fast"):
+            profiler = self._profiler
+            with self._profile_scope():
+                await self._async_fast_poll_registers()
+            if profiler is not None:
+                profiler.record_cycle("fast", self._fleet_member.label)
+                if profiler.done and profiler is self._profiler:
+                    self._finish_profiling()
+
+    async def _async_fast_poll_registers(self) -> None:
+        """Read the fast-poll registers of all heat pumps and run edge detection."""
         try:
             num_hps = self.entry.data.get("num_hps", 1)
             data = {}
@@ -1573,7 +1790,116 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.debug("Fast poll error (non-fatal): %s", ex)
 
     async def _async_update_data(self) -> dict:
-        """Fetch data from Lambda device."""
+        """Fetch data from Lambda device.
+
+        Überlappende Aufrufe (z. B. ``async_refresh()`` während des Startup-Fills)
+        starten keinen zweiten Zyklus: sie warten auf den laufenden und übernehmen
+        dessen Ergebnis. Schlug dieser fehl, läuft ein eigener Zyklus.
+        """
+        generation = self._full_update_generation
+        async with self._full_update_lock:
+            if self._full_update_generation != generation:
+                _LOGGER.debug("Full update already completed while waiting, reusing result")
+                return self._full_update_result
+            data = await self._async_run_full_update()
+            self._full_update_result = data
+            self._full_update_generation += 1
+            return data
+
+    async def _async_run_full_update(self) -> dict:
+        """Ein voller Zyklus (gestaffelt und begrenzt über den Fleet-Scheduler)."""
+        if self._fleet_phase_pending and self.startup_complete:
+            # Erster regulärer Zyklus nach dem Start: um den Phasenversatz verschieben,
+            # damit nicht alle Controller im selben Moment pollen (der Versatz bleibt,
+            # da HA den nächsten Zyklus relativ zum Ende des vorherigen plant)
+            self._fleet_phase_pending = False
+            delay = self._fleet_member.phase_offset(self.update_interval.total_seconds())
+            if delay > 0:
+                await asyncio.sleep(delay)
+        if self._profiler is not None and self._profiler.done:
+            # Letzter Zyklus ohne Listener-Update (z. B. fehlgeschlagen): jetzt abschließen
+            self._finish_profiling()
+        async with self._fleet.cycle(self._fleet_member, "full") as fleet_cycle:
+            profiler = self._profiler
+            self._fleet_cycle = fleet_cycle
+            self.perf_trace.begin_cycle()
+            try:
+                with self._profile_scope():
+                    return await self._async_fetch_data()
+            finally:
+                self._fleet_cycle = None
+                self.perf_trace.end_cycle()
+                if profiler is not None:
+                    profiler.record_cycle("full", self._fleet_member.label)
+
+    # --- On-Demand-Profiling ------------------------------------------------
+
+    @property
+    def profiling_active(self) -> bool:
+        return self._profiler is not None
+
+    def start_profiling(self, cycles: int, profiler: CycleProfiler | None = None) -> None:
+        """Die nächsten ``cycles`` vollen Zyklen (plus Fast-Polls und State-Writes) profilieren.
+
+        ``profiler``: gemeinsamer Profiler mehrerer Coordinators (cProfile erlaubt
+        nur einen aktiven Profiler pro Thread); ohne wird ein eigener angelegt.
+        """
+        if self._profiler is not None:
+            raise RuntimeError("Profiling already active")
+        if profiler is None:
+            profiler = CycleProfiler(cycles, self._config_path, self._name_prefix)
+        profiler.attach(self._fleet_member.label)
+        self._profiler = profiler
+        _LOGGER.info("Profiling the next %d update cycles of %s", cycles, self._name_prefix)
+
+    def _profile_scope(self):
+        if self._profiler is None:
+            return contextlib.nullcontext()
+        return self._profiler.capture()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Listener benachrichtigen; bei aktivem Profiling inkl. der State-Writes."""
+        profiler = self._profiler
+        if profiler is None:
+            super().async_update_listeners()
+            return
+        with profiler.capture():
+            super().async_update_listeners()
+        if profiler.done:
+            self._finish_profiling()
+
+    @callback
+    def _finish_profiling(self) -> None:
+        """Profiler abhängen und den Report im Executor schreiben."""
+        profiler, self._profiler = self._profiler, None
+        if profiler is None or not profiler.claim_report():
+            # Gemeinsamer Profiler: den Report schreibt der erste fertige Coordinator
+            return
+        self.entry.async_create_background_task(
+            self.hass,
+            self._async_write_profile_report(profiler),
+            f"{DOMAIN}_profile_report_{self.entry.entry_id}",
+        )
+
+    async def _async_write_profile_report(self, profiler: CycleProfiler) -> None:
+        """Profiling-Report im Executor schreiben und das Ergebnis loggen."""
+        if profiler.error:
+            _LOGGER.warning("Profiling of %s aborted: %s", self._name_prefix, profiler.error)
+        try:
+            pstats_path, summary_path = await self.hass.async_add_executor_job(
+                profiler.write_report
+            )
+        except Exception as ex:
+            _LOGGER.error("Failed to write profiling report: %s", ex)
+            return
+        _LOGGER.info(
+            "Profiling finished (%d full cycles, %d fast polls): %s, %s",
+            profiler.full_cycles, profiler.fast_polls, summary_path, pstats_path,
+        )
+
+    async def _async_fetch_data(self) -> dict:
+        """Read all registers of one full update cycle."""
         self._full_update_running = True
         try:
             _LOGGER.debug("PRODUCTION: Starting data update (coordinator_id=%s)", id(self))
@@ -1592,25 +1918,17 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
             await wait_for_stable_connection(self)
             _LOGGER.debug("COORDINATOR: Connection stable, proceeding with data update")
 
-            # Get firmware version for sensor filtering
-            fw_version = get_firmware_version_int(self.entry)
+            # Fleet-Slot erst jetzt: Verbindungs-Wartezeit belegt keinen globalen Platz
+            if self._fleet_cycle is not None:
+                await self._fleet_cycle.acquire()
 
-            # Filter compatible sensors based on firmware version
-            compatible_hp_sensors = get_compatible_sensors(
-                HP_SENSOR_TEMPLATES, fw_version
-            )
-            compatible_boil_sensors = get_compatible_sensors(
-                BOIL_SENSOR_TEMPLATES, fw_version
-            )
-            compatible_buff_sensors = get_compatible_sensors(
-                BUFF_SENSOR_TEMPLATES, fw_version
-            )
-            compatible_sol_sensors = get_compatible_sensors(
-                SOL_SENSOR_TEMPLATES, fw_version
-            )
-            compatible_hc_sensors = get_compatible_sensors(
-                HC_SENSOR_TEMPLATES, fw_version
-            )
+            # Firmware-gefilterte Templates aus dem vorkompilierten Katalog (einmal pro Firmware gebaut)
+            catalog = get_register_catalog(get_firmware_version_int(self.entry))
+            compatible_hp_sensors = catalog.templates("hp")
+            compatible_boil_sensors = catalog.templates("boil")
+            compatible_buff_sensors = catalog.templates("buff")
+            compatible_sol_sensors = catalog.templates("sol")
+            compatible_hc_sensors = catalog.templates("hc")
 
             data = {}
             update_interval_seconds = self.entry.options.get("update_interval", DEFAULT_UPDATE_INTERVAL)
@@ -1705,6 +2023,8 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
                             ex,
                         )
 
+            self._publish_partial(data)
+
             # Read buffer sensors
             num_buff = self.entry.data.get("num_buff", 0)
             for buff_idx in range(1, num_buff + 1):
@@ -1762,6 +2082,8 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
                             ex,
                         )
 
+            self._publish_partial(data)
+
             # Read solar sensors
             num_sol = self.entry.data.get("num_sol", 0)
             for sol_idx in range(1, num_sol + 1):
@@ -1819,6 +2141,8 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
                             ex,
                         )
 
+            self._publish_partial(data)
+
             # Read heating circuit sensors using global register collection
             num_hc = self.entry.data.get("num_hc", 1)
             for hc_idx in range(1, num_hc + 1):
@@ -1903,9 +2227,10 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
             self._persist_dirty = True
 
             # Energy Consumption Tracking - NACH dem Lesen der Register
-            _LOGGER.debug("DEBUG-001: Starting energy consumption tracking")
             await self._track_energy_consumption(data)
-            _LOGGER.debug("DEBUG-002: Energy consumption tracking completed")
+
+            # Auto-Detection mit niedriger Priorität: Proben nach den regulären Reads
+            await self._run_module_probes()
 
             _LOGGER.debug("PRODUCTION: Data update completed successfully (coordinator_id=%s)", id(self))
             return data
@@ -1914,17 +2239,9 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error("DEBUG-ERROR: Error updating data: %s", ex)
             import traceback
             _LOGGER.error("DEBUG-ERROR: Traceback: %s", traceback.format_exc())
-            if (
-                self.client is not None
-                and hasattr(self.client, "close")
-                and callable(getattr(self.client, "close", None))
-            ):
-                try:
-                    self.client.close()
-                except Exception as close_ex:
-                    _LOGGER.debug("Error closing client connection: %s", close_ex)
-                finally:
-                    self.client = None
+            # Verbindung freigeben (geschlossen wird sie erst, wenn kein
+            # anderer Entry desselben Gateways sie mehr nutzt)
+            self.release_client()
             raise UpdateFailed(f"Error fetching Lambda data: {ex}")
         finally:
             self._full_update_running = False
@@ -1956,33 +2273,34 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def _track_energy_consumption(self, data):
         """Track energy consumption by operating mode."""
-        _LOGGER.debug("DEBUG-004: Entering _track_energy_consumption")
         try:
             # Get number of heat pumps from config entry
             num_hps = self.entry.data.get("num_hps", 1)
-            _LOGGER.debug("DEBUG-005: Number of heat pumps: %s", num_hps)
-            
+
             # Get current operating states for all heat pumps
             current_states = {}
             for hp_idx in range(1, num_hps + 1):
                 state_key = f"hp{hp_idx}_operating_state"
-                _LOGGER.debug("DEBUG-006A: Available keys in data: %s", list(data.keys()))
-                _LOGGER.debug("DEBUG-006B: Looking for key: %s", state_key)
                 if state_key in data:
                     current_states[hp_idx] = data[state_key]
-                    _LOGGER.debug("DEBUG-006C: Found %s = %s", state_key, data[state_key])
                 else:
                     current_states[hp_idx] = 0  # Default to 0 if not available
-                    _LOGGER.debug("DEBUG-006D: Key %s not found, using default 0", state_key)
-                _LOGGER.debug("DEBUG-006: HP%s operating state: %s", hp_idx, current_states[hp_idx])
+                    self._hot_log.debug_sampled(
+                        ("energy_state_missing", hp_idx),
+                        "Key %s not found, using default 0 (available keys: %s)",
+                        state_key,
+                        lazy(sorted, data),
+                    )
+            self._hot_log.debug_sampled("energy_states", "HP operating states: %s", current_states)
 
             # Track energy consumption for each heat pump
-            for hp_idx in range(1, num_hps + 1):
-                _LOGGER.debug("DEBUG-007: Tracking energy consumption for HP%s", hp_idx)
-                await self._track_hp_energy_consumption(hp_idx, current_states[hp_idx], data)
-                _LOGGER.debug("DEBUG-008: Completed tracking energy consumption for HP%s", hp_idx)
-
-            _LOGGER.debug("DEBUG-009: Completed _track_energy_consumption")
+            # COP-Engine sammelt alle Energy-Änderungen des Zyklus und publiziert die COPs danach einmal
+            self.cop_engine.begin_batch()
+            try:
+                for hp_idx in range(1, num_hps + 1):
+                    await self._track_hp_energy_consumption(hp_idx, current_states[hp_idx], data)
+            finally:
+                self.cop_engine.end_batch()
 
         except Exception as ex:
             _LOGGER.error("DEBUG-ERROR: Error tracking energy consumption: %s", ex)
@@ -1991,7 +2309,6 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def _track_hp_energy_consumption(self, hp_idx, current_state, data):
         """Track energy consumption for a specific heat pump (both electrical and thermal)."""
-        _LOGGER.debug("DEBUG-010: Entering _track_hp_energy_consumption for HP%s", hp_idx)
         try:
             # --- ELECTRICAL ENERGY (existing logic) ---
             await self._track_hp_energy_type_consumption(
@@ -2035,14 +2352,16 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
             # Entity-IDs der Sensoren werden in sensor.py mit kleingeschriebenem name_prefix erzeugt
             name_prefix = normalize_name_prefix(self.entry.data.get("name", "")) or "eu08l"
             sensor_entity_id = default_sensor_id_template.format(name_prefix=name_prefix, hp_idx=hp_idx)
-            _LOGGER.debug(
+            self._hot_log.debug_sampled(
+                ("energy_source", hp_idx, sensor_type),
                 "[Energy] HP%s %s: Verwende Modbus-Sensor %s",
                 hp_idx, sensor_type, sensor_entity_id,
             )
         # Get current energy reading from the configured sensor
         current_energy_state = self.hass.states.get(sensor_entity_id)
         if not current_energy_state or current_energy_state.state in ["unknown", "unavailable"]:
-            _LOGGER.debug(
+            self._hot_log.debug_sampled(
+                ("energy_source_unavailable", hp_idx, sensor_type),
                 "[Energy] HP%s %s: Sensor %s nicht verfügbar (state=%s)",
                 hp_idx, sensor_type, sensor_entity_id,
                 current_energy_state.state if current_energy_state else "None",
@@ -2127,10 +2446,8 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
             
             # Get energy offsets for this heat pump
             hp_key = f"hp{hp_idx}"
-            _LOGGER.debug("DEBUG-014: Getting energy offsets for %s", hp_key)
             energy_offsets = self._energy_offsets.get(hp_key, {})
-            _LOGGER.debug("DEBUG-015: Energy offsets for %s: %s", hp_key, energy_offsets)
-            _LOGGER.debug("DEBUG-016: Type of energy_offsets: %s", type(energy_offsets))
+            self._hot_log.debug("Energy offsets for %s: %s", hp_key, energy_offsets)
             
             # Get name prefix from entry data
             name_prefix = normalize_name_prefix(self.entry.data.get("name", "")) or "eu08l"
@@ -2162,19 +2479,41 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
         if self._unsub_fast_poll is not None:
             return
         fast_interval = self.entry.options.get("fast_update_interval", DEFAULT_FAST_UPDATE_INTERVAL)
+        offset = self._fleet_member.phase_offset(fast_interval)
         _LOGGER.info(
-            "Starting fast edge-detection poll at %ds interval", fast_interval
-        )
-        self._unsub_fast_poll = async_track_time_interval(
-            self.hass,
-            self._async_fast_update,
-            timedelta(seconds=fast_interval),
+            "Starting fast edge-detection poll at %ds interval (phase offset %.2fs)",
+            fast_interval,
+            offset,
         )
 
+        @callback
+        def _start(_now=None) -> None:
+            self.perf_trace.reset_fast_ticks()
+            self._unsub_fast_poll = async_track_time_interval(
+                self.hass,
+                self._async_fast_update,
+                timedelta(seconds=fast_interval),
+            )
+
+        if offset > 0:
+            # Bis zum Start hält _unsub_fast_poll den Abbruch des verzögerten Starts
+            self._unsub_fast_poll = async_call_later(self.hass, offset, _start)
+        else:
+            _start()
+
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
         _LOGGER.debug("Shutting down Lambda coordinator")
         try:
+            if self._startup_fill_task is not None and not self._startup_fill_task.done():
+                self._startup_fill_task.cancel()
+                _LOGGER.debug("Cancelled background startup fill")
+            self._startup_fill_task = None
+
+            if self._unsub_config_listener is not None:
+                self._unsub_config_listener()
+                self._unsub_config_listener = None
+
             # Stop periodic updates by unsubscribing from refresh callback
             # This prevents new refresh tasks from being created
             if hasattr(self, "_unsub_refresh") and self._unsub_refresh:
@@ -2192,19 +2531,19 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
                     _LOGGER.debug("Stopped fast edge-detection polling")
                 except Exception as unsub_ex:
                     _LOGGER.debug("Error unsubscribing fast poll: %s", unsub_ex)
+
+            self._fleet.unregister(self._fleet_member)
+            profiler, self._profiler = self._profiler, None
+            if profiler is not None:
+                # Gemeinsamer Profiler: nicht auf die Zyklen dieses Coordinators warten;
+                # war er der letzte offene, wird der Report hier geschrieben
+                profiler.detach(self._fleet_member.label)
+                if profiler.done and profiler.claim_report():
+                    await self._async_write_profile_report(profiler)
             
-            # Close Modbus connection immediately to cancel any pending operations
-            # This should cause any running Modbus operations to fail gracefully
-            if self.client is not None:
-                try:
-                    # Try to close gracefully first
-                    if hasattr(self.client, "close") and callable(getattr(self.client, "close", None)):
-                        self.client.close()
-                        _LOGGER.debug("Closed Modbus client connection")
-                except Exception as close_ex:
-                    _LOGGER.debug("Error closing client connection: %s", close_ex)
-                finally:
-                    self.client = None
+            # Release the Modbus connection immediately to cancel any pending operations;
+            # the pool closes it when no other entry on the same gateway uses it
+            self.release_client()
             
             # Clean up entity registry listener
             if hasattr(self, "_registry_listener") and self._registry_listener:
@@ -2219,26 +2558,60 @@ class LambdaDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Error during coordinator shutdown: %s", ex)
 
     async def _load_sensor_overrides(self) -> dict[str, str]:
-        """Load sensor name overrides from YAML config file."""
-        config_path = os.path.join(self._config_dir, "lambda_wp_config.yaml")
-        if not os.path.exists(config_path):
-            return {}
-        try:
+        """Sensor-Namen-Überschreibungen aus der zentral geparsten lambda_wp_config.yaml."""
+        from .utils import load_lambda_config
 
-            def _read_config():
-                with open(config_path) as f:
-                    content = f.read()
-                    config = yaml.safe_load(content) or {}
-                    overrides = {}
-                    for sensor in config.get("sensors_names_override", []):
-                        if "id" in sensor and "override_name" in sensor:
-                            overrides[sensor["id"]] = sensor["override_name"]
-                    return overrides
-
-            return await self.hass.async_add_executor_job(_read_config)
+        try:
+            config = await load_lambda_config(self.hass)
+            return dict(config.get("sensors_names_override") or {})
         except Exception as e:
             _LOGGER.error("Fehler beim Laden der Sensor-Namen-Überschreibungen: %s", e)
             return {}
 
+    @callback
+    def _apply_reloaded_config(self, config) -> None:
+        """Geänderte lambda_wp_config.yaml ohne Integrations-Reload übernehmen.
+
+        Disabled Registers, Energie-Offsets und die INT32-Register-Reihenfolge
+        wirken ab dem nächsten Zyklus. Deadband/Max-Silence aus state_write_gating
+        werden in den angemeldeten Gates neu aufgelöst, geänderte Cycling-Offsets
+        sofort auf die Total-Sensoren angewendet (Differenz zum applied_offset).
+        Namens-Overrides (sensors_names_override) bestimmen die Keys in ``data``,
+        unter denen bestehende Sensoren lesen (``LambdaSensor._data_key``); sie
+        bleiben daher bis zum Neuladen der Integration unverändert. Precision-
+        Overrides gelten nur für neu angelegte Entities.
+        """
+        from .utils import validate_external_sensors
+
+        cycling_offsets_changed = config["cycling_offsets"] != self._cycling_offsets
+        self.disabled_registers = config["disabled_registers"]
+        self._cycling_offsets = config["cycling_offsets"]
+        self._energy_offsets = config["energy_consumption_offsets"]
+        self.state_write_gating = config["state_write_gating"]
+        if dict(config["sensors_names_override"]) != self.sensor_overrides:
+            _LOGGER.info(
+                "sensors_names_override changed in lambda_wp_config.yaml; "
+                "takes effect after reloading the integration"
+            )
+        for gate in list(self.state_gates):
+            gate.reconfigure(self.state_write_gating)
+        if cycling_offsets_changed:
+            self._reapply_cycling_offsets()
+        self._int32_register_order = config["int32_register_order"]
+        self._energy_sensor_configs = validate_external_sensors(
+            self.hass, config["energy_consumption_sensors"]
+        )
+        _LOGGER.info(
+            "Applied reloaded lambda_wp_config.yaml: %d disabled registers, %d state gates, register order %s",
+            len(self.disabled_registers),
+            len(self.state_gates),
+            self._int32_register_order,
+        )
 
-
+    @callback
+    def _reapply_cycling_offsets(self) -> None:
+        """Geänderte cycling_offsets auf die Cycling-Total-Sensoren anwenden."""
+        entry_data = self.hass.data.get(DOMAIN, {}).get(self.entry.entry_id, {})
+        for entity in entry_data.get("cycling_entities", {}).values():
+            if getattr(entity, "_sensor_id", "").endswith("_total") and entity.hass is not None:
+                self.hass.async_create_task(entity._apply_cycling_offset())
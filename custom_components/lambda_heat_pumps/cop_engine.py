@@ -0,0 +1,135 @@
+"""Zentrale COP-Berechnung pro Coordinator.
+
+Statt dass jeder ``LambdaCOPSensor`` (3 Modi × 5 Perioden pro HP) bis zu vier
+Energy-Entities per State-Change-Event abonniert, Strings parst und bei jedem
+Einzel-Update neu rechnet, bekommt die ``COPEngine`` die Werte direkt von den
+Energy-Consumption-Sensoren (``set_energy_value`` des Energy-Trackers, Resets,
+Restore). Geänderte (HP, Modus)-Paare werden gesammelt und einmal pro
+Coordinator-Zyklus (bzw. einmal pro Event-Loop-Durchlauf außerhalb eines
+Zyklus) neu berechnet; jeder COP-Sensor schreibt seinen State nur bei Änderung.
+
+Die Quellwerte (Perioden-Akkumulatoren der Energy-Sensoren) und die
+COP-Baselines aller Sensoren liegen in je einer Tabelle der Engine.
+"""
+
+from __future__ import annotations
+
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+SOURCE_THERMAL = "thermal"
+SOURCE_ELECTRICAL = "electrical"
+
+
+class COPEngine:
+    """Quellwerte, Baselines und Publish-Steuerung aller COP-Sensoren eines Coordinators."""
+
+    def __init__(self, hass=None):
+        self._hass = hass
+        # (hp_index, mode, kind, period) -> aktueller Perioden-Wert in kWh (wie angezeigt)
+        self._sources: dict[tuple, float] = {}
+        # (hp_index, mode, period) -> [thermal_baseline, electrical_baseline]
+        self._baselines: dict[tuple, list] = {}
+        # (hp_index, mode) -> registrierte COP-Sensoren
+        self._sensors: dict[tuple, list] = {}
+        self._pending: set[tuple] = set()
+        self._batch_depth = 0
+        self._flush_scheduled = False
+
+    # ------------------------------------------------------------------
+    # Quellwerte (vom Energy-Tracker)
+    # ------------------------------------------------------------------
+    def update_source(self, hp_index, mode, kind, period, value) -> None:
+        """Neuer Perioden-Wert eines Energy-Sensors (thermal/electrical)."""
+        if value is None:
+            return
+        key = (hp_index, mode, kind, period)
+        value = float(value)
+        if self._sources.get(key) == value:
+            return
+        self._sources[key] = value
+        self._pending.add((hp_index, mode))
+        if self._batch_depth == 0:
+            self._schedule_flush()
+
+    def get_source(self, hp_index, mode, kind, period) -> float | None:
+        """Zuletzt gemeldeter Perioden-Wert oder None (noch nicht gemeldet)."""
+        return self._sources.get((hp_index, mode, kind, period))
+
+    # ------------------------------------------------------------------
+    # Baselines
+    # ------------------------------------------------------------------
+    def get_baseline(self, hp_index, mode, period, kind) -> float | None:
+        entry = self._baselines.get((hp_index, mode, period))
+        if entry is None:
+            return None
+        return entry[0] if kind == SOURCE_THERMAL else entry[1]
+
+    def set_baseline(self, hp_index, mode, period, kind, value) -> None:
+        entry = self._baselines.setdefault((hp_index, mode, period), [None, None])
+        entry[0 if kind == SOURCE_THERMAL else 1] = value
+
+    # ------------------------------------------------------------------
+    # Sensoren und Publish
+    # ------------------------------------------------------------------
+    def register(self, sensor) -> None:
+        """COP-Sensor für Recalculation bei Quelländerungen seines (HP, Modus) registrieren."""
+        sensors = self._sensors.setdefault((sensor._hp_index, sensor._mode), [])
+        if sensor not in sensors:
+            sensors.append(sensor)
+
+    def unregister(self, sensor) -> None:
+        sensors = self._sensors.get((sensor._hp_index, sensor._mode))
+        if sensors and sensor in sensors:
+            sensors.remove(sensor)
+
+    def sensors(self):
+        """Alle registrierten COP-Sensoren (z. B. für den Perioden-Rollover)."""
+        for sensors in self._sensors.values():
+            yield from sensors
+
+    def begin_batch(self) -> None:
+        """Quelländerungen sammeln (z. B. während eines Coordinator-Zyklus)."""
+        self._batch_depth += 1
+
+    def end_batch(self) -> int:
+        """Batch beenden; beim äußersten Batch alle geänderten COPs einmal publizieren."""
+        self._batch_depth = max(0, self._batch_depth - 1)
+        if self._batch_depth == 0:
+            return self.flush()
+        return 0
+
+    def _schedule_flush(self) -> None:
+        if self._flush_scheduled or self._hass is None:
+            return
+        loop = getattr(self._hass, "loop", None)
+        if loop is None or not hasattr(loop, "call_soon"):
+            return
+        self._flush_scheduled = True
+        loop.call_soon(self.flush)
+
+    def flush(self) -> int:
+        """Berechne COPs aller betroffenen (HP, Modus)-Paare neu.
+
+        Returns:
+            Anzahl neu berechneter COP-Sensoren.
+        """
+        self._flush_scheduled = False
+        if not self._pending:
+            return 0
+        pending = self._pending
+        self._pending = set()
+        count = 0
+        for key in pending:
+            for sensor in self._sensors.get(key, ()):
+                if sensor.hass is None:
+                    continue
+                try:
+                    sensor._update_cop()
+                    count += 1
+                except Exception as e:
+                    _LOGGER.debug("COP update failed for %s: %s", sensor.entity_id, e)
+        if count:
+            _LOGGER.debug("COP engine: %d COP sensors recalculated for %d HP/mode pairs", count, len(pending))
+        return count
@@ -0,0 +1,147 @@
+"""Diagnostics support for Lambda Heat Pumps.
+
+Der Download enthält neben der (redigierten) Konfiguration einen
+Performance-Snapshot für Issues zu langsamem Polling: Read-Plan und Batches,
+gelernte Batch-Fehler/Einzel-Reads, Batch-Zeiten der letzten Zyklen,
+Fast-Poll-Jitter, Persist-Writes, Entity-Anzahlen und die effektive
+Polling-Konfiguration. Host-Adressen und Zugangsdaten werden entfernt.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import Counter
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from .const import (
+    DEFAULT_FAST_UPDATE_INTERVAL,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+)
+from .register_catalog import get_register_catalog
+from .utils import get_firmware_version_int
+
+TO_REDACT = {"host", "password", "username", "mac", "serial_number"}
+
+
+def _file_sizes(paths: dict[str, str]) -> dict[str, int | None]:
+    sizes = {}
+    for name, path in paths.items():
+        try:
+            sizes[name] = os.path.getsize(path)
+        except OSError:
+            sizes[name] = None
+    return sizes
+
+
+def _entity_counts(hass: HomeAssistant, entry: ConfigEntry, entry_data: dict) -> dict[str, Any]:
+    registry = er.async_get(hass)
+    entries = er.async_entries_for_config_entry(registry, entry.entry_id)
+    return {
+        "total": len(entries),
+        "disabled": sum(1 for reg_entry in entries if reg_entry.disabled_by),
+        "by_platform": dict(Counter(reg_entry.domain for reg_entry in entries)),
+        "by_device_class": dict(
+            Counter(
+                reg_entry.device_class or reg_entry.original_device_class or "none"
+                for reg_entry in entries
+            )
+        ),
+        "cycling_entities": len(entry_data.get("cycling_entities", {})),
+        "energy_entities": len(entry_data.get("energy_entities", {})),
+    }
+
+
+def _polling_config(entry: ConfigEntry, coordinator) -> dict[str, Any]:
+    update_interval = entry.options.get("update_interval", DEFAULT_UPDATE_INTERVAL)
+    fast_interval = entry.options.get("fast_update_interval", DEFAULT_FAST_UPDATE_INTERVAL)
+    member = coordinator._fleet_member
+    return {
+        "update_interval": update_interval,
+        "fast_update_interval": fast_interval,
+        "slave_id": coordinator.slave_id,
+        "firmware_version": get_firmware_version_int(entry),
+        "modules": {
+            key: entry.data.get(key)
+            for key in ("num_hps", "num_boil", "num_buff", "num_sol", "num_hc")
+        },
+        "int32_register_order": coordinator._int32_register_order,
+        "disabled_registers": sorted(getattr(coordinator, "disabled_registers", set())),
+        "enabled_addresses": len(coordinator._enabled_addresses),
+        "fleet_slot": member.slot,
+        "phase_offset_s": round(member.phase_offset(update_interval), 2),
+        "fast_phase_offset_s": round(member.phase_offset(fast_interval), 2),
+        "max_batch_failures": coordinator._max_batch_failures,
+        "startup_complete": coordinator.startup_complete,
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
+    diagnostics: dict[str, Any] = {
+        "entry": {
+            "version": entry.version,
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "entities": _entity_counts(hass, entry, entry_data),
+    }
+
+    coordinator = entry_data.get("coordinator")
+    if coordinator is None:
+        return diagnostics
+
+    performance = coordinator.perf_trace.as_dict()
+    persist_store = coordinator._persist_store
+    fleet_stats = coordinator._fleet.stats()
+    connection = coordinator._connection_pool.stats().get(
+        f"{coordinator.host}:{coordinator.port}", {}
+    )
+
+    diagnostics.update(
+        {
+            "polling": _polling_config(entry, coordinator),
+            "read_plan": performance.pop("read_plan"),
+            "learned": {
+                "batch_failures": [
+                    {"start": start, "count": count, "failures": failures}
+                    for (start, count), failures in sorted(coordinator._batch_failures.items())
+                ],
+                "individual_read_batches": [
+                    {"start": start, "count": count}
+                    for start, count in sorted(coordinator._individual_read_addresses)
+                ],
+            },
+            "performance": performance,
+            "persist_files": await hass.async_add_executor_job(
+                _file_sizes,
+                {
+                    "snapshot_bytes": persist_store.snapshot_path,
+                    "journal_bytes": persist_store.journal_path,
+                },
+            ),
+            # Nur Fleet-Summen und der eigene Eintrag (Labels anderer Entries enthalten Hosts)
+            "fleet": {
+                "members": fleet_stats["members"],
+                "max_concurrent": fleet_stats["max_concurrent"],
+                "cycles": fleet_stats["cycles"],
+                "this_entry": fleet_stats["per_member"].get(coordinator._fleet_member.label, {}),
+            },
+            "connection": connection,
+            "setup_ms": {
+                **entry_data.get("platform_setup_ms", {}),
+                "register_catalog_build": round(
+                    get_register_catalog(get_firmware_version_int(entry)).build_ms, 2
+                ),
+            },
+        }
+    )
+    return diagnostics
@@ -0,0 +1,105 @@
+"""Reverse-Index Entity-ID/Unique-ID -> Modbus-Register-Adresse.
+
+Der Coordinator pollt nur Register, deren Entity in der Entity-Registry
+aktiviert ist. Früher wurde bei jedem ``entity_registry_updated``-Event das
+komplette Mapping verworfen und durch Proben aller Entity-ID-Schreibweisen
+gegen die Registry neu aufgebaut. ``EntityAddressIndex`` hält stattdessen
+
+- die Kandidaten (alle Schreibweisen der Entity-ID sowie Unique-IDs) -> Adresse,
+  einmal aus den Templates gebaut,
+- pro bekannter Entity deren Adresse und Enabled-Bit,
+- pro Adresse die Menge der aktivierten Entities,
+
+sodass ein Registry-Event nur den Eintrag der betroffenen Entity ändert und
+meldet, ob sich der Poll-Status der Adresse dadurch geändert hat.
+"""
+
+from __future__ import annotations
+
+
+class EntityAddressIndex:
+    """Kandidaten-Index und inkrementelles Enabled-Tracking pro Adresse."""
+
+    __slots__ = ("_candidates", "_entity_address", "_entity_enabled", "_address_enabled")
+
+    def __init__(self) -> None:
+        self._candidates: dict[str, int] = {}
+        self._entity_address: dict[str, int] = {}
+        self._entity_enabled: dict[str, bool] = {}
+        self._address_enabled: dict[int, set[str]] = {}
+
+    def add_candidate(self, key: str, address: int) -> None:
+        """Entity-ID- oder Unique-ID-Kandidat registrieren (erster Eintrag gewinnt)."""
+        self._candidates.setdefault(key, address)
+
+    def candidate_entity_ids(self):
+        """Alle Entity-ID-Kandidaten (für den initialen Abgleich mit der Registry)."""
+        return (key for key in self._candidates if key.startswith("sensor."))
+
+    def resolve(self, entity_id: str | None, unique_id: str | None = None) -> int | None:
+        """Adresse für eine Entity: bekanntes Mapping, Entity-ID-Kandidat, dann Unique-ID."""
+        if entity_id:
+            address = self._entity_address.get(entity_id)
+            if address is None:
+                address = self._candidates.get(entity_id)
+            if address is not None:
+                return address
+        if unique_id:
+            return self._candidates.get(unique_id)
+        return None
+
+    def apply(self, entity_id: str, address: int, enabled: bool) -> bool:
+        """Entity mit Adresse/Enabled-Bit setzen. True, wenn die Adresse nun gepollt werden soll."""
+        previous = self._entity_address.get(entity_id)
+        if previous is not None and previous != address:
+            self._discard(entity_id, previous)
+        self._entity_address[entity_id] = address
+        self._entity_enabled[entity_id] = enabled
+        enabled_entities = self._address_enabled.setdefault(address, set())
+        if enabled:
+            enabled_entities.add(entity_id)
+        else:
+            enabled_entities.discard(entity_id)
+        return bool(enabled_entities)
+
+    def remove(self, entity_id: str) -> tuple[int | None, bool]:
+        """Entity vergessen. Liefert (Adresse, Adresse weiterhin aktiv)."""
+        address = self._entity_address.pop(entity_id, None)
+        self._entity_enabled.pop(entity_id, None)
+        if address is None:
+            return None, False
+        return address, self._discard(entity_id, address)
+
+    def rename(self, old_entity_id: str, new_entity_id: str) -> None:
+        """Entity-ID-Änderung übernehmen (Adresse und Enabled-Bit bleiben)."""
+        address = self._entity_address.get(old_entity_id)
+        if address is None:
+            return
+        enabled = self._entity_enabled.get(old_entity_id, False)
+        self.remove(old_entity_id)
+        self.apply(new_entity_id, address, enabled)
+
+    def is_address_enabled(self, address: int) -> bool:
+        """True, wenn mindestens eine bekannte Entity dieser Adresse aktiviert ist."""
+        return bool(self._address_enabled.get(address))
+
+    def clear_entities(self) -> None:
+        """Entity-Zustände verwerfen, Kandidaten behalten (Neuabgleich mit der Registry)."""
+        self._entity_address.clear()
+        self._entity_enabled.clear()
+        self._address_enabled.clear()
+
+    @property
+    def entity_addresses(self) -> dict[str, int]:
+        """Entity-ID -> Adresse der in der Registry gefundenen Entities."""
+        return self._entity_address
+
+    def __len__(self) -> int:
+        return len(self._candidates)
+
+    def _discard(self, entity_id: str, address: int) -> bool:
+        enabled_entities = self._address_enabled.get(address)
+        if not enabled_entities:
+            return False
+        enabled_entities.discard(entity_id)
+        return bool(enabled_entities)
@@ -0,0 +1,208 @@
+"""Gemeinsamer Scheduler für mehrere Lambda-Controller (Fleet).
+
+Mehrere Config Entries in einer HA-Instanz starten ihre 30-s-Zyklen und den
+2-s-Fast-Poll praktisch gleichzeitig; CPU-, Netzwerk- und Log-Spitzen fallen
+dadurch zusammen. Der ``FleetScheduler`` wird von allen
+``LambdaDataUpdateCoordinator`` geteilt und
+
+- vergibt jedem Coordinator einen Slot und daraus einen Phasenversatz
+  (Goldener-Schnitt-Folge: gleichmäßig verteilt, bestehende Versätze bleiben
+  stabil, wenn weitere Controller hinzukommen),
+- begrenzt die Anzahl voller Zyklen, die gleichzeitig Register lesen und
+  dekodieren (``FLEET_MAX_CONCURRENT_CYCLES``). Der Slot wird erst nach dem
+  Warten auf eine stabile Verbindung angefordert (``FleetCycle.acquire``) und
+  spätestens nach ``FLEET_SLOT_MAX_HOLD`` Sekunden freigegeben, damit ein
+  Controller mit Timeouts/Retries die anderen nicht blockiert. Fast-Polls
+  belegen keinen Slot und werden nie wegen anderer Controller übersprungen,
+- sammelt Zykluszeiten (Dauer und Wartezeit) pro Art (``full``/``fast``)
+  fleet-weit und pro Coordinator (``stats()``, z. B. für die Diagnose).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from .const import FLEET_MAX_CONCURRENT_CYCLES, FLEET_SLOT_MAX_HOLD
+
+_SCHEDULER_KEY = "_lambda_fleet_scheduler"
+
+# Bruchteil des Goldenen Schnitts: Slot k erhält den Versatz frac(k * φ⁻¹) * Intervall
+_GOLDEN_FRACTION = 0.6180339887498949
+
+
+class CycleStats:
+    """Laufende Statistik einer Zyklus-Art (Dauer und Wartezeit in ms)."""
+
+    __slots__ = ("count", "total_ms", "max_ms", "last_ms", "wait_total_ms", "wait_max_ms", "expired")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms = 0.0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.expired = 0  # Slot wegen FLEET_SLOT_MAX_HOLD vorzeitig freigegeben
+
+    def record(self, duration_ms: float, wait_ms: float) -> None:
+        self.count += 1
+        self.total_ms += duration_ms
+        self.last_ms = duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.wait_total_ms += wait_ms
+        self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 1) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 1),
+            "last_ms": round(self.last_ms, 1),
+            "wait_avg_ms": round(self.wait_total_ms / self.count, 1) if self.count else 0.0,
+            "wait_max_ms": round(self.wait_max_ms, 1),
+            "slot_expired": self.expired,
+        }
+
+
+class FleetMember:
+    """Registrierung eines Coordinators im Fleet-Scheduler."""
+
+    __slots__ = ("label", "slot", "stats")
+
+    def __init__(self, label: str, slot: int) -> None:
+        self.label = label
+        self.slot = slot
+        self.stats: dict[str, CycleStats] = {}
+
+    def phase_offset(self, interval: float) -> float:
+        """Versatz (Sekunden) dieses Coordinators innerhalb eines Intervalls."""
+        if interval <= 0:
+            return 0.0
+        return (self.slot * _GOLDEN_FRACTION) % 1.0 * interval
+
+
+class FleetCycle:
+    """Ein laufender Zyklus; hält den globalen Slot nur zwischen ``acquire`` und ``release``."""
+
+    __slots__ = ("_scheduler", "_held", "_timer", "wait_ms", "expired")
+
+    def __init__(self, scheduler: FleetScheduler) -> None:
+        self._scheduler = scheduler
+        self._held = False
+        self._timer: asyncio.TimerHandle | None = None
+        self.wait_ms = 0.0
+        self.expired = False
+
+    async def acquire(self, max_hold: float | None = None) -> None:
+        """Slot anfordern; wird nach ``max_hold`` Sekunden automatisch freigegeben."""
+        if self._held:
+            return
+        requested = time.perf_counter()
+        await self._scheduler._get_semaphore().acquire()
+        self.wait_ms += (time.perf_counter() - requested) * 1000
+        self._held = True
+        self._scheduler._in_flight += 1
+        hold = self._scheduler.max_hold if max_hold is None else max_hold
+        if hold > 0:
+            self._timer = asyncio.get_running_loop().call_later(hold, self._expire)
+
+    def _expire(self) -> None:
+        self._timer = None
+        if self._held:
+            self.expired = True
+            self.release()
+
+    def release(self) -> None:
+        """Slot freigeben (idempotent)."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._held:
+            self._held = False
+            self._scheduler._in_flight -= 1
+            self._scheduler._get_semaphore().release()
+
+
+class FleetScheduler:
+    """Phasenversatz, globales Concurrency-Limit und Zyklus-Statistik aller Controller."""
+
+    def __init__(
+        self,
+        max_concurrent: int = FLEET_MAX_CONCURRENT_CYCLES,
+        max_hold: float = FLEET_SLOT_MAX_HOLD,
+    ) -> None:
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.max_hold = float(max_hold)
+        self._semaphore: asyncio.Semaphore | None = None
+        self._members: list[FleetMember] = []
+        self._in_flight = 0
+        self._totals: dict[str, CycleStats] = {}
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Lazy, damit der Semaphore erst im laufenden Event-Loop entsteht
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        return self._semaphore
+
+    def register(self, label: str) -> FleetMember:
+        """Coordinator aufnehmen; erhält den kleinsten freien Slot."""
+        used = {member.slot for member in self._members}
+        slot = next(idx for idx in range(len(self._members) + 1) if idx not in used)
+        member = FleetMember(label, slot)
+        self._members.append(member)
+        return member
+
+    def unregister(self, member: FleetMember) -> None:
+        """Coordinator entfernen (Slot wird für den nächsten frei)."""
+        if member in self._members:
+            self._members.remove(member)
+
+    @property
+    def members(self) -> int:
+        return len(self._members)
+
+    @asynccontextmanager
+    async def cycle(self, member: FleetMember, kind: str) -> AsyncIterator[FleetCycle]:
+        """Einen Zyklus messen. Den globalen Slot belegt erst ``FleetCycle.acquire``."""
+        handle = FleetCycle(self)
+        started = time.perf_counter()
+        try:
+            yield handle
+        finally:
+            handle.release()
+            duration_ms = (time.perf_counter() - started) * 1000
+            for stats in (
+                member.stats.setdefault(kind, CycleStats()),
+                self._totals.setdefault(kind, CycleStats()),
+            ):
+                stats.record(duration_ms, handle.wait_ms)
+                if handle.expired:
+                    stats.expired += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Fleet-weite und pro-Coordinator-Zykluszeiten."""
+        return {
+            "members": len(self._members),
+            "max_concurrent": self.max_concurrent,
+            "in_flight": self._in_flight,
+            "cycles": {kind: stats.as_dict() for kind, stats in self._totals.items()},
+            "per_member": {
+                member.label: {
+                    "slot": member.slot,
+                    "cycles": {kind: stats.as_dict() for kind, stats in member.stats.items()},
+                }
+                for member in self._members
+            },
+        }
+
+
+def get_fleet_scheduler(hass) -> FleetScheduler:
+    """Der Fleet-Scheduler dieser HA-Instanz (wird beim ersten Zugriff angelegt)."""
+    scheduler = hass.data.get(_SCHEDULER_KEY)
+    if not isinstance(scheduler, FleetScheduler):
+        scheduler = FleetScheduler()
+        hass.data[_SCHEDULER_KEY] = scheduler
+    return scheduler
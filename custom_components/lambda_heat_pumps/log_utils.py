@@ -0,0 +1,84 @@
+"""Logging-Fassade für Hot-Paths (Update-Zyklus, Register-Reads, Energy-Tracking).
+
+``_LOGGER.debug("...", list(data.keys()))`` baut die Argumente auch dann, wenn
+Debug aus ist, und mit ``debug_mode`` schreibt jeder Zyklus hunderte Zeilen pro
+Register. ``HotPathLogger`` kapselt einen Logger:
+
+- ``debug``: ``isEnabledFor``-Guard vor dem Aufruf,
+- ``lazy(func, *args)``: Argument wird erst beim Formatieren ausgewertet,
+- ``debug_sampled`` / ``warning_limited``: höchstens eine Zeile pro Schlüssel und
+  Intervall, unterdrückte Zeilen werden beim nächsten Durchlass mitgezählt.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from .const import HOT_PATH_LOG_INTERVAL
+
+
+class LazyArg:
+    """Log-Argument, das erst bei der Formatierung berechnet wird."""
+
+    __slots__ = ("_func", "_args")
+
+    def __init__(self, func, *args):
+        self._func = func
+        self._args = args
+
+    def __str__(self) -> str:
+        return str(self._func(*self._args))
+
+    def __repr__(self) -> str:
+        return repr(self._func(*self._args))
+
+
+def lazy(func, *args) -> LazyArg:
+    """``hot_log.debug("Keys: %s", lazy(list, data))`` – list() nur bei aktivem Debug."""
+    return LazyArg(func, *args)
+
+
+class HotPathLogger:
+    """Logger-Wrapper mit Level-Guard und Rate-Limit pro Schlüssel."""
+
+    __slots__ = ("logger", "interval", "_last", "_suppressed")
+
+    def __init__(self, logger: logging.Logger, interval: float = HOT_PATH_LOG_INTERVAL):
+        self.logger = logger
+        self.interval = float(interval)
+        self._last: dict = {}
+        self._suppressed: dict = {}
+
+    @property
+    def debug_enabled(self) -> bool:
+        return self.logger.isEnabledFor(logging.DEBUG)
+
+    def debug(self, msg: str, *args) -> None:
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(msg, *args, stacklevel=2)
+
+    def debug_sampled(self, key, msg: str, *args, now: float | None = None) -> bool:
+        """Debug-Zeile höchstens einmal pro Intervall und Schlüssel."""
+        return self._log_limited(logging.DEBUG, key, msg, args, now)
+
+    def warning_limited(self, key, msg: str, *args, now: float | None = None) -> bool:
+        """Warning höchstens einmal pro Intervall und Schlüssel."""
+        return self._log_limited(logging.WARNING, key, msg, args, now)
+
+    def _log_limited(self, level: int, key, msg: str, args: tuple, now: float | None) -> bool:
+        if not self.logger.isEnabledFor(level):
+            return False
+        if now is None:
+            now = time.monotonic()
+        last = self._last.get(key)
+        if last is not None and now - last < self.interval:
+            self._suppressed[key] = self._suppressed.get(key, 0) + 1
+            return False
+        self._last[key] = now
+        suppressed = self._suppressed.pop(key, 0)
+        if suppressed:
+            msg = f"{msg} (+%d unterdrückt)"
+            args = (*args, suppressed)
+        self.logger.log(level, msg, *args, stacklevel=3)
+        return True
@@ -5,7 +5,6 @@ import functools
 import logging
 import os
 import re
-import shutil
 import yaml
 from datetime import datetime
 from pathlib import Path
@@ -13,6 +12,8 @@ from typing import Any, Dict, Tuple
 
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
 
 
@@ -20,6 +21,8 @@ from .const import DOMAIN, LAMBDA_WP_CONFIG_TEMPLATE
 from .const_migration import (
     MigrationVersion,
     MIGRATION_BACKUP_DIR,
+    MIGRATION_FINGERPRINT_FILE,
+    MIGRATION_VERSION,
     MIGRATION_NAMES,
     BACKUP_RETENTION_DAYS,
     CLEANUP_ON_MIGRATION,
@@ -30,6 +33,15 @@ from .const_migration import (
     DEFAULT_ENERGY_CONSUMPTION_SENSORS,
     DEFAULT_ENERGY_CONSUMPTION_OFFSETS
 )
+from .migration_fingerprint import (
+    build_fingerprint,
+    fingerprint_matches,
+    load_fingerprint,
+    save_fingerprint,
+    stream_copy,
+    stream_copy_files,
+    text_digest,
+)
 from .utils import (
     analyze_file_ageing,
     delete_files,
@@ -74,18 +86,19 @@ async def create_registry_backup(
             "core.config_entries"
         ]
         
-        backup_paths = []
-        for registry_file in registry_files:
-            source_path = os.path.join(config_dir, ".storage", registry_file)
-            dest_path = os.path.join(
-                backup_dir, 
-                f"{registry_file}.{migration_name}_{timestamp}"
+        copy_pairs = [
+            (
+                os.path.join(config_dir, ".storage", registry_file),
+                os.path.join(backup_dir, f"{registry_file}.{migration_name}_{timestamp}"),
             )
-            
-            if await hass.async_add_executor_job(os.path.exists, source_path):
-                await hass.async_add_executor_job(shutil.copy2, source_path, dest_path)
-                backup_paths.append(dest_path)
-                _LOGGER.info("Registry backup erstellt: %s", dest_path)
+            for registry_file in registry_files
+        ]
+
+        # Registry-Dateien können auf großen Installationen viele MB groß sein:
+        # blockweise im Executor kopieren (ein Job für alle Dateien)
+        backup_paths = await hass.async_add_executor_job(stream_copy_files, copy_pairs)
+        for dest_path in backup_paths:
+            _LOGGER.info("Registry backup erstellt: %s", dest_path)
         
         return True, backup_dir
         
@@ -130,7 +143,7 @@ async def create_lambda_config_backup(
             f"lambda_wp_config.{migration_name}_{timestamp}.yaml"
         )
         
-        await hass.async_add_executor_job(shutil.copy2, lambda_config_path, backup_path)
+        await hass.async_add_executor_job(stream_copy, lambda_config_path, backup_path)
         
         _LOGGER.info("Lambda config backup erstellt: %s", backup_path)
         return True, backup_path
@@ -175,6 +188,90 @@ async def rollback_migration(
         return False
 
 
+# =============================================================================
+# MIGRATIONS-FINGERPRINT (schneller Start)
+# =============================================================================
+
+@functools.lru_cache(maxsize=1)
+def _template_digest() -> str:
+    return text_digest(LAMBDA_WP_CONFIG_TEMPLATE)
+
+
+def _registry_schema_marker() -> str:
+    """Speicher-Schema der Registries (ändert sich nur mit Home Assistant selbst)."""
+    return "er{}.{}/dr{}.{}".format(
+        getattr(er, "STORAGE_VERSION_MAJOR", "?"),
+        getattr(er, "STORAGE_VERSION_MINOR", "?"),
+        getattr(dr, "STORAGE_VERSION_MAJOR", "?"),
+        getattr(dr, "STORAGE_VERSION_MINOR", "?"),
+    )
+
+
+def _fingerprint_paths(hass: HomeAssistant) -> Tuple[str, str]:
+    config_dir = hass.config.config_dir
+    return (
+        os.path.join(config_dir, MIGRATION_FINGERPRINT_FILE),
+        os.path.join(config_dir, "lambda_wp_config.yaml"),
+    )
+
+
+async def async_migration_fingerprint_matches(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> bool:
+    """
+    Prüfe in O(1), ob seit der letzten Migration nichts Relevantes geändert wurde.
+
+    Verglichen werden Entry-Version, Template-Hash, Registry-Schema und die
+    lambda_wp_config.yaml (stat, Hash nur bei geänderter mtime). Registry-
+    Dateien werden dabei nicht gelesen.
+
+    Returns:
+        bool: True wenn keine Migration/Prüfung der Config-Datei nötig ist
+    """
+    if config_entry.version != MIGRATION_VERSION:
+        return False
+    try:
+        fingerprint_path, config_path = _fingerprint_paths(hass)
+
+        def _check() -> bool:
+            return fingerprint_matches(
+                load_fingerprint(fingerprint_path),
+                MIGRATION_VERSION,
+                config_path,
+                _template_digest(),
+                _registry_schema_marker(),
+            )
+
+        matches = await hass.async_add_executor_job(_check)
+    except Exception as e:
+        _LOGGER.debug("Migrations-Fingerprint nicht prüfbar: %s", e)
+        return False
+    if matches:
+        _LOGGER.debug("Migrations-Fingerprint unverändert - Migrationsprüfung übersprungen")
+    return bool(matches)
+
+
+async def async_save_migration_fingerprint(hass: HomeAssistant) -> None:
+    """Fingerprint nach abgeschlossener Migration/Prüfung speichern (Fehler werden nur geloggt)."""
+    try:
+        fingerprint_path, config_path = _fingerprint_paths(hass)
+
+        def _save() -> None:
+            save_fingerprint(
+                fingerprint_path,
+                build_fingerprint(
+                    MIGRATION_VERSION,
+                    config_path,
+                    _template_digest(),
+                    _registry_schema_marker(),
+                ),
+            )
+
+        await hass.async_add_executor_job(_save)
+    except Exception as e:
+        _LOGGER.debug("Migrations-Fingerprint konnte nicht gespeichert werden: %s", e)
+
+
 # =============================================================================
 # LAMBDA CONFIG SECTIONS (lambda_wp_config.yaml)
 # Template-basierte Migration: fehlende Abschnitte an richtiger Stelle einfügen,
@@ -684,7 +781,7 @@ async def migrate_to_legacy_names(
 
         # Importiere aktuelle Namenslogik
         from .utils import generate_sensor_names, normalize_name_prefix
-        from .const import CLIMATE_TEMPLATES, HP_SENSOR_TEMPLATES, BOIL_SENSOR_TEMPLATES, HC_SENSOR_TEMPLATES, BUFF_SENSOR_TEMPLATES, SOL_SENSOR_TEMPLATES, SENSOR_TYPES
+        from .const import CLIMATE_TEMPLATES, SENSOR_TYPES
 
         # Hole aktuelle Namensschemata für alle Climate- und Sensor-Entitäten
         entry_data = config_entry.data
@@ -710,14 +807,15 @@ async def migrate_to_legacy_names(
         # Sensoren: aktuelle unique_ids und entity_ids
         valid_sensor_ids = set()
         # HP
-        from .utils import get_firmware_version_int, get_compatible_sensors
-        fw_version = get_firmware_version_int(config_entry)
+        from .utils import get_firmware_version_int
+        from .register_catalog import get_register_catalog
+        catalog = get_register_catalog(get_firmware_version_int(config_entry))
         for prefix, count, template in [
-            ("hp", num_hps, get_compatible_sensors(HP_SENSOR_TEMPLATES, fw_version)),
-            ("boil", num_boil, get_compatible_sensors(BOIL_SENSOR_TEMPLATES, fw_version)),
-            ("buff", num_buff, get_compatible_sensors(BUFF_SENSOR_TEMPLATES, fw_version)),
-            ("sol", num_sol, get_compatible_sensors(SOL_SENSOR_TEMPLATES, fw_version)),
-            ("hc", num_hc, get_compatible_sensors(HC_SENSOR_TEMPLATES, fw_version)),
+            ("hp", num_hps, catalog.templates("hp")),
+            ("boil", num_boil, catalog.templates("boil")),
+            ("buff", num_buff, catalog.templates("buff")),
+            ("sol", num_sol, catalog.templates("sol")),
+            ("hc", num_hc, catalog.templates("hc")),
         ]:
             for idx in range(1, count + 1):
                 device_prefix = f"{prefix}{idx}"
@@ -0,0 +1,168 @@
+"""Migrations-Fingerprint und Streaming-Backups.
+
+Beim Start prüfte die Integration bisher jedes Mal die lambda_wp_config.yaml
+(Lesen + YAML-Parse für die Abschnitts-Migration). Der Fingerprint hält fest,
+in welchem Zustand zuletzt erfolgreich migriert wurde:
+
+- ``entry_version``: Migrationsversion des Config Entries,
+- ``template``: Hash des ``LAMBDA_WP_CONFIG_TEMPLATE``,
+- ``registry_schema``: Speicher-Schema von Entity-/Device-Registry,
+- ``config``: Größe, mtime und SHA-256 der lambda_wp_config.yaml.
+
+Passt alles, ist keine Migration nötig. Der Vergleich kostet ein ``stat`` und
+das Lesen einer kleinen JSON-Datei; die YAML wird nur gehasht, wenn sich
+Größe/mtime geändert haben. Registry-Dateien werden nie gelesen.
+
+``stream_copy`` kopiert große Registry-Dateien blockweise (für Backups im
+Executor) und ersetzt das Ziel atomar. Alle Funktionen sind Blocking I/O.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+from typing import Iterable
+
+_LOGGER = logging.getLogger(__name__)
+
+COPY_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+
+def text_digest(text: str) -> str:
+    """SHA-256 eines Strings (z. B. des Config-Templates)."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def file_digest(path: str, chunk_size: int = COPY_CHUNK_SIZE) -> str | None:
+    """SHA-256 einer Datei (blockweise gelesen), ``None`` wenn sie fehlt."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+def _file_signature(path: str) -> dict | None:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def build_fingerprint(
+    entry_version: int,
+    config_path: str,
+    template_digest: str,
+    registry_schema: str,
+) -> dict:
+    """Aktuellen Fingerprint erzeugen (hasht die Config-Datei)."""
+    signature = _file_signature(config_path)
+    config = None
+    if signature is not None:
+        config = {**signature, "sha256": file_digest(config_path)}
+    return {
+        "entry_version": entry_version,
+        "template": template_digest,
+        "registry_schema": registry_schema,
+        "config": config,
+    }
+
+
+def fingerprint_matches(
+    stored: dict | None,
+    entry_version: int,
+    config_path: str,
+    template_digest: str,
+    registry_schema: str,
+) -> bool:
+    """True wenn sich seit ``stored`` nichts Migrationsrelevantes geändert hat.
+
+    Bei gleicher Größe und mtime wird der gespeicherte Hash übernommen; nur
+    wenn die Datei angefasst wurde, wird sie neu gehasht (``touch`` ohne
+    Inhaltsänderung gilt weiterhin als unverändert).
+    """
+    if not isinstance(stored, dict):
+        return False
+    if (
+        stored.get("entry_version") != entry_version
+        or stored.get("template") != template_digest
+        or stored.get("registry_schema") != registry_schema
+    ):
+        return False
+    stored_config = stored.get("config")
+    if not isinstance(stored_config, dict):
+        return False
+    signature = _file_signature(config_path)
+    if signature is None:
+        return False
+    if (
+        signature["size"] == stored_config.get("size")
+        and signature["mtime_ns"] == stored_config.get("mtime_ns")
+    ):
+        return True
+    return file_digest(config_path) == stored_config.get("sha256")
+
+
+def load_fingerprint(path: str) -> dict | None:
+    """Gespeicherten Fingerprint lesen; fehlend/beschädigt → ``None``."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def save_fingerprint(path: str, fingerprint: dict) -> None:
+    """Fingerprint atomar schreiben."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(fingerprint, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def invalidate_fingerprint(path: str) -> None:
+    """Fingerprint löschen (nächster Start prüft wieder vollständig)."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def stream_copy(source: str, dest: str, chunk_size: int = COPY_CHUNK_SIZE) -> None:
+    """Datei blockweise kopieren (konstanter Speicherbedarf), Ziel atomar ersetzen."""
+    tmp_path = dest + ".tmp"
+    try:
+        with open(source, "rb") as src, open(tmp_path, "wb") as dst:
+            shutil.copyfileobj(src, dst, chunk_size)
+        shutil.copystat(source, tmp_path)
+        os.replace(tmp_path, dest)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def stream_copy_files(pairs: Iterable[tuple[str, str]]) -> list[str]:
+    """``(quelle, ziel)``-Paare kopieren; fehlende Quellen werden übersprungen.
+
+    Returns:
+        Liste der geschriebenen Zielpfade.
+    """
+    written = []
+    for source, dest in pairs:
+        if not os.path.exists(source):
+            continue
+        stream_copy(source, dest)
+        written.append(dest)
+    return written
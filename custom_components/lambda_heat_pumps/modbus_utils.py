@@ -2,6 +2,7 @@
 
 import logging
 import asyncio
+import weakref
 from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
@@ -10,6 +11,9 @@ _LOGGER = logging.getLogger(__name__)
 # when the asyncio loop is destroyed and recreated (e.g. in test environments).
 _health_check_lock: asyncio.Lock | None = None
 _modbus_read_lock: asyncio.Lock | None = None
+# Ein Lock pro Modbus-Client (= Verbindung): Requests auf derselben Verbindung laufen
+# nacheinander (Transaction-IDs), verschiedene Controller blockieren sich nicht gegenseitig
+_client_locks: "weakref.WeakKeyDictionary[Any, asyncio.Lock]" = weakref.WeakKeyDictionary()
 
 
 def _get_health_check_lock() -> asyncio.Lock:
@@ -19,8 +23,17 @@ def _get_health_check_lock() -> asyncio.Lock:
     return _health_check_lock
 
 
-def _get_modbus_read_lock() -> asyncio.Lock:
+def _get_modbus_read_lock(client=None) -> asyncio.Lock:
+    """Lock der Verbindung ``client``; ohne (bzw. nicht weak-referenzierbaren) Client der gemeinsame Lock."""
     global _modbus_read_lock
+    if client is not None:
+        try:
+            lock = _client_locks.get(client)
+            if lock is None:
+                lock = _client_locks[client] = asyncio.Lock()
+            return lock
+        except TypeError:
+            pass
     if _modbus_read_lock is None:
         _modbus_read_lock = asyncio.Lock()
     return _modbus_read_lock
@@ -80,7 +93,7 @@ async def async_read_holding_registers(
 ) -> Any:
     """Read holding registers with Lambda-specific timeout and retry logic.
     
-    Uses a global lock to prevent concurrent Modbus requests that could cause
+    Uses a per-connection lock to prevent concurrent Modbus requests that could cause
     Transaction ID mismatches.
     """
     last_exception = None
@@ -97,7 +110,7 @@ async def async_read_holding_registers(
     # Verwende globalen Lock, um parallele Modbus-Requests zu vermeiden
     # Dies verhindert Transaction ID Mismatches, die auftreten können, wenn
     # mehrere Requests gleichzeitig gesendet werden
-    async with _get_modbus_read_lock():
+    async with _get_modbus_read_lock(client):
         for attempt in range(LAMBDA_MAX_RETRIES):
             try:
                 # For pymodbus 3.11.1, use only address as positional, rest as kwargs
@@ -167,9 +180,9 @@ async def async_read_holding_registers(
 async def async_read_input_registers(
     client, address: int, count: int, slave_id: int = LAMBDA_MODBUS_UNIT_ID
 ) -> Any:
-    """Read input registers with timeout, retry and global lock (M-09).
+    """Read input registers with timeout, retry and per-connection lock (M-09).
 
-    Mirrors async_read_holding_registers: uses _modbus_read_lock to prevent
+    Mirrors async_read_holding_registers: uses the per-connection lock to prevent
     parallel requests and retries up to LAMBDA_MAX_RETRIES times with timeout.
     """
     last_exception = None
@@ -180,7 +193,7 @@ async def async_read_input_registers(
     if not hasattr(client, "connected") or not client.connected:
         raise Exception("Modbus client not connected")
 
-    async with _get_modbus_read_lock():
+    async with _get_modbus_read_lock(client):
         for attempt in range(LAMBDA_MAX_RETRIES):
             try:
                 try:
@@ -245,10 +258,10 @@ async def async_write_register(
 ) -> Any:
     """Write single register with full API compatibility.
     
-    Uses a global lock to prevent concurrent Modbus requests that could cause
+    Uses a per-connection lock to prevent concurrent Modbus requests that could cause
     Transaction ID mismatches.
     """
-    async with _get_modbus_read_lock():
+    async with _get_modbus_read_lock(client):
         try:
             # For pymodbus 3.11.1, use address as positional, rest as kwargs
             try:
@@ -279,10 +292,10 @@ async def async_write_registers(
 ) -> Any:
     """Write multiple registers with full API compatibility.
     
-    Uses a global lock to prevent concurrent Modbus requests that could cause
+    Uses a per-connection lock to prevent concurrent Modbus requests that could cause
     Transaction ID mismatches.
     """
-    async with _get_modbus_read_lock():
+    async with _get_modbus_read_lock(client):
         try:
             api_type = _detect_pymodbus_api(client, "write_registers")
 
@@ -406,43 +419,15 @@ async def get_int32_register_order(hass) -> str:
         Rückwärtskompatibilität: "big" wird zu "high_first", "little" zu "low_first" konvertiert
     """
     try:
+        from .config_service import resolve_int32_register_order
         from .utils import load_lambda_config
         config = await load_lambda_config(hass)
-        modbus_config = config.get("modbus", {})
-        
-        # Prüfe zuerst neue Config, dann alte (für Rückwärtskompatibilität)
-        register_order = modbus_config.get("int32_register_order")
+        # Bereits beim Parsen aufgelöst (Config-Service); Fallback für reine Dict-Configs
+        register_order = config.get("int32_register_order")
         if register_order is None:
-            # Rückwärtskompatibilität: Alte Config migrieren
-            old_byte_order = modbus_config.get("int32_byte_order")
-            if old_byte_order is not None:
-                _LOGGER.info(
-                    "Migration: int32_byte_order gefunden, verwende Wert für int32_register_order. "
-                    "Bitte migrieren Sie Ihre Config zu modbus.int32_register_order"
-                )
-                register_order = old_byte_order
-            else:
-                register_order = "high_first"  # Standard
-        
-        # Rückwärtskompatibilität: Konvertiere alte Werte
-        if register_order == "big":
-            register_order = "high_first"
-            _LOGGER.info(
-                "Veralteter Wert 'big' verwendet. Bitte aktualisieren Sie Ihre Config auf 'high_first'"
-            )
-        elif register_order == "little":
-            register_order = "low_first"
-            _LOGGER.info(
-                "Veralteter Wert 'little' verwendet. Bitte aktualisieren Sie Ihre Config auf 'low_first'"
-            )
-        
-        # Validiere Wert
-        if register_order not in ["high_first", "low_first"]:
-            _LOGGER.warning("Ungültige int32_register_order: %s, verwende 'high_first'", register_order)
-            return "high_first"
-            
+            register_order = resolve_int32_register_order(config.get("modbus") or {})
         return register_order
-        
+
     except Exception as e:
         _LOGGER.warning("Fehler beim Laden der Register-Reihenfolge-Konfiguration: %s", e)
         return "high_first"  # Sicherer Fallback auf aktuelles Verhalten
@@ -1,12 +1,27 @@
-"""Module auto-detection utilities for Lambda Heat Pumps integration."""
+"""Module auto-detection utilities for Lambda Heat Pumps integration.
+
+Die Proben (erstes Register jedes möglichen Modul-Slots) stehen in einem
+Plan (``ModuleProbe``). Pro Modul-Typ wird nach dem ersten fehlenden Slot
+abgebrochen. Der Plan wird entweder direkt abgearbeitet
+(``auto_detect_modules``, Ersteinrichtung) oder vom Coordinator am Ende seiner
+Update-Zyklen in kleinen Portionen (niedrige Priorität, kein Konkurrieren um
+den Bus). Das Ergebnis wird pro Controller und Firmware gecacht
+(``module_detection_cache.json``), sodass normale Neustarts keinen Scan
+benötigen.
+"""
 
 from __future__ import annotations
 
+import json
 import logging
 import asyncio
+import os
+import time
 
 from typing import TYPE_CHECKING, Any
+from .const import AUTO_DETECT_CACHE_MAX_AGE, AUTO_DETECT_PROBE_TIMEOUT
 from .modbus_utils import async_read_holding_registers
+from .utils import get_firmware_version
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -33,6 +48,82 @@ MAX_MODULE_COUNTS = {
 }
 
 
+# Fallback, falls die Auto-Detection nicht abgeschlossen werden kann
+FALLBACK_MODULE_COUNTS = {"hp": 1, "boil": 1, "buff": 0, "sol": 0, "hc": 1}
+
+
+def build_probe_plan() -> list[tuple[str, int, int]]:
+    """Alle Proben ``(module_type, module_idx, address)``: erstes Test-Register jedes Slots."""
+    plan = []
+    for module_type, test_registers in MODULE_TEST_REGISTERS.items():
+        base = test_registers[0] - test_registers[0] % 100
+        offset = test_registers[0] % 100
+        for module_idx in range(MAX_MODULE_COUNTS[module_type]):
+            plan.append((module_type, module_idx, base + module_idx * 100 + offset))
+    return plan
+
+
+class ModuleProbe:
+    """Fortschritt einer Auto-Detection über den Probe-Plan.
+
+    Pro Modul-Typ werden die Slots in Reihenfolge geprüft; der erste nicht
+    lesbare Slot beendet den Typ (Module sind lückenlos nummeriert).
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[str, list[tuple[int, int]]] = {}
+        for module_type, module_idx, address in build_probe_plan():
+            self._pending.setdefault(module_type, []).append((module_idx, address))
+        self._counts = {module_type: 0 for module_type in MODULE_TEST_REGISTERS}
+
+    def next_probes(self, limit: int) -> list[tuple[str, int, int]]:
+        """Die nächsten höchstens ``limit`` Proben (je Typ nur der nächste Slot)."""
+        probes = []
+        for module_type, slots in self._pending.items():
+            if slots and len(probes) < limit:
+                module_idx, address = slots[0]
+                probes.append((module_type, module_idx, address))
+        return probes
+
+    def record(self, module_type: str, module_idx: int, found: bool) -> None:
+        slots = self._pending.get(module_type)
+        if not slots or slots[0][0] != module_idx:
+            return
+        if found:
+            slots.pop(0)
+            self._counts[module_type] = module_idx + 1
+        else:
+            slots.clear()
+
+    @property
+    def done(self) -> bool:
+        return not any(self._pending.values())
+
+    def detected(self) -> dict[str, int]:
+        """Erkannte Modul-Anzahlen (mindestens eine Wärmepumpe)."""
+        detected = dict(self._counts)
+        if detected["hp"] == 0:
+            detected["hp"] = 1  # Always assume at least 1 heat pump
+            _LOGGER.info("No heat pump detected, assuming 1 (minimum required)")
+        return detected
+
+
+async def probe_module_slot(client: Any, slave_id: int, address: int) -> bool:
+    """True, wenn das Test-Register des Slots lesbar ist."""
+    try:
+        result = await asyncio.wait_for(
+            async_read_holding_registers(client, address, 1, slave_id),
+            timeout=AUTO_DETECT_PROBE_TIMEOUT,
+        )
+        return not result.isError()
+    except asyncio.TimeoutError:
+        _LOGGER.debug("Timeout testing module slot at %s (%ss timeout)", address, AUTO_DETECT_PROBE_TIMEOUT)
+        return False
+    except Exception as ex:
+        _LOGGER.debug("Error testing module slot at %s: %s", address, ex)
+        return False
+
+
 async def auto_detect_modules(client: Any, slave_id: int) -> dict[str, int]:
     """
     Automatically detect installed modules by testing register accessibility.
@@ -46,99 +137,101 @@ async def auto_detect_modules(client: Any, slave_id: int) -> dict[str, int]:
             "hp": 1, "boil": 1, "hc": 2, "buff": 0, "sol": 0
         }
 
+    Raises:
+        asyncio.TimeoutError: Probe-Plan nicht innerhalb von 15 s abgeschlossen.
+            Der Aufrufer entscheidet über ``FALLBACK_MODULE_COUNTS``; geschätzte
+            Werte dürfen nicht gecacht werden.
     """
     # Gesamt-Timeout für komplette Auto-Detection: 15 Sekunden
     async def _auto_detect_internal():
-        detected = {"hp": 0, "boil": 0, "buff": 0, "sol": 0, "hc": 0}
-
-        for module_type, test_registers in MODULE_TEST_REGISTERS.items():
-            max_count = MAX_MODULE_COUNTS[module_type]
-
-            _LOGGER.debug("Testing %s modules (max: %s)", module_type, max_count)
-
-            for module_idx in range(max_count):
-                # Calculate base address for this module instance
-                if module_type == "hp":
-                    # HP: 1000, 1100, 1200
-                    base_address = 1000 + (module_idx * 100)
-                elif module_type == "boil":
-                    # Boiler: 2000, 2100, 2200, etc.
-                    base_address = 2000 + (module_idx * 100)
-                elif module_type == "buff":
-                    # Buffer: 3000, 3100, 3200, etc.
-                    base_address = 3000 + (module_idx * 100)
-                elif module_type == "sol":
-                    # Solar: 4000, 4100
-                    base_address = 4000 + (module_idx * 100)
-                elif module_type == "hc":
-                    # HC: 5000, 5100, 5200, etc.
-                    base_address = 5000 + (module_idx * 100)
-                else:
-                    continue
-
-                # Test if this module instance exists by reading first test register
-                test_register = base_address + (test_registers[0] % 100)
-
-                try:
-                    # Verwende die Kompatibilitätsfunktion mit Timeout
-                    result = await asyncio.wait_for(
-                        async_read_holding_registers(
-                            client, test_register, 1, slave_id
-                        ),
-                        timeout=2.0  # 2 Sekunden Timeout pro Register-Read
-                    )
-
-                    if not result.isError():
-                        detected[module_type] = module_idx + 1
-                        _LOGGER.debug(
-                            "Detected %s module %s at address %s",
-                            module_type,
-                            module_idx + 1,
-                            test_register,
-                        )
-                    else:
-                        # No more modules of this type
-                        _LOGGER.debug(
-                            "No %s module %s found at address %s",
-                            module_type,
-                            module_idx + 1,
-                            test_register,
-                        )
-                        break
-
-                except asyncio.TimeoutError:
-                    _LOGGER.debug(
-                        "Timeout testing %s module %s at %s (2s timeout)",
-                        module_type,
-                        module_idx + 1,
-                        test_register,
-                    )
-                    # Stop checking this module type on timeout
-                    break
-                except (AttributeError, ConnectionError, TimeoutError) as ex:
-                    _LOGGER.debug(
-                        "Error testing %s module %s at %s: %s",
-                        module_type,
-                        module_idx + 1,
-                        test_register,
-                        ex,
-                    )
-                    # Stop checking this module type on error
-                    break
-
-        # Ensure minimum counts for critical modules
-        if detected["hp"] == 0:
-            detected["hp"] = 1  # Always assume at least 1 heat pump
-            _LOGGER.info("No heat pump detected, assuming 1 (minimum required)")
-
+        probe = ModuleProbe()
+        while not probe.done:
+            for module_type, module_idx, address in probe.next_probes(len(MODULE_TEST_REGISTERS)):
+                found = await probe_module_slot(client, slave_id, address)
+                probe.record(module_type, module_idx, found)
+        detected = probe.detected()
         _LOGGER.info("Auto-detected modules: %s", detected)
         return detected
 
+    return await asyncio.wait_for(_auto_detect_internal(), timeout=15.0)
+
+
+def module_cache_key(entry: ConfigEntry) -> str:
+    """Controller-Identität + Firmware: ``host:port/slave_id/firmware``.
+
+    Die Firmware steht seit dem Options-Flow in ``entry.options`` (ältere
+    Entries: ``entry.data``), daher über ``get_firmware_version``.
+    """
+    return "{}:{}/{}/{}".format(
+        entry.data.get("host", ""),
+        entry.data.get("port", ""),
+        entry.data.get("slave_id", ""),
+        get_firmware_version(entry),
+    )
+
+
+def load_detection_cache(path: str, key: str, now: float | None = None) -> dict[str, int] | None:
+    """Gecachte Modul-Anzahlen für ``key`` (None: kein/abgelaufener/ungültiger Eintrag).
+
+    Blocking I/O – im Executor aufrufen.
+    """
     try:
-        return await asyncio.wait_for(_auto_detect_internal(), timeout=15.0)
-    except asyncio.TimeoutError:
-        _LOGGER.warning("Auto-detection timed out after 15 seconds, using fallback values")
-        return {"hp": 1, "boil": 1, "buff": 0, "sol": 0, "hc": 1}  # Fallback-Werte
+        with open(path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    entry = cache.get(key) if isinstance(cache, dict) else None
+    if not isinstance(entry, dict):
+        return None
+    if now is None:
+        now = time.time()
+    if now - float(entry.get("timestamp", 0)) > AUTO_DETECT_CACHE_MAX_AGE:
+        return None
+    detected = entry.get("detected")
+    if not isinstance(detected, dict) or set(detected) != set(MODULE_TEST_REGISTERS):
+        return None
+    return {module_type: int(count) for module_type, count in detected.items()}
+
+
+def _write_detection_cache(path: str, cache: dict) -> None:
+    """Cache atomar schreiben (Temp-Datei + ``os.replace``)."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def save_detection_cache(path: str, key: str, detected: dict, now: float | None = None) -> None:
+    """Ergebnis für ``key`` speichern (andere Controller bleiben erhalten). Blocking I/O."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if not isinstance(cache, dict):
+            cache = {}
+    except (OSError, ValueError):
+        cache = {}
+    cache[key] = {
+        "detected": dict(detected),
+        "timestamp": time.time() if now is None else now,
+    }
+    _write_detection_cache(path, cache)
+
+
+def invalidate_detection_cache(path: str, key: str | None = None) -> None:
+    """Cache-Eintrag (oder ohne ``key`` den ganzen Cache) verwerfen. Blocking I/O."""
+    if key is None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        return
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return
+    if isinstance(cache, dict) and cache.pop(key, None) is not None:
+        _write_detection_cache(path, cache)
 
 
 async def update_entry_with_detected_modules(
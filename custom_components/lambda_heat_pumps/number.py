@@ -16,6 +16,7 @@ from .const import (
     HC_FLOW_LINE_OFFSET_NUMBER_CONFIG,
     HC_ECO_TEMP_REDUCTION_NUMBER_CONFIG,
 )
+from .state_gate import create_state_gate
 from .utils import (
     build_device_info,
     build_subdevice_info,
@@ -312,6 +313,13 @@ class LambdaFlowLineOffsetNumber(CoordinatorEntity, RestoreNumber, NumberEntity)
 
         # Key für Coordinator-Cache
         self._coordinator_key = f"hc{self._hc_index}_set_flow_line_offset_temperature"
+        # Value-Change-Gating für Coordinator-Updates
+        self._state_gate = create_state_gate(
+            getattr(coordinator, "state_write_gating", None),
+            self._coordinator_key,
+            "set_flow_line_offset_temperature",
+            registry=getattr(coordinator, "state_gates", None),
+        )
 
     @property
     def native_value(self) -> float | None:
@@ -495,6 +503,7 @@ class LambdaFlowLineOffsetNumber(CoordinatorEntity, RestoreNumber, NumberEntity)
             )
 
         # 9. UI aktualisieren
+        self._state_gate.record(value, self.available)
         self.async_write_ha_state()
 
         _LOGGER.info(
@@ -506,8 +515,9 @@ class LambdaFlowLineOffsetNumber(CoordinatorEntity, RestoreNumber, NumberEntity)
     @callback
     def _handle_coordinator_update(self) -> None:
         """Wird automatisch aufgerufen, wenn Coordinator Daten aktualisiert."""
-        # Aktualisiere UI, wenn Modbus-Wert sich geändert hat
-        self.async_write_ha_state()
+        # Aktualisiere UI nur, wenn Modbus-Wert sich geändert hat (oder Max-Silence abgelaufen)
+        if self._state_gate.check(self.native_value, self.available):
+            self.async_write_ha_state()
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -0,0 +1,131 @@
+"""Laufzeit-Messwerte eines Coordinators für die Diagnose.
+
+``PerfTrace`` sammelt mit geringem Overhead (Ringpuffer fester Größe, keine
+Log-Ausgaben) was bei langsamem Polling für ein Issue gebraucht wird:
+
+- pro Update-Zyklus die gelesenen Batches (Start, Anzahl, Modus, Dauer);
+  der letzte vollständige Zyklus ist zugleich der aktuelle Read-Plan,
+- Jitter des Fast-Polls (Abweichung des tatsächlichen vom konfigurierten
+  Intervall),
+- Dauer und Größe der Persist-Writes (Journal-Record bzw. Snapshot).
+
+``as_dict()`` liefert eine JSON-taugliche Zusammenfassung.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+
+from .const import PERF_TRACE_CYCLES, PERF_TRACE_SAMPLES
+
+# Modus eines Batches im Read-Plan
+BATCH_MODE_BATCH = "batch"  # ein Modbus-Request für den ganzen Bereich
+BATCH_MODE_INDIVIDUAL = "individual"  # Einzel-Reads (gelernt oder konfiguriert)
+BATCH_MODE_FAILED = "failed"  # Batch-Read mit Fehlerantwort
+BATCH_MODE_FALLBACK = "fallback"  # Exception, Einzel-Reads als Ersatz
+
+
+def _summary(values) -> dict:
+    """count/avg/max/p95 einer Reihe von Millisekunden-Werten."""
+    ordered = sorted(values)
+    if not ordered:
+        return {"count": 0, "avg_ms": 0.0, "max_ms": 0.0, "p95_ms": 0.0}
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return {
+        "count": len(ordered),
+        "avg_ms": round(sum(ordered) / len(ordered), 2),
+        "max_ms": round(ordered[-1], 2),
+        "p95_ms": round(p95, 2),
+    }
+
+
+class PerfTrace:
+    """Ringpuffer der letzten Zyklen, Fast-Poll-Ticks und Persist-Writes."""
+
+    def __init__(self, max_cycles: int = PERF_TRACE_CYCLES, max_samples: int = PERF_TRACE_SAMPLES) -> None:
+        self._cycles: deque = deque(maxlen=max_cycles)
+        self._current: list | None = None
+        self._cycle_started = 0.0
+        self._last_fast_tick: float | None = None
+        self._fast_jitter_ms: deque = deque(maxlen=max_samples)
+        self._persist_writes: deque = deque(maxlen=max_samples)
+
+    # --- Update-Zyklen -----------------------------------------------------
+
+    def begin_cycle(self) -> None:
+        self._current = []
+        self._cycle_started = time.perf_counter()
+
+    def record_batch(self, start: int, count: int, mode: str, duration_ms: float) -> None:
+        if self._current is not None:
+            self._current.append((start, count, mode, round(duration_ms, 2)))
+
+    def end_cycle(self) -> None:
+        if self._current is None:
+            return
+        duration_ms = (time.perf_counter() - self._cycle_started) * 1000
+        self._cycles.append(
+            {"ended": time.time(), "duration_ms": round(duration_ms, 1), "batches": self._current}
+        )
+        self._current = None
+
+    # --- Fast-Poll ---------------------------------------------------------
+
+    def record_fast_tick(self, expected_interval: float, now: float | None = None) -> None:
+        """Timer-Tick des Fast-Polls (monotone Zeit) mit konfiguriertem Intervall."""
+        now = time.monotonic() if now is None else now
+        if self._last_fast_tick is not None:
+            actual = now - self._last_fast_tick
+            self._fast_jitter_ms.append((actual - expected_interval) * 1000)
+        self._last_fast_tick = now
+
+    def reset_fast_ticks(self) -> None:
+        """Nach Neustart des Timers: nächster Tick ist wieder der erste."""
+        self._last_fast_tick = None
+
+    # --- Persist -----------------------------------------------------------
+
+    def record_persist_write(self, kind: str, duration_ms: float, size_bytes: int) -> None:
+        self._persist_writes.append((kind, round(duration_ms, 2), int(size_bytes or 0)))
+
+    # --- Export ------------------------------------------------------------
+
+    def as_dict(self) -> dict:
+        cycles = list(self._cycles)
+        last = cycles[-1] if cycles else None
+        batch_times = [batch[3] for cycle in cycles for batch in cycle["batches"]]
+        jitter = list(self._fast_jitter_ms)
+        writes = list(self._persist_writes)
+        return {
+            "read_plan": [
+                {"start": start, "count": count, "mode": mode}
+                for start, count, mode, _ in (last["batches"] if last else [])
+            ],
+            "cycles": [
+                {
+                    "ended": cycle["ended"],
+                    "duration_ms": cycle["duration_ms"],
+                    "batches": [
+                        {"start": start, "count": count, "mode": mode, "ms": ms}
+                        for start, count, mode, ms in cycle["batches"]
+                    ],
+                }
+                for cycle in cycles
+            ],
+            "cycle_duration": _summary(cycle["duration_ms"] for cycle in cycles),
+            "batch_duration": _summary(batch_times),
+            "fast_poll_jitter": {
+                **_summary(abs(value) for value in jitter),
+                "last_ms": [round(value, 1) for value in jitter[-10:]],
+            },
+            "persist_writes": {
+                **_summary(duration for _, duration, _ in writes),
+                "bytes_total": sum(size for _, _, size in writes),
+                "bytes_max": max((size for _, _, size in writes), default=0),
+                "by_kind": {
+                    kind: sum(1 for write_kind, _, _ in writes if write_kind == kind)
+                    for kind in sorted({write_kind for write_kind, _, _ in writes})
+                },
+            },
+        }
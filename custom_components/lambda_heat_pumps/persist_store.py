@@ -0,0 +1,287 @@
+"""Journal-basierter Speicher für cycle_energy_persist.
+
+Der Snapshot (``cycle_energy_persist.json``) bleibt das lesbare Format. Änderungen
+werden als kleine Delta-Records (JSON Lines) an ``cycle_energy_persist.json.journal``
+angehängt. Nach ``PERSIST_JOURNAL_MAX_RECORDS`` Records bzw. ``PERSIST_JOURNAL_MAX_BYTES``
+wird der Snapshot atomar (Temp-Datei + ``os.replace``) neu geschrieben und das
+Journal geleert. Beim Start wird der Snapshot geladen und das Journal darauf
+abgespielt; ein abgeschnittener letzter Record (Absturz beim Schreiben) wird verworfen.
+
+Snapshot und Records tragen eine Generation (``_journal_generation`` bzw. ``gen``),
+die mit jeder Kompaktierung steigt. Bleibt nach einem Absturz zwischen Snapshot-Tausch
+und Löschen des Journals das alte Journal liegen, werden dessen Records beim Laden
+übersprungen, statt ältere absolute Werte auf den neueren Snapshot zu spielen.
+
+Das Diffing läuft auf dem Event Loop (nur im Speicher), die Datei-I/O im Executor.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import os
+
+from .const import (
+    PERSIST_JOURNAL_MAX_BYTES,
+    PERSIST_JOURNAL_MAX_RECORDS,
+    PERSIST_JOURNAL_SUFFIX,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# Reservierter Snapshot-Schlüssel für die Journal-Generation
+GENERATION_KEY = "_journal_generation"
+
+
+class PersistWrite:
+    """Vorbereiteter Schreibauftrag (auf dem Loop erzeugt, im Executor ausgeführt)."""
+
+    __slots__ = ("kind", "payload")
+
+    def __init__(self, kind: str, payload: str):
+        self.kind = kind  # "append" oder "compact"
+        self.payload = payload
+
+    def __len__(self) -> int:
+        return len(self.payload)
+
+
+class PersistJournalStore:
+    """Snapshot + Append-only-Journal für die Persist-Daten des Coordinators."""
+
+    def __init__(
+        self,
+        snapshot_path: str,
+        max_records: int = PERSIST_JOURNAL_MAX_RECORDS,
+        max_bytes: int = PERSIST_JOURNAL_MAX_BYTES,
+    ):
+        self.snapshot_path = snapshot_path
+        self.journal_path = snapshot_path + PERSIST_JOURNAL_SUFFIX
+        self._max_records = max_records
+        self._max_bytes = max_bytes
+        # Zuletzt geschriebener Stand (Snapshot + alle Journal-Records)
+        self._shadow: dict = {}
+        self._journal_records = 0
+        self._journal_bytes = 0
+        self._needs_compaction = True  # Erster Write erzeugt immer einen Snapshot
+        # Generation des aktuellen Snapshots; Records älterer Generationen sind überholt
+        self._generation = 0
+
+    # ------------------------------------------------------------------
+    # Laden (blocking, im Executor aufrufen)
+    # ------------------------------------------------------------------
+    def exists(self) -> bool:
+        """True, wenn Snapshot oder Journal vorhanden sind."""
+        return os.path.exists(self.snapshot_path) or os.path.exists(self.journal_path)
+
+    def load(self) -> dict:
+        """Lade Snapshot und spiele das Journal ab.
+
+        Raises:
+            json.JSONDecodeError: Wenn der Snapshot selbst beschädigt ist
+                (Journal-Fehler werden toleriert).
+        """
+        data: dict = {}
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path) as f:
+                content = f.read().strip()
+            if content:
+                data = json.loads(content)
+            else:
+                _LOGGER.warning("Persist file %s is empty, using defaults", self.snapshot_path)
+        # Snapshots/Records ohne Generation (ältere Versionen) gelten als Generation 0
+        generation = data.pop(GENERATION_KEY, 0) if isinstance(data, dict) else 0
+
+        records = 0
+        stale = 0
+        size = 0
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path) as f:
+                for line in f:
+                    size += len(line)
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Abgeschnittener Record nach Absturz - alles danach verwerfen
+                        _LOGGER.warning(
+                            "Persist journal %s: truncated record after %d entries ignored",
+                            self.journal_path,
+                            records,
+                        )
+                        break
+                    if record.get("gen", 0) < generation:
+                        # Journal vor der letzten Kompaktierung (Absturz vor dem Löschen)
+                        stale += 1
+                        continue
+                    apply_journal_record(data, record)
+                    records += 1
+
+        self._shadow = copy.deepcopy(data)
+        self._generation = generation
+        self._journal_records = records + stale
+        self._journal_bytes = size
+        # Nach Replay beim nächsten Write kompaktieren (Journal wird dann geleert)
+        self._needs_compaction = records + stale > 0 or not os.path.exists(self.snapshot_path)
+        if stale:
+            _LOGGER.warning(
+                "Persist journal %s: %d records older than the snapshot skipped",
+                self.journal_path,
+                stale,
+            )
+        if records:
+            _LOGGER.debug(
+                "Persist journal replayed: %d records (%d bytes)", records, size
+            )
+        return data
+
+    def reset(self) -> None:
+        """Verwerfe den bekannten Stand (z. B. nach beschädigtem Snapshot)."""
+        self._shadow = {}
+        self._journal_records = 0
+        self._journal_bytes = 0
+        self._needs_compaction = True
+
+    # ------------------------------------------------------------------
+    # Zugriff auf den zuletzt geschriebenen Stand (ohne Datei-I/O)
+    # ------------------------------------------------------------------
+    def get_section(self, key: str, default=None):
+        """Liefert einen Abschnitt des zuletzt persistierten Stands."""
+        return self._shadow.get(key, default)
+
+    # ------------------------------------------------------------------
+    # Schreiben
+    # ------------------------------------------------------------------
+    def prepare_write(self, data: dict) -> PersistWrite | None:
+        """Berechne den Schreibauftrag für ``data`` (auf dem Event Loop aufrufen).
+
+        Returns:
+            ``None`` wenn sich nichts geändert hat, sonst einen PersistWrite
+            (Delta-Record oder kompletter Snapshot).
+        """
+        record = _diff(self._shadow, data)
+        if record is None and not self._needs_compaction:
+            return None
+
+        compact = (
+            self._needs_compaction
+            or self._journal_records + 1 >= self._max_records
+            or self._journal_bytes >= self._max_bytes
+        )
+        payload = None
+        if record is not None:
+            if not compact:
+                payload = json.dumps({**record, "gen": self._generation}, separators=(",", ":")) + "\n"
+            # Record-Werte sind bereits Kopien und werden danach nicht mehr verändert
+            apply_journal_record(self._shadow, record)
+
+        if compact:
+            # Neue Generation schon beim Vorbereiten: auch nach einem fehlgeschlagenen
+            # Commit bleibt sie monoton, der nächste Write kompaktiert ohnehin erneut
+            self._generation += 1
+            return PersistWrite(
+                "compact",
+                json.dumps({**self._shadow, GENERATION_KEY: self._generation}, indent=2),
+            )
+        return PersistWrite("append", payload)
+
+    def commit(self, write: PersistWrite) -> int:
+        """Führe den Schreibauftrag aus (blocking, im Executor aufrufen).
+
+        Returns:
+            Anzahl geschriebener Bytes.
+        """
+        directory = os.path.dirname(self.snapshot_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if write.kind == "append":
+            with open(self.journal_path, "a") as f:
+                f.write(write.payload)
+                f.flush()
+                os.fsync(f.fileno())
+            self._journal_records += 1
+            self._journal_bytes += len(write.payload)
+            return len(write.payload)
+
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.write(write.payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        # Journal erst nach erfolgreichem Snapshot-Tausch leeren; bleibt es nach einem
+        # Absturz liegen, verwirft load() die Records anhand der Generation
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self._journal_records = 0
+        self._journal_bytes = 0
+        self._needs_compaction = False
+        return len(write.payload)
+
+    def invalidate(self) -> None:
+        """Nach einem fehlgeschlagenen Write: nächster Write schreibt den kompletten Snapshot."""
+        self._needs_compaction = True
+
+
+def apply_journal_record(data: dict, record: dict) -> None:
+    """Wende einen Delta-Record auf ``data`` an (in-place).
+
+    Record-Format::
+
+        {"set": {key: value}, "upd": {section: {subkey: value}}, "del": {section: [subkey, ...]}}
+    """
+    for key, value in (record.get("set") or {}).items():
+        data[key] = value
+    for section, entries in (record.get("upd") or {}).items():
+        target = data.get(section)
+        if not isinstance(target, dict):
+            target = {}
+            data[section] = target
+        target.update(entries)
+    for section, subkeys in (record.get("del") or {}).items():
+        target = data.get(section)
+        if isinstance(target, dict):
+            for subkey in subkeys:
+                target.pop(subkey, None)
+
+
+def _diff(old: dict, new: dict) -> dict | None:
+    """Erzeuge einen Delta-Record von ``old`` nach ``new`` (None wenn identisch).
+
+    Dict-Abschnitte werden pro Unterschlüssel verglichen (z. B. einzelne Energy-Entities),
+    alle anderen Werte als Ganzes.
+    """
+    set_: dict = {}
+    upd: dict = {}
+    dels: dict = {}
+    for key, value in new.items():
+        old_value = old.get(key, _MISSING)
+        if isinstance(value, dict) and isinstance(old_value, dict):
+            changed = {}
+            for subkey, subvalue in value.items():
+                if old_value.get(subkey, _MISSING) != subvalue:
+                    changed[subkey] = copy.deepcopy(subvalue)
+            if changed:
+                upd[key] = changed
+            removed = [k for k in old_value if k not in value]
+            if removed:
+                dels[key] = removed
+        elif old_value is _MISSING or old_value != value:
+            set_[key] = copy.deepcopy(value)
+
+    if not (set_ or upd or dels):
+        return None
+    record: dict = {}
+    if set_:
+        record["set"] = set_
+    if upd:
+        record["upd"] = upd
+    if dels:
+        record["del"] = dels
+    return record
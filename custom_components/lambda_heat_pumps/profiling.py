@@ -0,0 +1,177 @@
+"""cProfile-Mitschnitt der nächsten N Update-Zyklen (Service ``profile_update_cycles``).
+
+Um Hot-Spots auf einem produktiven Pi zu finden, musste bisher Code gepatcht
+werden. ``CycleProfiler`` wird per Service an einen Coordinator gehängt und
+profiliert dort
+
+- die vollen Zyklen (``_async_update_data`` inkl. ``_track_energy_consumption``
+  und ``_persist_counters``),
+- die Fast-Polls (Flankenerkennung, Cycling-Zähler),
+- die anschließenden Entity-State-Writes (``async_update_listeners``).
+
+cProfile misst dabei alles, was während eines Zyklus im Event-Loop läuft (auch
+andere Tasks zwischen den ``await``-Punkten). Verschachtelte Bereiche (Fast-Poll
+während eines vollen Zyklus) werden über einen Zähler zusammengefasst, da pro
+Thread nur ein Profiler aktiv sein kann. Aus demselben Grund teilen sich alle
+profilierten Coordinators einen ``CycleProfiler`` (``attach``): der Mitschnitt
+ist abgeschlossen, wenn jeder angehängte Coordinator ``cycles`` volle Zyklen
+erreicht hat. Dann schreibt ``write_report`` (einmal, siehe ``claim_report``)
+eine ``.pstats``-Datei und eine Text-Zusammenfassung; die Coordinators
+entfernen den Profiler wieder.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import os
+import pstats
+import re
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator
+
+# Funktionen mit eigenem Abschnitt in der Zusammenfassung
+FOCUS_FUNCTIONS = (
+    "_async_update_data",
+    "_async_fetch_data",
+    "_track_energy_consumption",
+    "_persist_counters",
+    "_async_fast_update",
+    "async_update_listeners",
+    "async_write_ha_state",
+)
+SUMMARY_TOP_FUNCTIONS = 40
+
+
+class CycleProfiler:
+    """Profiler für eine begrenzte Anzahl von Update-Zyklen eines oder mehrerer Coordinators."""
+
+    def __init__(self, cycles: int, output_dir: str, label: str) -> None:
+        self.cycles = cycles
+        self.output_dir = output_dir
+        self.label = re.sub(r"[^A-Za-z0-9_-]", "_", label)
+        self.error: str | None = None
+        self.full_cycles = 0
+        self.fast_polls = 0
+        self.started = time.time()
+        self._profile = cProfile.Profile()
+        self._depth = 0
+        self._members: dict[str, int] = {}  # volle Zyklen pro angehängtem Coordinator
+        self._detached: set[str] = set()  # während des Profilings entladene Coordinators
+        self._report_claimed = False
+
+    def attach(self, member: str) -> None:
+        """Coordinator anhängen; ``done`` wartet auf dessen ``cycles`` volle Zyklen."""
+        self._members.setdefault(member, 0)
+        self._detached.discard(member)
+
+    def detach(self, member: str) -> None:
+        """Entladenen Coordinator abhängen; ``done`` wartet nicht mehr auf ihn."""
+        if member in self._members:
+            self._detached.add(member)
+
+    @contextmanager
+    def capture(self) -> Iterator[None]:
+        """Bereich profilieren (verschachtelbar)."""
+        if self._depth == 0:
+            try:
+                self._profile.enable()
+            except ValueError as ex:
+                # Anderer Profiler im Thread aktiv (z. B. HA-Integration "profiler"):
+                # Zyklus normal laufen lassen, Session wird beendet
+                self.error = str(ex)
+                yield
+                return
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self._profile.disable()
+
+    def record_cycle(self, kind: str, member: str | None = None) -> None:
+        """Abgeschlossenen Zyklus zählen (``full`` oder ``fast``)."""
+        if kind == "full":
+            self.full_cycles += 1
+            if member in self._members:
+                self._members[member] += 1
+        else:
+            self.fast_polls += 1
+
+    @property
+    def done(self) -> bool:
+        """Ziel erreicht (oder Profiling nicht möglich) und kein Bereich mehr aktiv."""
+        if self._depth or self.error is not None:
+            return self._depth == 0
+        if not self._members:
+            return self.full_cycles >= self.cycles
+        # Alle entladen: all() über leere Liste -> fertig, Report mit dem Bisherigen
+        return all(
+            count >= self.cycles
+            for member, count in self._members.items()
+            if member not in self._detached
+        )
+
+    def claim_report(self) -> bool:
+        """True genau für den ersten Aufrufer: dieser schreibt den Report."""
+        if self._report_claimed:
+            return False
+        self._report_claimed = True
+        return True
+
+    def write_report(self) -> tuple[str, str]:
+        """``.pstats`` und Text-Zusammenfassung schreiben (Blocking I/O).
+
+        Returns:
+            (pstats_pfad, summary_pfad)
+        """
+        if self._depth:
+            raise RuntimeError("Profiler is still capturing")
+        os.makedirs(self.output_dir, exist_ok=True)
+        stamp = datetime.fromtimestamp(self.started).strftime("%Y%m%d_%H%M%S")
+        base = os.path.join(self.output_dir, f"profile_{self.label}_{stamp}")
+        pstats_path = base + ".pstats"
+        summary_path = base + ".txt"
+        self._profile.dump_stats(pstats_path)
+
+        out = io.StringIO()
+        out.write(
+            f"Lambda Heat Pumps profile: {self.label}\n"
+            f"Started: {datetime.fromtimestamp(self.started).isoformat(timespec='seconds')}\n"
+            f"Wall time: {time.time() - self.started:.1f} s\n"
+            f"Full cycles: {self.full_cycles}, fast polls: {self.fast_polls}\n"
+        )
+        if self._members:
+            out.write(
+                "Coordinators: "
+                + ", ".join(
+                    f"{member} ({count} full{', unloaded' if member in self._detached else ''})"
+                    for member, count in self._members.items()
+                )
+                + "\n"
+            )
+        if self.error:
+            out.write(f"Aborted: {self.error}\n")
+        out.write(
+            f"Raw data: {os.path.basename(pstats_path)} "
+            f"(python -m pstats {os.path.basename(pstats_path)})\n\n"
+        )
+        try:
+            stats = pstats.Stats(self._profile, stream=out)
+        except TypeError:
+            # Keine Messdaten (Profiling konnte nicht gestartet werden)
+            out.write("No samples recorded.\n")
+        else:
+            stats.strip_dirs()
+            out.write("=== Focus functions (cumulative) ===\n")
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats("|".join(FOCUS_FUNCTIONS))
+            out.write(f"=== Top {SUMMARY_TOP_FUNCTIONS} by cumulative time ===\n")
+            stats.print_stats(SUMMARY_TOP_FUNCTIONS)
+            out.write(f"=== Top {SUMMARY_TOP_FUNCTIONS} by own time ===\n")
+            stats.sort_stats(pstats.SortKey.TIME).print_stats(SUMMARY_TOP_FUNCTIONS)
+        with open(summary_path, "w", encoding="utf-8") as f:
+            f.write(out.getvalue())
+        return pstats_path, summary_path
@@ -0,0 +1,146 @@
+"""Vorkompilierter, firmware-indizierter Register-Katalog.
+
+Die Sensor-Templates (``const_sensor.py``) bleiben die Quelle der Wahrheit.
+Bisher filterte jede Plattform und jeder Coordinator-Zyklus sie erneut mit
+``get_compatible_sensors``. ``get_register_catalog(fw_version)`` baut die
+gefilterten Strukturen einmal pro Firmware-Stand (lazy, beim ersten Zugriff)
+und liefert danach immer dasselbe Objekt:
+
+- ``general`` / ``templates(device_type)``: Sensor-ID → Deskriptor,
+- ``slices(device_type, count)``: pro Modul ``(idx, base_address, registers)``
+  mit ``registers = ((sensor_id, address, descriptor), …)``,
+- ``address_map(counts)``: Adresse → ``(sensor_key, descriptor)``.
+
+Alle Container sind unveränderlich (``MappingProxyType``/Tupel). Die
+Deskriptoren sind die geteilten Template-Dicts und dürfen nicht verändert
+werden. ``build_ms`` hält die Aufbauzeit für die Diagnose fest.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, NamedTuple
+
+from .const import (
+    BASE_ADDRESSES,
+    BOIL_SENSOR_TEMPLATES,
+    BUFF_SENSOR_TEMPLATES,
+    HC_SENSOR_TEMPLATES,
+    HP_SENSOR_TEMPLATES,
+    SENSOR_TYPES,
+    SOL_SENSOR_TEMPLATES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+MODULE_TEMPLATES = {
+    "hp": HP_SENSOR_TEMPLATES,
+    "boil": BOIL_SENSOR_TEMPLATES,
+    "buff": BUFF_SENSOR_TEMPLATES,
+    "sol": SOL_SENSOR_TEMPLATES,
+    "hc": HC_SENSOR_TEMPLATES,
+}
+
+
+def is_compatible(descriptor: Mapping, fw_version: int) -> bool:
+    """Gleiche Regel wie ``get_compatible_sensors``: ohne numerische ``firmware_version`` immer kompatibel."""
+    required = descriptor.get("firmware_version")
+    if isinstance(required, (int, float)):
+        return required <= fw_version
+    return True
+
+
+def _filter(templates: dict, fw_version: int) -> Mapping:
+    return MappingProxyType(
+        {sensor_id: info for sensor_id, info in templates.items() if is_compatible(info, fw_version)}
+    )
+
+
+class ModuleSlice(NamedTuple):
+    """Register eines Moduls (z. B. ``hc2``) mit absoluten Adressen."""
+
+    idx: int
+    base_address: int
+    registers: tuple  # ((sensor_id, address, descriptor), ...)
+
+
+class RegisterCatalog:
+    """Für einen Firmware-Stand gefilterte Templates und daraus abgeleitete Indizes."""
+
+    __slots__ = ("fw_version", "general", "_modules", "_slices", "_address_maps", "build_ms")
+
+    def __init__(self, fw_version: int) -> None:
+        started = time.perf_counter()
+        self.fw_version = fw_version
+        self.general = _filter(SENSOR_TYPES, fw_version)
+        self._modules = MappingProxyType(
+            {device_type: _filter(templates, fw_version) for device_type, templates in MODULE_TEMPLATES.items()}
+        )
+        self._slices: dict[tuple[str, int], tuple] = {}
+        self._address_maps: dict[tuple, Mapping] = {}
+        self.build_ms = (time.perf_counter() - started) * 1000
+
+    def templates(self, device_type: str) -> Mapping:
+        """Kompatible Templates eines Modul-Typs (``hp``, ``boil``, ``buff``, ``sol``, ``hc``)."""
+        return self._modules.get(device_type, MappingProxyType({}))
+
+    def slices(self, device_type: str, count: int) -> tuple:
+        """``ModuleSlice`` für Modul 1..``count`` (gecacht pro Typ und Anzahl)."""
+        key = (device_type, count)
+        cached = self._slices.get(key)
+        if cached is not None:
+            return cached
+        start_address = BASE_ADDRESSES.get(device_type, 0)
+        templates = self.templates(device_type)
+        modules = []
+        if start_address:
+            for idx in range(1, count + 1):
+                base_address = start_address + (idx - 1) * 100
+                registers = tuple(
+                    (sensor_id, base_address + info["relative_address"], info)
+                    for sensor_id, info in templates.items()
+                    if "relative_address" in info
+                )
+                modules.append(ModuleSlice(idx, base_address, registers))
+        result = tuple(modules)
+        self._slices[key] = result
+        return result
+
+    def address_map(self, counts: Mapping[str, int]) -> Mapping:
+        """Adresse → ``(sensor_key, descriptor)`` für allgemeine Sensoren und alle Module.
+
+        Bei mehrfach belegten Adressen gewinnt der erste Eintrag (allgemeine
+        Sensoren, danach Module in Template-Reihenfolge).
+        """
+        key = tuple(sorted((device_type, int(count)) for device_type, count in counts.items()))
+        cached = self._address_maps.get(key)
+        if cached is not None:
+            return cached
+        index: dict[int, tuple] = {}
+        for sensor_id, info in self.general.items():
+            if "address" in info:
+                index.setdefault(info["address"], (sensor_id, info))
+        for device_type, count in key:
+            for module in self.slices(device_type, count):
+                for sensor_id, address, info in module.registers:
+                    index.setdefault(address, (f"{device_type}{module.idx}_{sensor_id}", info))
+        result = MappingProxyType(index)
+        self._address_maps[key] = result
+        return result
+
+
+@lru_cache(maxsize=None)
+def get_register_catalog(fw_version: int) -> RegisterCatalog:
+    """Katalog für ``fw_version`` (einmal pro Firmware-Stand und Prozess gebaut)."""
+    catalog = RegisterCatalog(fw_version)
+    _LOGGER.debug(
+        "Register catalog for firmware %s built in %.2f ms (%d general, %s)",
+        fw_version,
+        catalog.build_ms,
+        len(catalog.general),
+        ", ".join(f"{t}={len(catalog.templates(t))}" for t in MODULE_TEMPLATES),
+    )
+    return catalog
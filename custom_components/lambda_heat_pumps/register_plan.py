@@ -0,0 +1,105 @@
+"""Batch-Planung für Modbus-Register-Reads.
+
+``plan_register_batches`` gruppiert Adressen zu Lese-Transaktionen (wie bisher
+inline in ``LambdaDataUpdateCoordinator._read_registers_batch``):
+
+- INT32 immer als eigenes Paar ``[addr, addr + 1]``,
+- INT16/UINT16 nur zusammenhängend und mit gleichem Datentyp,
+- höchstens ``MAX_BATCH_REGISTERS`` Register pro Transaktion.
+
+Der Coordinator-Zyklus und der Diagnose-Service ``read_modbus_registers``
+verwenden denselben Planer. ``range_address_info`` und
+``template_address_info`` bauen die Adress-Infos für einen Adressbereich bzw.
+einen Modul-Block aus den Sensor-Templates.
+"""
+
+from __future__ import annotations
+
+from .const import REGISTER_DATA_TYPES
+
+MAX_BATCH_REGISTERS = 100  # Modbus max 125 holding regs; 100 = safe margin
+
+
+def plan_register_batches(address_info: dict, max_batch: int = MAX_BATCH_REGISTERS) -> list[list[int]]:
+    """Adressen ``{address: {"data_type": ...}}`` zu Lese-Batches gruppieren."""
+    batches: list[list[int]] = []
+    current_batch: list[int] = []
+    current_type = None
+    last_addr = None
+
+    for addr in sorted(address_info):
+        dtype = address_info[addr].get("data_type", "uint16")
+        # If INT32, always treat as a pair (addr, addr+1)
+        if dtype == "int32":
+            if current_batch:
+                batches.append(current_batch)
+                current_batch = []
+                current_type = None
+            batches.append([addr, addr + 1])
+            last_addr = addr + 1
+            continue
+        # For INT16/UINT16, group only if consecutive and same type
+        if (
+            not current_batch
+            or addr != last_addr + 1
+            or current_type != dtype
+            or len(current_batch) >= max_batch
+        ):
+            if current_batch:
+                batches.append(current_batch)
+            current_batch = [addr]
+            current_type = dtype
+        else:
+            current_batch.append(addr)
+        last_addr = addr
+    if current_batch:
+        batches.append(current_batch)
+    return batches
+
+
+def range_address_info(start: int, count: int, data_type: str = "uint16", data_types: dict | None = None) -> dict:
+    """Adress-Infos für ``count`` Register ab ``start`` (INT32 belegt zwei Register).
+
+    Ein INT32 auf der letzten Adresse des Bereichs (bzw. auf 65535) wird als
+    INT16 gelesen, damit kein Register hinter dem Bereich angefragt wird.
+    """
+    data_types = data_types or {}
+    info = {}
+    addr = start
+    end = min(start + count, 65536)
+    while addr < end:
+        dtype = data_types.get(addr, data_type)
+        if dtype == "int32" and addr + 1 >= end:
+            dtype = "int16"
+        info[addr] = {"data_type": dtype}
+        addr += 2 if dtype == "int32" else 1
+    return info
+
+
+def template_address_info(templates: dict, base_address: int = 0) -> tuple[dict, dict]:
+    """Adress-Infos und Namen ``{address: sensor_id}`` aus Sensor-Templates.
+
+    Modul-Templates nutzen ``relative_address`` (+ ``base_address``), allgemeine
+    Sensoren (``SENSOR_TYPES``) eine absolute ``address``. Berechnete Sensoren
+    ohne Register werden übersprungen.
+    """
+    info: dict = {}
+    names: dict = {}
+    for sensor_id, template in templates.items():
+        if template.get("data_type") not in REGISTER_DATA_TYPES:
+            continue
+        if "relative_address" in template:
+            address = base_address + template["relative_address"]
+        elif "address" in template:
+            address = template["address"]
+        else:
+            continue
+        if address in info:
+            continue
+        entry = {"data_type": template["data_type"]}
+        for key in ("scale", "register_order", "byte_order"):
+            if key in template:
+                entry[key] = template[key]
+        info[address] = entry
+        names[address] = sensor_id
+    return info, names
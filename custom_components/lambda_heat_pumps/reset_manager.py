@@ -1,29 +1,52 @@
 """
 Lambda Heat Pumps - Reset Manager
 Centralized reset logic for all sensor types and periods.
+
+Ein einziger Listener zur vollen Stunde bestimmt, welche Perioden an diesem
+Zeitpunkt wechseln (hourly, 2h, 4h, daily, monthly, yearly), und führt den
+Rollover für alle betroffenen Entities in einem geordneten, synchronen
+Durchlauf aus:
+
+1. Yesterday-Snapshot (nur bei Tageswechsel, vor dem Daily-Reset),
+2. Perioden-Reset der Zähler (Cycling, Energy) und danach der COP-Sensoren,
+3. State-Writes aller geänderten Entities.
+
+Die Energy-Baselines (Total zu Periodenbeginn) liegen in der Rollup-Tabelle
+des Coordinators (``rollup_baselines``); Energy-Sensoren schreiben sie beim
+Reset direkt dort hinein. Cycling-Perioden-Sensoren zählen selbst und setzen
+ihren Wert beim Reset auf 0, sie brauchen keine Baseline.
+
+Damit entstehen keine Tasks pro Entity mehr, und an Mitternacht des 1. Januar
+können sich die Perioden-Resets nicht gegenseitig überholen.
 """
 
 import logging
 from datetime import datetime
-from typing import Callable
+
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_track_time_change
-from homeassistant.helpers.dispatcher import async_dispatcher_send
-
-# Import signal constants from automations
-from .automations import (
-    SIGNAL_RESET_DAILY,
-    SIGNAL_RESET_2H,
-    SIGNAL_RESET_4H,
-    SIGNAL_RESET_HOURLY,
-    SIGNAL_RESET_MONTHLY,
-    SIGNAL_RESET_YEARLY,
-    _update_yesterday_sensors_async,
-)
+
+from .automations import snapshot_yesterday_sensors
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def due_periods(now: datetime) -> frozenset[str]:
+    """Perioden, die zum Zeitpunkt ``now`` (volle Stunde) wechseln."""
+    periods = {"hourly"}
+    if now.hour % 2 == 0:
+        periods.add("2h")
+    if now.hour % 4 == 0:
+        periods.add("4h")
+    if now.hour == 0:
+        periods.add("daily")
+        if now.day == 1:
+            periods.add("monthly")
+            if now.month == 1:
+                periods.add("yearly")
+    return frozenset(periods)
+
+
 class ResetManager:
     """Zentrale Reset-Logik für alle Sensor-Typen und Perioden."""
 
@@ -34,108 +57,80 @@ class ResetManager:
         self._unsub_timers = {}
 
     def setup_reset_automations(self):
-        """Richte Reset-Automatisierungen ein."""
+        """Richte den Perioden-Scheduler ein (ein Listener zur vollen Stunde)."""
         _LOGGER.info("Setting up reset automations for entry %s", self._entry_id)
 
-        # Daily Reset: Erst Yesterday mit aktuellem Daily-Wert füllen, danach Daily auf 0
-        @callback
-        def reset_daily(now: datetime) -> None:
-            """Reset daily sensors at midnight after updating yesterday sensors."""
-            _LOGGER.info("Resetting daily sensors at midnight")
-
-            async def _daily_reset_sequence() -> None:
-                await _update_yesterday_sensors_async(self.hass, self._entry_id)
-                await self._send_reset_signal_async(SIGNAL_RESET_DAILY)
-
-            self.hass.async_create_task(_daily_reset_sequence())
-
-        self._unsub_timers["daily"] = async_track_time_change(
-            self.hass, reset_daily, hour=0, minute=0, second=0
-        )
-
-        # 2h Reset (alle 2 Stunden)
         @callback
-        def reset_2h(now: datetime) -> None:
-            """Reset 2h sensors every 2 hours."""
-            _LOGGER.info("Resetting 2h sensors (all modes)")
-
-            # Sende Signal an alle 2H-Sensoren (asynchron)
-            self.hass.async_create_task(self._send_reset_signal_async(SIGNAL_RESET_2H))
-
-        self._unsub_timers["2h"] = async_track_time_change(
-            self.hass,
-            reset_2h,
-            hour=[0, 2, 4, 6, 8, 10, 12, 14, 16, 18, 20, 22],
-            minute=0,
-            second=0,
-        )
-
-        # 4h Reset (alle 4 Stunden)
-        @callback
-        def reset_4h(now: datetime) -> None:
-            """Reset 4h sensors every 4 hours."""
-            _LOGGER.info("Resetting 4h sensors (all modes)")
-
-            # Sende Signal an alle 4H-Sensoren (asynchron)
-            self.hass.async_create_task(self._send_reset_signal_async(SIGNAL_RESET_4H))
+        def _on_boundary(now: datetime) -> None:
+            self.rollover(due_periods(now))
 
-        self._unsub_timers["4h"] = async_track_time_change(
-            self.hass, reset_4h, hour=[0, 4, 8, 12, 16, 20], minute=0, second=0
+        self._unsub_timers["boundary"] = async_track_time_change(
+            self.hass, _on_boundary, minute=0, second=0
         )
 
-        # Hourly Reset (jede volle Stunde, für Heating Energy Hourly Debug-Sensor)
-        @callback
-        def reset_hourly(now: datetime) -> None:
-            """Reset hourly energy sensors every full hour."""
-            _LOGGER.info("Resetting hourly energy sensors at %s:%s", now.hour, now.minute)
-
-            self.hass.async_create_task(self._send_reset_signal_async(SIGNAL_RESET_HOURLY))
+        _LOGGER.info("Reset automations set up successfully")
 
-        self._unsub_timers["hourly"] = async_track_time_change(
-            self.hass, reset_hourly, hour=list(range(24)), minute=0, second=0
-        )
+    @callback
+    def rollover(self, periods) -> int:
+        """Rollover für alle Entities der Perioden ``periods`` in einem Durchlauf.
 
-        # Monthly Reset (1. des Monats)
-        @callback
-        def reset_monthly(now: datetime) -> None:
-            """Reset monthly sensors on the 1st of each month."""
-            if now.day == 1:
-                _LOGGER.info("Resetting monthly sensors (cycling, energy) on 1st of month")
-
-                # Sende Signal an alle Monthly-Sensoren (asynchron)
-                self.hass.async_create_task(
-                    self._send_reset_signal_async(SIGNAL_RESET_MONTHLY)
-                )
-
-        self._unsub_timers["monthly"] = async_track_time_change(
-            self.hass, reset_monthly, hour=0, minute=0, second=0
-        )
+        Returns:
+            Anzahl geschriebener Entities.
+        """
+        periods = frozenset(periods)
+        entry_data = self.hass.data.get("lambda_heat_pumps", {}).get(self._entry_id, {})
+        cycling_entities = entry_data.get("cycling_entities", {})
+        energy_entities = entry_data.get("energy_entities", {})
+        coordinator = entry_data.get("coordinator")
+        cop_engine = getattr(coordinator, "cop_engine", None)
 
-        # Yearly Reset (1. Januar)
-        @callback
-        def reset_yearly(now: datetime) -> None:
-            """Reset yearly sensors on January 1st."""
-            if now.month == 1 and now.day == 1:
-                _LOGGER.info("Resetting yearly sensors on January 1st")
-
-                # Sende Signal an alle Yearly-Sensoren (asynchron)
-                self.hass.async_create_task(
-                    self._send_reset_signal_async(SIGNAL_RESET_YEARLY)
-                )
-
-        self._unsub_timers["yearly"] = async_track_time_change(
-            self.hass, reset_yearly, hour=0, minute=0, second=0
+        _LOGGER.info(
+            "Period rollover for entry %s: %s",
+            self._entry_id,
+            ", ".join(sorted(periods)),
         )
 
-        _LOGGER.info("Reset automations set up successfully")
+        changed = []
+        # 1. Yesterday-Snapshot vor dem Daily-Reset
+        if "daily" in periods:
+            changed.extend(snapshot_yesterday_sensors(self.hass, cycling_entities))
+
+        if cop_engine is not None:
+            cop_engine.begin_batch()
+        try:
+            # 2a. Zähler (Energy setzt die Baseline in der Rollup-Tabelle und meldet den
+            #     neuen Perioden-Wert direkt an die COP-Engine)
+            for entity in cycling_entities.values():
+                if getattr(entity, "_reset_interval", None) in periods and entity._apply_period_reset():
+                    changed.append(entity)
+            for entity in energy_entities.values():
+                if getattr(entity, "_reset_interval", None) in periods and entity._apply_period_reset():
+                    entity._mark_persist_dirty()
+                    entity._publish_cop_source()
+                    changed.append(entity)
+
+            # 2b. COP-Baselines aus den bereits zurückgesetzten Quellwerten
+            if cop_engine is not None:
+                for sensor in list(cop_engine.sensors()):
+                    if sensor._period in periods and sensor._apply_period_reset():
+                        changed.append(sensor)
+
+            # 3. State-Writes
+            for entity in changed:
+                try:
+                    entity.async_write_ha_state()
+                except Exception as ex:  # Ein Entity darf den Rollover nicht abbrechen
+                    _LOGGER.error("Rollover state write failed for %s: %s", entity.entity_id, ex)
+        finally:
+            if cop_engine is not None:
+                cop_engine.end_batch()
 
-    async def _send_reset_signal_async(self, signal: str) -> None:
-        """Send reset signal asynchronously."""
         _LOGGER.info(
-            "Reset signal sent: signal=%s entry_id=%s",
-            signal, self._entry_id,
+            "Period rollover for entry %s complete: %d entities updated",
+            self._entry_id,
+            len(changed),
         )
-        async_dispatcher_send(self.hass, signal, self._entry_id)
+        return len(changed)
 
     def cleanup(self):
         """Cleanup Reset-Automatisierungen."""
@@ -147,4 +142,3 @@ class ResetManager:
                 _LOGGER.debug("Cleaned up %s listener for entry %s", period, self._entry_id)
 
         self._unsub_timers = {}
-
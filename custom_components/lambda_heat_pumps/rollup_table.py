@@ -0,0 +1,91 @@
+"""Zentrale Perioden-Baseline-Tabelle pro Coordinator.
+
+Jeder Energy-Perioden-Sensor (daily, hourly, monthly, yearly, …) zeigt
+``Total − Baseline``, wobei die Baseline der Total-Wert zu Periodenbeginn ist.
+Früher hielt jede Entity ihre Baseline selbst (``_yesterday_value``,
+``_previous_monthly_value``, …) und stellte sie einzeln über
+RestoreEntity-Attribute wieder her. ``RollupBaselineTable`` hält alle Baselines
+eines Coordinators in einem Dict, Schlüssel ``(hp, mode, kind, period)``:
+
+- Rollover: ``set``/``rollover`` pro Schlüssel in O(1),
+- Neustart: ein ``load`` aus ``cycle_energy_persist.json`` (Sektion
+  ``rollup_baselines``), bevor die Entities hinzugefügt werden,
+- ``dirty`` signalisiert dem Coordinator, dass beim nächsten Persist-Zyklus
+  geschrieben werden muss.
+"""
+
+from __future__ import annotations
+
+_KEY_SEP = "|"
+
+
+def _key(hp, mode, kind, period) -> tuple:
+    return (int(hp), str(mode), str(kind), str(period))
+
+
+class RollupBaselineTable:
+    """Baselines (Total-Wert zu Periodenbeginn) pro (hp, mode, kind, period)."""
+
+    __slots__ = ("_values", "dirty")
+
+    def __init__(self) -> None:
+        self._values: dict[tuple, float] = {}
+        self.dirty = False
+
+    def get(self, hp, mode, kind, period, default=None):
+        """Baseline oder ``default``, wenn für den Schlüssel noch nichts vorliegt."""
+        return self._values.get(_key(hp, mode, kind, period), default)
+
+    def has(self, hp, mode, kind, period) -> bool:
+        return _key(hp, mode, kind, period) in self._values
+
+    def set(self, hp, mode, kind, period, value) -> bool:
+        """Baseline setzen. True, wenn sich der Wert geändert hat."""
+        key = _key(hp, mode, kind, period)
+        value = float(value)
+        if self._values.get(key) == value:
+            return False
+        self._values[key] = value
+        self.dirty = True
+        return True
+
+    def value(self, hp, mode, kind, period, total) -> float:
+        """Perioden-Wert ``total − baseline`` (nie negativ; ohne Baseline = total)."""
+        baseline = self._values.get(_key(hp, mode, kind, period), 0.0)
+        return max(0.0, float(total) - baseline)
+
+    def rollover(self, period, totals) -> int:
+        """Periodenwechsel: Baseline = aktueller Total für alle ``((hp, mode, kind), total)``.
+
+        Returns:
+            Anzahl geänderter Schlüssel.
+        """
+        changed = 0
+        for (hp, mode, kind), total in totals:
+            if total is not None and self.set(hp, mode, kind, period, total):
+                changed += 1
+        return changed
+
+    def to_dict(self) -> dict[str, float]:
+        """JSON-taugliche Form: ``{"1|heating|electrical|daily": 12.34}``."""
+        return {
+            _KEY_SEP.join(str(part) for part in key): round(value, 4)
+            for key, value in self._values.items()
+        }
+
+    def load(self, data) -> int:
+        """Tabelle aus ``to_dict``-Daten ersetzen. Ungültige Einträge werden übersprungen."""
+        self._values.clear()
+        for raw_key, value in (data or {}).items():
+            parts = str(raw_key).split(_KEY_SEP)
+            if len(parts) != 4:
+                continue
+            try:
+                self._values[_key(*parts)] = float(value)
+            except (TypeError, ValueError):
+                continue
+        self.dirty = False
+        return len(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
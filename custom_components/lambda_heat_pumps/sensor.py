@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import logging
+import time
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -18,7 +20,6 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.template import Template
 from homeassistant.exceptions import TemplateError
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import async_track_state_change_event, async_track_time_interval
 from datetime import timedelta
 from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
@@ -27,11 +28,6 @@ from homeassistant.helpers.entity_registry import async_get as async_get_entity_
 from .const import (
     DOMAIN,
     SENSOR_TYPES,
-    HP_SENSOR_TEMPLATES,
-    BOIL_SENSOR_TEMPLATES,
-    HC_SENSOR_TEMPLATES,
-    BUFF_SENSOR_TEMPLATES,
-    SOL_SENSOR_TEMPLATES,
     CALCULATED_SENSOR_TEMPLATES,
     ENERGY_CONSUMPTION_SENSOR_TEMPLATES,
     ENERGY_CONSUMPTION_MODES,
@@ -42,6 +38,10 @@ from .const import (
     COP_PERIODS,
 )
 from .coordinator import LambdaDataUpdateCoordinator
+from .cop_engine import COPEngine, SOURCE_ELECTRICAL, SOURCE_THERMAL
+from .register_catalog import get_register_catalog
+from .rollup_table import RollupBaselineTable
+from .state_gate import create_state_gate, resolve_precision
 from .utils import (
     apply_energy_period_reset,
     build_device_info,
@@ -51,7 +51,6 @@ from .utils import (
     generate_sensor_names,
     load_sensor_translations,
     get_firmware_version_int,
-    get_compatible_sensors,
     get_entity_icon,
     normalize_name_prefix,
     restore_energy_period_state,
@@ -75,6 +74,393 @@ from .const_mapping import MAIN_E_MANAGER_OPERATING_STATE  # noqa: F401
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sensor-IDs mit diesen Bestandteilen (undokumentierte Register) loggen ihren Wert im Debug-Level
+_DEBUG_VALUE_SENSOR_KEYWORDS = (
+    "extended",
+    "config",
+    "additional",
+    "ambient",
+    "compressor_outlet",
+    "maximum_value",
+)
+
+
+_HA_STATE_CLASSES = {
+    "measurement": SensorStateClass.MEASUREMENT,
+    "total": SensorStateClass.TOTAL,
+    "total_increasing": SensorStateClass.TOTAL_INCREASING,
+}
+_HA_DEVICE_CLASSES = {
+    "temperature": SensorDeviceClass.TEMPERATURE,
+    "power": SensorDeviceClass.POWER,
+    "energy": SensorDeviceClass.ENERGY,
+    "enum": SensorDeviceClass.ENUM,
+}
+_UNIT_DEVICE_CLASSES = {
+    "°C": SensorDeviceClass.TEMPERATURE,
+    "W": SensorDeviceClass.POWER,
+    "Wh": SensorDeviceClass.ENERGY,
+}
+
+
+@dataclasses.dataclass(frozen=True, slots=True, eq=False)
+class LambdaSensorDescription:
+    """Unveränderliche Template-Metadaten eines LambdaSensor; von allen Geräte-Indizes geteilt."""
+
+    unit: str | None
+    scale: float
+    state_class: str | None
+    device_class: str | None
+    relative_address: int
+    data_type: str | None
+    device_type: str | None
+    txt_mapping: bool
+    precision: int | float | None
+    options: list[str] | None
+    sensor_info: dict
+    icon: str | None
+    ha_state_class: SensorStateClass | None
+    ha_device_class: SensorDeviceClass | None
+    unit_device_class: SensorDeviceClass | None
+
+
+# (Template-Felder) -> Description; sensor_info über id() (Templates sind Modul-Konstanten
+# und werden von der Description referenziert, die id bleibt also eindeutig)
+_SENSOR_DESCRIPTIONS: dict[tuple, LambdaSensorDescription] = {}
+
+
+def _hashable_option(options):
+    if options is None or isinstance(options, (str, tuple)):
+        return options
+    if isinstance(options, list):
+        return tuple(options)
+    # z. B. {"register": True}: Objekt wird von der Description referenziert, id bleibt eindeutig
+    return id(options)
+
+
+def _describe_sensor(
+    unit,
+    scale,
+    state_class,
+    device_class,
+    relative_address,
+    data_type,
+    device_type,
+    txt_mapping,
+    precision,
+    options,
+    sensor_info,
+) -> LambdaSensorDescription:
+    """Geteilte Description für identische Template-Metadaten (Flyweight)."""
+    key = (
+        unit,
+        scale,
+        state_class,
+        device_class,
+        relative_address,
+        data_type,
+        device_type,
+        txt_mapping,
+        precision,
+        _hashable_option(options),
+        id(sensor_info),
+    )
+    desc = _SENSOR_DESCRIPTIONS.get(key)
+    if desc is None:
+        desc = _SENSOR_DESCRIPTIONS[key] = LambdaSensorDescription(
+            unit=unit,
+            scale=scale,
+            state_class=state_class,
+            device_class=device_class,
+            relative_address=relative_address,
+            data_type=data_type,
+            device_type=device_type,
+            txt_mapping=txt_mapping,
+            precision=precision,
+            options=options,
+            sensor_info=sensor_info or {},
+            icon=get_entity_icon(sensor_info),
+            ha_state_class=_HA_STATE_CLASSES.get(state_class),
+            ha_device_class=_HA_DEVICE_CLASSES.get(device_class),
+            unit_device_class=_UNIT_DEVICE_CLASSES.get(unit),
+        )
+    return desc
+
+
+# COP-Perioden mit eigenen Zyklus-Baselines (Reset-Signal)
+_COP_CYCLIC_PERIODS = ("daily", "monthly", "yearly", "hourly")
+
+
+def _resolve_gating_config(hass, entry) -> dict:
+    """state_write_gating-Overrides des Coordinators dieses Entries (leer ohne Coordinator)."""
+    try:
+        coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id, {}).get("coordinator")
+    except Exception:
+        return {}
+    gating_config = getattr(coordinator, "state_write_gating", None)
+    return gating_config if isinstance(gating_config, dict) else {}
+
+
+def _resolve_state_gate_registry(hass, entry):
+    """Gate-Registry des Coordinators dieses Entries (None ohne Coordinator)."""
+    try:
+        coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id, {}).get("coordinator")
+    except Exception:
+        return None
+    return getattr(coordinator, "state_gates", None)
+
+
+def _resolve_cop_engine(hass, entry) -> tuple[COPEngine, bool]:
+    """COP-Engine des Coordinators dieses Entries (shared=True) oder eine eigene Engine."""
+    try:
+        coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id, {}).get("coordinator")
+        engine = getattr(coordinator, "cop_engine", None)
+        if isinstance(engine, COPEngine):
+            return engine, True
+    except Exception:
+        pass
+    return COPEngine(), False
+
+
+def _format_numeric_value(value) -> float | None:
+    """Formatter für numerische Sensoren: Rohwert -> float (None bei ungültigen Werten)."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _round_numeric_value(value, precision: int) -> float | None:
+    """Formatter mit per YAML überschriebener Precision."""
+    try:
+        return round(float(value), precision)
+    except (ValueError, TypeError):
+        return None
+
+
+# Betriebsarten der Cycling-Zähler und die Zähler-Familien je HP in Registrierungsreihenfolge
+_CYCLING_MODES = ("heating", "hot_water", "cooling", "defrost", "compressor_start")
+_CYCLING_FAMILIES = (
+    ("total", _CYCLING_MODES),
+    ("yesterday", _CYCLING_MODES),
+    ("daily", _CYCLING_MODES),
+    ("2h", _CYCLING_MODES),
+    ("4h", _CYCLING_MODES),
+    ("monthly", ("compressor_start",)),
+)
+
+
+@dataclasses.dataclass(frozen=True, slots=True, eq=False)
+class _HPSensorSpec:
+    """Ein abgeleiteter HP-Sensor (Cycling/Energy/COP), unabhängig vom HP-Index."""
+
+    kind: str  # "cycling", "yesterday", "energy", "cop"
+    sensor_id: str
+    name: str
+    template: dict
+    mode: str
+    period: str | None = None
+    thermal_sensor_id: str | None = None
+    thermal_name: str | None = None
+    electrical_sensor_id: str | None = None
+    electrical_name: str | None = None
+
+
+_HP_SENSOR_SPECS: tuple[_HPSensorSpec, ...] | None = None
+
+
+def _hp_sensor_specs() -> tuple[_HPSensorSpec, ...]:
+    """Tabelle aller abgeleiteten HP-Sensoren (einmal pro Prozess aus den Templates gebaut).
+
+    Reihenfolge: Cycling-Familien (total, yesterday, daily, 2h, 4h, monthly),
+    Energy (Total zuerst, ENERGY_REGISTRATION_ORDER), Thermal Energy, COP.
+    """
+    global _HP_SENSOR_SPECS
+    if _HP_SENSOR_SPECS is not None:
+        return _HP_SENSOR_SPECS
+
+    specs = []
+    for family, modes in _CYCLING_FAMILIES:
+        for mode in modes:
+            sensor_id = f"{mode}_cycling_{family}"
+            template = CALCULATED_SENSOR_TEMPLATES[sensor_id]
+            specs.append(
+                _HPSensorSpec(
+                    kind="yesterday" if family == "yesterday" else "cycling",
+                    sensor_id=sensor_id,
+                    name=template["name"],
+                    template=template,
+                    mode=mode,
+                )
+            )
+
+    periods = [p for p in ENERGY_REGISTRATION_ORDER if p in ENERGY_CONSUMPTION_PERIODS]
+    for pattern in ("{mode}_energy_{period}", "{mode}_thermal_energy_{period}"):
+        thermal = "thermal" in pattern
+        for mode in ENERGY_CONSUMPTION_MODES:
+            for period in periods:
+                sensor_id = pattern.format(mode=mode, period=period)
+                template = ENERGY_CONSUMPTION_SENSOR_TEMPLATES.get(sensor_id)
+                if not template:
+                    # Thermal energy sensors sind optional, kein Warning
+                    if not thermal:
+                        _LOGGER.warning("Template not found for %s", sensor_id)
+                    continue
+                if thermal and template.get("data_type") != "thermal_calculated":
+                    continue
+                specs.append(
+                    _HPSensorSpec(
+                        kind="energy",
+                        sensor_id=sensor_id,
+                        name=template["name"],
+                        template=template,
+                        mode=mode,
+                        period=period,
+                    )
+                )
+
+    # COP_MODES: heating, hot_water, cooling (ohne defrost)
+    # COP_PERIODS: daily, monthly, yearly, total, hourly (hourly nur für heating)
+    for mode in COP_MODES:
+        mode_display = mode.replace("_", " ").title()
+        for period in COP_PERIODS:
+            if period == "hourly" and mode != "heating":
+                continue
+            thermal_sensor_id = f"{mode}_thermal_energy_{period}"
+            electrical_sensor_id = f"{mode}_energy_{period}"
+            specs.append(
+                _HPSensorSpec(
+                    kind="cop",
+                    sensor_id=f"{mode}_cop_{period}",
+                    name=f"{mode_display} COP {period.title()}",
+                    template={},
+                    mode=mode,
+                    period=period,
+                    thermal_sensor_id=thermal_sensor_id,
+                    thermal_name=ENERGY_CONSUMPTION_SENSOR_TEMPLATES.get(
+                        thermal_sensor_id, {}
+                    ).get("name", f"{mode_display} Thermal Energy {period.title()}"),
+                    electrical_sensor_id=electrical_sensor_id,
+                    electrical_name=ENERGY_CONSUMPTION_SENSOR_TEMPLATES.get(
+                        electrical_sensor_id, {}
+                    ).get("name", f"{mode_display} Energy {period.title()}"),
+                )
+            )
+
+    _HP_SENSOR_SPECS = tuple(specs)
+    return _HP_SENSOR_SPECS
+
+
+class _SensorNameTable:
+    """Name/Entity-ID/Unique-ID pro (Device-Präfix, Sensor-ID), einmal berechnet.
+
+    COP-Sensoren referenzieren die Entity-IDs der Energy-Sensoren; diese werden
+    aus der Tabelle gelesen statt erneut mit Übersetzungs-Lookup generiert.
+    """
+
+    __slots__ = ("_name_prefix", "_use_legacy_modbus_names", "_translations", "_table")
+
+    def __init__(self, name_prefix: str, use_legacy_modbus_names: bool, translations):
+        self._name_prefix = name_prefix
+        self._use_legacy_modbus_names = use_legacy_modbus_names
+        self._translations = translations
+        self._table: dict[tuple[str, str], dict] = {}
+
+    def names(self, device_prefix: str, sensor_name: str, sensor_id: str) -> dict:
+        key = (device_prefix, sensor_id)
+        names = self._table.get(key)
+        if names is None:
+            names = generate_sensor_names(
+                device_prefix,
+                sensor_name,
+                sensor_id,
+                self._name_prefix,
+                self._use_legacy_modbus_names,
+                translations=self._translations,
+            )
+            self._table[key] = names
+        return names
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+
+def _create_hp_sensor(hass, entry, spec: _HPSensorSpec, hp_idx: int, name_table: _SensorNameTable):
+    """Entity für einen Eintrag aus ``_hp_sensor_specs`` und HP-Index erzeugen."""
+    device_prefix = f"hp{hp_idx}"
+    names = name_table.names(device_prefix, spec.name, spec.sensor_id)
+    template = spec.template
+
+    if spec.kind == "cycling":
+        return LambdaCyclingSensor(
+            hass=hass,
+            entry=entry,
+            sensor_id=spec.sensor_id,
+            name=names["name"],
+            entity_id=names["entity_id"],
+            unique_id=names["unique_id"],
+            unit=template["unit"],
+            state_class=template["state_class"],
+            device_class=template["device_class"],
+            device_type=template["device_type"],
+            hp_index=hp_idx,
+        )
+    if spec.kind == "yesterday":
+        return LambdaYesterdaySensor(
+            hass=hass,
+            entry=entry,
+            sensor_id=spec.sensor_id,
+            name=names["name"],
+            entity_id=names["entity_id"],
+            unique_id=names["unique_id"],
+            unit=template["unit"],
+            state_class=template["state_class"],
+            device_class=template["device_class"],
+            device_type=template["device_type"],
+            hp_index=hp_idx,
+            mode=spec.mode,
+        )
+    if spec.kind == "energy":
+        return LambdaEnergyConsumptionSensor(
+            hass,
+            entry,
+            spec.sensor_id,
+            names["name"],
+            names["entity_id"],
+            names["unique_id"],
+            template["unit"],
+            template["state_class"],
+            template.get("device_class"),
+            template["device_type"],
+            hp_idx,
+            spec.mode,
+            spec.period,
+        )
+    # COP: Quell-Entity-IDs aus der Namenstabelle (identisch zu den Energy-Sensoren)
+    thermal_entity_id = name_table.names(
+        device_prefix, spec.thermal_name, spec.thermal_sensor_id
+    )["entity_id"]
+    electrical_entity_id = name_table.names(
+        device_prefix, spec.electrical_name, spec.electrical_sensor_id
+    )["entity_id"]
+    return LambdaCOPSensor(
+        hass,
+        entry,
+        spec.sensor_id,
+        names["name"],
+        names["entity_id"],
+        names["unique_id"],
+        None,  # Keine Einheit (COP ist dimensionslos)
+        "measurement",
+        None,  # Keine device_class
+        "hp",
+        hp_idx,
+        spec.mode,
+        spec.period,
+        thermal_entity_id,
+        electrical_entity_id,
+    )
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -112,6 +498,9 @@ async def async_setup_entry(
         fw_version,
     )
 
+    name_table = _SensorNameTable(name_prefix, use_legacy_modbus_names, sensor_translations)
+    setup_start = time.perf_counter()
+
     # Create sensors for each device type using a generic loop
     sensors = []
     general_sensors = []  # General Sensors separat sammeln für frühe Registrierung
@@ -153,13 +542,10 @@ async def async_setup_entry(
 
         # Verwende die zentrale Namensgenerierung für General Sensors
         # Für General Sensors ist der sensor_id der device_prefix
-        names = generate_sensor_names(
+        names = name_table.names(
             sensor_id,  # device_prefix für General Sensors ist der sensor_id
             sensor_info["name"],
             sensor_id_final,  # sensor_id für die Namensgenerierung
-            name_prefix,
-            use_legacy_modbus_names,
-            translations=sensor_translations,
         )
 
         entity_id = names["entity_id"]
@@ -196,6 +582,7 @@ async def async_setup_entry(
     # über nicht existierende via_device Referenzen in Home Assistant 2025.12.0+.
     # Home Assistant registriert Entities in der Reihenfolge, in der sie hinzugefügt werden,
     # daher wird das Haupt-Device erstellt, bevor Sub-Devices registriert werden.
+    build_general_end = time.perf_counter()
     if general_sensors:
         _LOGGER.info("Registriere %d General Sensors zuerst (erstellt Haupt-Device)...", len(general_sensors))
         async_add_entities(general_sensors, update_before_add=False)
@@ -208,19 +595,22 @@ async def async_setup_entry(
         _LOGGER.warning("Keine General Sensors vorhanden, Haupt-Device wird möglicherweise nicht erstellt")
 
     # Sub-Device Sensoren (HP/Boil/HC/Buff/Sol) - verwenden via_device auf das Haupt-Device
+    catalog = get_register_catalog(fw_version)
     TEMPLATES = [
-        ("hp", num_hps, get_compatible_sensors(HP_SENSOR_TEMPLATES, fw_version)),
-        ("boil", num_boil, get_compatible_sensors(BOIL_SENSOR_TEMPLATES, fw_version)),
-        ("buff", num_buff, get_compatible_sensors(BUFF_SENSOR_TEMPLATES, fw_version)),
-        ("sol", num_sol, get_compatible_sensors(SOL_SENSOR_TEMPLATES, fw_version)),
-        ("hc", num_hc, get_compatible_sensors(HC_SENSOR_TEMPLATES, fw_version)),
+        ("hp", num_hps, catalog.templates("hp")),
+        ("boil", num_boil, catalog.templates("boil")),
+        ("buff", num_buff, catalog.templates("buff")),
+        ("sol", num_sol, catalog.templates("sol")),
+        ("hc", num_hc, catalog.templates("hc")),
     ]
 
+    build_start = time.perf_counter()
+    # Always use lowercased name_prefix for all entity_id/unique_id generation
+    name_prefix_lc = name_prefix.lower() if name_prefix else ""
     for prefix, count, template in TEMPLATES:
+        base_addresses = generate_base_addresses(prefix, count)
         for idx in range(1, count + 1):
-            base_address = generate_base_addresses(prefix, count)[idx]
-            # Always use lowercased name_prefix for all entity_id/unique_id generation
-            name_prefix_lc = name_prefix.lower() if name_prefix else ""
+            base_address = base_addresses[idx]
             for sensor_id, sensor_info in template.items():
                 address = base_address + sensor_info["relative_address"]
                 if coordinator.is_register_disabled(address):
@@ -257,14 +647,7 @@ async def async_setup_entry(
                     device_prefix = f"{prefix}{idx}"
 
                     # Verwende die zentrale Namensgenerierung
-                    names = generate_sensor_names(
-                        device_prefix,
-                        sensor_info["name"],
-                        sensor_id,
-                        name_prefix,
-                        use_legacy_modbus_names,
-                        translations=sensor_translations,
-                    )
+                    names = name_table.names(device_prefix, sensor_info["name"], sensor_id)
 
                     sensor_id_final = f"{prefix}{idx}_{sensor_id}"
                     entity_id = names["entity_id"]
@@ -308,470 +691,33 @@ async def async_setup_entry(
                 )
 
     # Extended/undocumented sensors sind jetzt direkt in HP_SENSOR_TEMPLATES integriert
-    # --- Cycling Total Sensors (echte Entities, keine Templates) ---
-    cycling_modes = [
-        ("heating", "heating_cycling_total"),
-        ("hot_water", "hot_water_cycling_total"),
-        ("cooling", "cooling_cycling_total"),
-        ("defrost", "defrost_cycling_total"),
-        ("compressor_start", "compressor_start_cycling_total"),
-    ]
-    cycling_sensor_count = 0
-    cycling_sensor_ids = []
-    cycling_entities = {}  # Dictionary für schnellen Zugriff
-
-    for hp_idx in range(1, num_hps + 1):
-        for mode, template_id in cycling_modes:
-            template = CALCULATED_SENSOR_TEMPLATES[template_id]
-            # Entity-ID und unique_id generieren
-            device_prefix = f"hp{hp_idx}"
-            names = generate_sensor_names(
-                device_prefix,
-                template["name"],
-                template_id,
-                name_prefix,
-                use_legacy_modbus_names,
-                translations=sensor_translations,
-            )
-            cycling_sensor_ids.append(names["entity_id"])
-
-            cycling_sensor = LambdaCyclingSensor(
-                hass=hass,
-                entry=entry,
-                sensor_id=template_id,
-                name=names["name"],
-                entity_id=names["entity_id"],
-                unique_id=names["unique_id"],
-                unit=template["unit"],
-                state_class=template["state_class"],
-                device_class=template["device_class"],
-                device_type=template["device_type"],
-                hp_index=hp_idx,
-            )
-
-            sensors.append(cycling_sensor)
-            cycling_entities[names["entity_id"]] = cycling_sensor
-            cycling_sensor_count += 1
-
-    # --- Yesterday Cycling Sensors (echte Entities - speichern gestern Werte) ---
-    yesterday_modes = [
-        ("heating", "heating_cycling_yesterday"),
-        ("hot_water", "hot_water_cycling_yesterday"),
-        ("cooling", "cooling_cycling_yesterday"),
-        ("defrost", "defrost_cycling_yesterday"),
-        ("compressor_start", "compressor_start_cycling_yesterday"),
-    ]
-    yesterday_sensor_count = 0
-    yesterday_sensor_ids = []
-
-    for hp_idx in range(1, num_hps + 1):
-        for mode, template_id in yesterday_modes:
-            template = CALCULATED_SENSOR_TEMPLATES[template_id]
-            # Entity-ID und unique_id generieren
-            device_prefix = f"hp{hp_idx}"
-            names = generate_sensor_names(
-                device_prefix,
-                template["name"],
-                template_id,
-                name_prefix,
-                use_legacy_modbus_names,
-                translations=sensor_translations,
-            )
-            yesterday_sensor_ids.append(names["entity_id"])
-
-            yesterday_sensor = LambdaYesterdaySensor(
-                hass=hass,
-                entry=entry,
-                sensor_id=template_id,
-                name=names["name"],
-                entity_id=names["entity_id"],
-                unique_id=names["unique_id"],
-                unit=template["unit"],
-                state_class=template["state_class"],
-                device_class=template["device_class"],
-                device_type=template["device_type"],
-                hp_index=hp_idx,
-                mode=mode,
-            )
-
-            sensors.append(yesterday_sensor)
-            yesterday_sensor_count += 1
-
-    # --- Daily Cycling Sensors (echte Entities - werden täglich um Mitternacht auf 0 gesetzt) ---
-    daily_modes = [
-        ("heating", "heating_cycling_daily"),
-        ("hot_water", "hot_water_cycling_daily"),
-        ("cooling", "cooling_cycling_daily"),
-        ("defrost", "defrost_cycling_daily"),
-        ("compressor_start", "compressor_start_cycling_daily"),
-    ]
-    daily_sensor_count = 0
-    daily_sensor_ids = []
-
-    for hp_idx in range(1, num_hps + 1):
-        for mode, template_id in daily_modes:
-            template = CALCULATED_SENSOR_TEMPLATES[template_id]
-            device_prefix = f"hp{hp_idx}"
-            names = generate_sensor_names(
-                device_prefix,
-                template["name"],
-                template_id,
-                name_prefix,
-                use_legacy_modbus_names,
-                translations=sensor_translations,
-            )
-            daily_sensor_ids.append(names["entity_id"])
-
-            daily_sensor = LambdaCyclingSensor(
-                hass=hass,
-                entry=entry,
-                sensor_id=template_id,
-                name=names["name"],
-                entity_id=names["entity_id"],
-                unique_id=names["unique_id"],
-                unit=template["unit"],
-                state_class=template["state_class"],
-                device_class=template["device_class"],
-                device_type=template["device_type"],
-                hp_index=hp_idx,
-            )
-
-            sensors.append(daily_sensor)
-            daily_sensor_count += 1
-
-    # --- 2h Cycling Sensors (echte Entities - werden alle 2 Stunden auf 0 gesetzt) ---
-    two_hour_modes = [
-        ("heating", "heating_cycling_2h"),
-        ("hot_water", "hot_water_cycling_2h"),
-        ("cooling", "cooling_cycling_2h"),
-        ("defrost", "defrost_cycling_2h"),
-        ("compressor_start", "compressor_start_cycling_2h"),
-    ]
-    two_hour_sensor_count = 0
-    two_hour_sensor_ids = []
-
-    for hp_idx in range(1, num_hps + 1):
-        for mode, template_id in two_hour_modes:
-            template = CALCULATED_SENSOR_TEMPLATES[template_id]
-            device_prefix = f"hp{hp_idx}"
-            names = generate_sensor_names(
-                device_prefix,
-                template["name"],
-                template_id,
-                name_prefix,
-                use_legacy_modbus_names,
-                translations=sensor_translations,
-            )
-            two_hour_sensor_ids.append(names["entity_id"])
-
-            two_hour_sensor = LambdaCyclingSensor(
-                hass=hass,
-                entry=entry,
-                sensor_id=template_id,
-                name=names["name"],
-                entity_id=names["entity_id"],
-                unique_id=names["unique_id"],
-                unit=template["unit"],
-                state_class=template["state_class"],
-                device_class=template["device_class"],
-                device_type=template["device_type"],
-                hp_index=hp_idx,
-            )
-
-            sensors.append(two_hour_sensor)
-            two_hour_sensor_count += 1
-
-    # --- 4h Cycling Sensors (echte Entities - werden alle 4 Stunden auf 0 gesetzt) ---
-    four_hour_modes = [
-        ("heating", "heating_cycling_4h"),
-        ("hot_water", "hot_water_cycling_4h"),
-        ("cooling", "cooling_cycling_4h"),
-        ("defrost", "defrost_cycling_4h"),
-        ("compressor_start", "compressor_start_cycling_4h"),
-    ]
-    four_hour_sensor_count = 0
-    four_hour_sensor_ids = []
-
-    for hp_idx in range(1, num_hps + 1):
-        for mode, template_id in four_hour_modes:
-            template = CALCULATED_SENSOR_TEMPLATES[template_id]
-            device_prefix = f"hp{hp_idx}"
-            names = generate_sensor_names(
-                device_prefix,
-                template["name"],
-                template_id,
-                name_prefix,
-                use_legacy_modbus_names,
-                translations=sensor_translations,
-            )
-            four_hour_sensor_ids.append(names["entity_id"])
-
-            four_hour_sensor = LambdaCyclingSensor(
-                hass=hass,
-                entry=entry,
-                sensor_id=template_id,
-                name=names["name"],
-                entity_id=names["entity_id"],
-                unique_id=names["unique_id"],
-                unit=template["unit"],
-                state_class=template["state_class"],
-                device_class=template["device_class"],
-                device_type=template["device_type"],
-                hp_index=hp_idx,
-            )
-
-            sensors.append(four_hour_sensor)
-            four_hour_sensor_count += 1
-
-    # --- Monthly Cycling Sensors (echte Entities - werden am 1. des Monats auf 0 gesetzt) ---
-    monthly_modes = [
-        ("compressor_start", "compressor_start_cycling_monthly"),
-    ]
-    monthly_sensor_ids = []
+    # --- Abgeleitete HP-Sensoren (Cycling, Yesterday, Energy, Thermal, COP) in einem Durchlauf ---
+    cycling_entities = {}  # Dictionary für schnellen Zugriff (alle Cycling-Familien)
+    energy_entities = {}
+    family_counts: dict[str, int] = {}
+    hp_specs = _hp_sensor_specs()
 
     for hp_idx in range(1, num_hps + 1):
-        for mode, template_id in monthly_modes:
-            template = CALCULATED_SENSOR_TEMPLATES[template_id]
-            device_prefix = f"hp{hp_idx}"
-            names = generate_sensor_names(
-                device_prefix,
-                template["name"],
-                template_id,
-                name_prefix,
-                use_legacy_modbus_names,
-                translations=sensor_translations,
-            )
-            monthly_sensor_ids.append(names["entity_id"])
-
-            monthly_sensor = LambdaCyclingSensor(
-                hass=hass,
-                entry=entry,
-                sensor_id=template_id,
-                name=names["name"],
-                entity_id=names["entity_id"],
-                unique_id=names["unique_id"],
-                unit=template["unit"],
-                state_class=template["state_class"],
-                device_class=template["device_class"],
-                device_type=template["device_type"],
-                hp_index=hp_idx,
-            )
-
-            sensors.append(monthly_sensor)
+        for spec in hp_specs:
+            sensor = _create_hp_sensor(hass, entry, spec, hp_idx, name_table)
+            sensors.append(sensor)
+            entity_id = name_table.names(f"hp{hp_idx}", spec.name, spec.sensor_id)["entity_id"]
+            if spec.kind == "energy":
+                energy_entities[entity_id] = sensor
+            elif spec.kind != "cop":
+                cycling_entities[entity_id] = sensor
+            family = spec.sensor_id.rsplit("_", 1)[-1] if spec.kind in ("cycling", "yesterday") else spec.kind
+            family_counts[family] = family_counts.get(family, 0) + 1
 
     # Speichere die Cycling-Entities für schnellen Zugriff
-    if "lambda_heat_pumps" not in hass.data:
-        hass.data["lambda_heat_pumps"] = {}
-    if entry.entry_id not in hass.data["lambda_heat_pumps"]:
-        hass.data["lambda_heat_pumps"][entry.entry_id] = {}
-    
-    # Erweitere cycling_entities um alle neuen Sensor-Typen
-    all_cycling_entities = cycling_entities.copy()
-    
-    # Füge Yesterday-Sensoren hinzu
-    for sensor in sensors:
-        if hasattr(sensor, 'entity_id') and sensor.entity_id in yesterday_sensor_ids:
-            all_cycling_entities[sensor.entity_id] = sensor
-    
-    # Füge Daily-Sensoren hinzu
-    for sensor in sensors:
-        if hasattr(sensor, 'entity_id') and sensor.entity_id in daily_sensor_ids:
-            all_cycling_entities[sensor.entity_id] = sensor
-    
-    # Füge 2H-Sensoren hinzu
-    for sensor in sensors:
-        if hasattr(sensor, 'entity_id') and sensor.entity_id in two_hour_sensor_ids:
-            all_cycling_entities[sensor.entity_id] = sensor
-    
-    # Füge 4H-Sensoren hinzu
-    for sensor in sensors:
-        if hasattr(sensor, 'entity_id') and sensor.entity_id in four_hour_sensor_ids:
-            all_cycling_entities[sensor.entity_id] = sensor
-    
-    # Füge Monthly-Sensoren hinzu
-    for sensor in sensors:
-        if hasattr(sensor, 'entity_id') and sensor.entity_id in monthly_sensor_ids:
-            all_cycling_entities[sensor.entity_id] = sensor
-    
-    hass.data["lambda_heat_pumps"][entry.entry_id]["cycling_entities"] = all_cycling_entities
-    _LOGGER.info(
-        "Total-Cycling-Sensoren erzeugt: %d, Entity-IDs: %s",
-        cycling_sensor_count,
-        cycling_sensor_ids,
-    )
-    _LOGGER.info(
-        "Yesterday-Sensoren erzeugt: %d, Entity-IDs: %s",
-        yesterday_sensor_count,
-        yesterday_sensor_ids,
-    )
-    _LOGGER.info(
-        "Daily-Sensoren erzeugt: %d, Entity-IDs: %s",
-        daily_sensor_count,
-        daily_sensor_ids,
-    )
+    hass.data.setdefault("lambda_heat_pumps", {}).setdefault(entry.entry_id, {})[
+        "cycling_entities"
+    ] = cycling_entities
     _LOGGER.info(
-        "2h-Sensoren erzeugt: %d, Entity-IDs: %s",
-        two_hour_sensor_count,
-        two_hour_sensor_ids,
+        "Abgeleitete HP-Sensoren erzeugt: %d (%s)",
+        sum(family_counts.values()),
+        ", ".join(f"{family}={count}" for family, count in family_counts.items()),
     )
-    _LOGGER.info(
-        "4h-Sensoren erzeugt: %d, Entity-IDs: %s",
-        four_hour_sensor_count,
-        four_hour_sensor_ids,
-    )
-
-    for hp_idx in range(1, num_hps + 1):
-        for mode in ENERGY_CONSUMPTION_MODES:
-            for period in ENERGY_REGISTRATION_ORDER:
-                if period not in ENERGY_CONSUMPTION_PERIODS:
-                    continue
-                sensor_id = f"{mode}_energy_{period}"
-                sensor_template = ENERGY_CONSUMPTION_SENSOR_TEMPLATES.get(sensor_id)
-                if not sensor_template:
-                    _LOGGER.warning("Template not found for %s", sensor_id)
-                    continue
-                
-                device_prefix = f"hp{hp_idx}"
-                names = generate_sensor_names(
-                    device_prefix,
-                    sensor_template["name"],
-                    sensor_id,
-                    name_prefix,
-                    use_legacy_modbus_names,
-                    translations=sensor_translations,
-                )
-                
-                sensor = LambdaEnergyConsumptionSensor(
-                    hass,
-                    entry,
-                    sensor_id,
-                    names["name"],
-                    names["entity_id"],
-                    names["unique_id"],
-                    sensor_template["unit"],
-                    sensor_template["state_class"],
-                    sensor_template.get("device_class"),
-                    sensor_template["device_type"],
-                    hp_idx,
-                    mode,
-                    period,
-                )
-                sensors.append(sensor)
-                _LOGGER.debug("Created energy consumption sensor: %s", names['entity_id'])
-
-    for hp_idx in range(1, num_hps + 1):
-        for mode in ENERGY_CONSUMPTION_MODES:
-            for period in ENERGY_REGISTRATION_ORDER:
-                if period not in ENERGY_CONSUMPTION_PERIODS:
-                    continue
-                sensor_id = f"{mode}_thermal_energy_{period}"
-                sensor_template = ENERGY_CONSUMPTION_SENSOR_TEMPLATES.get(sensor_id)
-                if not sensor_template:
-                    # Thermal energy sensors sind optional, kein Warning
-                    continue
-                
-                # Prüfe ob es ein thermal_calculated Sensor ist
-                if sensor_template.get("data_type") != "thermal_calculated":
-                    continue
-                
-                device_prefix = f"hp{hp_idx}"
-                names = generate_sensor_names(
-                    device_prefix,
-                    sensor_template["name"],
-                    sensor_id,
-                    name_prefix,
-                    use_legacy_modbus_names,
-                    translations=sensor_translations,
-                )
-                
-                sensor = LambdaEnergyConsumptionSensor(
-                    hass,
-                    entry,
-                    sensor_id,
-                    names["name"],
-                    names["entity_id"],
-                    names["unique_id"],
-                    sensor_template["unit"],
-                    sensor_template["state_class"],
-                    sensor_template.get("device_class"),
-                    sensor_template["device_type"],
-                    hp_idx,
-                    mode,
-                    period,
-                )
-                sensors.append(sensor)
-                _LOGGER.debug("Created thermal energy consumption sensor: %s", names['entity_id'])
-
-    # COP sensors (per HP, per mode, per period)
-    # COP_MODES: heating, hot_water, cooling (ohne defrost)
-    # COP_PERIODS: daily, monthly, yearly, total, hourly (hourly nur für heating)
-    for hp_idx in range(1, num_hps + 1):
-        for mode in COP_MODES:
-            for period in COP_PERIODS:
-                if period == "hourly" and mode != "heating":
-                    continue
-                # Generiere Sensor-ID und Namen
-                sensor_id = f"{mode}_cop_{period}"
-                
-                # Generiere Names für COP-Sensor
-                mode_display = mode.replace("_", " ").title()
-                sensor_name = f"{mode_display} COP {period.title()}"
-                
-                device_prefix = f"hp{hp_idx}"
-                cop_names = generate_sensor_names(
-                    device_prefix,
-                    sensor_name,
-                    sensor_id,
-                    name_prefix,
-                    use_legacy_modbus_names,
-                    translations=sensor_translations,
-                )
-                
-                # Generiere Entity-IDs für Quell-Sensoren
-                thermal_sensor_id = f"{mode}_thermal_energy_{period}"
-                electrical_sensor_id = f"{mode}_energy_{period}"
-                
-                thermal_names = generate_sensor_names(
-                    device_prefix,
-                    ENERGY_CONSUMPTION_SENSOR_TEMPLATES.get(thermal_sensor_id, {}).get("name", f"{mode_display} Thermal Energy {period.title()}"),
-                    thermal_sensor_id,
-                    name_prefix,
-                    use_legacy_modbus_names,
-                    translations=sensor_translations,
-                )
-                
-                electrical_names = generate_sensor_names(
-                    device_prefix,
-                    ENERGY_CONSUMPTION_SENSOR_TEMPLATES.get(electrical_sensor_id, {}).get("name", f"{mode_display} Energy {period.title()}"),
-                    electrical_sensor_id,
-                    name_prefix,
-                    use_legacy_modbus_names,
-                    translations=sensor_translations,
-                )
-                
-                thermal_entity_id = thermal_names["entity_id"]
-                electrical_entity_id = electrical_names["entity_id"]
-                
-                # Erstelle COP-Sensor
-                cop_sensor = LambdaCOPSensor(
-                    hass,
-                    entry,
-                    sensor_id,
-                    cop_names["name"],
-                    cop_names["entity_id"],
-                    cop_names["unique_id"],
-                    None,  # Keine Einheit (COP ist dimensionslos)
-                    "measurement",
-                    None,  # Keine device_class
-                    "hp",
-                    hp_idx,
-                    mode,
-                    period,
-                    thermal_entity_id,
-                    electrical_entity_id,
-                )
-                sensors.append(cop_sensor)
-                _LOGGER.debug("Created COP sensor: %s (thermal: %s, electrical: %s)", cop_names['entity_id'], thermal_entity_id, electrical_entity_id)
 
     _LOGGER.info(
         "Alle Sensoren (inkl. Cycling, Energy Consumption und COP) erzeugt: %d (davon %d General Sensors bereits registriert)",
@@ -780,20 +726,29 @@ async def async_setup_entry(
     )
     # Füge alle anderen Sensoren hinzu (General Sensors wurden bereits hinzugefügt)
     async_add_entities(sensors, update_before_add=False)
-    
-    # Registriere Energy Consumption Entities in hass.data für direkten Zugriff
-    energy_entities = {}
-    for sensor in sensors:
-        if isinstance(sensor, LambdaEnergyConsumptionSensor):
-            energy_entities[sensor.entity_id] = sensor
-    
-    # Speichere Energy Entities in hass.data
-    if "energy_entities" not in coordinator_data:
-        coordinator_data["energy_entities"] = {}
-    coordinator_data["energy_entities"].update(energy_entities)
-    
+
+    # Speichere Energy Entities in hass.data für direkten Zugriff
+    coordinator_data.setdefault("energy_entities", {}).update(energy_entities)
     _LOGGER.info("Registered %s energy consumption entities", len(energy_entities))
 
+    # Setup-Zeit (ohne die Pause nach den General Sensors) für Diagnose festhalten
+    setup_ms = (build_general_end - setup_start + time.perf_counter() - build_start) * 1000
+    platform_setup_ms = coordinator_data.setdefault("platform_setup_ms", {})
+    platform_setup_ms["sensor"] = round(setup_ms, 1)
+    platform_setup_ms["register_catalog"] = round(catalog.build_ms, 2)
+    _LOGGER.info(
+        "Sensor-Plattform aufgebaut: %d Entities, %d Namenseinträge in %.1f ms "
+        "(HPs=%d, Boil=%d, Buff=%d, Sol=%d, HC=%d)",
+        len(sensors) + len(general_sensors),
+        len(name_table),
+        setup_ms,
+        num_hps,
+        num_boil,
+        num_buff,
+        num_sol,
+        num_hc,
+    )
+
     # Load template sensors from template_sensor.py (parallel, non-blocking)
     from .template_sensor import async_setup_entry as setup_template_sensors
 
@@ -858,12 +813,6 @@ class LambdaCyclingSensor(RestoreEntity, SensorEntity):
         self._last_2h_value = 0
         # Last 4h-Wert für 4h-Berechnung
         self._last_4h_value = 0
-        # Signal-Unsubscribe-Funktionen
-        self._unsub_dispatcher = None
-        self._unsub_2h_dispatcher = None
-        self._unsub_4h_dispatcher = None
-        self._unsub_monthly_dispatcher = None
-        self._unsub_yearly_dispatcher = None
 
         if state_class == "total_increasing":
             self._attr_state_class = SensorStateClass.TOTAL_INCREASING
@@ -930,57 +879,9 @@ class LambdaCyclingSensor(RestoreEntity, SensorEntity):
         last_state = await self.async_get_last_state()
         await self.restore_state(last_state)
 
-        # Nur das zu diesem Sensor passende Reset-Signal abonnieren (verhindert, dass Daily bei 2h-Signal resettet)
-        from .automations import SIGNAL_RESET_DAILY, SIGNAL_RESET_2H, SIGNAL_RESET_4H, SIGNAL_RESET_MONTHLY, SIGNAL_RESET_YEARLY  # noqa: F401
-
-        @callback
-        def _wrap_reset(entry_id: str):
-            self.hass.async_create_task(self._handle_reset(entry_id))
-
-        if self._reset_interval == "daily":
-            self._unsub_dispatcher = async_dispatcher_connect(
-                self.hass, SIGNAL_RESET_DAILY, _wrap_reset
-            )
-        elif self._reset_interval == "2h":
-            self._unsub_2h_dispatcher = async_dispatcher_connect(
-                self.hass, SIGNAL_RESET_2H, _wrap_reset
-            )
-        elif self._reset_interval == "4h":
-            self._unsub_4h_dispatcher = async_dispatcher_connect(
-                self.hass, SIGNAL_RESET_4H, _wrap_reset
-            )
-        elif self._reset_interval == "monthly":
-            self._unsub_monthly_dispatcher = async_dispatcher_connect(
-                self.hass, SIGNAL_RESET_MONTHLY, _wrap_reset
-            )
-        elif self._reset_interval == "yearly":
-            self._unsub_yearly_dispatcher = async_dispatcher_connect(
-                self.hass, SIGNAL_RESET_YEARLY, _wrap_reset
-            )
-        # total / yesterday: kein Reset-Signal abonnieren
-
         # Schreibe den State sofort ins UI
         self.async_write_ha_state()
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Clean up when entity is removed."""
-        if self._unsub_dispatcher:
-            self._unsub_dispatcher()
-            self._unsub_dispatcher = None
-        if self._unsub_2h_dispatcher:
-            self._unsub_2h_dispatcher()
-            self._unsub_2h_dispatcher = None
-        if self._unsub_4h_dispatcher:
-            self._unsub_4h_dispatcher()
-            self._unsub_4h_dispatcher = None
-        if self._unsub_monthly_dispatcher:
-            self._unsub_monthly_dispatcher()
-            self._unsub_monthly_dispatcher = None
-        if self._unsub_yearly_dispatcher:
-            self._unsub_yearly_dispatcher()
-            self._unsub_yearly_dispatcher = None
-        await super().async_will_remove_from_hass()
-
     async def restore_state(self, last_state):
         """Restore state from database to prevent reset on reload."""
         if last_state is not None:
@@ -1087,50 +988,19 @@ class LambdaCyclingSensor(RestoreEntity, SensorEntity):
         except Exception as e:
             _LOGGER.error("Error applying cycling offset for %s: %s", self.entity_id, e)
 
-    async def _handle_reset(self, entry_id: str):
-        """Handle reset signal for all periods (einheitlich, wie Energy)."""
-        if entry_id != self._entry.entry_id:
-            return
-
+    def _apply_period_reset(self) -> bool:
+        """Zähler der eigenen Periode auf 0 setzen (ohne State-Write). True bei Reset."""
+        if self._reset_interval not in ("daily", "2h", "4h", "monthly", "yearly"):
+            return False
+        if not self._sensor_id.endswith(f"_{self._reset_interval}"):
+            return False
         old_value = self._cycling_value if self._cycling_value is not None else 0
-        new_value = 0
-
-        # Prüfe Periode basierend auf sensor_id und reset_interval
-        if self._sensor_id.endswith("_daily") and self._reset_interval == "daily":
-            self._cycling_value = new_value
-            self.async_write_ha_state()
-            _LOGGER.info(
-                "Cycling reset: sensor=%s old_value=%s new_value=%s reset_interval=%s",
-                self.entity_id, old_value, new_value, self._reset_interval,
-            )
-        elif self._sensor_id.endswith("_2h") and self._reset_interval == "2h":
-            self._cycling_value = new_value
-            self.async_write_ha_state()
-            _LOGGER.info(
-                "Cycling reset: sensor=%s old_value=%s new_value=%s reset_interval=%s",
-                self.entity_id, old_value, new_value, self._reset_interval,
-            )
-        elif self._sensor_id.endswith("_4h") and self._reset_interval == "4h":
-            self._cycling_value = new_value
-            self.async_write_ha_state()
-            _LOGGER.info(
-                "Cycling reset: sensor=%s old_value=%s new_value=%s reset_interval=%s",
-                self.entity_id, old_value, new_value, self._reset_interval,
-            )
-        elif self._sensor_id.endswith("_monthly") and self._reset_interval == "monthly":
-            self._cycling_value = new_value
-            self.async_write_ha_state()
-            _LOGGER.info(
-                "Cycling reset: sensor=%s old_value=%s new_value=%s reset_interval=%s",
-                self.entity_id, old_value, new_value, self._reset_interval,
-            )
-        elif self._sensor_id.endswith("_yearly") and self._reset_interval == "yearly":
-            self._cycling_value = new_value
-            self.async_write_ha_state()
-            _LOGGER.info(
-                "Cycling reset: sensor=%s old_value=%s new_value=%s reset_interval=%s",
-                self.entity_id, old_value, new_value, self._reset_interval,
-            )
+        self._cycling_value = 0
+        _LOGGER.info(
+            "Cycling reset: sensor=%s old_value=%s new_value=%s reset_interval=%s",
+            self.entity_id, old_value, 0, self._reset_interval,
+        )
+        return True
 
     @property
     def name(self):
@@ -1183,9 +1053,45 @@ class LambdaCyclingSensor(RestoreEntity, SensorEntity):
 
 
 # --- Entity-Klasse für Energy Consumption Sensoren ---
+class _RollupBaseline:
+    """Baseline-Attribut eines Energy-Sensors, abgelegt in der Rollup-Tabelle des Coordinators.
+
+    Nur die Baseline der eigenen Periode (``obj._period``) liegt in der Tabelle;
+    die übrigen Baseline-Attribute bleiben Instanzwerte (Default 0.0).
+    """
+
+    def __init__(self, period: str):
+        self._period = period
+        self._local = None
+
+    def __set_name__(self, owner, name):
+        self._local = f"_local{name}"
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        table = obj._rollup_table() if obj._period == self._period else None
+        if table is not None:
+            return table.get(obj._hp_index, obj._mode, obj._cop_source_kind, self._period, 0.0)
+        return obj.__dict__.get(self._local, 0.0)
+
+    def __set__(self, obj, value):
+        table = obj._rollup_table() if obj._period == self._period else None
+        if table is not None:
+            table.set(obj._hp_index, obj._mode, obj._cop_source_kind, self._period, value)
+        else:
+            obj.__dict__[self._local] = value
+
+
 class LambdaEnergyConsumptionSensor(RestoreEntity, SensorEntity):
     """Energy consumption sensor (echte Entity, Wert wird von increment_energy_consumption_counter gesetzt)."""
 
+    # Perioden-Baselines (Total zu Periodenbeginn), Attributnamen aus ENERGY_PERIOD_CONFIG
+    _yesterday_value = _RollupBaseline("daily")
+    _last_hour_value = _RollupBaseline("hourly")
+    _previous_monthly_value = _RollupBaseline("monthly")
+    _previous_yearly_value = _RollupBaseline("yearly")
+
     def __init__(
         self,
         hass,
@@ -1222,17 +1128,14 @@ class LambdaEnergyConsumptionSensor(RestoreEntity, SensorEntity):
         self._attr_unique_id = unique_id
         # Initialisiere energy_value mit 0.0
         self._energy_value = 0.0
-        # Yesterday-Wert für Daily-Berechnung
-        self._yesterday_value = 0.0
-        # Last-Hour-Wert für Hourly-Berechnung (Debug)
-        self._last_hour_value = 0.0
-        # Previous Period-Werte für Monthly/Yearly-Berechnung
-        self._previous_monthly_value = 0.0
-        self._previous_yearly_value = 0.0
+        # Baselines (_yesterday_value, _last_hour_value, _previous_monthly/yearly_value) liegen
+        # in der Rollup-Tabelle des Coordinators (Default 0.0, siehe _RollupBaseline)
         # Track applied offset to prevent duplicate application
         self._applied_offset = 0.0
-        # Signal-Unsubscribe-Funktionen
-        self._unsub_dispatcher = None
+        # Coordinator-Referenz für das Persist-Dirty-Set (lazy aufgelöst)
+        self._persist_coordinator = None
+        # Quelltyp für die COP-Engine (thermische vs. elektrische Energie)
+        self._cop_source_kind = SOURCE_THERMAL if "_thermal_energy_" in sensor_id else SOURCE_ELECTRICAL
 
         if state_class == "total_increasing":
             self._attr_state_class = SensorStateClass.TOTAL_INCREASING
@@ -1257,23 +1160,57 @@ class LambdaEnergyConsumptionSensor(RestoreEntity, SensorEntity):
             new_value = old_value
         self._energy_value = new_value
         self.async_write_ha_state()
-        # Coordinator bitten, Energy-States beim nächsten Persist-Zyklus in cycle_energy_persist zu speichern
-        try:
-            reg = async_get_entity_registry(self.hass)
-            entry = reg.async_get(self.entity_id)
-            if entry and entry.config_entry_id:
-                comp = self.hass.data.get(DOMAIN, {}).get(entry.config_entry_id, {})
-                coord = comp.get("coordinator")
-                if coord and hasattr(coord, "set_energy_persist_dirty"):
-                    coord.set_energy_persist_dirty()
-        except Exception:
-            pass
+        # Coordinator bitten, diese Entity beim nächsten Persist-Zyklus in cycle_energy_persist zu speichern
+        self._mark_persist_dirty()
         _LOGGER.debug("Energy sensor %s value updated from %.2f to %.2f", self.entity_id, old_value, self._energy_value)
 
+    def _rollup_table(self):
+        """Rollup-Baseline-Tabelle des Coordinators oder None (z. B. in Tests ohne Coordinator)."""
+        table = getattr(self._resolve_coordinator(), "rollup_baselines", None)
+        return table if isinstance(table, RollupBaselineTable) else None
+
+    def _resolve_coordinator(self):
+        """Coordinator dieses Entries (gecacht) oder None."""
+        coord = self._persist_coordinator
+        if coord is None:
+            try:
+                comp = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {})
+                coord = comp.get("coordinator")
+            except Exception:
+                coord = None
+            self._persist_coordinator = coord
+        return coord
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Schreibt den State und meldet den Wert direkt an die COP-Engine des Coordinators."""
+        super().async_write_ha_state()
+        self._publish_cop_source()
+
+    def _publish_cop_source(self) -> None:
+        """Aktuellen Perioden-Wert an die COP-Engine melden (auch ohne State-Write, z. B. im Rollover)."""
+        coord = self._resolve_coordinator()
+        engine = getattr(coord, "cop_engine", None) if coord is not None else None
+        if isinstance(engine, COPEngine):
+            engine.update_source(
+                self._hp_index, self._mode, self._cop_source_kind, self._period, self.native_value
+            )
+
+    def _mark_persist_dirty(self):
+        """Meldet diese Entity im Dirty-Set des Coordinators an (nur geänderte Entities werden persistiert)."""
+        coord = self._resolve_coordinator()
+        if coord is None:
+            return
+        if hasattr(coord, "mark_energy_entity_dirty"):
+            coord.mark_energy_entity_dirty(self.entity_id)
+        elif hasattr(coord, "set_energy_persist_dirty"):
+            coord.set_energy_persist_dirty()
+
     def update_yesterday_value(self):
         """Update yesterday value with current total value (called at midnight)."""
         old_yesterday = self._yesterday_value
         self._yesterday_value = self._energy_value
+        self._mark_persist_dirty()
         _LOGGER.debug(
             "Yesterday value updated for %s: %.2f -> %.2f",
             self.entity_id, old_yesterday, self._yesterday_value,
@@ -1283,6 +1220,9 @@ class LambdaEnergyConsumptionSensor(RestoreEntity, SensorEntity):
         """Initialize the sensor when added to Home Assistant."""
         await super().async_added_to_hass()
 
+        # Baseline aus der beim Start geladenen Rollup-Tabelle merken (hat Vorrang vor Attributen)
+        table_baseline = self._stored_rollup_baseline()
+
         # RestoreEntity provides async_get_last_state() method
         last_state = await self.async_get_last_state()
         await self.restore_state(last_state)
@@ -1291,11 +1231,15 @@ class LambdaEnergyConsumptionSensor(RestoreEntity, SensorEntity):
         if our_state:
             self._apply_persisted_energy_state(our_state)
             self.async_write_ha_state()
+        if table_baseline is not None:
+            self._apply_rollup_baseline(table_baseline)
 
         # Apply energy offset LAST — after _apply_persisted_energy_state() may have
         # overwritten _energy_value with the coordinator's raw persisted value.
         if self._period == "total":
             await self._apply_energy_offset()
+        # Restore/Offset können die internen Werte verändert haben
+        self._mark_persist_dirty()
 
         # Für Daily-Sensoren: Initialisiere Yesterday-Wert beim Start, falls notwendig
         # Total-Sensoren werden oft erst nach Daily-Sensoren registriert → 100ms + ggf. verzögerter Zweitlauf
@@ -1314,40 +1258,6 @@ class LambdaEnergyConsumptionSensor(RestoreEntity, SensorEntity):
                     self.entity_id,
                 )
 
-        # Registriere Signal-Handler für Reset-Signale
-        # Verwende zentrale Signale wie Cycling Sensoren
-        from .automations import SIGNAL_RESET_DAILY, SIGNAL_RESET_2H, SIGNAL_RESET_4H, SIGNAL_RESET_HOURLY, SIGNAL_RESET_MONTHLY, SIGNAL_RESET_YEARLY  # noqa: F401
-        
-        # Wrapper-Funktion für asynchronen Handler mit @callback
-        @callback
-        def _wrap_reset(entry_id: str):
-            self.hass.async_create_task(self._handle_reset(entry_id))
-        
-        if self._reset_interval == "daily":
-            self._unsub_dispatcher = async_dispatcher_connect(
-                self.hass, SIGNAL_RESET_DAILY, _wrap_reset
-            )
-        elif self._reset_interval == "2h":
-            self._unsub_dispatcher = async_dispatcher_connect(
-                self.hass, SIGNAL_RESET_2H, _wrap_reset
-            )
-        elif self._reset_interval == "4h":
-            self._unsub_dispatcher = async_dispatcher_connect(
-                self.hass, SIGNAL_RESET_4H, _wrap_reset
-            )
-        elif self._reset_interval == "monthly":
-            self._unsub_dispatcher = async_dispatcher_connect(
-                self.hass, SIGNAL_RESET_MONTHLY, _wrap_reset
-            )
-        elif self._reset_interval == "yearly":
-            self._unsub_dispatcher = async_dispatcher_connect(
-                self.hass, SIGNAL_RESET_YEARLY, _wrap_reset
-            )
-        elif self._reset_interval == "hourly":
-            self._unsub_dispatcher = async_dispatcher_connect(
-                self.hass, SIGNAL_RESET_HOURLY, _wrap_reset
-            )
-
     async def _initialize_daily_yesterday_value(self):
         """Initialisiere Yesterday-Wert für Daily-Sensoren beim Start.
 
@@ -1383,6 +1293,7 @@ class LambdaEnergyConsumptionSensor(RestoreEntity, SensorEntity):
                             "energy_value=%.2f, yesterday_value=%.2f kWh (displayed=%.2f, from %s)",
                             self.entity_id, self._energy_value, self._yesterday_value, displayed_before, total_entity_id,
                         )
+                        self._mark_persist_dirty()
                         self.async_write_ha_state()
                     # else: _energy_value >= total_value bei yesterday=0 (z.B. Restore/Persist überschrieben).
                     # Nicht _yesterday_value = total_value setzen – sonst würde Daily auf 0 fallen.
@@ -1404,16 +1315,7 @@ class LambdaEnergyConsumptionSensor(RestoreEntity, SensorEntity):
                             "Daily sensor %s: mit Total synchronisiert (energy_value=yesterday_value=%.2f kWh, daily=0)",
                             self.entity_id, total_value,
                         )
-                    try:
-                        reg = async_get_entity_registry(self.hass)
-                        entry = reg.async_get(self.entity_id)
-                        if entry and entry.config_entry_id:
-                            comp = self.hass.data.get(DOMAIN, {}).get(entry.config_entry_id, {})
-                            coord = comp.get("coordinator")
-                            if coord and hasattr(coord, "set_energy_persist_dirty"):
-                                coord.set_energy_persist_dirty()
-                    except Exception:
-                        pass
+                    self._mark_persist_dirty()
                     self.async_write_ha_state()
                 # Wenn Daily-Wert größer als Total-Wert ist (unmöglich), korrigiere Yesterday
                 elif current_daily > total_value * 1.1:  # 10% Toleranz
@@ -1423,6 +1325,7 @@ class LambdaEnergyConsumptionSensor(RestoreEntity, SensorEntity):
                         f"daily value ({current_daily:.2f} kWh) was larger than total ({total_value:.2f} kWh). "
                         f"Set yesterday = {self._yesterday_value:.2f} kWh"
                     )
+                    self._mark_persist_dirty()
                     self.async_write_ha_state()
                 else:
                     _LOGGER.debug(
@@ -1444,6 +1347,26 @@ class LambdaEnergyConsumptionSensor(RestoreEntity, SensorEntity):
             )
             return True  # Total war nicht verfügbar → Zweitlauf sinnvoll
 
+    def _stored_rollup_baseline(self):
+        """Baseline der eigenen Periode aus der Rollup-Tabelle (None, falls nicht vorhanden)."""
+        table = self._rollup_table()
+        if table is None or ENERGY_PERIOD_CONFIG.get(self._period) is None:
+            return None
+        return table.get(self._hp_index, self._mode, self._cop_source_kind, self._period)
+
+    def _apply_rollup_baseline(self, baseline: float) -> None:
+        """Baseline aus der Rollup-Tabelle übernehmen, sofern konsistent (baseline <= energy_value)."""
+        cfg = ENERGY_PERIOD_CONFIG[self._period]
+        if baseline > self._energy_value:
+            _LOGGER.debug(
+                "Energy sensor %s: Rollup-Baseline %.2f > energy_value %.2f, Attribut-Baseline bleibt",
+                self.entity_id, baseline, self._energy_value,
+            )
+            return
+        if getattr(self, cfg["baseline_attr"]) != baseline:
+            setattr(self, cfg["baseline_attr"], baseline)
+            self.async_write_ha_state()
+
     def _get_energy_sensor_persisted_state_from_coordinator(self):
         """Liefert den aus cycle_energy_persist geladenen State für diese Entity (oder None)."""
         try:
@@ -1498,12 +1421,6 @@ class LambdaEnergyConsumptionSensor(RestoreEntity, SensorEntity):
         except (ValueError, TypeError) as e:
             _LOGGER.warning("Apply persisted energy state for %s: %s", self.entity_id, e)
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Clean up when entity is removed."""
-        if self._unsub_dispatcher:
-            self._unsub_dispatcher()
-        await super().async_will_remove_from_hass()
-
     async def restore_state(self, last_state):
         """Restore the state from the last state.
 
@@ -1666,10 +1583,8 @@ class LambdaEnergyConsumptionSensor(RestoreEntity, SensorEntity):
         except Exception as e:
             _LOGGER.error("Error applying energy offset for %s: %s", self.entity_id, e)
 
-    async def _handle_reset(self, entry_id: str):
-        """Handle reset signal. Periodenbezogene Resets (daily/hourly/monthly/yearly) über utils."""
-        if entry_id != self._entry.entry_id:
-            return
+    def _apply_period_reset(self) -> bool:
+        """Periodenwechsel anwenden (Baseline bzw. 0, ohne State-Write). True bei Reset."""
         old_value = self.native_value
         _LOGGER.debug("Resetting energy sensor %s (period: %s, reset_interval: %s)", self.entity_id, self._period, self._reset_interval)
         if self._reset_interval in ("daily", "hourly", "monthly", "yearly") and self._period == self._reset_interval:
@@ -1687,7 +1602,8 @@ class LambdaEnergyConsumptionSensor(RestoreEntity, SensorEntity):
             )
         else:
             _LOGGER.debug("Total sensor %s not reset.", self.entity_id)
-        self.async_write_ha_state()
+            return False
+        return True
 
     def _get_total_entity_id(self) -> str | None:
         """Entity-ID des zugehörigen Total-Sensors (für Daily/Hourly/Monthly/Yearly)."""
@@ -1797,7 +1713,16 @@ class LambdaCOPSensor(RestoreEntity, SensorEntity):
         self._cop_value = None  # Initialisiere mit None (unavailable)
         self._unsub_state_changes = None  # Unsubscribe-Funktion für State-Changes
         self._unsub_timer = None  # Periodisches Auffrischen (daily/monthly/yearly nach Reset)
-        self._unsub_reset_dispatcher = None  # Reset-Signal (daily/monthly/yearly) für "first reset"-Umschaltung
+        # Quellwerte und Baselines liegen in der COP-Engine des Coordinators
+        # (eigene Engine, falls kein Coordinator vorhanden ist, z. B. in Tests)
+        self._cop_engine, self._cop_engine_shared = _resolve_cop_engine(hass, entry)
+        # Periodischer Refresh schreibt nur bei Änderung oder nach Max-Silence
+        self._state_gate = create_state_gate(
+            _resolve_gating_config(hass, entry),
+            f"hp{hp_index}_{sensor_id}",
+            sensor_id,
+            registry=_resolve_state_gate_registry(hass, entry),
+        )
         # Baseline nur, weil ein Quellsensor früher in der Integration vorhanden ist, der andere später
         # angelegt wird (mit diesem Release kommen die thermischen Energy-Sensoren dazu; elektrisch war
         # bereits da). COP = Delta_thermal/Delta_electrical ab dem Zeitpunkt, an dem beide existieren.
@@ -1819,191 +1744,145 @@ class LambdaCOPSensor(RestoreEntity, SensorEntity):
             self._attr_state_class = None
         self._attr_device_class = device_class
 
-    def _calculate_cop(self) -> float | None:
-        """Berechne COP aus thermal_energy und electrical_energy.
-        Baseline-Konzept: Ein Quellsensor (elektrisch) war früher in der Integration, der andere
-        (thermisch) kommt mit diesem Release; Baseline = Werte zum Stichtag, damit nur Deltas
-        ab „beide vorhanden“ gezählt werden. Total: immer Baseline. Zyklisch: Wenn Baselines
-        gesetzt sind, immer (Quellsensor − Baseline) verwenden; sonst direkte Division."""
-        thermal_state = self.hass.states.get(self._thermal_energy_entity_id)
-        electrical_state = self.hass.states.get(self._electrical_energy_entity_id)
+    # --- Baselines liegen in der Baseline-Tabelle der COP-Engine ---
+    @property
+    def _thermal_baseline(self) -> float | None:
+        return self._cop_engine.get_baseline(self._hp_index, self._mode, self._period, SOURCE_THERMAL)
 
-        # Zyklische COP: Wenn Baselines gesetzt sind, immer mit Quellsensor-Werten − Baseline rechnen
-        if self._period in ("daily", "monthly", "yearly", "hourly") and self._thermal_baseline is not None and self._electrical_baseline is not None:
-            period_thermal_ok = thermal_state and thermal_state.state not in (None, "unknown", "unavailable")
-            period_electrical_ok = electrical_state and electrical_state.state not in (None, "unknown", "unavailable")
-            period_thermal_val = 0.0
-            period_electrical_val = 0.0
-            if period_thermal_ok:
-                try:
-                    period_thermal_val = float(str(thermal_state.state).replace(",", "."))
-                except (ValueError, TypeError):
-                    period_thermal_ok = False
-            if period_electrical_ok:
-                try:
-                    period_electrical_val = float(str(electrical_state.state).replace(",", "."))
-                except (ValueError, TypeError):
-                    period_electrical_ok = False
-            # Beide Quellsensoren verfügbar: COP = (period − baseline) / (period − baseline)
-            if period_thermal_ok and period_electrical_ok:
-                try:
-                    effective_thermal = period_thermal_val - self._thermal_baseline
-                    effective_electrical = period_electrical_val - self._electrical_baseline
-                    if effective_electrical <= 0:
-                        _LOGGER.debug(
-                            "COP %s %s: effective_electrical <= 0 (%.6f), returning unavailable",
-                            self._period,
-                            self.entity_id,
-                            effective_electrical,
-                        )
-                        return None
-                    if effective_thermal < 0:
-                        effective_thermal = 0.0
-                    cop_exact = effective_thermal / effective_electrical
-                    cop_rounded = round(cop_exact, self._precision)
-                    _LOGGER.debug(
-                        "COP %s (Baseline, Quellsensoren) for %s: effective_thermal=%.6f, effective_electrical=%.6f, cop=%.2f",
-                        self._period,
-                        self.entity_id,
-                        effective_thermal,
-                        effective_electrical,
-                        cop_rounded,
-                    )
-                    return cop_rounded
-                except (ValueError, TypeError):
-                    pass
-            # Ein Quellsensor 0 oder nicht verfügbar: Fallback auf Total − Baseline
-            else:
-                thermal_total_state = self.hass.states.get(self._thermal_total_entity_id)
-                electrical_total_state = self.hass.states.get(self._electrical_total_entity_id)
-                if (
-                    thermal_total_state
-                    and thermal_total_state.state not in (None, "unknown", "unavailable")
-                    and electrical_total_state
-                    and electrical_total_state.state not in (None, "unknown", "unavailable")
-                ):
-                    try:
-                        thermal_str_t = str(thermal_total_state.state).replace(",", ".")
-                        electrical_str_t = str(electrical_total_state.state).replace(",", ".")
-                        total_thermal = float(thermal_str_t)
-                        total_electrical = float(electrical_str_t)
-                        effective_thermal = total_thermal - self._thermal_baseline
-                        effective_electrical = total_electrical - self._electrical_baseline
-                        if effective_electrical <= 0:
-                            _LOGGER.debug(
-                                "COP %s %s: effective_electrical <= 0, returning unavailable",
-                                self._period,
-                                self.entity_id,
-                            )
-                            return None
-                        if effective_thermal < 0:
-                            effective_thermal = 0.0
-                        cop_exact = effective_thermal / effective_electrical
-                        cop_rounded = round(cop_exact, self._precision)
-                        _LOGGER.info(
-                            "COP %s %s: Baseline angewendet (Fallback Total, Quellsensor 0 oder nicht verfügbar)",
-                            self._period,
-                            self.entity_id,
-                        )
-                        _LOGGER.debug(
-                            "COP %s (Baseline, Total-Fallback) for %s: effective_thermal=%.6f, effective_electrical=%.6f, cop=%.2f",
-                            self._period,
-                            self.entity_id,
-                            effective_thermal,
-                            effective_electrical,
-                            cop_rounded,
-                        )
-                        return cop_rounded
-                    except (ValueError, TypeError):
-                        pass
+    @_thermal_baseline.setter
+    def _thermal_baseline(self, value) -> None:
+        self._cop_engine.set_baseline(self._hp_index, self._mode, self._period, SOURCE_THERMAL, value)
 
-        # Prüfe ob beide Sensoren verfügbar sind
-        if not thermal_state or thermal_state.state in (None, "unknown", "unavailable"):
+    @property
+    def _electrical_baseline(self) -> float | None:
+        return self._cop_engine.get_baseline(self._hp_index, self._mode, self._period, SOURCE_ELECTRICAL)
+
+    @_electrical_baseline.setter
+    def _electrical_baseline(self, value) -> None:
+        self._cop_engine.set_baseline(self._hp_index, self._mode, self._period, SOURCE_ELECTRICAL, value)
+
+    def _source_value(self, kind: str, period: str) -> float | None:
+        """Aktueller Wert eines Quellsensors: aus der COP-Engine (vom Energy-Tracker gemeldet),
+        sonst aus dem HA-State (behandelt auch Komma-Dezimaltrennzeichen aus HA-UI)."""
+        value = self._cop_engine.get_source(self._hp_index, self._mode, kind, period)
+        if value is not None:
+            return value
+        if kind == SOURCE_THERMAL:
+            entity_id = self._thermal_total_entity_id if period == "total" else self._thermal_energy_entity_id
+        else:
+            entity_id = self._electrical_total_entity_id if period == "total" else self._electrical_energy_entity_id
+        state = self.hass.states.get(entity_id)
+        if not state or state.state in (None, "unknown", "unavailable"):
             _LOGGER.debug(
-                "Thermal energy sensor %s not available for COP sensor %s",
-                self._thermal_energy_entity_id,
+                "Energy sensor %s not available for COP sensor %s",
+                entity_id,
+                self.entity_id,
+            )
+            return None
+        try:
+            return float(str(state.state).replace(",", "."))
+        except (ValueError, TypeError) as e:
+            _LOGGER.warning(
+                "Could not calculate COP for %s: %s=%s, error=%s",
                 self.entity_id,
+                entity_id,
+                state.state,
+                e,
             )
             return None
 
-        if not electrical_state or electrical_state.state in (None, "unknown", "unavailable"):
+    def _cop_from_delta(self, effective_thermal: float, effective_electrical: float, label: str) -> float | None:
+        """COP aus Deltas seit Baseline (None wenn kein elektrischer Verbrauch)."""
+        if effective_electrical <= 0:
             _LOGGER.debug(
-                "Electrical energy sensor %s not available for COP sensor %s",
-                self._electrical_energy_entity_id,
+                "COP %s %s: effective_electrical <= 0 (%.6f), returning unavailable",
+                self._period,
                 self.entity_id,
+                effective_electrical,
             )
             return None
+        if effective_thermal < 0:
+            effective_thermal = 0.0
+        cop_rounded = round(effective_thermal / effective_electrical, self._precision)
+        _LOGGER.debug(
+            "COP %s (%s) for %s: effective_thermal=%.6f, effective_electrical=%.6f, cop=%.2f",
+            self._period,
+            label,
+            self.entity_id,
+            effective_thermal,
+            effective_electrical,
+            cop_rounded,
+        )
+        return cop_rounded
 
-        try:
-            # Konvertiere zu float (behandelt auch Komma-Dezimaltrennzeichen aus HA-UI)
-            thermal_str = str(thermal_state.state).replace(",", ".")
-            electrical_str = str(electrical_state.state).replace(",", ".")
-            
-            thermal_value = float(thermal_str)
-            electrical_value = float(electrical_str)
-
-            # Total-COP: Deltas seit Baseline (elektrisch war früher da, thermisch mit diesem Release)
-            if self._period == "total" and self._thermal_baseline is not None and self._electrical_baseline is not None:
-                effective_thermal = thermal_value - self._thermal_baseline
-                effective_electrical = electrical_value - self._electrical_baseline
-                if effective_electrical <= 0:
-                    _LOGGER.debug(
-                        "COP total %s: effective_electrical <= 0 (%.6f), returning unavailable",
-                        self.entity_id,
-                        effective_electrical,
-                    )
-                    return None
-                if effective_thermal < 0:
-                    effective_thermal = 0.0
-                cop_exact = effective_thermal / effective_electrical
-                cop_rounded = round(cop_exact, self._precision)
-                _LOGGER.debug(
-                    "COP total (baseline) for %s: effective_thermal=%.6f, effective_electrical=%.6f, cop=%.2f",
-                    self.entity_id,
-                    effective_thermal,
-                    effective_electrical,
-                    cop_rounded,
-                )
-                return cop_rounded
+    def _calculate_cop(self) -> float | None:
+        """Berechne COP aus thermal_energy und electrical_energy.
+        Baseline-Konzept: Ein Quellsensor (elektrisch) war früher in der Integration, der andere
+        (thermisch) kommt mit diesem Release; Baseline = Werte zum Stichtag, damit nur Deltas
+        ab „beide vorhanden“ gezählt werden. Total: immer Baseline. Zyklisch: Wenn Baselines
+        gesetzt sind, immer (Quellsensor − Baseline) verwenden; sonst direkte Division."""
+        thermal_value = self._source_value(SOURCE_THERMAL, self._period)
+        electrical_value = self._source_value(SOURCE_ELECTRICAL, self._period)
+        thermal_baseline = self._thermal_baseline
+        electrical_baseline = self._electrical_baseline
+        has_baselines = thermal_baseline is not None and electrical_baseline is not None
 
-            # Daily/Monthly/Yearly oder Total ohne Baseline: direkte Division
-            if self._period in ("daily", "monthly", "yearly", "hourly") and thermal_value > 0 and electrical_value > 0:
-                _LOGGER.info(
-                    "COP %s %s: Baseline nicht notwendig (beide Quellsensoren > 0)",
-                    self._period,
-                    self.entity_id,
+        # Zyklische COP: Wenn Baselines gesetzt sind, immer mit Quellsensor-Werten − Baseline rechnen
+        if self._period in _COP_CYCLIC_PERIODS and has_baselines:
+            # Beide Quellsensoren verfügbar: COP = (period − baseline) / (period − baseline)
+            if thermal_value is not None and electrical_value is not None:
+                return self._cop_from_delta(
+                    thermal_value - thermal_baseline,
+                    electrical_value - electrical_baseline,
+                    "Baseline, Quellsensoren",
                 )
-            if electrical_value <= 0:
+            # Ein Quellsensor 0 oder nicht verfügbar: Fallback auf Total − Baseline
+            total_thermal = self._source_value(SOURCE_THERMAL, "total")
+            total_electrical = self._source_value(SOURCE_ELECTRICAL, "total")
+            if total_thermal is not None and total_electrical is not None:
                 _LOGGER.debug(
-                    "Electrical energy is 0 or negative (%.6f) for COP sensor %s, returning 0",
-                    electrical_value,
+                    "COP %s %s: Baseline angewendet (Fallback Total, Quellsensor 0 oder nicht verfügbar)",
+                    self._period,
                     self.entity_id,
                 )
-                return 0.0
+                return self._cop_from_delta(
+                    total_thermal - thermal_baseline,
+                    total_electrical - electrical_baseline,
+                    "Baseline, Total-Fallback",
+                )
 
-            cop_exact = thermal_value / electrical_value
-            cop_rounded = round(cop_exact, self._precision)
+        # Prüfe ob beide Sensoren verfügbar sind
+        if thermal_value is None or electrical_value is None:
+            return None
 
-            _LOGGER.debug(
-                "COP calculation for %s: thermal=%.6f kWh, electrical=%.6f kWh, cop_exact=%.10f, cop_rounded=%.2f",
-                self.entity_id,
-                thermal_value,
-                electrical_value,
-                cop_exact,
-                cop_rounded,
+        # Total-COP: Deltas seit Baseline (elektrisch war früher da, thermisch mit diesem Release)
+        if self._period == "total" and has_baselines:
+            return self._cop_from_delta(
+                thermal_value - thermal_baseline,
+                electrical_value - electrical_baseline,
+                "baseline",
             )
 
-            return cop_rounded
-
-        except (ValueError, TypeError) as e:
-            _LOGGER.warning(
-                "Could not calculate COP for %s: thermal=%s, electrical=%s, error=%s",
+        # Daily/Monthly/Yearly oder Total ohne Baseline: direkte Division
+        if electrical_value <= 0:
+            _LOGGER.debug(
+                "Electrical energy is 0 or negative (%.6f) for COP sensor %s, returning 0",
+                electrical_value,
                 self.entity_id,
-                thermal_state.state if thermal_state else None,
-                electrical_state.state if electrical_state else None,
-                e,
             )
-            return None
+            return 0.0
+
+        cop_exact = thermal_value / electrical_value
+        cop_rounded = round(cop_exact, self._precision)
+        _LOGGER.debug(
+            "COP calculation for %s: thermal=%.6f kWh, electrical=%.6f kWh, cop_exact=%.10f, cop_rounded=%.2f",
+            self.entity_id,
+            thermal_value,
+            electrical_value,
+            cop_exact,
+            cop_rounded,
+        )
+        return cop_rounded
 
     @callback
     def _update_cop(self):
@@ -2014,13 +1893,41 @@ class LambdaCOPSensor(RestoreEntity, SensorEntity):
         if new_cop != old_cop:
             self._cop_value = new_cop
             _LOGGER.debug(
-                "COP sensor %s updated: %.2f -> %s",
+                "COP sensor %s updated: %s -> %s",
                 self.entity_id,
-                old_cop if old_cop is not None else "None",
-                new_cop if new_cop is not None else "None",
+                old_cop,
+                new_cop,
             )
+            self._state_gate.record(new_cop)
             self.async_write_ha_state()
 
+    def _apply_period_reset(self) -> bool:
+        """Zyklusstart: Baselines = Quellwerte (period), COP neu berechnen (ohne State-Write)."""
+        # Baselines = Werte der Quellsensoren (period) zum Zyklusstart, nicht Total
+        self._set_baselines_from_sources("Zyklus-Baselines gesetzt (Reset, Quellsensoren)")
+        self._reset_occurred = True
+        self._cop_value = self._calculate_cop()
+        self._state_gate.record(self._cop_value)
+        return True
+
+    def _set_baselines_from_sources(self, label: str) -> bool:
+        """Baselines = aktuelle Werte der Quellsensoren (period). True wenn gesetzt."""
+        thermal_value = self._source_value(SOURCE_THERMAL, self._period)
+        electrical_value = self._source_value(SOURCE_ELECTRICAL, self._period)
+        if thermal_value is None or electrical_value is None:
+            return False
+        self._thermal_baseline = thermal_value
+        self._electrical_baseline = electrical_value
+        _LOGGER.info(
+            "COP %s %s: %s thermal=%.2f kWh, electrical=%.2f kWh",
+            self._period,
+            self.entity_id,
+            label,
+            thermal_value,
+            electrical_value,
+        )
+        return True
+
     async def async_added_to_hass(self) -> None:
         """Initialize the sensor when added to Home Assistant."""
         await super().async_added_to_hass()
@@ -2029,168 +1936,66 @@ class LambdaCOPSensor(RestoreEntity, SensorEntity):
         last_state = await self.async_get_last_state()
         await self.restore_state(last_state)
 
-        # Registriere State-Change-Tracker für Quell-Sensoren
-        track_entities = [self._thermal_energy_entity_id, self._electrical_energy_entity_id]
-        # Zyklische COP: Total-Entities tracken (Berechnung nutzt Total + eigene Zyklus-Baselines)
-        if self._period in ("daily", "monthly", "yearly", "hourly"):
-            if self._thermal_total_entity_id not in track_entities:
-                track_entities.append(self._thermal_total_entity_id)
-            if self._electrical_total_entity_id not in track_entities:
-                track_entities.append(self._electrical_total_entity_id)
-
-        @callback
-        def _state_change_callback(event):
-            """Callback when tracked entity state changes."""
-            new_state = event.data.get("new_state")
-            old_state = event.data.get("old_state")
-            entity_id = event.data.get("entity_id")
-
-            if new_state is None:
-                return
+        if self._cop_engine_shared:
+            # Quellwerte kommen direkt vom Energy-Tracker; die Engine publiziert 1x pro Zyklus
+            self._cop_engine.register(self)
+        else:
+            # Ohne Coordinator-Engine: State-Change-Tracker für Quell-Sensoren
+            track_entities = [self._thermal_energy_entity_id, self._electrical_energy_entity_id]
+            # Zyklische COP: Total-Entities tracken (Berechnung nutzt Total + eigene Zyklus-Baselines)
+            if self._period in _COP_CYCLIC_PERIODS:
+                if self._thermal_total_entity_id not in track_entities:
+                    track_entities.append(self._thermal_total_entity_id)
+                if self._electrical_total_entity_id not in track_entities:
+                    track_entities.append(self._electrical_total_entity_id)
 
-            # Nur aktualisieren, wenn sich der State wirklich geändert hat
-            if old_state is None or old_state.state != new_state.state:
-                _LOGGER.debug(
-                    "Tracked entity %s changed from %s to %s, updating COP sensor %s",
-                    entity_id,
-                    old_state.state if old_state else None,
-                    new_state.state,
-                    self.entity_id,
-                )
-                self._update_cop()
+            @callback
+            def _state_change_callback(event):
+                """Callback when tracked entity state changes."""
+                new_state = event.data.get("new_state")
+                old_state = event.data.get("old_state")
+                if new_state is None:
+                    return
+                # Nur aktualisieren, wenn sich der State wirklich geändert hat
+                if old_state is None or old_state.state != new_state.state:
+                    self._update_cop()
 
-        # Tracke State-Änderungen für beide Quell-Sensoren
-        self._unsub_state_changes = async_track_state_change_event(
-            self.hass,
-            track_entities,
-            _state_change_callback,
-        )
+            self._unsub_state_changes = async_track_state_change_event(
+                self.hass,
+                track_entities,
+                _state_change_callback,
+            )
 
-        # Nach Listener-Registrierung einmal mit aktuellen Quell-Sensoren synchronisieren.
+        # Einmal mit aktuellen Quell-Sensoren synchronisieren.
         # Verhindert, dass COP nach Restart veralteten DB-State zeigt, wenn Energy-Sensoren
-        # vor dem COP-Sensor korrigiert wurden und ihr State-Update vor dem Listener kam.
+        # vor dem COP-Sensor korrigiert wurden.
         self._update_cop()
 
-        # Daily/Monthly/Yearly/Hourly: Periodisch (alle 5 Min) neu berechnen, damit COP nach Reset
-        # wieder aktualisiert wird, falls State-Change-Events der Energy-Sensoren nicht ankommen.
-        # State immer schreiben, damit "Zuletzt aktualisiert" auch bei unverändertem Wert (z.B. 0) aktualisiert wird.
-        if self._period in ("daily", "monthly", "yearly", "hourly"):
+        if self._period in _COP_CYCLIC_PERIODS:
+            # Daily/Monthly/Yearly/Hourly: Periodisch (alle 5 Min) neu berechnen, damit COP nach Reset
+            # wieder aktualisiert wird, falls keine Energy-Änderungen ankommen.
+            # Unveränderter Wert wird nur nach Ablauf der Max-Silence erneut geschrieben.
             @callback
             def _periodic_refresh(_now):
                 self._update_cop()
-                self.async_write_ha_state()
+                if self._state_gate.check(self._cop_value):
+                    self.async_write_ha_state()
             self._unsub_timer = async_track_time_interval(
                 self.hass, _periodic_refresh, timedelta(minutes=5)
             )
 
-        # Zyklische COP: Reset-Signal abonnieren, um nach erstem Reset auf reale Perioden-Berechnung umzuschalten
-        if self._period in ("daily", "monthly", "yearly", "hourly"):
-            from .automations import (
-                SIGNAL_RESET_DAILY,
-                SIGNAL_RESET_MONTHLY,
-                SIGNAL_RESET_YEARLY,
-                SIGNAL_RESET_HOURLY,
+        # Zyklische COP: Eigene Initial-Baselines aus Quellsensoren (period), nicht aus Total
+        # Total-COP: Baseline einmalig setzen (Stichtag = beide Quellsensoren vorhanden)
+        if self._thermal_baseline is None and self._electrical_baseline is None:
+            label = (
+                "baseline set (Stichtag: beide Quellen vorhanden)"
+                if self._period == "total"
+                else "Zyklus-Baselines initial (Quellsensoren)"
             )
-
-            @callback
-            def _on_reset(_entry_id):
-                # Baselines = Werte der Quellsensoren (period) zum Zyklusstart, nicht Total
-                thermal_src_state = self.hass.states.get(self._thermal_energy_entity_id)
-                electrical_src_state = self.hass.states.get(self._electrical_energy_entity_id)
-                if (
-                    thermal_src_state
-                    and thermal_src_state.state not in (None, "unknown", "unavailable")
-                    and electrical_src_state
-                    and electrical_src_state.state not in (None, "unknown", "unavailable")
-                ):
-                    try:
-                        self._thermal_baseline = float(str(thermal_src_state.state).replace(",", "."))
-                        self._electrical_baseline = float(str(electrical_src_state.state).replace(",", "."))
-                        _LOGGER.info(
-                            "COP %s %s: Zyklus-Baselines gesetzt (Reset, Quellsensoren) thermal=%.2f kWh, electrical=%.2f kWh",
-                            self._period,
-                            self.entity_id,
-                            self._thermal_baseline,
-                            self._electrical_baseline,
-                        )
-                    except (ValueError, TypeError):
-                        pass
-                self._reset_occurred = True
+            if self._set_baselines_from_sources(label):
                 self._update_cop()
                 self.async_write_ha_state()
 
-            if self._period == "daily":
-                self._unsub_reset_dispatcher = async_dispatcher_connect(
-                    self.hass, SIGNAL_RESET_DAILY, _on_reset
-                )
-            elif self._period == "monthly":
-                self._unsub_reset_dispatcher = async_dispatcher_connect(
-                    self.hass, SIGNAL_RESET_MONTHLY, _on_reset
-                )
-            elif self._period == "yearly":
-                self._unsub_reset_dispatcher = async_dispatcher_connect(
-                    self.hass, SIGNAL_RESET_YEARLY, _on_reset
-                )
-            elif self._period == "hourly":
-                self._unsub_reset_dispatcher = async_dispatcher_connect(
-                    self.hass, SIGNAL_RESET_HOURLY, _on_reset
-                )
-
-        # Zyklische COP: Eigene Initial-Baselines aus Quellsensoren (period), nicht aus Total
-        if self._period in ("daily", "monthly", "yearly", "hourly") and self._thermal_baseline is None and self._electrical_baseline is None:
-            thermal_src_state = self.hass.states.get(self._thermal_energy_entity_id)
-            electrical_src_state = self.hass.states.get(self._electrical_energy_entity_id)
-            if (
-                thermal_src_state
-                and thermal_src_state.state not in (None, "unknown", "unavailable")
-                and electrical_src_state
-                and electrical_src_state.state not in (None, "unknown", "unavailable")
-            ):
-                try:
-                    self._thermal_baseline = float(str(thermal_src_state.state).replace(",", "."))
-                    self._electrical_baseline = float(str(electrical_src_state.state).replace(",", "."))
-                    _LOGGER.info(
-                        "COP %s %s: Zyklus-Baselines initial (Quellsensoren) thermal=%.2f kWh, electrical=%.2f kWh",
-                        self._period,
-                        self.entity_id,
-                        self._thermal_baseline,
-                        self._electrical_baseline,
-                    )
-                    self._update_cop()
-                    self.async_write_ha_state()
-                except (ValueError, TypeError) as e:
-                    _LOGGER.warning(
-                        "Could not set COP %s initial baselines for %s: %s",
-                        self._period,
-                        self.entity_id,
-                        e,
-                    )
-
-        # Total-COP: Baseline einmalig setzen (Stichtag = beide Quellsensoren vorhanden)
-        if self._period == "total" and self._thermal_baseline is None and self._electrical_baseline is None:
-            thermal_state = self.hass.states.get(self._thermal_energy_entity_id)
-            electrical_state = self.hass.states.get(self._electrical_energy_entity_id)
-            if thermal_state and thermal_state.state not in (None, "unknown", "unavailable") and electrical_state and electrical_state.state not in (None, "unknown", "unavailable"):
-                try:
-                    thermal_str = str(thermal_state.state).replace(",", ".")
-                    electrical_str = str(electrical_state.state).replace(",", ".")
-                    self._thermal_baseline = float(thermal_str)
-                    self._electrical_baseline = float(electrical_str)
-                    _LOGGER.info(
-                        "COP total %s: baseline set thermal=%.2f kWh, electrical=%.2f kWh (Stichtag: beide Quellen vorhanden)",
-                        self.entity_id,
-                        self._thermal_baseline,
-                        self._electrical_baseline,
-                    )
-                    self._update_cop()
-                    self.async_write_ha_state()
-                except (ValueError, TypeError) as e:
-                    _LOGGER.warning(
-                        "Could not set COP total baseline for %s: %s",
-                        self.entity_id,
-                        e,
-                    )
-
         # Initialisiere den State (berechnet oder restored)
         if self._cop_value is None:
             self._update_cop()
@@ -2231,30 +2036,20 @@ class LambdaCOPSensor(RestoreEntity, SensorEntity):
                     self._thermal_baseline = float(str(tb).replace(",", "."))
                     self._electrical_baseline = float(str(eb).replace(",", "."))
                     # Konsistenz: Baseline darf nicht größer als aktueller Wert sein (nach Neustart/Reset)
-                    thermal_state = self.hass.states.get(self._thermal_energy_entity_id)
-                    electrical_state = self.hass.states.get(self._electrical_energy_entity_id)
-                    if thermal_state and thermal_state.state not in (None, "unknown", "unavailable"):
-                        try:
-                            current_thermal = float(str(thermal_state.state).replace(",", "."))
-                            if self._thermal_baseline > current_thermal:
-                                _LOGGER.warning(
-                                    "COP total %s: thermal_baseline (%.2f) > current (%.2f), korrigiere baseline = current",
-                                    self.entity_id, self._thermal_baseline, current_thermal,
-                                )
-                                self._thermal_baseline = current_thermal
-                        except (ValueError, TypeError):
-                            pass
-                    if electrical_state and electrical_state.state not in (None, "unknown", "unavailable"):
-                        try:
-                            current_electrical = float(str(electrical_state.state).replace(",", "."))
-                            if self._electrical_baseline > current_electrical:
-                                _LOGGER.warning(
-                                    "COP total %s: electrical_baseline (%.2f) > current (%.2f), korrigiere baseline = current",
-                                    self.entity_id, self._electrical_baseline, current_electrical,
-                                )
-                                self._electrical_baseline = current_electrical
-                        except (ValueError, TypeError):
-                            pass
+                    current_thermal = self._source_value(SOURCE_THERMAL, self._period)
+                    if current_thermal is not None and self._thermal_baseline > current_thermal:
+                        _LOGGER.warning(
+                            "COP total %s: thermal_baseline (%.2f) > current (%.2f), korrigiere baseline = current",
+                            self.entity_id, self._thermal_baseline, current_thermal,
+                        )
+                        self._thermal_baseline = current_thermal
+                    current_electrical = self._source_value(SOURCE_ELECTRICAL, self._period)
+                    if current_electrical is not None and self._electrical_baseline > current_electrical:
+                        _LOGGER.warning(
+                            "COP total %s: electrical_baseline (%.2f) > current (%.2f), korrigiere baseline = current",
+                            self.entity_id, self._electrical_baseline, current_electrical,
+                        )
+                        self._electrical_baseline = current_electrical
                     _LOGGER.debug(
                         "COP total %s: restored baselines thermal=%.2f, electrical=%.2f",
                         self.entity_id,
@@ -2302,15 +2097,13 @@ class LambdaCOPSensor(RestoreEntity, SensorEntity):
 
     async def async_will_remove_from_hass(self) -> None:
         """Clean up when entity is removed."""
+        self._cop_engine.unregister(self)
         if self._unsub_state_changes:
             self._unsub_state_changes()
             self._unsub_state_changes = None
         if self._unsub_timer:
             self._unsub_timer()
             self._unsub_timer = None
-        if self._unsub_reset_dispatcher:
-            self._unsub_reset_dispatcher()
-            self._unsub_reset_dispatcher = None
         await super().async_will_remove_from_hass()
 
     @property
@@ -2421,12 +2214,16 @@ class LambdaYesterdaySensor(RestoreEntity, SensorEntity):
 
     async def set_cycling_value(self, value):
         """Set the cycling value and update state."""
+        self._set_yesterday_value(value)
+        self.async_write_ha_state()
+
+    def _set_yesterday_value(self, value) -> None:
+        """Yesterday-Wert setzen (ohne State-Write, z. B. im Rollover-Durchlauf)."""
         old_value = self._yesterday_value
         self._yesterday_value = int(value)
         _LOGGER.info(
-            f"Yesterday sensor {self.entity_id} updated: {old_value} -> {self._yesterday_value}"
+            "Yesterday sensor %s updated: %s -> %s", self.entity_id, old_value, self._yesterday_value
         )
-        self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
         """Initialize the sensor when added to Home Assistant."""
@@ -2553,25 +2350,26 @@ class LambdaSensor(CoordinatorEntity[LambdaDataUpdateCoordinator], SensorEntity)
         self._attr_name = name
         self._attr_unique_id = unique_id  # Immer die generierte ID verwenden
         self.entity_id = entity_id or f"sensor.{sensor_id}"
-        self._unit = unit
         self._address = address
-        self._scale = scale
-        self._state_class = state_class
-        self._device_class = device_class
-        self._relative_address = relative_address
-        self._data_type = data_type
-        self._device_type = device_type
-        self._txt_mapping = txt_mapping
-        self._precision = precision
-        self._options = options
-        self._sensor_info = sensor_info or {}
-        self._base_state_name = None
-        if sensor_info:
-            self._base_state_name = sensor_info.get("name")
+        # Template-Metadaten (Einheit, Scale, Klassen, Precision, ...) als geteilte Description
+        self._desc = _describe_sensor(
+            unit,
+            scale,
+            state_class,
+            device_class,
+            relative_address,
+            data_type,
+            device_type,
+            txt_mapping,
+            precision,
+            options,
+            sensor_info,
+        )
         self._entity_enabled = False  # Track if entity is enabled
-        
+        self._device_info = None  # Lazy, geteiltes device_info-Dict
+
         # Setze Icon aus sensor_info (zentrale Steuerung)
-        self._attr_icon = get_entity_icon(sensor_info)
+        self._attr_icon = self._desc.icon
 
         # Debug log sensor creation with register option
         if sensor_info and sensor_info.get("options", {}).get("register", False):
@@ -2588,23 +2386,24 @@ class LambdaSensor(CoordinatorEntity[LambdaDataUpdateCoordinator], SensorEntity)
         else:
             coordinator._entity_addresses = {entity_id: address}
 
-        _LOGGER.debug(
-            "Sensor initialized with ID: %s and config: %s",
-            sensor_id,
-            {
-                "name": name,
-                "unit": unit,
-                "address": address,
-                "scale": scale,
-                "state_class": state_class,
-                "device_class": device_class,
-                "relative_address": relative_address,
-                "data_type": data_type,
-                "device_type": device_type,
-                "txt_mapping": txt_mapping,
-                "precision": precision,
-            },
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Sensor initialized with ID: %s and config: %s",
+                sensor_id,
+                {
+                    "name": name,
+                    "unit": unit,
+                    "address": address,
+                    "scale": scale,
+                    "state_class": state_class,
+                    "device_class": device_class,
+                    "relative_address": relative_address,
+                    "data_type": data_type,
+                    "device_type": device_type,
+                    "txt_mapping": txt_mapping,
+                    "precision": precision,
+                },
+            )
 
         self._is_state_sensor = txt_mapping
 
@@ -2617,25 +2416,164 @@ class LambdaSensor(CoordinatorEntity[LambdaDataUpdateCoordinator], SensorEntity)
             self._attr_native_unit_of_measurement = unit
             if precision is not None and isinstance(precision, int):
                 self._attr_suggested_display_precision = precision
-            if unit == "°C":
-                self._attr_device_class = SensorDeviceClass.TEMPERATURE
-            elif unit == "W":
-                self._attr_device_class = SensorDeviceClass.POWER
-            elif unit == "Wh":
-                self._attr_device_class = SensorDeviceClass.ENERGY
-            if state_class:
-                if state_class == "total":
-                    self._attr_state_class = SensorStateClass.TOTAL
-                elif state_class == "total_increasing":
-                    self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-                elif state_class == "measurement":
-                    self._attr_state_class = SensorStateClass.MEASUREMENT
+            if self._desc.unit_device_class is not None:
+                self._attr_device_class = self._desc.unit_device_class
+            if self._desc.ha_state_class is not None:
+                self._attr_state_class = self._desc.ha_state_class
+
+        # Einmalig bei der Konstruktion auflösen statt bei jedem State-Write:
+        # Override-Name / Data-Key, State-Text-Mapping, Debug-Logging und Formatter
+        self._display_name = self._attr_name or ""
+        self._data_key = sensor_id
+        use_legacy_modbus_names = coordinator.entry.data.get(
+            "use_legacy_modbus_names", True
+        )
+        if use_legacy_modbus_names and hasattr(coordinator, "sensor_overrides"):
+            override_name = coordinator.sensor_overrides.get(sensor_id)
+            if override_name:
+                self._display_name = override_name
+                self._data_key = override_name
+        self._state_mapping_name = self._resolve_state_mapping_name()
+        self._state_mapping = (
+            globals().get(self._state_mapping_name)
+            if self._is_state_sensor and self._state_mapping_name
+            else None
+        )
+        self._state_options = (
+            list(self._state_mapping.values()) if self._state_mapping else None
+        )
+        if self._is_state_sensor and self._state_mapping is None:
+            _LOGGER.warning(
+                "No state mapping found f. sensor '%s' (tried mapping: %s). "
+                "Sensor details: device_type=%s, register=%d, data_type=%s. "
+                "This sensor is marked as state sensor (txt_mapping=True) but no "
+                "corresponding mapping dictionary was found.",
+                self._attr_name,
+                self._state_mapping_name,
+                self._device_type,
+                self._relative_address,
+                self._data_type,
+            )
+        self._debug_value_logging = any(
+            keyword in sensor_id for keyword in _DEBUG_VALUE_SENSOR_KEYWORDS
+        )
+        self._format_value = (
+            self._format_state_value if self._is_state_sensor else _format_numeric_value
+        )
+        # Value-Change-Gating: State nur bei Änderung jenseits der Deadband schreiben
+        gating_config = getattr(coordinator, "state_write_gating", None)
+        self._state_gate = create_state_gate(
+            gating_config,
+            sensor_id,
+            sensor_info=sensor_info,
+            unit=unit,
+            registry=getattr(coordinator, "state_gates", None),
+        )
+        if not self._is_state_sensor:
+            precision_override = resolve_precision(gating_config, sensor_id, None, None)
+            if precision_override is not None:
+                # Precision per YAML überschrieben: Wert runden (weniger Rauschen im Recorder)
+                self._desc = dataclasses.replace(self._desc, precision=precision_override)
+                self._attr_suggested_display_precision = precision_override
+                self._format_value = lambda value: _round_numeric_value(
+                    value, precision_override
+                )
+
+    # Template-Metadaten aus der geteilten Description (read-only)
+    @property
+    def _unit(self):
+        return self._desc.unit
+
+    @property
+    def _scale(self):
+        return self._desc.scale
+
+    @property
+    def _state_class(self):
+        return self._desc.state_class
+
+    @property
+    def _device_class(self):
+        return self._desc.device_class
+
+    @property
+    def _relative_address(self):
+        return self._desc.relative_address
+
+    @property
+    def _data_type(self):
+        return self._desc.data_type
+
+    @property
+    def _device_type(self):
+        return self._desc.device_type
+
+    @property
+    def _txt_mapping(self):
+        return self._desc.txt_mapping
+
+    @property
+    def _precision(self):
+        return self._desc.precision
+
+    @property
+    def _options(self):
+        return self._desc.options
+
+    @property
+    def _sensor_info(self):
+        return self._desc.sensor_info
+
+    @property
+    def _base_state_name(self):
+        return self._desc.sensor_info.get("name")
+
+    def _resolve_state_mapping_name(self) -> str | None:
+        """Name des State-Mapping-Dicts (z.B. "HP_OPERATING_STATE") aus Device-Typ und Basisnamen."""
+        # Extract base name without index
+        # (e.g. "HP1 Operating State" -> "Operating State")
+        if self._base_state_name:
+            base_name = self._base_state_name
+        else:
+            base_name = self._attr_name or ""
+            if (
+                self._device_type
+                and base_name
+                and self._device_type.upper() in base_name
+            ):
+                # Remove prefix and index (e.g. "HP1 " oder "BOIL2 ")
+                base_name = " ".join(base_name.split()[1:])
+        if not base_name or not self._device_type:
+            return None
+        # Ersetze auch Bindestriche durch Unterstriche
+        return (
+            f"{self._device_type.upper()}_"
+            f"{base_name.upper().replace(' ', '_').replace('-', '_')}"
+        )
+
+    def _format_state_value(self, value) -> str:
+        """Formatter für State-Sensoren (txt_mapping): Rohwert -> Text."""
+        try:
+            numeric_value = int(float(value))
+        except (ValueError, TypeError):
+            return f"Unknown state ({value})"
+        if self._state_mapping is None:
+            return f"Unknown mapping for state ({numeric_value})"
+        return self._state_mapping.get(
+            numeric_value, f"Unknown state ({numeric_value})"
+        )
 
     @property
     def should_poll(self) -> bool:
         """Only poll if the entity is enabled and added to HA."""
         return self._entity_enabled
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """State nur schreiben, wenn Wert/Verfügbarkeit sich über die Deadband hinaus geändert hat."""
+        if self._state_gate.check(self.native_value, self.available):
+            self.async_write_ha_state()
+
     async def async_added_to_hass(self) -> None:
         """Setup polling when entity is enabled and added to HA."""
         await super().async_added_to_hass()
@@ -2671,102 +2609,38 @@ class LambdaSensor(CoordinatorEntity[LambdaDataUpdateCoordinator], SensorEntity)
 
     @property
     def name(self) -> str:
-        """Return the name of the sensor."""
-        use_legacy_modbus_names = self.coordinator.entry.data.get(
-            "use_legacy_modbus_names", True
-        )
-        if use_legacy_modbus_names and hasattr(self.coordinator, "sensor_overrides"):
-            override_name = self.coordinator.sensor_overrides.get(self._sensor_id)
-            if override_name:
-                # Verwende den Override-Namen als sensor_id
-                _LOGGER.debug(
-                    "Overriding sensor_id from %s to %s",
-                    self._sensor_id,
-                    override_name,
-                )
-                self._sensor_id = override_name
-                return override_name
-        return self._attr_name or ""
+        """Return the name of the sensor (Override-Name bei Konstruktion aufgelöst)."""
+        return self._display_name
+
+    @property
+    def available(self) -> bool:
+        """Während des gestuften Erststarts erst verfügbar, wenn der Wert gelesen wurde."""
+        if not super().available:
+            return False
+        if getattr(self.coordinator, "startup_complete", True):
+            return True
+        data = self.coordinator.data
+        return bool(data) and self._data_key in data
 
     @property
     def native_value(self) -> float | str | None:
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-        value = self.coordinator.data.get(self._sensor_id)
+        value = data.get(self._data_key)
 
         # Debug logging für undokumentierte Register
-        if self._sensor_id and (
-            "extended" in self._sensor_id
-            or "config" in self._sensor_id
-            or "additional" in self._sensor_id
-            or "ambient" in self._sensor_id
-            or "compressor_outlet" in self._sensor_id
-            or "maximum_value" in self._sensor_id
-        ):
+        if self._debug_value_logging:
             _LOGGER.debug(
                 "Debug sensor %s: value=%s, coordinator.data has %d entries",
-                self._sensor_id,
+                self._data_key,
                 value,
-                len(self.coordinator.data) if self.coordinator.data else 0,
+                len(data),
             )
 
         if value is None:
             return None
-        if self._is_state_sensor:
-            try:
-                numeric_value = int(float(value))
-            except (ValueError, TypeError):
-                return f"Unknown state ({value})"
-
-            # Extract base name without index
-            # (e.g. "HP1 Operating State" -> "Operating State")
-            if self._base_state_name:
-                base_name = self._base_state_name
-            else:
-                base_name = self._attr_name or ""
-                if (
-                    self._device_type
-                    and base_name
-                    and self._device_type.upper() in base_name
-                ):
-                    # Remove prefix and index (e.g. "HP1 " oder "BOIL2 ")
-                    base_name = " ".join(base_name.split()[1:])
-            # Ersetze auch Bindestriche durch Unterstriche
-            if base_name:
-                mapping_name = (
-                    f"{self._device_type.upper()}_"
-                    f"{base_name.upper().replace(' ', '_').replace('-', '_')}"
-                )
-            try:
-                state_mapping = globals().get(mapping_name)
-                if state_mapping is not None:
-                    return state_mapping.get(
-                        numeric_value, f"Unknown state ({numeric_value})"
-                    )
-                _LOGGER.warning(
-                    "No state mapping found f. sensor '%s' (tried mapping: %s)"
-                    "with value %s. Sensor details: device_type=%s, "
-                    "register=%d, data_type=%s. This sensor is marked as state"
-                    "sensor (txt_mapping=True) but no corresponding mapping "
-                    "dictionary was found.",
-                    self._attr_name,
-                    mapping_name,
-                    numeric_value,
-                    self._device_type,
-                    self._relative_address,
-                    self._data_type,
-                )
-                return f"Unknown mapping for state ({numeric_value})"
-            except Exception as e:
-                _LOGGER.error(
-                    "Error accessing mapping dictionary: %s",
-                    str(e),
-                )
-                return f"Error loading mappings ({numeric_value})"
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return None
+        return self._format_value(value)
 
     @property
     def native_unit_of_measurement(self) -> str | None:
@@ -2776,32 +2650,18 @@ class LambdaSensor(CoordinatorEntity[LambdaDataUpdateCoordinator], SensorEntity)
     @property
     def state_class(self) -> SensorStateClass | None:
         """Return the state class of the sensor."""
-        if self._state_class == "measurement":
-            return SensorStateClass.MEASUREMENT
-        elif self._state_class == "total":
-            return SensorStateClass.TOTAL
-        elif self._state_class == "total_increasing":
-            return SensorStateClass.TOTAL_INCREASING
-        return None
+        return self._desc.ha_state_class
 
     @property
     def device_class(self) -> SensorDeviceClass | None:
         """Return the device class of the sensor."""
-        if self._device_class == "temperature":
-            return SensorDeviceClass.TEMPERATURE
-        elif self._device_class == "power":
-            return SensorDeviceClass.POWER
-        elif self._device_class == "energy":
-            return SensorDeviceClass.ENERGY
-        elif self._device_class == "enum":
-            return SensorDeviceClass.ENUM
-        return None
+        return self._desc.ha_device_class
 
     @property
     def options(self) -> list[str] | None:
         """Return the available options for enum sensors."""
-        if self._device_class == "enum" and self._options:
-            return self._options
+        if self._desc.device_class == "enum" and self._desc.options:
+            return self._desc.options
         return None
 
     @property
@@ -2817,45 +2677,8 @@ class LambdaSensor(CoordinatorEntity[LambdaDataUpdateCoordinator], SensorEntity)
         attrs["register"] = self._address
 
         # For txt_mapping sensors (state sensors), add enum options
-        if self._txt_mapping and self._is_state_sensor:
-            _LOGGER.debug(
-                "Processing state sensor %s for enum options", self._sensor_id
-            )
-            # Get the mapping dictionary name
-            if self._base_state_name:
-                base_name = self._base_state_name
-            else:
-                base_name = self._attr_name or ""
-                if (
-                    self._device_type
-                    and base_name
-                    and self._device_type.upper() in base_name
-                ):
-                    base_name = " ".join(base_name.split()[1:])
-
-            if base_name:
-                mapping_name = (
-                    f"{self._device_type.upper()}_"
-                    f"{base_name.upper().replace(' ', '_').replace('-', '_')}"
-                )
-                _LOGGER.debug("Looking for state mapping: %s", mapping_name)
-
-                try:
-                    state_mapping = globals().get(mapping_name)
-                    if state_mapping is not None:
-                        # Convert mapping to options list
-                        options = list(state_mapping.values())
-                        _LOGGER.debug(
-                            "Found enum options for %s: %s", self._sensor_id, options
-                        )
-                        attrs["options"] = options
-                    else:
-                        _LOGGER.debug("No state mapping found for %s", mapping_name)
-
-                except Exception as e:
-                    _LOGGER.debug(
-                        "Error getting state mapping for %s: %s", mapping_name, e
-                    )
+        if self._txt_mapping and self._state_options is not None:
+            attrs["options"] = self._state_options
 
         _LOGGER.debug("Final attributes for %s: %s", self._sensor_id, attrs)
         return attrs
@@ -2863,12 +2686,17 @@ class LambdaSensor(CoordinatorEntity[LambdaDataUpdateCoordinator], SensorEntity)
     @property
     def device_info(self):
         """Return device info for this sensor."""
-        device_type, device_index = extract_device_info_from_sensor_id(
-            self._sensor_id
-        )
-        if device_type and device_index:
-            return build_subdevice_info(self._entry, device_type, device_index)
-        return build_device_info(self._entry)
+        if self._device_info is None:
+            device_type, device_index = extract_device_info_from_sensor_id(
+                self._sensor_id
+            )
+            if device_type and device_index:
+                self._device_info = build_subdevice_info(
+                    self._entry, device_type, device_index
+                )
+            else:
+                self._device_info = build_device_info(self._entry)
+        return self._device_info
 
 
 class LambdaTemplateSensor(CoordinatorEntity, SensorEntity):
@@ -2906,7 +2734,14 @@ class LambdaTemplateSensor(CoordinatorEntity, SensorEntity):
         self._entity_id = entity_id
         self._unique_id = unique_id
         self._template_str = template_str
+        self._template = None  # Einmal pro Entity kompiliert (beim ersten Update)
         self._state = None
+        self._state_gate = create_state_gate(
+            getattr(coordinator, "state_write_gating", None),
+            sensor_id,
+            unit=unit,
+            registry=getattr(coordinator, "state_gates", None),
+        )
         _LOGGER.info(
             f"Template-Sensor erstellt: {self._name} (ID: {self._sensor_id}) mit Template: {self._template_str}"
         )
@@ -2969,8 +2804,9 @@ class LambdaTemplateSensor(CoordinatorEntity, SensorEntity):
     def handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         try:
-            template = Template(self._template_str, self.hass)
-            rendered_value = template.async_render()
+            if self._template is None:
+                self._template = Template(self._template_str, self.hass)
+            rendered_value = self._template.async_render()
             if rendered_value is None or rendered_value == "unavailable":
                 self._state = None
                 return
@@ -3007,7 +2843,8 @@ class LambdaTemplateSensor(CoordinatorEntity, SensorEntity):
                 "Error rendering template for sensor %s: %s", self._sensor_id, err
             )
             self._state = None
-        self.async_write_ha_state()
+        if self._state_gate.check(self._state):
+            self.async_write_ha_state()
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator (for testing)."""
@@ -1,23 +1,51 @@
 """Services for Lambda WP integration."""
 
 from __future__ import annotations
+import asyncio
 import logging
-from datetime import timedelta
+import time
 
 import voluptuous as vol
 
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.const import ATTR_ENTITY_ID
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
+from homeassistant.helpers.service import async_register_admin_service
 
 from .const import (
     DOMAIN,
     CONF_ROOM_TEMPERATURE_ENTITY,
-    DEFAULT_WRITE_INTERVAL,
     CONF_PV_POWER_SENSOR_ENTITY,
+    ROOM_TEMPERATURE_WRITE_THRESHOLD,
+    PV_SURPLUS_WRITE_THRESHOLD,
+    SERVICE_ENTRY_DEADLINE,
+    PROFILE_DEFAULT_CYCLES,
+    PROFILE_MAX_CYCLES,
+    BASE_ADDRESSES,
+    MAX_RANGE_READ_REGISTERS,
+    REGISTER_DATA_TYPES,
+    SENSOR_TYPES,
+    HP_SENSOR_TEMPLATES,
+    BOIL_SENSOR_TEMPLATES,
+    BUFF_SENSOR_TEMPLATES,
+    SOL_SENSOR_TEMPLATES,
+    HC_SENSOR_TEMPLATES,
 )
 from .modbus_utils import async_read_holding_registers, async_write_registers, wait_for_stable_connection
+from .profiling import CycleProfiler
+from .register_catalog import get_register_catalog
+from .register_plan import range_address_info, template_address_info
+from .utils import get_firmware_version_int
+from .write_scheduler import (
+    PV_SURPLUS_ADDRESS,
+    RegisterWriteTarget,
+    collect_due,
+    next_deadline,
+    pv_surplus_raw,
+    room_temperature_address,
+    room_temperature_raw,
+)
 
 # Konstanten für Zustandsarten definieren
 STATE_UNAVAILABLE = "unavailable"
@@ -38,6 +66,51 @@ def should_start_scheduler(hass: HomeAssistant) -> bool:
     return False
 
 
+def _connection_key(entry_id: str, entry_data: dict):
+    """Verbindung eines Entries (host, port); ohne Coordinator der Entry selbst."""
+    coordinator = entry_data.get("coordinator") if isinstance(entry_data, dict) else None
+    host = getattr(coordinator, "host", None)
+    if not host:
+        return entry_id
+    return (host, getattr(coordinator, "port", None))
+
+
+async def _run_per_connection(
+    entries: dict, func, deadline: float = SERVICE_ENTRY_DEADLINE, label: str = "service"
+) -> dict[str, bool]:
+    """``func(entry_id, entry_data)`` für alle Entries ausführen.
+
+    Verbindungen (host:port) laufen parallel, Entries derselben Verbindung
+    nacheinander. Jeder Entry hat eine eigene Deadline; Fehler und Timeouts
+    bleiben auf den Entry beschränkt.
+
+    Returns:
+        ``{entry_id: erfolgreich}``
+    """
+    groups: dict = {}
+    for entry_id, entry_data in entries.items():
+        groups.setdefault(_connection_key(entry_id, entry_data), []).append((entry_id, entry_data))
+
+    results: dict[str, bool] = {}
+
+    async def _run_group(items) -> None:
+        for entry_id, entry_data in items:
+            try:
+                await asyncio.wait_for(func(entry_id, entry_data), timeout=deadline)
+                results[entry_id] = True
+            except asyncio.TimeoutError:
+                results[entry_id] = False
+                _LOGGER.warning(
+                    "%s for entry_id %s exceeded deadline of %ss", label, entry_id, deadline
+                )
+            except Exception as ex:
+                results[entry_id] = False
+                _LOGGER.error("%s for entry_id %s failed: %s", label, entry_id, ex)
+
+    await asyncio.gather(*(_run_group(items) for items in groups.values()))
+    return results
+
+
 # Service Schema
 UPDATE_ROOM_TEMPERATURE_SCHEMA = vol.Schema(
     {
@@ -55,6 +128,43 @@ READ_MODBUS_REGISTER_SCHEMA = vol.Schema(
     }
 )
 
+# Register-Blöcke für read_modbus_registers (module/index → Templates)
+_MODULE_TEMPLATES = {
+    "general": SENSOR_TYPES,
+    "hp": HP_SENSOR_TEMPLATES,
+    "boil": BOIL_SENSOR_TEMPLATES,
+    "buff": BUFF_SENSOR_TEMPLATES,
+    "sol": SOL_SENSOR_TEMPLATES,
+    "hc": HC_SENSOR_TEMPLATES,
+}
+
+# Service Schema für read_modbus_registers (Adressbereich oder Modul-Block)
+READ_MODBUS_REGISTERS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional("entry_id"): cv.string,
+            vol.Optional("start_address"): vol.All(
+                vol.Coerce(int),
+                vol.Range(min=0, max=65535),
+            ),
+            vol.Optional("count", default=1): vol.All(
+                vol.Coerce(int),
+                vol.Range(min=1, max=MAX_RANGE_READ_REGISTERS),
+            ),
+            vol.Optional("data_type", default="uint16"): vol.In(REGISTER_DATA_TYPES),
+            vol.Optional("data_types", default={}): {
+                vol.Coerce(int): vol.In(REGISTER_DATA_TYPES)
+            },
+            vol.Optional("module"): vol.In(list(_MODULE_TEMPLATES)),
+            vol.Optional("index", default=1): vol.All(
+                vol.Coerce(int),
+                vol.Range(min=1, max=8),
+            ),
+        }
+    ),
+    cv.has_at_least_one_key("start_address", "module"),
+)
+
 # Service Schema für write_modbus_register
 WRITE_MODBUS_REGISTER_SCHEMA = vol.Schema(
     {
@@ -70,6 +180,17 @@ WRITE_MODBUS_REGISTER_SCHEMA = vol.Schema(
 )
 
 
+PROFILE_UPDATE_CYCLES_SCHEMA = vol.Schema(
+    {
+        vol.Optional("entry_id"): cv.string,
+        vol.Optional("cycles", default=PROFILE_DEFAULT_CYCLES): vol.All(
+            vol.Coerce(int),
+            vol.Range(min=1, max=PROFILE_MAX_CYCLES),
+        ),
+    }
+)
+
+
 async def _handle_update_room_temperature(
     hass: HomeAssistant, call: ServiceCall
 ) -> None:
@@ -93,11 +214,14 @@ async def _handle_update_room_temperature(
         target_entity_id,
     )
 
-    for entry_id, entry_data in lambda_entries.items():
+    # Controller parallel (pro Verbindung), ein nicht erreichbarer Controller blockiert die anderen nicht
+    async def _process(entry_id: str, entry_data: dict) -> None:
         await _process_room_temperature_entry(
             hass, entry_id, entry_data, target_entity_id
         )
 
+    await _run_per_connection(dict(lambda_entries), _process, label="update_room_temperature")
+
 
 async def _process_room_temperature_entry(
     hass: HomeAssistant, entry_id: str, entry_data: dict, target_entity_id: str
@@ -309,6 +433,109 @@ async def _handle_read_modbus_register(hass: HomeAssistant, call: ServiceCall) -
     return {"error": "No valid coordinator found"}
 
 
+def _resolve_register_block(call_data: dict, entry) -> tuple[dict, dict]:
+    """Adress-Infos und Namen für read_modbus_registers (Modul-Block oder Adressbereich).
+
+    Im Adressbereich werden bekannte Register über den Katalog des Entries
+    (Firmware, Modul-Anzahl) benannt, z. B. ``hp1_operating_state``.
+    """
+    module = call_data.get("module")
+    if module:
+        base_address = 0
+        if module != "general":
+            base_address = BASE_ADDRESSES[module] + (call_data.get("index", 1) - 1) * 100
+        return template_address_info(_MODULE_TEMPLATES[module], base_address)
+    start = call_data["start_address"]
+    count = min(call_data.get("count", 1), 65536 - start)
+    address_info = range_address_info(
+        start, count, call_data.get("data_type", "uint16"), call_data.get("data_types")
+    )
+    address_map = get_register_catalog(get_firmware_version_int(entry)).address_map(
+        {
+            "hp": entry.data.get("num_hps", 1),
+            "boil": entry.data.get("num_boil", 1),
+            "buff": entry.data.get("num_buff", 0),
+            "sol": entry.data.get("num_sol", 0),
+            "hc": entry.data.get("num_hc", 1),
+        }
+    )
+    names = {address: address_map[address][0] for address in address_info if address in address_map}
+    return address_info, names
+
+
+async def _handle_read_modbus_registers(hass: HomeAssistant, call: ServiceCall) -> dict:
+    """Handle read_modbus_registers: Register-Block über den Batch-Planer lesen und dekodieren."""
+    target_entry_id = call.data.get("entry_id")
+    coordinator = None
+    entry_id = None
+    for candidate_id, entry_data in hass.data.get(DOMAIN, {}).items():
+        if target_entry_id and candidate_id != target_entry_id:
+            continue
+        candidate = entry_data.get("coordinator") if isinstance(entry_data, dict) else None
+        if candidate and candidate.client:
+            coordinator, entry_id = candidate, candidate_id
+            break
+    if coordinator is None:
+        _LOGGER.error("No valid coordinator found for read_modbus_registers")
+        return {"error": "No valid coordinator found"}
+
+    address_info, names = _resolve_register_block(call.data, coordinator.entry)
+    started = time.perf_counter()
+    result = await coordinator.async_read_register_range(address_info)
+    duration_ms = (time.perf_counter() - started) * 1000
+
+    registers = []
+    for address in sorted(address_info):
+        item = {"address": address, "data_type": address_info[address]["data_type"]}
+        if address in names:
+            item["name"] = names[address]
+        value = result["values"].get(address)
+        item["value"] = round(value, 4) if isinstance(value, float) else value
+        if address in result["errors"]:
+            item["error"] = result["errors"][address]
+        registers.append(item)
+
+    _LOGGER.info(
+        "Read %d registers for entry_id %s in %d transactions (%.1f ms)",
+        len(registers), entry_id, result["transactions"], duration_ms,
+    )
+    return {
+        "entry_id": entry_id,
+        "registers": registers,
+        "transactions": result["transactions"],
+        "duration_ms": round(duration_ms, 1),
+    }
+
+
+async def _handle_profile_update_cycles(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle profile_update_cycles: nächste N Zyklen der Coordinators mit cProfile messen."""
+    target_entry_id = call.data.get("entry_id")
+    coordinators = []
+    for entry_id, entry_data in hass.data.get(DOMAIN, {}).items():
+        if target_entry_id and entry_id != target_entry_id:
+            continue
+        coordinator = entry_data.get("coordinator") if isinstance(entry_data, dict) else None
+        if coordinator is not None:
+            coordinators.append(coordinator)
+    if not coordinators:
+        _LOGGER.error("No valid coordinator found for profile_update_cycles")
+        return
+    # cProfile erlaubt einen Profiler pro Thread: nur eine Session gleichzeitig
+    if any(
+        getattr(entry_data.get("coordinator"), "profiling_active", False)
+        for entry_data in hass.data.get(DOMAIN, {}).values()
+        if isinstance(entry_data, dict)
+    ):
+        _LOGGER.warning("Profiling is already running, request ignored")
+        return
+    # Ein gemeinsamer Profiler für alle gewählten Coordinators (ein cProfile pro Thread)
+    cycles = call.data["cycles"]
+    label = coordinators[0]._name_prefix if len(coordinators) == 1 else "all"
+    profiler = CycleProfiler(cycles, coordinators[0]._config_path, label)
+    for coordinator in coordinators:
+        coordinator.start_profiling(cycles, profiler)
+
+
 async def _handle_write_modbus_register(hass: HomeAssistant, call: ServiceCall) -> None:
     """Handle write Modbus register service call."""
     register_address = call.data.get("register_address")
@@ -359,186 +586,211 @@ async def _handle_write_modbus_register(hass: HomeAssistant, call: ServiceCall)
             )
 
 
-async def _handle_write_room_and_pv(hass: HomeAssistant) -> None:
-    """
-    Write room temperature and PV surplus to Modbus registers
-    for all entries.
-    """
-    lambda_entries = hass.data.get(DOMAIN, {})
-    if not lambda_entries:
-        _LOGGER.info("No Lambda WP integrations found yet, skipping write operation")
-        return
+def _build_write_targets(config_entry) -> list[RegisterWriteTarget]:
+    """Write-Ziele (Raumtemperatur je Heizkreis, PV-Überschuss) aus den Entry-Optionen."""
+    options = config_entry.options or {}
+    targets = []
+    if options.get("room_thermostat_control", False):
+        for hc_idx in range(1, config_entry.data.get("num_hc", 1) + 1):
+            entity_id = options.get(CONF_ROOM_TEMPERATURE_ENTITY.format(hc_idx))
+            if entity_id:
+                targets.append(
+                    RegisterWriteTarget(
+                        f"room_temperature_hc{hc_idx}",
+                        room_temperature_address(hc_idx),
+                        entity_id,
+                        threshold=ROOM_TEMPERATURE_WRITE_THRESHOLD,
+                    )
+                )
+    if options.get("pv_surplus", False):
+        entity_id = options.get(CONF_PV_POWER_SENSOR_ENTITY)
+        if entity_id:
+            targets.append(
+                RegisterWriteTarget(
+                    "pv_surplus",
+                    PV_SURPLUS_ADDRESS,
+                    entity_id,
+                    threshold=PV_SURPLUS_WRITE_THRESHOLD,
+                    signed=options.get("pv_surplus_mode", "pos") == "neg",
+                )
+            )
+    return targets
 
-    # Prüfe ob mindestens eine Option aktiv ist
-    if not should_start_scheduler(hass):
-        _LOGGER.debug("No service options are active, skipping write operation")
-        return
 
-    # Create a copy of the dictionary to avoid "dictionary changed size during iteration"
-    entries_copy = dict(lambda_entries)
-    for entry_id, entry_data in entries_copy.items():
-        await _write_room_and_pv_for_entry(hass, entry_id, entry_data)
+class _EntryWriteScheduler:
+    """Ereignisgesteuerte Writes von Raumtemperatur und PV-Überschuss für einen Entry.
 
+    Reagiert auf State-Änderungen der konfigurierten Quell-Entities; fällige
+    Writes (Schwelle überschritten und Mindestabstand abgelaufen, oder
+    Keep-Alive) werden in einem Durchlauf geschrieben.
+    """
 
-async def _write_room_and_pv_for_entry(
-    hass: HomeAssistant, entry_id: str, entry_data: dict
-) -> None:
-    """Write room temperature and PV surplus for a specific entry."""
-    config_entry = hass.config_entries.async_get_entry(entry_id)
-    if not config_entry or not config_entry.options:
-        return
+    def __init__(self, hass: HomeAssistant, entry_id: str, config_entry, entry_data: dict):
+        self.hass = hass
+        self.entry_id = entry_id
+        self._entry_data = entry_data
+        self._pv_mode = config_entry.options.get("pv_surplus_mode", "pos")
+        self.targets = _build_write_targets(config_entry)
+        self._by_source: dict[str, list[RegisterWriteTarget]] = {}
+        for target in self.targets:
+            self._by_source.setdefault(target.source_entity_id, []).append(target)
+        self._unsub_state = None
+        self._unsub_timer = None
+        self._running = False
 
-    coordinator = entry_data.get("coordinator")
-    if not coordinator or not coordinator.client:
-        _LOGGER.error(
-            "Coordinator or Modbus client not available for entry_id %s",
-            entry_id,
+    @callback
+    def start(self) -> None:
+        """Aktuelle Quellwerte übernehmen, State-Listener registrieren, ersten Durchlauf planen."""
+        for entity_id in self._by_source:
+            self._offer(entity_id, self.hass.states.get(entity_id))
+        self._unsub_state = async_track_state_change_event(
+            self.hass, list(self._by_source), self._on_source_changed
         )
-        return
-    
-    # 🎯 NEUE LOGIK: Warte auf stabile Verbindung vor Service-Operationen
-    _LOGGER.info("SERVICE: Checking connection stability before PV surplus update...")
-    await wait_for_stable_connection(coordinator)
-    _LOGGER.info("SERVICE: Connection stable, proceeding with PV surplus update")
-
-    # Debug: Log current options
-    room_thermostat_control = config_entry.options.get("room_thermostat_control", False)
-    pv_surplus = config_entry.options.get("pv_surplus", False)
-    _LOGGER.info("Entry %s options: room_thermostat_control=%s, pv_surplus=%s", 
-                 entry_id, room_thermostat_control, pv_surplus)
-
-    # Prüfe ob mindestens eine Option für diese Entry aktiv ist
-    if not room_thermostat_control and not pv_surplus:
-        _LOGGER.debug("No service options are active for entry %s, skipping write operation", entry_id)
-        return
-    
-    # Raumthermostat schreiben
-    if room_thermostat_control:
-        _LOGGER.info("Writing room temperatures for entry %s", entry_id)
-        await _write_room_temperatures(
-            hass, config_entry, coordinator, entry_id, entry_data
+        _LOGGER.info(
+            "SERVICES: Event-driven writes for entry %s: %s",
+            self.entry_id,
+            ", ".join(f"{t.name}@{t.address}" for t in self.targets),
         )
+        self._schedule()
 
-    # PV-Überschuss schreiben
-    if pv_surplus:
-        _LOGGER.info("Writing PV surplus for entry %s", entry_id)
-        await _write_pv_surplus(hass, config_entry, coordinator, entry_id, entry_data)
-
-
-async def _write_room_temperatures(
-    hass: HomeAssistant, config_entry, coordinator, entry_id: str, entry_data: dict
-) -> None:
-    """Write room temperatures for all heating circuits."""
-    num_hc = config_entry.data.get("num_hc", 1)
-    for hc_idx in range(1, num_hc + 1):
-        entity_key = CONF_ROOM_TEMPERATURE_ENTITY.format(hc_idx)
-        room_temp_entity_id = config_entry.options.get(entity_key)
-        if not room_temp_entity_id:
-            continue
-
-        state = hass.states.get(room_temp_entity_id)
+    @callback
+    def stop(self) -> None:
+        if self._unsub_state:
+            self._unsub_state()
+            self._unsub_state = None
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    def _raw_value(self, target: RegisterWriteTarget, state) -> int | None:
         if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN, ""):
-            continue
-
+            return None
         try:
-            temperature = float(state.state)
-            raw_value = int(temperature * 10)
-            register_address = 5004 + (hc_idx - 1) * 100
-            _LOGGER.info(
-                "[Scheduled] Writing room temperature to "
-                "register %s: %s (%s°C) for HC %s",
-                register_address,
-                raw_value,
-                temperature,
-                hc_idx,
-            )
-            await async_write_registers(
-                coordinator.client,
-                register_address,
-                [raw_value],
-                entry_data.get("slave_id", 1),
-            )
-        except Exception as ex:
-            _LOGGER.error(
-                "Error writing room temperature for HC %d: %s",
-                hc_idx,
-                ex,
+            if target.address == PV_SURPLUS_ADDRESS:
+                return pv_surplus_raw(
+                    state.state, state.attributes.get("unit_of_measurement", ""), self._pv_mode
+                )
+            return room_temperature_raw(state.state)
+        except (ValueError, TypeError) as ex:
+            _LOGGER.warning(
+                "Unable to convert %s (%s) for %s: %s",
+                target.source_entity_id, state.state, target.name, ex,
             )
+            return None
 
+    def _offer(self, entity_id: str, state) -> None:
+        for target in self._by_source.get(entity_id, ()):
+            target.offer(self._raw_value(target, state))
 
-async def _write_pv_surplus(
-    hass: HomeAssistant, config_entry, coordinator, entry_id: str, entry_data: dict
-) -> None:
-    """Write PV surplus to Modbus register."""
-    entity_id = config_entry.options.get(CONF_PV_POWER_SENSOR_ENTITY)
-    if not entity_id:
-        return
-
-    state = hass.states.get(entity_id)
-    if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN, ""):
-        return
-
-    try:
-        power_value = float(state.state)
-        unit = state.attributes.get("unit_of_measurement", "")
-        if unit == "kW":
-            power_value *= 1000  # in W
-
-        # Determine surplus mode
-        surplus_mode = config_entry.options.get("pv_surplus_mode", "pos")
-        if surplus_mode in ("entry", "pos"):
-            # UINT16: only positive values allowed
-            raw_value = max(0, int(power_value))
-            write_type = "UINT16"
-        elif surplus_mode == "neg":
-            # INT16: allow negative values, encode as 2's complement
-            from .utils import clamp_to_int16
-
-            raw_value = clamp_to_int16(power_value, context="PV surplus") & 0xFFFF
-            write_type = "INT16"
-        else:
-            # fallback: treat as UINT16
-            raw_value = max(0, int(power_value))
-            write_type = "UINT16 (fallback)"
+    @callback
+    def _on_source_changed(self, event) -> None:
+        self._offer(event.data["entity_id"], event.data.get("new_state"))
+        self._schedule()
 
-        _LOGGER.info(
-            "PV-surplus gesendet: Value nativ %s %s, value %s W (Register: %s, Mode: %s)",
-            state.state,
-            unit,
-            raw_value,
-            102,
-            write_type,
-        )
+    @callback
+    def _schedule(self) -> None:
+        """Timer auf den frühesten fälligen Write setzen (ein Timer pro Entry)."""
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+        if self._running:
+            return  # der laufende Durchlauf plant nach Abschluss neu
+        deadline = next_deadline(self.targets)
+        if deadline is None:
+            return
+        delay = max(0.0, deadline - time.monotonic())
+        self._unsub_timer = async_call_later(self.hass, delay, self._on_timer)
 
-        # 🎯 NEUE LOGIK: Warte auf stabile Verbindung vor PV Surplus Write
-        _LOGGER.info("SERVICE: Checking connection stability before PV surplus write...")
-        await wait_for_stable_connection(coordinator)
-        _LOGGER.info("SERVICE: Connection stable, proceeding with PV surplus write")
+    @callback
+    def _on_timer(self, _now) -> None:
+        self._unsub_timer = None
+        self.hass.async_create_task(self._run_pass())
 
-        result = await async_write_registers(
-            coordinator.client,
-            102,  # register_address for PV surplus
-            [raw_value],
-            entry_data.get("slave_id", 1),
-        )
-        
-        if result.isError():
-            _LOGGER.info(
-                "❌ MODBUS WRITE FAILED: PV surplus write failed, address=102, value=%d, result=%s, caller=_write_pv_surplus",
-                raw_value, result
-            )
-        else:
+    async def _run_pass(self) -> None:
+        """Alle fälligen Writes in einem Durchlauf schreiben."""
+        if self._running:
+            return
+        self._running = True
+        try:
+            now = time.monotonic()
+            due = collect_due(self.targets, now)
+            if not due:
+                return
+            coordinator = self._entry_data.get("coordinator")
+            if not coordinator or not coordinator.client:
+                _LOGGER.error(
+                    "Coordinator or Modbus client not available for entry_id %s",
+                    self.entry_id,
+                )
+                for target, _value in due:
+                    target.mark_failed(now)
+                return
+            # Verbindungsprüfung nur, wenn der letzte Coordinator-Zyklus fehlgeschlagen ist
+            if not getattr(coordinator, "last_update_success", True):
+                await wait_for_stable_connection(coordinator)
+            slave_id = self._entry_data.get("slave_id", 1)
+            try:
+                await asyncio.wait_for(
+                    self._write_all(coordinator, slave_id, due), timeout=SERVICE_ENTRY_DEADLINE
+                )
+            except asyncio.TimeoutError:
+                _LOGGER.warning(
+                    "Write pass for entry_id %s exceeded deadline of %ss",
+                    self.entry_id, SERVICE_ENTRY_DEADLINE,
+                )
+                failed_at = time.monotonic()
+                for target, value in due:
+                    if target.is_due(failed_at):
+                        target.mark_failed(failed_at)
+        finally:
+            self._running = False
+            self._schedule()
+
+    async def _write_all(self, coordinator, slave_id: int, due) -> None:
+        for target, value in due:
+            await self._write(coordinator, slave_id, target, value)
+
+    async def _write(self, coordinator, slave_id: int, target: RegisterWriteTarget, value: int) -> None:
+        try:
+            result = await async_write_registers(coordinator.client, target.address, [value], slave_id)
+            error = result if result.isError() else None
+        except Exception as ex:
+            error = ex
+        if error is not None:
+            target.mark_failed(time.monotonic())
             _LOGGER.info(
-                "✅ MODBUS WRITE SUCCESS: PV surplus written to address=102, value=%d, mode=%s, caller=_write_pv_surplus",
-                raw_value, write_type
+                "❌ MODBUS WRITE FAILED: %s write failed, address=%d, value=%d, error=%s, caller=_EntryWriteScheduler",
+                target.name, target.address, value, error,
             )
-    except Exception as ex:
-        _LOGGER.info(
-            "❌ MODBUS WRITE FAILED: PV surplus write failed, address=102, value=%d, error=%s, caller=_write_pv_surplus",
-            raw_value, ex
+            return
+        target.mark_written(value, time.monotonic())
+        _LOGGER.debug(
+            "✅ MODBUS WRITE SUCCESS: %s written to address=%d, value=%d, caller=_EntryWriteScheduler",
+            target.name, target.address, value,
         )
 
 
+@callback
+def _start_write_schedulers(hass: HomeAssistant, unsub_callbacks: dict) -> int:
+    """Write-Scheduler für alle Entries mit aktiver Option (neu) starten."""
+    for key in [key for key in unsub_callbacks if key.startswith("write_scheduler_")]:
+        unsub_callbacks.pop(key)()
+
+    started = 0
+    # Kopie, um "dictionary changed size during iteration" zu vermeiden
+    for entry_id, entry_data in dict(hass.data.get(DOMAIN, {})).items():
+        config_entry = hass.config_entries.async_get_entry(entry_id)
+        if not config_entry or not config_entry.options:
+            continue
+        scheduler = _EntryWriteScheduler(hass, entry_id, config_entry, entry_data)
+        if not scheduler.targets:
+            continue
+        scheduler.start()
+        unsub_callbacks[f"write_scheduler_{entry_id}"] = scheduler.stop
+        started += 1
+    return started
+
+
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up Lambda WP services."""
     _LOGGER.info("Setting up Lambda WP services...")
@@ -563,14 +815,18 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         """Read a value from a Modbus register of the Lambda heat pump."""
         return await _handle_read_modbus_register(hass, call)
 
+    async def async_read_modbus_registers(call: ServiceCall) -> dict:
+        """Read a block of Modbus registers (range or module) in batched transactions."""
+        return await _handle_read_modbus_registers(hass, call)
+
+    async def async_profile_update_cycles(call: ServiceCall) -> None:
+        """Profile the next update cycles and write a report to the config directory."""
+        await _handle_profile_update_cycles(hass, call)
+
     async def async_write_modbus_register(call: ServiceCall) -> None:
         """Write a value to a Modbus register of the Lambda heat pump."""
         await _handle_write_modbus_register(hass, call)
 
-    async def async_write_room_and_pv(call: ServiceCall = None) -> None:
-        """Write room temperature and PV surplus to Modbus registers."""
-        await _handle_write_room_and_pv(hass)
-
     # Setup regelmäßige Aktualisierungen für alle Entries
     @callback
     def setup_scheduled_updates() -> None:
@@ -589,7 +845,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         hass.async_create_task(wait_for_successful_read_then_start_services())
 
     async def wait_for_successful_read_then_start_services() -> None:
-        """Wait for successful coordinator read AND auto-detection completion, then start services with 41s interval."""
+        """Wait for successful coordinator read AND auto-detection completion, then start the write schedulers."""
         try:
             # Warte auf ersten erfolgreichen Coordinator-Update
             _LOGGER.info("⏳ SERVICES: Waiting for coordinator to complete first successful read...")
@@ -606,11 +862,14 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 _LOGGER.error("SERVICES: No coordinator found, cannot start services")
                 return
             
-            # Warte auf erfolgreichen Read (mit Timeout)
-            import asyncio
+            # Auf das erste vollständige Update des Coordinators warten (Startup-Fill im
+            # Hintergrund) statt einen eigenen, parallelen Refresh anzustoßen
             try:
-                await asyncio.wait_for(coordinator.async_refresh(), timeout=60)
-                _LOGGER.info("SERVICES: Coordinator read successful")
+                await asyncio.wait_for(coordinator.async_wait_startup_complete(), timeout=60)
+                if coordinator.last_update_success:
+                    _LOGGER.info("SERVICES: Coordinator read successful")
+                else:
+                    _LOGGER.warning("SERVICES: Coordinator read failed, continuing anyway")
             except asyncio.TimeoutError:
                 _LOGGER.warning("SERVICES: Coordinator read timeout, continuing anyway")
             except Exception as e:
@@ -619,32 +878,16 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             # 🎯 NEUE LOGIK: Warte zusätzlich auf Auto-Detection-Abschluss
             _LOGGER.info("⏳ SERVICES: Waiting for background auto-detection to complete...")
             await wait_for_auto_detection_completion()
-            _LOGGER.info("SERVICES: Auto-detection completed, starting services with 41s interval")
-            
-            # Starte Services mit 41s Intervall (ungerade Zahl > 30)
-            update_interval = timedelta(seconds=DEFAULT_WRITE_INTERVAL)
-            _LOGGER.info("SERVICES: Starting scheduled updates with interval: %s seconds", DEFAULT_WRITE_INTERVAL)
-
-            async def scheduled_update_callback(_):
-                _LOGGER.info("Scheduled update callback triggered")
-                await async_write_room_and_pv()
-
-            unsub = async_track_time_interval(
-                hass,
-                scheduled_update_callback,
-                update_interval,
-            )
-            unsub_update_callbacks["write_room_and_pv"] = unsub
-            _LOGGER.info("SERVICES: Scheduled updates setup completed with collision-free timing")
-            
+            _LOGGER.info("SERVICES: Auto-detection completed, starting event-driven writes")
+
+            started = _start_write_schedulers(hass, unsub_update_callbacks)
+            _LOGGER.info("SERVICES: Event-driven writes started for %d entries", started)
+
         except Exception as e:
             _LOGGER.error("SERVICES: Failed to setup services: %s", e, exc_info=True)
 
     async def wait_for_auto_detection_completion() -> None:
         """Wait for background auto-detection to complete (max 20 seconds)."""
-        import asyncio
-        import time
-        
         start_time = time.time()
         max_wait_time = 20  # Maximum 20 seconds wait for auto-detection
         
@@ -696,6 +939,15 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         supports_response=True,
     )
 
+    # Registriere read_modbus_registers Service (Bereich/Modul-Block)
+    hass.services.async_register(
+        DOMAIN,
+        "read_modbus_registers",
+        async_read_modbus_registers,
+        schema=READ_MODBUS_REGISTERS_SCHEMA,
+        supports_response=True,
+    )
+
     # Registriere write_modbus_register Service
     hass.services.async_register(
         DOMAIN,
@@ -704,6 +956,15 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         schema=WRITE_MODBUS_REGISTER_SCHEMA,
     )
 
+    # Registriere profile_update_cycles Service (nur Admins)
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        "profile_update_cycles",
+        async_profile_update_cycles,
+        schema=PROFILE_UPDATE_CYCLES_SCHEMA,
+    )
+
 
 async def async_unload_services(hass: HomeAssistant) -> None:
     """Unload Lambda WP services and stop all timers."""
@@ -726,8 +987,12 @@ async def async_unload_services(hass: HomeAssistant) -> None:
         hass.services.async_remove(DOMAIN, "update_room_temperature")
     if hass.services.has_service(DOMAIN, "read_modbus_register"):
         hass.services.async_remove(DOMAIN, "read_modbus_register")
+    if hass.services.has_service(DOMAIN, "read_modbus_registers"):
+        hass.services.async_remove(DOMAIN, "read_modbus_registers")
     if hass.services.has_service(DOMAIN, "write_modbus_register"):
         hass.services.async_remove(DOMAIN, "write_modbus_register")
+    if hass.services.has_service(DOMAIN, "profile_update_cycles"):
+        hass.services.async_remove(DOMAIN, "profile_update_cycles")
     
     _LOGGER.info("Lambda WP services unloaded successfully")
 
@@ -740,8 +1005,8 @@ async def setup_scheduled_timer(hass: HomeAssistant) -> None:
     if setup_func:
         # 🎯 NEUE LOGIK: Bei Reloads auch auf Auto-Detection warten
         _LOGGER.info("RELOAD: Restarting services with auto-detection wait...")
-        hass.async_create_task(wait_for_successful_read_then_start_services())
-        _LOGGER.info("Scheduled timer restart initiated with collision-free timing")
+        setup_func()
+        _LOGGER.info("Write scheduler restart initiated")
     else:
         _LOGGER.error(
             "Cannot restart scheduled timer: setup function not found after reload. "
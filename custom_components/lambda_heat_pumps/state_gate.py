@@ -0,0 +1,176 @@
+"""Value-Change-Gating für State-Writes.
+
+Viele Entities schreiben bei jedem Coordinator-Update ihren State, auch wenn
+sich nichts geändert hat; Temperaturen rauschen zusätzlich um ±0.1 °C. Jeder
+Write erzeugt ein ``state_changed``-Event (bzw. Attribut-Update) und Recorder-
+Last. ``StateWriteGate`` lässt einen Write nur durch, wenn
+
+- sich die Verfügbarkeit geändert hat,
+- ein nicht-numerischer Wert sich geändert hat,
+- ein numerischer Wert sich um mindestens die Deadband vom zuletzt
+  geschriebenen Wert entfernt hat (Deadband 0 = jede Änderung), oder
+- seit dem letzten Write ``max_silence`` Sekunden vergangen sind.
+
+Deadband, Precision und Max-Silence kommen aus dem Sensor-Template
+(``"deadband"``, ``"precision"``), Defaults pro Einheit
+(``STATE_DEADBAND_BY_UNIT``) und können in ``lambda_wp_config.yaml`` unter
+``state_write_gating`` überschrieben werden. Gates, die in einer Registry
+des Coordinators angemeldet sind, übernehmen geänderte Overrides beim
+Hot-Reload der YAML über ``reconfigure`` (der zuletzt geschriebene Stand bleibt).
+"""
+
+from __future__ import annotations
+
+import re
+import time
+
+from .const import DEFAULT_STATE_MAX_SILENCE, STATE_DEADBAND_BY_UNIT
+
+
+class StateWriteGate:
+    """Entscheidet pro Entity, ob ein State-Write fällig ist."""
+
+    __slots__ = (
+        "deadband",
+        "max_silence",
+        "_last_value",
+        "_last_available",
+        "_last_write",
+        "_spec",
+        "__weakref__",
+    )
+
+    def __init__(self, deadband: float = 0.0, max_silence: float = DEFAULT_STATE_MAX_SILENCE):
+        self.deadband = float(deadband or 0.0)
+        self.max_silence = float(max_silence)
+        self._last_value = None
+        self._last_available = None
+        self._last_write: float | None = None
+        # (sensor_id, template_key, sensor_info, unit) aus create_state_gate, für reconfigure
+        self._spec = None
+
+    def reconfigure(self, gating_config: dict | None) -> None:
+        """Deadband/Max-Silence aus geänderter ``state_write_gating``-Konfiguration neu auflösen."""
+        if self._spec is None:
+            return
+        self.deadband, self.max_silence = _resolve_gate_params(gating_config, *self._spec)
+
+    def should_write(self, value, available: bool = True, now: float | None = None) -> bool:
+        """True, wenn der Wert geschrieben werden soll (ohne den Stand zu übernehmen)."""
+        if self._last_write is None or available != self._last_available:
+            return True
+        if now is None:
+            now = time.monotonic()
+        if self.max_silence > 0 and now - self._last_write >= self.max_silence:
+            return True
+        last = self._last_value
+        if (
+            self.deadband > 0
+            and isinstance(value, (int, float))
+            and isinstance(last, (int, float))
+            and not isinstance(value, bool)
+        ):
+            return abs(value - last) >= self.deadband
+        return value != last
+
+    def record(self, value, available: bool = True, now: float | None = None) -> None:
+        """Geschriebenen Stand übernehmen."""
+        self._last_value = value
+        self._last_available = available
+        self._last_write = time.monotonic() if now is None else now
+
+    def check(self, value, available: bool = True, now: float | None = None) -> bool:
+        """``should_write`` + ``record``: True, wenn jetzt geschrieben werden soll."""
+        if not self.should_write(value, available, now):
+            return False
+        self.record(value, available, now)
+        return True
+
+
+_DEVICE_PREFIX_RE = re.compile(r"^(hp|boil|buff|sol|hc)\d+_")
+
+
+def _gating_config(gating_config) -> dict:
+    return gating_config if isinstance(gating_config, dict) else {}
+
+
+def _template_key(sensor_id: str, template_key: str | None) -> str:
+    """Template-Key = Sensor-ID ohne Geräte-Präfix (hp1_flow_line_temperature -> flow_line_temperature)."""
+    if template_key:
+        return template_key
+    return _DEVICE_PREFIX_RE.sub("", sensor_id or "", count=1)
+
+
+def _lookup(section: dict, sensor_id: str, template_key: str | None):
+    """Override für die volle Sensor-ID (z. B. hp1_flow_line_temperature) oder den Template-Key."""
+    if not isinstance(section, dict):
+        return None
+    if sensor_id in section:
+        return section[sensor_id]
+    if template_key and template_key in section:
+        return section[template_key]
+    return None
+
+
+def resolve_precision(
+    gating_config: dict | None,
+    sensor_id: str,
+    template_key: str | None,
+    precision,
+):
+    """Precision aus Template, ggf. durch ``state_write_gating.precision`` überschrieben."""
+    override = _lookup(
+        _gating_config(gating_config).get("precision", {}),
+        sensor_id,
+        _template_key(sensor_id, template_key),
+    )
+    if override is None:
+        return precision
+    try:
+        return int(override)
+    except (TypeError, ValueError):
+        return precision
+
+
+def _resolve_gate_params(
+    gating_config: dict | None,
+    sensor_id: str,
+    template_key: str | None,
+    sensor_info: dict | None,
+    unit: str | None,
+) -> tuple[float, float]:
+    """(Deadband, Max-Silence): YAML-Override > Template-"deadband" > Einheiten-Default."""
+    gating_config = _gating_config(gating_config)
+    deadband = _lookup(
+        gating_config.get("deadband", {}), sensor_id, _template_key(sensor_id, template_key)
+    )
+    if deadband is None and sensor_info:
+        deadband = sensor_info.get("deadband")
+    if deadband is None:
+        deadband = STATE_DEADBAND_BY_UNIT.get(unit, 0.0)
+    max_silence = gating_config.get("max_silence_seconds", DEFAULT_STATE_MAX_SILENCE)
+    try:
+        return float(deadband or 0.0), float(max_silence)
+    except (TypeError, ValueError):
+        return 0.0, float(DEFAULT_STATE_MAX_SILENCE)
+
+
+def create_state_gate(
+    gating_config: dict | None,
+    sensor_id: str,
+    template_key: str | None = None,
+    sensor_info: dict | None = None,
+    unit: str | None = None,
+    registry=None,
+) -> StateWriteGate:
+    """Gate mit Deadband/Max-Silence aus Template, Einheiten-Default und YAML-Overrides.
+
+    ``registry`` (z. B. ``coordinator.state_gates``, ein ``WeakSet``) meldet das Gate
+    für den Hot-Reload von ``state_write_gating`` an.
+    """
+    spec = (sensor_id, template_key, sensor_info, unit)
+    gate = StateWriteGate(*_resolve_gate_params(gating_config, *spec))
+    gate._spec = spec
+    if registry is not None:
+        registry.add(gate)
+    return gate
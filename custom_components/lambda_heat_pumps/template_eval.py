@@ -0,0 +1,125 @@
+"""Native Auswertung der eingebauten berechneten Sensor-Formeln.
+
+Die Formeln in ``CALCULATED_SENSOR_TEMPLATES`` stehen zur Auslieferung fest.
+Statt sie in jedem Zyklus als Jinja-Template zu rendern (Template-Parsing,
+``states()``-Lookups, String→Float-Konvertierung des Ergebnisses), beschreibt
+der optionale Schlüssel ``"native"`` die Formel als kleine Expression-Spec,
+die einmal pro Entity zu einer Python-Callable kompiliert wird::
+
+    "native": {
+        "inputs": {
+            # name: (entity_id-Template, Default wie Jinja ``| float(default)``)
+            "thermal": ("sensor.{full_entity_prefix}_..._accumulated", 0.0),
+            "power": ("sensor.{full_entity_prefix}_..._accumulated", 1.0),
+        },
+        # (op, arg, ...) mit arg = Input-Name, Zahl oder verschachtelte Expression
+        "expr": ("div_pos", "thermal", "power", 0),
+    }
+
+Jinja wird nur noch für Templates ohne ``"native"``-Spec (z. B. vom Nutzer
+angepasste Formeln) verwendet.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+_UNAVAILABLE_STATES = ("unknown", "unavailable", "none", "")
+
+
+def _op_div_pos(numerator, denominator, fallback=0):
+    """``numerator / denominator if denominator > 0 else fallback``."""
+
+    def _fn(values):
+        den = denominator(values)
+        if den > 0:
+            return numerator(values) / den
+        return fallback(values)
+
+    return _fn
+
+
+def _binary(func):
+    def _factory(left, right):
+        return lambda values: func(left(values), right(values))
+
+    return _factory
+
+
+_OPERATORS: dict[str, Callable[..., Callable]] = {
+    "add": _binary(lambda a, b: a + b),
+    "sub": _binary(lambda a, b: a - b),
+    "mul": _binary(lambda a, b: a * b),
+    "min": _binary(min),
+    "max": _binary(max),
+    "div_pos": _op_div_pos,
+}
+
+
+def _compile_expr(expr: Any, input_index: dict[str, int]) -> Callable[[list], float]:
+    """Expression-Spec rekursiv in eine Callable ``values -> float`` übersetzen."""
+    if isinstance(expr, bool):
+        raise ValueError(f"Invalid constant in native template: {expr!r}")
+    if isinstance(expr, (int, float)):
+        const = float(expr)
+        return lambda values: const
+    if isinstance(expr, str):
+        if expr not in input_index:
+            raise ValueError(f"Unknown input '{expr}' in native template")
+        idx = input_index[expr]
+        return lambda values: values[idx]
+    if isinstance(expr, (tuple, list)) and expr:
+        op, *args = expr
+        factory = _OPERATORS.get(op)
+        if factory is None:
+            raise ValueError(f"Unknown operator '{op}' in native template")
+        return factory(*(_compile_expr(arg, input_index) for arg in args))
+    raise ValueError(f"Invalid native template expression: {expr!r}")
+
+
+class NativeTemplate:
+    """Kompilierte eingebaute Formel: liest die Input-Entities und rechnet direkt in Python."""
+
+    __slots__ = ("entity_ids", "_defaults", "_fn")
+
+    def __init__(self, entity_ids: list[str], defaults: list[float], fn: Callable[[list], float]):
+        self.entity_ids = entity_ids
+        self._defaults = defaults
+        self._fn = fn
+
+    def evaluate(self, hass) -> float:
+        """Formel mit den aktuellen States auswerten (nicht-numerische States → Default)."""
+        values = []
+        get_state = hass.states.get
+        for entity_id, default in zip(self.entity_ids, self._defaults):
+            state = get_state(entity_id)
+            if state is None or state.state in _UNAVAILABLE_STATES:
+                values.append(default)
+                continue
+            try:
+                values.append(float(state.state))
+            except (ValueError, TypeError):
+                values.append(default)
+        return self._fn(values)
+
+
+def compile_native_template(spec: dict, format_kwargs: dict) -> NativeTemplate:
+    """Native Expression-Spec eines eingebauten Templates für ein Gerät kompilieren.
+
+    Args:
+        spec: ``sensor_info["native"]`` mit ``inputs`` und ``expr``
+        format_kwargs: Platzhalter für die Entity-IDs (z. B. ``full_entity_prefix``)
+
+    Raises:
+        ValueError: bei unbekannten Operatoren/Inputs oder ungültiger Spec
+    """
+    inputs = spec.get("inputs") or {}
+    entity_ids: list[str] = []
+    defaults: list[float] = []
+    input_index: dict[str, int] = {}
+    for name, (entity_template, default) in inputs.items():
+        input_index[name] = len(entity_ids)
+        entity_ids.append(entity_template.format(**format_kwargs))
+        defaults.append(float(default))
+    fn = _compile_expr(spec.get("expr"), input_index)
+    return NativeTemplate(entity_ids, defaults, fn)
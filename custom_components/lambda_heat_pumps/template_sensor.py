@@ -25,6 +25,8 @@ from .const import (
     HC_ROOM_THERMOSTAT_NUMBER_CONFIG,
 )
 from .coordinator import LambdaDataUpdateCoordinator
+from .state_gate import create_state_gate
+from .template_eval import NativeTemplate, compile_native_template
 from .utils import (
     build_device_info,
     build_subdevice_info,
@@ -241,9 +243,23 @@ async def async_setup_entry(
                         continue
 
                     template_str = sensor_info["template"].format(**format_kwargs)
+                    # Eingebaute Formeln nativ auswerten; Jinja nur ohne "native"-Spec
+                    native_template = None
+                    if "native" in sensor_info:
+                        try:
+                            native_template = compile_native_template(
+                                sensor_info["native"], format_kwargs
+                            )
+                        except (ValueError, KeyError, TypeError) as err:
+                            _LOGGER.warning(
+                                "Native formula for %s invalid, using Jinja template: %s",
+                                naming["entity_id"],
+                                err,
+                            )
                     _LOGGER.debug(
-                        "Creating template sensor %s with template: %s",
+                        "Creating template sensor %s with %s: %s",
                         naming["entity_id"],
+                        "native formula" if native_template else "template",
                         template_str,
                     )
                     template_sensors.append(
@@ -261,6 +277,7 @@ async def async_setup_entry(
                             unique_id=naming["unique_id"],
                             template_str=template_str,
                             sensor_info=sensor_info,
+                            native_template=native_template,
                         )
                     )
 
@@ -290,6 +307,7 @@ class LambdaTemplateSensor(CoordinatorEntity, SensorEntity):
         unique_id: str | None = None,
         template_str: str = "",
         sensor_info: dict | None = None,
+        native_template: NativeTemplate | None = None,
     ) -> None:
         """Initialize the template sensor."""
         super().__init__(coordinator)
@@ -308,6 +326,16 @@ class LambdaTemplateSensor(CoordinatorEntity, SensorEntity):
         self._unique_id = unique_id
         self._template_str = template_str
         self._template = None  # Will be set in async_added_to_hass
+        # Kompilierte eingebaute Formel (ersetzt Jinja-Rendering, falls vorhanden)
+        self._native_template = native_template
+        # State nur bei Änderung jenseits der Deadband (oder nach Max-Silence) schreiben
+        self._state_gate = create_state_gate(
+            getattr(coordinator, "state_write_gating", None),
+            sensor_id,
+            sensor_info=sensor_info,
+            unit=unit,
+            registry=getattr(coordinator, "state_gates", None),
+        )
         self._state = None
         self._last_warning = None
         self._last_identical_warning = None
@@ -372,12 +400,16 @@ class LambdaTemplateSensor(CoordinatorEntity, SensorEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if self._template is None:
+        if self._template is None and self._native_template is None:
             return
 
         try:
-            # Render the template
-            self._state = self._template.async_render()
+            if self._native_template is not None:
+                # Eingebaute Formel: direkt in Python, ohne Rendering/String-Konvertierung
+                self._state = self._native_template.evaluate(self.hass)
+            else:
+                # Render the template
+                self._state = self._template.async_render()
 
             _LOGGER.debug(
                 "Template sensor %s rendered state: %s (template: %s)",
@@ -393,7 +425,8 @@ class LambdaTemplateSensor(CoordinatorEntity, SensorEntity):
                 or self._state == "unknown"
             ):
                 self._state = None
-                self.async_write_ha_state()
+                if self._state_gate.check(None):
+                    self.async_write_ha_state()
                 return
 
             # Convert to appropriate type and apply precision
@@ -437,7 +470,8 @@ class LambdaTemplateSensor(CoordinatorEntity, SensorEntity):
             )
             self._state = None
 
-        self.async_write_ha_state()
+        if self._state_gate.check(self._state):
+            self.async_write_ha_state()
 
     def _extract_entity_ids_from_template(self, template_str: str) -> list[str]:
         """Extract entity IDs from template string (e.g., states('sensor.xyz'))."""
@@ -457,13 +491,17 @@ class LambdaTemplateSensor(CoordinatorEntity, SensorEntity):
         """When entity is added to hass."""
         await super().async_added_to_hass()
 
-        # Initialize the template now that we have access to hass
-        self._template = Template(self._template_str, self.hass)
+        if self._native_template is not None:
+            # Eingebaute Formel: Input-Entities sind aus der Spec bekannt
+            self._track_entities = list(self._native_template.entity_ids)
+        else:
+            # Initialize the template once now that we have access to hass
+            self._template = Template(self._template_str, self.hass)
 
-        # Extract entity IDs from template for state tracking
-        # template_str ist bereits formatiert (mit {full_entity_prefix} ersetzt)
-        # und enthält z.B. states('sensor.eu08l_hp1_heating_thermal_energy_daily')
-        self._track_entities = self._extract_entity_ids_from_template(self._template_str)
+            # Extract entity IDs from template for state tracking
+            # template_str ist bereits formatiert (mit {full_entity_prefix} ersetzt)
+            # und enthält z.B. states('sensor.eu08l_hp1_heating_thermal_energy_daily')
+            self._track_entities = self._extract_entity_ids_from_template(self._template_str)
         
         # Wenn Entity-IDs gefunden wurden, registriere State-Change-Tracker
         if self._track_entities:
@@ -518,6 +556,64 @@ class LambdaTemplateSensor(CoordinatorEntity, SensorEntity):
         await super().async_will_remove_from_hass()
 
 
+class _HeatingCurveModel:
+    """Stückweise lineare Heizkurve (cold/mid/warm) plus gecachte Number-Parameter."""
+
+    __slots__ = (
+        "y_cold",
+        "y_mid",
+        "y_warm",
+        "x_cold",
+        "x_mid",
+        "x_warm",
+        "flat",
+        "valid",
+        "rt_configured",
+        "rt_active",
+        "rt_offset",
+        "rt_factor",
+        "eco_reduction",
+        "_slope_cold",
+        "_slope_warm",
+    )
+
+    def __init__(self, y_cold, y_mid, y_warm, x_cold, x_mid, x_warm):
+        self.y_cold = y_cold
+        self.y_mid = y_mid
+        self.y_warm = y_warm
+        self.x_cold = x_cold
+        self.x_mid = x_mid
+        self.x_warm = x_warm
+        self.flat = False
+        self.valid = True
+        self.rt_configured = False
+        self.rt_active = False
+        self.rt_offset = None
+        self.rt_factor = None
+        self.eco_reduction = None
+        # Steigungen der beiden Segmente einmalig vorberechnen
+        self._slope_cold = self._slope(x_cold, y_cold, x_mid, y_mid)
+        self._slope_warm = self._slope(x_mid, y_mid, x_warm, y_warm)
+
+    @staticmethod
+    def _slope(x_a, y_a, x_b, y_b) -> float:
+        if x_a is None or x_b is None or y_a is None or y_b is None or x_b == x_a:
+            return 0.0
+        return (y_b - y_a) / (x_b - x_a)
+
+    def evaluate(self, ambient: float) -> float:
+        """Vorlauftemperatur für die Außentemperatur (ohne Anpassungen)."""
+        if self.flat:
+            return self.y_cold
+        if ambient >= self.x_warm:
+            return self.y_warm
+        if ambient > self.x_mid:
+            return self.y_mid + (ambient - self.x_mid) * self._slope_warm
+        if ambient > self.x_cold:
+            return self.y_cold + (ambient - self.x_cold) * self._slope_cold
+        return self.y_cold
+
+
 class LambdaHeatingCurveCalcSensor(CoordinatorEntity, SensorEntity):
     """Berechnet die Heizkurven-Vorlauftemperatur pro HC."""
 
@@ -570,6 +666,9 @@ class LambdaHeatingCurveCalcSensor(CoordinatorEntity, SensorEntity):
         self._last_eco_reduction = 0.0
         self._track_entities = []  # Liste der Entity-IDs, die wir tracken müssen
         self._unsub_state_changes = None  # Unsubscribe-Funktion für State-Changes
+        # Gecachtes Heizkurven-Modell; wird nur bei Änderung einer Number-Entity neu gebaut
+        self._curve_model: _HeatingCurveModel | None = None
+        self._last_written = None  # Zuletzt geschriebener (Wert, Attribute)-Stand
 
         parsed_type, parsed_index = extract_device_info_from_sensor_id(sensor_id)
         self._device_type = (device_type or parsed_type or "").lower()
@@ -587,6 +686,10 @@ class LambdaHeatingCurveCalcSensor(CoordinatorEntity, SensorEntity):
             self._operating_state_entity = f"sensor.{device_prefix}_operating_state"
             self._eco_temp_reduction_entity = f"number.{device_prefix}_eco_temp_reduction"
 
+        # Eingänge des gecachten Modells (Heizkurven-, Raumthermostat- und ECO-Numbers)
+        self._model_entities = set(number_entities.values())
+        self._model_entities.add(self._eco_temp_reduction_entity)
+
         if state_class == "measurement":
             self._attr_state_class = SensorStateClass.MEASUREMENT
         elif state_class == "total":
@@ -656,23 +759,8 @@ class LambdaHeatingCurveCalcSensor(CoordinatorEntity, SensorEntity):
         except (ValueError, TypeError):
             return default
 
-    @staticmethod
-    def _lerp(x: float, x_a: float, y_a: float, x_b: float, y_b: float) -> float:
-        if x_b == x_a:
-            return y_a
-        return y_a + (x - x_a) * (y_b - y_a) / (x_b - x_a)
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self._last_adjustment = 0.0
-        self._last_rt_delta = None
-        self._last_flow_offset = 0.0
-        ambient = self._get_float_state(self._ambient_sensor, None)
-        if ambient is None:
-            self._state = None
-            self.async_write_ha_state()
-            return
-
+    def _build_curve_model(self) -> _HeatingCurveModel:
+        """Liest die (selten geänderten) Number-Entities einmal und baut das Heizkurven-Modell."""
         cold_entity = self._number_entities["heating_curve_cold_outside_temp"]
         mid_entity = self._number_entities["heating_curve_mid_outside_temp"]
         warm_entity = self._number_entities["heating_curve_warm_outside_temp"]
@@ -686,8 +774,16 @@ class LambdaHeatingCurveCalcSensor(CoordinatorEntity, SensorEntity):
             warm_entity,
             self._defaults["heating_curve_warm_outside_temp"],
         )
+        model = _HeatingCurveModel(
+            y_cold,
+            y_mid,
+            y_warm,
+            self._temp_points.get("cold", -22.0),
+            self._temp_points.get("mid", 0.0),
+            self._temp_points.get("warm", 22.0),
+        )
 
-        # Prüfe, ob alle drei Werte gleich sind - dann kann _lerp übersprungen werden
+        # Prüfe, ob alle drei Werte gleich sind - dann ist die Kurve flach (keine Interpolation)
         if (
             y_cold is not None
             and y_mid is not None
@@ -695,6 +791,7 @@ class LambdaHeatingCurveCalcSensor(CoordinatorEntity, SensorEntity):
             and y_cold == y_mid
             and y_mid == y_warm
         ):
+            model.flat = True
             identical_warning_text = f"identical_values_{y_cold}"
             if identical_warning_text != self._last_identical_warning:
                 _LOGGER.warning(
@@ -708,11 +805,7 @@ class LambdaHeatingCurveCalcSensor(CoordinatorEntity, SensorEntity):
                     warm_entity,
                 )
                 self._last_identical_warning = identical_warning_text
-            # Direkt den Wert setzen, _lerp wird übersprungen (spart Rechenzeit)
-            result = y_cold
-            # Weiter mit Anpassungen (Room Thermostat, etc.)
         else:
-            # Normale Berechnung mit _lerp
             warnings: list[str] = []
             if y_cold is not None and y_mid is not None and y_cold <= y_mid:
                 warnings.append(f"Heizkurve: cold ({y_cold}) <= mid ({y_mid})")
@@ -731,95 +824,97 @@ class LambdaHeatingCurveCalcSensor(CoordinatorEntity, SensorEntity):
                         warm_entity,
                     )
                     self._last_warning = warning_text
-                self._state = None
-                self.async_write_ha_state()
-                return
-            self._last_warning = None
-            self._last_identical_warning = None
-
-            x_cold = self._temp_points.get("cold", -22.0)
-            x_mid = self._temp_points.get("mid", 0.0)
-            x_warm = self._temp_points.get("warm", 22.0)
-
-            result: float
-            if ambient >= x_warm:
-                result = y_warm
-            elif ambient > x_mid:
-                result = self._lerp(ambient, x_mid, y_mid, x_warm, y_warm)
-            elif ambient > x_cold:
-                result = self._lerp(ambient, x_cold, y_cold, x_mid, y_mid)
+                model.valid = False
             else:
-                result = y_cold
-
-        # Speichere das rohe Interpolationsergebnis (vor Anpassungen)
-        interpolated_result = result
-
-        adjustment = 0.0
-        rt_delta = None
-        offset_value = None
-        factor_value = None
+                self._last_warning = None
+                self._last_identical_warning = None
 
         if self._room_thermostat_enabled:
             offset_entity = self._number_entities.get("room_thermostat_offset")
             factor_entity = self._number_entities.get("room_thermostat_factor")
 
             if offset_entity and factor_entity:
-                offset_value = self._get_float_state(
+                model.rt_configured = True
+                model.rt_offset = self._get_float_state(
                     offset_entity, self._defaults.get("room_thermostat_offset", 0.0)
                 )
-                factor_value = self._get_float_state(
+                model.rt_factor = self._get_float_state(
                     factor_entity, self._defaults.get("room_thermostat_factor", 1.0)
                 )
 
-                if offset_value is None or factor_value is None:
+                if model.rt_offset is None or model.rt_factor is None:
                     _LOGGER.warning(
                         "%s — Raumthermostat-Werte fehlen (offset=%s, factor=%s), keine Verschiebung angewandt.",
                         self.entity_id,
-                        offset_value,
-                        factor_value,
+                        model.rt_offset,
+                        model.rt_factor,
                     )
-                elif factor_value <= 0:
+                elif model.rt_factor <= 0:
                     _LOGGER.warning(
                         "%s — Raumthermostat-Faktor unplausibel (%.2f), keine Verschiebung angewandt.",
                         self.entity_id,
-                        factor_value,
+                        model.rt_factor,
                     )
                 else:
-                    data = self.coordinator.data or {}
-                    idx = self._device_index
-                    current_temp = (
-                        data.get(f"hc{idx}_room_device_temperature") if idx else None
-                    )
-                    target_temp = (
-                        data.get(f"hc{idx}_target_room_temperature") if idx else None
-                    )
+                    model.rt_active = True
 
-                    if current_temp is None or target_temp is None:
-                        _LOGGER.debug(
-                            "%s — Raumthermostatwerte fehlen im Coordinator (current=%s, target=%s)",
-                            self.entity_id,
-                            current_temp,
-                            target_temp,
-                        )
-                    else:
-                        try:
-                            rt_delta = float(target_temp) - float(current_temp)
-                            adjustment = (rt_delta - float(offset_value)) * float(
-                                factor_value
-                            )
-                            result += adjustment
-                        except (TypeError, ValueError):
-                            _LOGGER.warning(
-                                "%s — Raumthermostatberechnung fehlgeschlagen (delta=%s, offset=%s, factor=%s)",
-                                self.entity_id,
-                                rt_delta,
-                                offset_value,
-                                factor_value,
-                            )
+        # Default aus HC_ECO_TEMP_REDUCTION_NUMBER_CONFIG
+        model.eco_reduction = self._get_float_state(self._eco_temp_reduction_entity, -1.0)
+        return model
 
-        flow_line_offset = 0.0
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        ambient = self._get_float_state(self._ambient_sensor, None)
+        if ambient is None:
+            self._write_state_if_changed(None, 0.0, None, 0.0, self._last_eco_reduction)
+            return
+
+        model = self._curve_model
+        if model is None:
+            model = self._curve_model = self._build_curve_model()
+        if not model.valid:
+            self._write_state_if_changed(None, 0.0, None, 0.0, self._last_eco_reduction)
+            return
+
+        # Speichere das rohe Interpolationsergebnis (vor Anpassungen)
+        interpolated_result = model.evaluate(ambient)
+        result = interpolated_result
+
+        adjustment = 0.0
+        rt_delta = None
         data = self.coordinator.data or {}
         idx = self._device_index
+
+        if model.rt_active:
+            current_temp = (
+                data.get(f"hc{idx}_room_device_temperature") if idx else None
+            )
+            target_temp = (
+                data.get(f"hc{idx}_target_room_temperature") if idx else None
+            )
+
+            if current_temp is None or target_temp is None:
+                _LOGGER.debug(
+                    "%s — Raumthermostatwerte fehlen im Coordinator (current=%s, target=%s)",
+                    self.entity_id,
+                    current_temp,
+                    target_temp,
+                )
+            else:
+                try:
+                    rt_delta = float(target_temp) - float(current_temp)
+                    adjustment = (rt_delta - model.rt_offset) * model.rt_factor
+                    result += adjustment
+                except (TypeError, ValueError):
+                    _LOGGER.warning(
+                        "%s — Raumthermostatberechnung fehlgeschlagen (delta=%s, offset=%s, factor=%s)",
+                        self.entity_id,
+                        rt_delta,
+                        model.rt_offset,
+                        model.rt_factor,
+                    )
+
+        flow_line_offset = 0.0
         if idx is not None:
             offset_key = f"hc{idx}_set_flow_line_offset_temperature"
             raw_offset = data.get(offset_key)
@@ -838,12 +933,11 @@ class LambdaHeatingCurveCalcSensor(CoordinatorEntity, SensorEntity):
         # ECO-Temperatur-Reduktion: Wenn operating_state = ECO (1), dann eco_temp_reduction addieren
         eco_temp_reduction = 0.0
         operating_state = None
-        
+
         # Versuche operating_state aus Coordinator zu lesen
         if idx is not None:
-            operating_state_key = f"hc{idx}_operating_state"
-            operating_state = data.get(operating_state_key)
-        
+            operating_state = data.get(f"hc{idx}_operating_state")
+
         # Fallback: Versuche als Entity zu lesen
         if operating_state is None:
             state_obj = self.hass.states.get(self._operating_state_entity)
@@ -852,53 +946,60 @@ class LambdaHeatingCurveCalcSensor(CoordinatorEntity, SensorEntity):
                     operating_state = int(float(state_obj.state))
                 except (ValueError, TypeError):
                     pass
-        
+
         # Prüfe ob operating_state = ECO (1)
-        if operating_state == 1:  # ECO
-            # Lese eco_temp_reduction Wert
-            eco_value = self._get_float_state(
-                self._eco_temp_reduction_entity,
-                -1.0  # Default aus HC_ECO_TEMP_REDUCTION_NUMBER_CONFIG
-            )
-            if eco_value is not None:
-                eco_temp_reduction = float(eco_value)
-                result += eco_temp_reduction
-                _LOGGER.debug(
-                    "%s — ECO-Modus aktiv (operating_state=1), eco_temp_reduction=%.1f°C wird addiert",
-                    self.entity_id,
-                    eco_temp_reduction,
-                )
+        if operating_state == 1 and model.eco_reduction is not None:  # ECO
+            eco_temp_reduction = float(model.eco_reduction)
+            result += eco_temp_reduction
 
         if self._precision is not None:
             result = round(result, int(self._precision))
 
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            def _fmt(value: float | None) -> str:
+                return f"{value:.2f}" if value is not None else "n/a"
+
+            _LOGGER.debug(
+                "Heizkurven-Wert %s: ambient=%.2f°C, y_cold=%s°C, y_mid=%s°C, y_warm=%s°C, interpolated=%.2f°C, flow_offset=%.2f°C, rt_enabled=%s, delta=%s, offset=%s, factor=%s, adjustment=%.2f°C, eco_reduction=%.2f°C (op_state=%s) -> %.2f°C",
+                self.entity_id,
+                ambient,
+                _fmt(model.y_cold),
+                _fmt(model.y_mid),
+                _fmt(model.y_warm),
+                interpolated_result,
+                flow_line_offset,
+                self._room_thermostat_enabled,
+                _fmt(rt_delta),
+                _fmt(model.rt_offset),
+                _fmt(model.rt_factor),
+                adjustment,
+                eco_temp_reduction,
+                operating_state,
+                result,
+            )
+
+        self._write_state_if_changed(
+            result, adjustment, rt_delta, flow_line_offset, eco_temp_reduction
+        )
+
+    def _write_state_if_changed(
+        self,
+        result: float | None,
+        adjustment: float,
+        rt_delta: float | None,
+        flow_line_offset: float,
+        eco_temp_reduction: float,
+    ) -> None:
+        """State (inkl. Attribute) nur schreiben, wenn sich etwas geändert hat."""
+        snapshot = (result, adjustment, rt_delta, flow_line_offset, eco_temp_reduction)
+        if snapshot == self._last_written:
+            return
         self._state = result
         self._last_adjustment = adjustment
         self._last_rt_delta = rt_delta
         self._last_flow_offset = flow_line_offset
         self._last_eco_reduction = eco_temp_reduction
-        def _fmt(value: float | None) -> str:
-            return f"{value:.2f}" if value is not None else "n/a"
-
-        _LOGGER.debug(
-            "Heizkurven-Wert %s: ambient=%.2f°C, y_cold=%s°C, y_mid=%s°C, y_warm=%s°C, interpolated=%.2f°C, flow_offset=%.2f°C, rt_enabled=%s, delta=%s, offset=%s, factor=%s, adjustment=%.2f°C, eco_reduction=%.2f°C (op_state=%s) -> %.2f°C",
-            self.entity_id,
-            ambient,
-            _fmt(y_cold),
-            _fmt(y_mid),
-            _fmt(y_warm),
-            interpolated_result,
-            flow_line_offset,
-            self._room_thermostat_enabled,
-            _fmt(rt_delta),
-            _fmt(offset_value),
-            _fmt(factor_value),
-            adjustment,
-            eco_temp_reduction,
-            operating_state,
-            result,
-        )
-
+        self._last_written = snapshot
         self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
@@ -933,6 +1034,9 @@ class LambdaHeatingCurveCalcSensor(CoordinatorEntity, SensorEntity):
                 
                 # Nur aktualisieren, wenn sich der State wirklich geändert hat
                 if old_state is None or old_state.state != new_state.state:
+                    if entity_id in self._model_entities:
+                        # Heizkurven-Parameter geändert: Modell beim nächsten Update neu bauen
+                        self._curve_model = None
                     _LOGGER.debug(
                         "Tracked entity %s changed from %s to %s, updating heating curve sensor %s",
                         entity_id,
@@ -16,6 +16,7 @@ from homeassistant.const import STATE_UNKNOWN
 from homeassistant.helpers.entity_component import async_update_entity
 from homeassistant.helpers.translation import async_get_translations
 
+from .config_service import async_get_config_service
 from .const import (
     BASE_ADDRESSES,
     CALCULATED_SENSOR_TEMPLATES,
@@ -111,10 +112,37 @@ def get_firmware_version_int(entry):
     return FIRMWARE_VERSION.get(DEFAULT_FIRMWARE, 1)
 
 
+# Geteilte device_info-Dicts pro (Entry, Gerätetyp, Index); Name/Host/Firmware sind Teil
+# des Keys, damit Änderungen am Entry (Options-Flow) neue Objekte erzeugen.
+# Die Dicts werden von allen Entities eines Geräts geteilt und dürfen nicht verändert werden.
+_DEVICE_INFO_CACHE: dict[tuple, dict] = {}
+
+
+def _device_info_key(entry, device_type_lc, device_index) -> tuple:
+    domain = entry.domain if hasattr(entry, "domain") else "lambda_heat_pumps"
+    return (
+        domain,
+        entry.entry_id,
+        get_firmware_version(entry),
+        entry.data.get("host"),
+        entry.data.get("name", "Lambda WP"),
+        device_type_lc,
+        device_index,
+    )
+
+
 def build_device_info(entry):
     """
     Build device_info dict for Home Assistant device registry.
     """
+    key = _device_info_key(entry, None, None)
+    info = _DEVICE_INFO_CACHE.get(key)
+    if info is None:
+        info = _DEVICE_INFO_CACHE[key] = _build_device_info(entry)
+    return info
+
+
+def _build_device_info(entry):
     DOMAIN = entry.domain if hasattr(entry, "domain") else "lambda_heat_pumps"
     entry_id = entry.entry_id
     fw_version = get_firmware_version(entry)
@@ -140,6 +168,14 @@ def build_subdevice_info(entry, device_type: str, device_index: int):
     if not device_type or not device_index:
         return build_device_info(entry)
 
+    key = _device_info_key(entry, device_type.lower(), device_index)
+    info = _DEVICE_INFO_CACHE.get(key)
+    if info is None:
+        info = _DEVICE_INFO_CACHE[key] = _build_subdevice_info(entry, device_type, device_index)
+    return info
+
+
+def _build_subdevice_info(entry, device_type: str, device_index: int):
     DOMAIN = entry.domain if hasattr(entry, "domain") else "lambda_heat_pumps"
     entry_id = entry.entry_id
     fw_version = get_firmware_version(entry)
@@ -343,175 +379,26 @@ async def ensure_lambda_config(hass: HomeAssistant) -> bool:
 
 
 async def load_lambda_config(hass: HomeAssistant) -> dict:
-    """Load complete Lambda configuration from lambda_wp_config.yaml."""
-    # Check if config is already cached in hass.data
-    if "_lambda_config_cache" in hass.data:
-        _LOGGER.debug("Using cached Lambda config")
-        return hass.data["_lambda_config_cache"]
-    
-    # First, ensure config file exists
-    await ensure_lambda_config(hass)
-    
-    # Then, try to migrate if needed (only once per session)
-    if "_lambda_migration_done" not in hass.data:
-        await migrate_lambda_config_sections(hass)
-        hass.data["_lambda_migration_done"] = True
-
-    config_dir = hass.config.config_dir
-    lambda_config_path = os.path.join(config_dir, "lambda_wp_config.yaml")
-
-    default_config = {
-        "disabled_registers": set(),
-        "sensors_names_override": {},
-        "cycling_offsets": {},
-        "energy_consumption_sensors": {},
-        "energy_consumption_offsets": {},
-        "modbus": {},
-    }
-
-    if not os.path.exists(lambda_config_path):
-        _LOGGER.warning("lambda_wp_config.yaml not found, using default configuration")
-        return default_config
-
-    try:
-        content = await hass.async_add_executor_job(
-            lambda: open(lambda_config_path, "r").read()
-        )
-        config = yaml.safe_load(content)
-
-        if not config:
-            _LOGGER.warning(
-                "lambda_wp_config.yaml is empty, using default configuration"
-            )
-            return default_config
-
-        # Load disabled registers
-        disabled_registers = set()
-        if "disabled_registers" in config:
-            try:
-                disabled_registers = set(int(x) for x in config["disabled_registers"])
-            except (ValueError, TypeError) as e:
-                _LOGGER.error("Invalid disabled_registers format: %s", e)
-                disabled_registers = set()
-
-        # Load sensor overrides
-        sensors_names_override = {}
-        if "sensors_names_override" in config:
-            try:
-                for override in config["sensors_names_override"]:
-                    if "id" in override and "override_name" in override:
-                        sensors_names_override[override["id"]] = override[
-                            "override_name"
-                        ]
-            except (TypeError, KeyError) as e:
-                _LOGGER.error("Invalid sensors_names_override format: %s", e)
-                sensors_names_override = {}
-
-        # Load cycling offsets
-        cycling_offsets = {}
-        if "cycling_offsets" in config:
-            try:
-                cycling_offsets = config["cycling_offsets"]
-                # Validate cycling offsets structure
-                for device, offsets in cycling_offsets.items():
-                    if not isinstance(offsets, dict):
-                        _LOGGER.warning(
-                            "Invalid cycling_offsets format for device %s", device
-                        )
-                        continue
-                    for offset_type, value in offsets.items():
-                        if not isinstance(value, (int, float)):
-                            _LOGGER.warning(
-                                "Invalid cycling offset value for %s.%s: %s",
-                                device,
-                                offset_type,
-                                value,
-                            )
-                            cycling_offsets[device][offset_type] = 0
-            except (TypeError, KeyError) as e:
-                _LOGGER.error("Invalid cycling_offsets format: %s", e)
-                cycling_offsets = {}
-
-        # Load energy consumption offsets
-        energy_consumption_offsets = {}
-        if "energy_consumption_offsets" in config:
-            try:
-                energy_consumption_offsets = config["energy_consumption_offsets"]
-                # Validate energy consumption offsets structure
-                for device, offsets in energy_consumption_offsets.items():
-                    if not isinstance(offsets, dict):
-                        _LOGGER.warning(
-                            "Invalid energy_consumption_offsets format for device %s", device
-                        )
-                        continue
-                    for offset_type, value in offsets.items():
-                        if not isinstance(value, (int, float)):
-                            _LOGGER.warning(
-                                "Invalid energy consumption offset value for %s.%s: %s",
-                                device,
-                                offset_type,
-                                value,
-                            )
-                            energy_consumption_offsets[device][offset_type] = 0.0
-            except (TypeError, KeyError) as e:
-                _LOGGER.error("Invalid energy_consumption_offsets format: %s", e)
-                energy_consumption_offsets = {}
-
-        # Warn when only one of electrical/thermal offset is specified for a mode.
-        # Modes with both sensor types: heating, hot_water, cooling, defrost (not stby).
-        _THERMAL_MODES = ("heating", "hot_water", "cooling", "defrost")
-        for device, offsets in energy_consumption_offsets.items():
-            if not isinstance(offsets, dict):
-                continue
-            for mode in _THERMAL_MODES:
-                elec_key = f"{mode}_energy_total"
-                therm_key = f"{mode}_thermal_energy_total"
-                elec_val = float(offsets.get(elec_key, 0.0))
-                therm_val = float(offsets.get(therm_key, 0.0))
-                if elec_val != 0.0 and therm_val == 0.0:
-                    _LOGGER.warning(
-                        "energy_consumption_offsets [%s]: %s is set (%.4f) but %s is 0 or missing — "
-                        "thermal energy sensor will not receive an offset. "
-                        "Add %s: <value> if a thermal offset is intended.",
-                        device, elec_key, elec_val, therm_key, therm_key,
-                    )
-                elif therm_val != 0.0 and elec_val == 0.0:
-                    _LOGGER.warning(
-                        "energy_consumption_offsets [%s]: %s is set (%.4f) but %s is 0 or missing — "
-                        "electrical energy sensor will not receive an offset. "
-                        "Add %s: <value> if an electrical offset is intended.",
-                        device, therm_key, therm_val, elec_key, elec_key,
-                    )
-
-        _LOGGER.debug(
-            "Loaded Lambda config: %d disabled registers, %d sensor "
-            "overrides, %d cycling device offsets, %d energy consumption device offsets",
-            len(disabled_registers),
-            len(sensors_names_override),
-            len(cycling_offsets),
-            len(energy_consumption_offsets),
-        )
-
-        config_result = {
-            "disabled_registers": disabled_registers,
-            "sensors_names_override": sensors_names_override,
-            "cycling_offsets": cycling_offsets,
-            "energy_consumption_sensors": config.get("energy_consumption_sensors", {}),
-            "energy_consumption_offsets": energy_consumption_offsets,
-            "modbus": config.get("modbus", {}),  # Include modbus configuration
-        }
-        
-        # Cache the config in hass.data to avoid repeated loading
-        hass.data["_lambda_config_cache"] = config_result
-        
-        return config_result
-
-    except Exception as e:
-        _LOGGER.error(
-            "Error loading configuration from lambda_wp_config.yaml: %s",
-            str(e),
-        )
-        return default_config
+    """Load complete Lambda configuration from lambda_wp_config.yaml.
+
+    Geteilt über den zentralen Config-Service (einmal im Executor geparst,
+    Hot-Reload über die mtime, siehe config_service.py).
+    """
+    service = async_get_config_service(hass)
+    if not service.loaded:
+        # First, ensure config file exists
+        await ensure_lambda_config(hass)
+
+        # Then, try to migrate if needed (only once per session)
+        if "_lambda_migration_done" not in hass.data:
+            await migrate_lambda_config_sections(hass)
+            # Geprüften Stand merken: beim nächsten Start überspringt
+            # async_setup_entry Anlage und Migration der Datei (Fingerprint)
+            from .migration import async_save_migration_fingerprint
+            await async_save_migration_fingerprint(hass)
+            hass.data["_lambda_migration_done"] = True
+
+    return await service.async_get()
 
 
 # Keep the old function for backward compatibility
@@ -0,0 +1,140 @@
+"""Ereignisgesteuerte Register-Writes (Raumtemperatur, PV-Überschuss).
+
+Früher wurden Raumtemperatur (``5004 + (hc-1)*100``) und PV-Überschuss
+(Register 102) alle ``DEFAULT_WRITE_INTERVAL`` Sekunden geschrieben, auch wenn
+sich der Quellwert nicht geändert hatte. ``RegisterWriteTarget`` hält pro
+Register den zuletzt geschriebenen und den aktuell gewünschten Rohwert und
+entscheidet, wann ein Write fällig ist:
+
+- der Wert hat sich um mindestens ``threshold`` (Rohwert-Einheiten) vom
+  zuletzt geschriebenen Wert entfernt und ``min_interval`` ist abgelaufen, oder
+  (bei ``signed``-Zielen wird das INT16-Zweierkomplement vorher dekodiert)
+- seit dem letzten Write sind ``keepalive`` Sekunden vergangen (die Lambda
+  verwirft externe Vorgaben ohne regelmäßige Auffrischung).
+
+``collect_due`` liefert alle zum selben Zeitpunkt fälligen Writes, damit sie in
+einem Durchlauf geschrieben werden; ``next_deadline`` den Zeitpunkt des
+nächsten Durchlaufs.
+"""
+
+from __future__ import annotations
+
+from .const import (
+    EXTERNAL_WRITE_KEEPALIVE,
+    EXTERNAL_WRITE_MIN_INTERVAL,
+)
+
+# Registeradressen der externen Vorgaben
+ROOM_TEMPERATURE_BASE_ADDRESS = 5004  # + (hc - 1) * 100
+PV_SURPLUS_ADDRESS = 102
+
+
+def room_temperature_address(hc_idx: int) -> int:
+    """Registeradresse der Raumtemperatur-Vorgabe für Heizkreis ``hc_idx`` (5004, 5104, …)."""
+    return ROOM_TEMPERATURE_BASE_ADDRESS + (hc_idx - 1) * 100
+
+
+def room_temperature_raw(state: str) -> int:
+    """Rohwert (0.1 °C) aus dem State der Raumtemperatur-Entity."""
+    return int(float(state) * 10)
+
+
+def pv_surplus_raw(state: str, unit: str | None, mode: str) -> int:
+    """Rohwert (W) für Register 102: UINT16 (``pos``) oder INT16-Zweierkomplement (``neg``)."""
+    power_value = float(state)
+    if unit == "kW":
+        power_value *= 1000  # in W
+    if mode == "neg":
+        from .utils import clamp_to_int16
+
+        return clamp_to_int16(power_value, context="PV surplus") & 0xFFFF
+    return max(0, int(power_value))
+
+
+class RegisterWriteTarget:
+    """Ein extern vorgegebenes Register mit Schwelle, Mindestabstand und Keep-Alive."""
+
+    __slots__ = (
+        "name",
+        "address",
+        "source_entity_id",
+        "threshold",
+        "min_interval",
+        "keepalive",
+        "signed",
+        "value",
+        "_written",
+        "_last_write",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        address: int,
+        source_entity_id: str,
+        threshold: int = 1,
+        min_interval: float = EXTERNAL_WRITE_MIN_INTERVAL,
+        keepalive: float = EXTERNAL_WRITE_KEEPALIVE,
+        signed: bool = False,
+    ):
+        self.name = name
+        self.address = address
+        self.source_entity_id = source_entity_id
+        self.threshold = threshold
+        self.min_interval = float(min_interval)
+        self.keepalive = float(keepalive)
+        self.signed = signed  # Rohwerte sind INT16-Zweierkomplement (PV-Modus ``neg``)
+        self.value: int | None = None  # aktueller Soll-Rohwert (None = Quelle nicht verfügbar)
+        self._written: int | None = None
+        self._last_write: float | None = None
+
+    def offer(self, value: int | None) -> None:
+        """Neuen Quellwert übernehmen (None: Quelle nicht verfügbar, es wird nichts geschrieben)."""
+        self.value = value
+
+    def _decoded(self, raw: int) -> int:
+        """Rohwert als Zahl für den Schwellenvergleich (``signed``: 0xFFFF → -1)."""
+        if self.signed and raw >= 0x8000:
+            return raw - 0x10000
+        return raw
+
+    def _changed(self) -> bool:
+        if self._written is None:
+            return True
+        return abs(self._decoded(self.value) - self._decoded(self._written)) >= max(self.threshold, 1)
+
+    def due_at(self) -> float | None:
+        """Frühester Zeitpunkt (monotonic) für den nächsten Write oder None."""
+        if self.value is None:
+            return None
+        if self._last_write is None:
+            return 0.0
+        if self._changed():
+            return self._last_write + self.min_interval
+        return self._last_write + self.keepalive
+
+    def is_due(self, now: float) -> bool:
+        at = self.due_at()
+        return at is not None and at <= now
+
+    def mark_written(self, value: int, now: float) -> None:
+        self._written = value
+        self._last_write = now
+
+    def mark_failed(self, now: float) -> None:
+        """Fehlgeschlagener Write: nach ``min_interval`` erneut versuchen."""
+        self._written = None
+        self._last_write = now
+
+
+def collect_due(targets, now: float) -> list[tuple[RegisterWriteTarget, int]]:
+    """Alle bei ``now`` fälligen Writes ``(target, value)``, nach Adresse sortiert."""
+    due = [(target, target.value) for target in targets if target.is_due(now)]
+    due.sort(key=lambda item: item[0].address)
+    return due
+
+
+def next_deadline(targets) -> float | None:
+    """Frühester Fälligkeitszeitpunkt aller Ziele (None, wenn keins einen Wert hat)."""
+    deadlines = [at for at in (target.due_at() for target in targets) if at is not None]
+    return min(deadlines) if deadlines else None
@@ -0,0 +1,128 @@
+"""Tests für den zentralen Config-Service (lambda_wp_config.yaml)."""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.lambda_heat_pumps.config_service import (
+    LambdaConfigService,
+    default_config,
+    parse_lambda_config,
+    read_config_file,
+    resolve_int32_register_order,
+)
+
+CONFIG_V1 = """
+disabled_registers:
+  - 1004
+  - "1005"
+sensors_names_override:
+  - id: hp1_state
+    override_name: wp_state
+cycling_offsets:
+  hp1:
+    heating_cycling_total: 5
+    hot_water_cycling_total: "bad"
+modbus:
+  int32_register_order: little
+"""
+
+CONFIG_V2 = """
+disabled_registers:
+  - 2000
+modbus:
+  int32_register_order: high_first
+"""
+
+
+def test_parse_validates_into_typed_result():
+    import yaml
+
+    config = parse_lambda_config(yaml.safe_load(CONFIG_V1))
+    assert config["disabled_registers"] == {1004, 1005}
+    assert config["sensors_names_override"] == {"hp1_state": "wp_state"}
+    assert config["cycling_offsets"]["hp1"] == {"heating_cycling_total": 5, "hot_water_cycling_total": 0}
+    assert config["int32_register_order"] == "low_first"
+    assert config["energy_consumption_sensors"] == {}
+
+
+@pytest.mark.parametrize(
+    "modbus, expected",
+    [
+        ({}, "high_first"),
+        ({"int32_register_order": "low_first"}, "low_first"),
+        ({"int32_byte_order": "big"}, "high_first"),
+        ({"int32_register_order": "sideways"}, "high_first"),
+    ],
+)
+def test_resolve_int32_register_order(modbus, expected):
+    assert resolve_int32_register_order(modbus) == expected
+
+
+def test_parse_empty_or_invalid_root_returns_default():
+    assert parse_lambda_config(None) == default_config()
+    assert parse_lambda_config(["not", "a", "mapping"]) == default_config()
+
+
+def test_read_missing_file_returns_default(tmp_path):
+    mtime, config = read_config_file(str(tmp_path / "missing.yaml"))
+    assert mtime is None
+    assert config == default_config()
+
+
+def _service(tmp_path):
+    hass = MagicMock()
+
+    async def run_sync(fn, *args):
+        return fn(*args)
+
+    hass.async_add_executor_job = run_sync
+    path = tmp_path / "lambda_wp_config.yaml"
+    path.write_text(CONFIG_V1, encoding="utf-8")
+    return LambdaConfigService(hass, str(path)), path
+
+
+def _bump_mtime(path):
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+
+@pytest.mark.asyncio
+async def test_service_parses_once_and_hot_reloads_on_mtime(tmp_path):
+    service, path = _service(tmp_path)
+    listener = MagicMock()
+    with patch(
+        "custom_components.lambda_heat_pumps.config_service.async_track_time_interval",
+        return_value=MagicMock(),
+    ) as track:
+        remove = service.async_add_listener(listener)
+    track.assert_called_once()
+
+    first = await service.async_get()
+    assert await service.async_get() is first
+    assert not await service.async_check_for_changes()
+    listener.assert_not_called()
+
+    path.write_text(CONFIG_V2, encoding="utf-8")
+    _bump_mtime(path)
+    assert await service.async_check_for_changes()
+    config = await service.async_get()
+    assert config["disabled_registers"] == {2000}
+    listener.assert_called_once_with(config)
+
+    remove()
+    track.return_value.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_service_keeps_last_valid_config_on_yaml_error(tmp_path):
+    service, path = _service(tmp_path)
+    valid = await service.async_get()
+
+    path.write_text("disabled_registers: [1004\n", encoding="utf-8")
+    _bump_mtime(path)
+    assert not await service.async_check_for_changes()
+    assert await service.async_get() is valid
+    # Die fehlerhafte Version wird nicht in jedem Intervall erneut gemeldet
+    assert not await service.async_check_for_changes()
@@ -0,0 +1,102 @@
+"""Tests für den geteilten Modbus-Verbindungs-Pool (mehrere Unit-IDs pro Gateway)."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.lambda_heat_pumps.connection_pool import (
+    ModbusConnectionPool,
+    get_connection_pool,
+)
+
+
+def _factory(connect_result=True):
+    clients = []
+
+    def create(host, port):
+        client = MagicMock()
+        client.connected = False
+
+        async def connect():
+            await asyncio.sleep(0)
+            client.connected = connect_result
+            return connect_result
+
+        client.connect = AsyncMock(side_effect=connect)
+        clients.append(client)
+        return client
+
+    return create, clients
+
+
+@pytest.mark.asyncio
+async def test_entries_on_same_gateway_share_one_transport():
+    factory, clients = _factory()
+    pool = ModbusConnectionPool(factory)
+    unit1, unit2, other = object(), object(), object()
+
+    first, second = await asyncio.gather(
+        pool.async_acquire("10.0.0.5", 502, unit1),
+        pool.async_acquire("10.0.0.5", 502, unit2),
+    )
+    third = await pool.async_acquire("10.0.0.6", 502, other)
+
+    assert first is second
+    assert third is not first
+    assert len(clients) == 2
+    clients[0].connect.assert_awaited_once()
+    assert pool.users("10.0.0.5", 502) == 2
+    assert pool.stats()["10.0.0.5:502"] == {"users": 2, "connected": True, "connects": 1}
+
+
+@pytest.mark.asyncio
+async def test_last_release_closes_connection():
+    factory, clients = _factory()
+    pool = ModbusConnectionPool(factory)
+    unit1, unit2 = object(), object()
+    await pool.async_acquire("10.0.0.5", 502, unit1)
+    await pool.async_acquire("10.0.0.5", 502, unit2)
+
+    pool.release("10.0.0.5", 502, unit1)
+    pool.release("10.0.0.5", 502, unit1)  # doppelte Freigabe zählt nicht
+    clients[0].close.assert_not_called()
+    assert pool.users("10.0.0.5", 502) == 1
+
+    pool.release("10.0.0.5", 502, unit2)
+    clients[0].close.assert_called_once()
+    assert pool.stats() == {}
+
+    # Nächster Nutzer baut eine neue Verbindung auf
+    await pool.async_acquire("10.0.0.5", 502, unit1)
+    assert len(clients) == 2
+
+
+@pytest.mark.asyncio
+async def test_reconnects_lost_shared_connection():
+    factory, clients = _factory()
+    pool = ModbusConnectionPool(factory)
+    unit1, unit2 = object(), object()
+    client = await pool.async_acquire("10.0.0.5", 502, unit1)
+    client.connected = False
+
+    assert await pool.async_acquire("10.0.0.5", 502, unit2) is client
+    assert client.connect.await_count == 2
+    assert len(clients) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_connect_raises_and_drops_unused_client():
+    factory, clients = _factory(connect_result=False)
+    pool = ModbusConnectionPool(factory)
+
+    with pytest.raises(ConnectionError):
+        await pool.async_acquire("10.0.0.5", 502, object())
+    clients[0].close.assert_called_once()
+    assert pool.stats() == {}
+
+
+def test_pool_is_shared_per_hass():
+    hass = SimpleNamespace(data={})
+    assert get_connection_pool(hass) is get_connection_pool(hass)
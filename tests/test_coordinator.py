@@ -1,14 +1,12 @@
 """Test the coordinator module."""
 
+import asyncio
 import os
 from datetime import timedelta
 from types import SimpleNamespace
-from io import StringIO
-from contextlib import asynccontextmanager
-from unittest.mock import AsyncMock, MagicMock, Mock, patch, mock_open
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
-import yaml
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
@@ -20,6 +18,10 @@ from custom_components.lambda_heat_pumps.const import (
     SENSOR_TYPES,
 )
 from custom_components.lambda_heat_pumps.coordinator import LambdaDataUpdateCoordinator
+from custom_components.lambda_heat_pumps.persist_store import PersistJournalStore
+from custom_components.lambda_heat_pumps.profiling import CycleProfiler
+from custom_components.lambda_heat_pumps.sensor import LambdaSensor
+from custom_components.lambda_heat_pumps.state_gate import create_state_gate
 from tests.conftest import DummyLoop
 
 
@@ -240,6 +242,49 @@ async def test_async_update_data_success(mock_hass, mock_entry):
     mock_client.read_holding_registers.assert_called()
 
 
+@pytest.mark.asyncio
+async def test_overlapping_full_updates_share_one_cycle(mock_hass, mock_entry):
+    """Ein zweiter Refresh während des Startup-Fills startet keinen parallelen Zyklus."""
+    coordinator = LambdaDataUpdateCoordinator(mock_hass, mock_entry)
+    running = 0
+    max_running = 0
+    release = asyncio.Event()
+
+    async def fake_cycle():
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await release.wait()
+        running -= 1
+        return {"value": 1}
+
+    with patch.object(coordinator, "_async_run_full_update", side_effect=fake_cycle) as cycle:
+        first = asyncio.ensure_future(coordinator._async_update_data())
+        second = asyncio.ensure_future(coordinator._async_update_data())
+        await asyncio.sleep(0)
+        release.set()
+        assert await first == await second == {"value": 1}
+
+    assert cycle.call_count == 1
+    assert max_running == 1
+
+
+@pytest.mark.asyncio
+async def test_wait_startup_complete_returns_after_fill(mock_hass, mock_entry):
+    """Services warten auf den Startup-Fill statt selbst zu refreshen."""
+    coordinator = LambdaDataUpdateCoordinator(mock_hass, mock_entry)
+    coordinator.async_refresh = AsyncMock()
+    coordinator.async_update_listeners = Mock()
+
+    waiter = asyncio.ensure_future(coordinator.async_wait_startup_complete())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await coordinator._async_startup_fill()
+    await asyncio.wait_for(waiter, timeout=1)
+    coordinator.async_refresh.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_async_update_data_no_client(mock_hass, mock_entry):
     """Test data update when no client is available (Coordinator liefert weiterhin Data-Dict)."""
@@ -267,6 +312,49 @@ async def test_async_update_data_disabled_register(mock_hass, mock_entry):
     coordinator.disabled_registers = {1000}  # Disable register 1000
 
 
+@pytest.mark.asyncio
+async def test_read_critical_registers_only_requests_critical_sensors(mock_hass, mock_entry):
+    """Gestufter Erststart: nur Betriebszustände und Klima-Temperaturen werden angefordert."""
+    coordinator = LambdaDataUpdateCoordinator(mock_hass, mock_entry)
+    coordinator.is_address_enabled_by_entity = Mock(return_value=True)
+    coordinator._read_all_registers_globally = AsyncMock(return_value={"hp1_operating_state": 1})
+
+    with patch(
+        "custom_components.lambda_heat_pumps.coordinator.wait_for_stable_connection",
+        new=AsyncMock(),
+    ):
+        result = await coordinator._read_critical_registers()
+
+    assert result == {"hp1_operating_state": 1}
+    requested = {
+        sensor_id
+        for request in coordinator._global_register_requests.values()
+        for sensor_id in request["sensor_ids"]
+    }
+    assert "hp1_operating_state" in requested
+    assert "boil1_actual_high_temperature" in requested
+    assert "hc1_target_room_temperature" in requested
+    assert "hp1_flow_line_temperature" not in requested
+
+
+def test_publish_partial_merges_until_startup_complete(mock_hass, mock_entry):
+    """Teil-Daten werden gemergt und publiziert, nach dem ersten vollen Update nicht mehr."""
+    coordinator = LambdaDataUpdateCoordinator(mock_hass, mock_entry)
+    coordinator.async_update_listeners = Mock()
+    coordinator.data = None
+
+    coordinator._publish_partial({"hp1_operating_state": 1})
+    coordinator._publish_partial({"boil1_actual_high_temperature": 48.5})
+    coordinator._publish_partial({})
+
+    assert coordinator.data == {"hp1_operating_state": 1, "boil1_actual_high_temperature": 48.5}
+    assert coordinator.async_update_listeners.call_count == 2
+
+    coordinator.startup_complete = True
+    coordinator._publish_partial({"hc1_room_device_temperature": 21.0})
+    assert "hc1_room_device_temperature" not in coordinator.data
+
+
 @pytest.mark.asyncio
 async def test_dynamic_batch_read_failure_handling(mock_hass, mock_entry):
     """Test dynamic batch read failure handling."""
@@ -421,34 +509,25 @@ async def test_connect_failure(mock_hass, mock_entry):
 
 @pytest.mark.asyncio
 async def test_load_sensor_overrides_success(mock_hass, mock_entry):
-    """Test successful sensor overrides loading."""
-    config_data = {
-        "sensors_names_override": [{"id": "test_sensor", "override_name": "new_name"}]
-    }
-
-    async def run_sync(fn):
-        """Führt synchrone Funktion aus (Ersatz für async_add_executor_job)."""
-        return fn()
-
-    mock_hass.async_add_executor_job = run_sync
+    """Overrides kommen aus der zentral geparsten Config (kein eigenes Parsen)."""
+    config = {"sensors_names_override": {"test_sensor": "new_name"}}
 
     with patch(
-        "custom_components.lambda_heat_pumps.coordinator.os.path.exists",
-        return_value=True,
+        "custom_components.lambda_heat_pumps.utils.load_lambda_config",
+        new=AsyncMock(return_value=config),
     ):
-        with patch("builtins.open", mock_open(read_data=yaml.dump(config_data))):
-            coordinator = LambdaDataUpdateCoordinator(mock_hass, mock_entry)
-            result = await coordinator._load_sensor_overrides()
+        coordinator = LambdaDataUpdateCoordinator(mock_hass, mock_entry)
+        result = await coordinator._load_sensor_overrides()
 
-            assert result == {"test_sensor": "new_name"}
+        assert result == {"test_sensor": "new_name"}
 
 
 @pytest.mark.asyncio
 async def test_load_sensor_overrides_file_not_exists(mock_hass, mock_entry):
-    """Test sensor overrides loading when file doesn't exist."""
+    """Fehlende Datei: Config-Service liefert die Default-Config ohne Overrides."""
     with patch(
-        "custom_components.lambda_heat_pumps.coordinator.os.path.exists",
-        return_value=False,
+        "custom_components.lambda_heat_pumps.utils.load_lambda_config",
+        new=AsyncMock(return_value={"sensors_names_override": {}}),
     ):
         coordinator = LambdaDataUpdateCoordinator(mock_hass, mock_entry)
         result = await coordinator._load_sensor_overrides()
@@ -458,20 +537,263 @@ async def test_load_sensor_overrides_file_not_exists(mock_hass, mock_entry):
 
 @pytest.mark.asyncio
 async def test_load_sensor_overrides_yaml_error(mock_hass, mock_entry):
-    """Test sensor overrides loading with YAML error."""
-    @asynccontextmanager
-    async def fake_open_error(*args, **kwargs):
-        yield StringIO("invalid yaml")
+    """Fehler beim Laden der Config: leere Overrides statt Abbruch."""
+    with patch(
+        "custom_components.lambda_heat_pumps.utils.load_lambda_config",
+        new=AsyncMock(side_effect=ValueError("invalid yaml")),
+    ):
+        coordinator = LambdaDataUpdateCoordinator(mock_hass, mock_entry)
+        result = await coordinator._load_sensor_overrides()
+
+        assert result == {}
+
+
+def test_apply_reloaded_config_updates_coordinator(mock_hass, mock_entry):
+    """Hot-Reload: geänderte Config wirkt ohne Integrations-Reload auf den Coordinator."""
+    coordinator = LambdaDataUpdateCoordinator(mock_hass, mock_entry)
+    config = {
+        "disabled_registers": {1004},
+        "sensors_names_override": {"hp1_state": "wp_state"},
+        "cycling_offsets": {"hp1": {"heating_cycling_total": 5}},
+        "energy_consumption_sensors": {},
+        "energy_consumption_offsets": {},
+        "modbus": {"int32_register_order": "low_first"},
+        "state_write_gating": {},
+        "int32_register_order": "low_first",
+    }
 
     with patch(
-        "custom_components.lambda_heat_pumps.coordinator.os.path.exists",
-        return_value=True,
+        "custom_components.lambda_heat_pumps.utils.validate_external_sensors",
+        return_value={},
     ):
-        with patch("aiofiles.open", fake_open_error):
-            coordinator = LambdaDataUpdateCoordinator(mock_hass, mock_entry)
-            result = await coordinator._load_sensor_overrides()
+        coordinator._apply_reloaded_config(config)
 
-            assert result == {}
+    assert coordinator.is_register_disabled(1004)
+    # Namens-Overrides erst nach dem Neuladen der Integration (Data-Keys bestehender Sensoren)
+    assert "hp1_state" not in coordinator.sensor_overrides
+    assert coordinator._cycling_offsets == {"hp1": {"heating_cycling_total": 5}}
+    assert coordinator._int32_register_order == "low_first"
+
+
+def test_name_override_edit_keeps_existing_sensor_value(mock_hass, mock_entry):
+    """Hot-Reload: geänderter Namens-Override lässt bestehende Sensoren nicht auf unknown fallen."""
+    coordinator = LambdaDataUpdateCoordinator(mock_hass, mock_entry)
+    coordinator.sensor_overrides = {"hp1_flow_line_temperature": "wp_vorlauf"}
+    sensor = LambdaSensor(
+        coordinator=coordinator,
+        entry=mock_entry,
+        sensor_id="hp1_flow_line_temperature",
+        name="Flow Line Temperature",
+        unit="°C",
+        address=1004,
+        scale=0.01,
+        state_class="measurement",
+        device_class=None,
+        relative_address=4,
+        data_type="int16",
+        device_type="hp",
+        txt_mapping=False,
+        precision=1,
+        entity_id="sensor.wp_vorlauf",
+        unique_id="wp_vorlauf",
+    )
+    config = {
+        "disabled_registers": set(),
+        "sensors_names_override": {"hp1_flow_line_temperature": "wp_flow"},
+        "cycling_offsets": {},
+        "energy_consumption_sensors": {},
+        "energy_consumption_offsets": {},
+        "state_write_gating": {},
+        "int32_register_order": "high_first",
+    }
+
+    with patch(
+        "custom_components.lambda_heat_pumps.utils.validate_external_sensors",
+        return_value={},
+    ):
+        coordinator._apply_reloaded_config(config)
+
+    # Nächster Zyklus: Werte landen unter dem Key, den der Coordinator auflöst
+    key = coordinator.sensor_overrides.get("hp1_flow_line_temperature", "hp1_flow_line_temperature")
+    coordinator.data = {key: 35.2}
+    assert sensor.native_value == 35.2
+
+
+def test_apply_reloaded_config_reconfigures_gates_and_cycling_offsets(mock_hass, mock_entry):
+    """Hot-Reload: Gates übernehmen neue Deadband, geänderte Cycling-Offsets werden angewendet."""
+    total_sensor = SimpleNamespace(
+        _sensor_id="heating_cycling_total",
+        hass=mock_hass,
+        _apply_cycling_offset=Mock(return_value="apply"),
+    )
+    daily_sensor = SimpleNamespace(
+        _sensor_id="heating_cycling_daily", hass=mock_hass, _apply_cycling_offset=Mock()
+    )
+    mock_hass.data = {
+        "lambda_heat_pumps": {
+            mock_entry.entry_id: {
+                "cycling_entities": {"a": total_sensor, "b": daily_sensor}
+            }
+        }
+    }
+    coordinator = LambdaDataUpdateCoordinator(mock_hass, mock_entry)
+    gate = create_state_gate(
+        coordinator.state_write_gating,
+        "hp1_flow_line_temperature",
+        unit="°C",
+        registry=coordinator.state_gates,
+    )
+    assert gate.deadband == 0.15
+    config = {
+        "disabled_registers": set(),
+        "sensors_names_override": {},
+        "cycling_offsets": {"hp1": {"heating_cycling_total": 5}},
+        "energy_consumption_sensors": {},
+        "energy_consumption_offsets": {},
+        "state_write_gating": {
+            "max_silence_seconds": 120,
+            "deadband": {"flow_line_temperature": 0.5},
+        },
+        "int32_register_order": "high_first",
+    }
+
+    with patch(
+        "custom_components.lambda_heat_pumps.utils.validate_external_sensors",
+        return_value={},
+    ):
+        coordinator._apply_reloaded_config(config)
+
+    assert gate.deadband == 0.5
+    assert gate.max_silence == 120
+    total_sensor._apply_cycling_offset.assert_called_once()
+    mock_hass.async_create_task.assert_called_once_with("apply")
+    daily_sensor._apply_cycling_offset.assert_not_called()
+
+    # Unveränderte Offsets: kein erneutes Anwenden
+    mock_hass.async_create_task.reset_mock()
+    with patch(
+        "custom_components.lambda_heat_pumps.utils.validate_external_sensors",
+        return_value={},
+    ):
+        coordinator._apply_reloaded_config(config)
+    mock_hass.async_create_task.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_coordinators_share_fleet_scheduler(mock_hass, mock_entry):
+    """Mehrere Controller: gemeinsamer Scheduler, eigene Slots, Abmeldung beim Shutdown."""
+    mock_hass.data = {}
+    first = LambdaDataUpdateCoordinator(mock_hass, mock_entry)
+    second = LambdaDataUpdateCoordinator(mock_hass, mock_entry)
+
+    assert first._fleet is second._fleet
+    assert {first._fleet_member.slot, second._fleet_member.slot} == {0, 1}
+    assert second._fleet_member.phase_offset(30) > 0
+
+    await first.async_shutdown()
+    assert first._fleet.members == 1
+
+
+@pytest.mark.asyncio
+async def test_overlapping_persists_are_serialized(mock_hass, mock_entry, tmp_path):
+    """Zwei überlappende Persists: Commits laufen nacheinander, der letzte Stand gewinnt."""
+    mock_hass.data = {}
+    coordinator = LambdaDataUpdateCoordinator(mock_hass, mock_entry)
+    coordinator._persist_store = PersistJournalStore(str(tmp_path / "cycle_energy_persist.json"))
+    coordinator._collect_energy_sensor_states = Mock(return_value={})
+
+    active = 0
+    max_active = 0
+    release_first = asyncio.Event()
+
+    async def _executor(func, *args):
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        try:
+            if not release_first.is_set():
+                await release_first.wait()
+            return func(*args)
+        finally:
+            active -= 1
+
+    mock_hass.async_add_executor_job = _executor
+
+    coordinator._heating_cycles = {"hp1": 1}
+    coordinator._persist_dirty = True
+    first = asyncio.create_task(coordinator._persist_counters(force=True))
+    await asyncio.sleep(0)  # erster Persist wartet im Commit
+
+    coordinator._heating_cycles = {"hp1": 2}
+    coordinator._persist_dirty = True
+    second = asyncio.create_task(coordinator._persist_counters(force=True))
+    await asyncio.sleep(0)
+    release_first.set()
+    await asyncio.gather(first, second)
+
+    assert max_active == 1
+    assert not coordinator._persist_dirty
+    reloaded = PersistJournalStore(coordinator._persist_store.snapshot_path).load()
+    assert reloaded["heating_cycles"] == {"hp1": 2}
+
+
+@pytest.mark.asyncio
+async def test_shutdown_mid_profile_detaches_and_writes_report(mock_hass, mock_entry, tmp_path):
+    """Entladen während des Profilings: die übrigen Coordinators bestimmen das Ende."""
+    mock_hass.data = {}
+    mock_hass.async_add_executor_job = AsyncMock(return_value=("a.pstats", "a.txt"))
+    first = LambdaDataUpdateCoordinator(mock_hass, mock_entry)
+    second = LambdaDataUpdateCoordinator(mock_hass, mock_entry)
+    second._fleet_member.label = "second"
+    profiler = CycleProfiler(1, str(tmp_path), "all")
+    first.start_profiling(1, profiler)
+    second.start_profiling(1, profiler)
+
+    profiler.record_cycle("full", first._fleet_member.label)
+    assert not profiler.done
+
+    # second war der letzte offene Coordinator: Report beim Shutdown
+    await second.async_shutdown()
+    assert second._profiler is None
+    assert profiler.done
+    mock_hass.async_add_executor_job.assert_any_await(profiler.write_report)
+    assert not profiler.claim_report()
+
+
+@pytest.mark.asyncio
+async def test_fast_poll_not_skipped_when_fleet_busy(mock_hass, mock_entry):
+    """Volle Zyklen anderer Controller blockieren den Fast-Poll nicht."""
+    mock_hass.data = {}
+    coordinator = LambdaDataUpdateCoordinator(mock_hass, mock_entry)
+    other = LambdaDataUpdateCoordinator(mock_hass, mock_entry)
+    coordinator._initialization_complete = True
+    coordinator.client = Mock()
+    coordinator._async_fast_poll_registers = AsyncMock()
+
+    held = []
+    for _ in range(coordinator._fleet.max_concurrent):
+        manager = other._fleet.cycle(other._fleet_member, "full")
+        fleet_cycle = await manager.__aenter__()
+        await fleet_cycle.acquire()
+        held.append(manager)
+
+    await asyncio.wait_for(coordinator._async_fast_update(None), timeout=1)
+    coordinator._async_fast_poll_registers.assert_awaited_once()
+
+    for manager in held:
+        await manager.__aexit__(None, None, None)
+
+
+def test_hot_path_log_sampling_is_per_coordinator(mock_hass, mock_entry):
+    """Gesampelte Log-Zeilen eines Controllers unterdrücken nicht die eines anderen."""
+    mock_hass.data = {}
+    first = LambdaDataUpdateCoordinator(mock_hass, mock_entry)
+    second = LambdaDataUpdateCoordinator(mock_hass, mock_entry)
+
+    assert first._hot_log is not second._hot_log
+    with patch.object(first._hot_log.logger, "isEnabledFor", return_value=True):
+        assert first._hot_log.debug_sampled(("read_error", 1000), "Error reading register %s", 1000, now=0.0)
+        assert second._hot_log.debug_sampled(("read_error", 1000), "Error reading register %s", 1000, now=1.0)
 
 
 def test_on_ha_started(mock_hass, mock_entry):
@@ -589,6 +911,44 @@ def test_collect_energy_sensor_states_corrects_invalid_daily_monthly_yearly(mock
     assert out["sensor.eu08l_hp1_heating_energy_yearly"]["attributes"]["previous_yearly_value"] == 1668.47
 
 
+def test_collect_energy_sensor_states_serializes_only_dirty_entities(mock_hass, mock_entry):
+    """Nach dem ersten Persist werden nur Entities aus dem Dirty-Set neu serialisiert."""
+    from custom_components.lambda_heat_pumps.const import DOMAIN
+
+    entities = {}
+    mock_hass.data = {DOMAIN: {mock_entry.entry_id: {"energy_entities": entities}}}
+    for name in ("heating_energy_total", "hot_water_energy_total"):
+        ent = MagicMock()
+        ent._energy_value = 10.0
+        ent._yesterday_value = 0.0
+        ent._previous_monthly_value = 0.0
+        ent._previous_yearly_value = 0.0
+        ent._applied_offset = 0.0
+        ent.native_value = 10.0
+        entities[f"sensor.eu08l_hp1_{name}"] = ent
+
+    coordinator = LambdaDataUpdateCoordinator(mock_hass, mock_entry)
+    first = coordinator._collect_energy_sensor_states()
+    assert first["sensor.eu08l_hp1_heating_energy_total"]["state"] == 10.0
+
+    # Beide Entities ändern sich, aber nur eine meldet sich als dirty
+    for ent in entities.values():
+        ent._energy_value = 12.0
+        ent.native_value = 12.0
+    coordinator.mark_energy_entity_dirty("sensor.eu08l_hp1_heating_energy_total")
+    assert coordinator._persist_dirty is True
+
+    second = coordinator._collect_energy_sensor_states()
+    assert second["sensor.eu08l_hp1_heating_energy_total"]["state"] == 12.0
+    assert second["sensor.eu08l_hp1_hot_water_energy_total"]["state"] == 10.0
+    assert coordinator._energy_dirty_entities == set()
+
+    # Entfernte Entities verschwinden aus dem Cache
+    del entities["sensor.eu08l_hp1_hot_water_energy_total"]
+    third = coordinator._collect_energy_sensor_states()
+    assert list(third) == ["sensor.eu08l_hp1_heating_energy_total"]
+
+
 # --- Tests für Daily-Reset / Energy-Consumption-Fixes (Entity-ID + use_legacy_modbus_names) ---
 
 
@@ -0,0 +1,77 @@
+"""Tests for the shared per-coordinator COP engine."""
+
+from unittest.mock import MagicMock
+
+from custom_components.lambda_heat_pumps.cop_engine import (
+    COPEngine,
+    SOURCE_ELECTRICAL,
+    SOURCE_THERMAL,
+)
+
+
+def _sensor(hp_index=1, mode="heating"):
+    sensor = MagicMock()
+    sensor._hp_index = hp_index
+    sensor._mode = mode
+    sensor.hass = MagicMock()
+    return sensor
+
+
+def test_batch_publishes_each_pair_once():
+    """Mehrere Quelländerungen in einem Zyklus führen zu genau einer Neuberechnung."""
+    engine = COPEngine()
+    heating = _sensor()
+    hot_water = _sensor(mode="hot_water")
+    engine.register(heating)
+    engine.register(hot_water)
+
+    engine.begin_batch()
+    engine.update_source(1, "heating", SOURCE_THERMAL, "daily", 10.0)
+    engine.update_source(1, "heating", SOURCE_ELECTRICAL, "daily", 2.5)
+    engine.update_source(1, "heating", SOURCE_THERMAL, "total", 100.0)
+    heating._update_cop.assert_not_called()
+    assert engine.end_batch() == 1
+
+    heating._update_cop.assert_called_once()
+    hot_water._update_cop.assert_not_called()
+    assert engine.get_source(1, "heating", SOURCE_ELECTRICAL, "daily") == 2.5
+
+
+def test_unchanged_source_is_not_pending():
+    """Gleicher Wert erneut gemeldet: keine Neuberechnung."""
+    engine = COPEngine()
+    sensor = _sensor()
+    engine.register(sensor)
+    engine.update_source(1, "heating", SOURCE_THERMAL, "daily", 1.0)
+    engine.flush()
+    sensor._update_cop.reset_mock()
+
+    engine.update_source(1, "heating", SOURCE_THERMAL, "daily", 1.0)
+    assert engine.flush() == 0
+    sensor._update_cop.assert_not_called()
+
+
+def test_update_outside_batch_schedules_single_flush():
+    """Außerhalb eines Zyklus wird einmal pro Loop-Durchlauf geflusht."""
+    hass = MagicMock()
+    engine = COPEngine(hass)
+    engine.update_source(1, "heating", SOURCE_THERMAL, "daily", 1.0)
+    engine.update_source(1, "heating", SOURCE_ELECTRICAL, "daily", 1.0)
+    hass.loop.call_soon.assert_called_once_with(engine.flush)
+
+
+def test_baseline_table():
+    """Baselines werden pro (HP, Modus, Periode) getrennt nach Quelle gespeichert."""
+    engine = COPEngine()
+    assert engine.get_baseline(1, "heating", "daily", SOURCE_THERMAL) is None
+    engine.set_baseline(1, "heating", "daily", SOURCE_THERMAL, 4.0)
+    engine.set_baseline(1, "heating", "daily", SOURCE_ELECTRICAL, 1.0)
+    assert engine.get_baseline(1, "heating", "daily", SOURCE_THERMAL) == 4.0
+    assert engine.get_baseline(1, "heating", "daily", SOURCE_ELECTRICAL) == 1.0
+    assert engine.get_baseline(1, "heating", "total", SOURCE_THERMAL) is None
+
+    sensor = _sensor()
+    engine.register(sensor)
+    engine.unregister(sensor)
+    engine.update_source(1, "heating", SOURCE_THERMAL, "daily", 5.0)
+    assert engine.flush() == 0
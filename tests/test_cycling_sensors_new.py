@@ -12,6 +12,7 @@ from custom_components.lambda_heat_pumps.sensor import (
     LambdaYesterdaySensor,
     async_setup_entry,
 )
+from custom_components.lambda_heat_pumps.reset_manager import ResetManager
 from tests.conftest import DummyLoop
 
 
@@ -181,6 +182,14 @@ def test_lambda_yesterday_sensor_extra_state_attributes(mock_entry, mock_coordin
     assert attrs["sensor_type"] == "cycling_yesterday"
 
 
+def _rollover(sensor, entry_id, period):
+    """Perioden-Rollover des ResetManagers für einen Sensor des Entries "test_entry"."""
+    sensor.hass.data = {
+        "lambda_heat_pumps": {"test_entry": {"cycling_entities": {sensor.entity_id: sensor}}}
+    }
+    return ResetManager(sensor.hass, entry_id).rollover({period})
+
+
 # Tests für LambdaCyclingSensor (neue Architektur)
 def test_lambda_cycling_sensor_reset_handlers(mock_entry, mock_coordinator):
     """Test LambdaCyclingSensor reset handlers."""
@@ -205,16 +214,15 @@ def test_lambda_cycling_sensor_reset_handlers(mock_entry, mock_coordinator):
     # Set initial value
     daily_sensor._cycling_value = 50
     
-    # Test daily reset (async method) - jetzt _handle_reset für alle Perioden
-    import asyncio
-    asyncio.run(daily_sensor._handle_reset("test_entry"))
+    # Daily-Reset über den Rollover-Durchlauf
+    assert _rollover(daily_sensor, "test_entry", "daily") == 1
     assert daily_sensor._cycling_value == 0
     daily_sensor.async_write_ha_state.assert_called_once()
     
     # Test with wrong entry_id
     daily_sensor._cycling_value = 50
     daily_sensor.async_write_ha_state.reset_mock()
-    asyncio.run(daily_sensor._handle_reset("wrong_entry"))
+    assert _rollover(daily_sensor, "wrong_entry", "daily") == 0
     assert daily_sensor._cycling_value == 50  # Should not reset
     daily_sensor.async_write_ha_state.assert_not_called()
 
@@ -241,9 +249,8 @@ def test_lambda_cycling_sensor_2h_reset_handler(mock_entry, mock_coordinator):
     # Set initial value
     sensor._cycling_value = 30
     
-    # Test 2h reset (async method) - jetzt _handle_reset für alle Perioden
-    import asyncio
-    asyncio.run(sensor._handle_reset("test_entry"))
+    # 2h-Reset über den Rollover-Durchlauf
+    assert _rollover(sensor, "test_entry", "2h") == 1
     assert sensor._cycling_value == 0
     sensor.async_write_ha_state.assert_called_once()
 
@@ -270,9 +277,8 @@ def test_lambda_cycling_sensor_4h_reset_handler(mock_entry, mock_coordinator):
     # Set initial value
     sensor._cycling_value = 75
     
-    # Test 4h reset (async method) - jetzt _handle_reset für alle Perioden
-    import asyncio
-    asyncio.run(sensor._handle_reset("test_entry"))
+    # 4h-Reset über den Rollover-Durchlauf
+    assert _rollover(sensor, "test_entry", "4h") == 1
     assert sensor._cycling_value == 0
     sensor.async_write_ha_state.assert_called_once()
 
@@ -299,9 +305,8 @@ def test_lambda_cycling_sensor_monthly_reset_handler(mock_entry, mock_coordinato
     # Set initial value
     sensor._cycling_value = 100
     
-    # Test monthly reset (async method) - jetzt _handle_reset für alle Perioden
-    import asyncio
-    asyncio.run(sensor._handle_reset("test_entry"))
+    # monthly-Reset über den Rollover-Durchlauf
+    assert _rollover(sensor, "test_entry", "monthly") == 1
     assert sensor._cycling_value == 0
     sensor.async_write_ha_state.assert_called_once()
 
@@ -350,8 +355,7 @@ def test_compressor_start_cycling_sensor_2h_reset(mock_entry, mock_coordinator):
     sensor.async_write_ha_state = Mock()
     sensor._cycling_value = 15
     
-    import asyncio
-    asyncio.run(sensor._handle_reset("test_entry"))
+    assert _rollover(sensor, "test_entry", "2h") == 1
     assert sensor._cycling_value == 0
     sensor.async_write_ha_state.assert_called_once()
 
@@ -375,8 +379,7 @@ def test_compressor_start_cycling_sensor_4h_reset(mock_entry, mock_coordinator):
     sensor.async_write_ha_state = Mock()
     sensor._cycling_value = 25
     
-    import asyncio
-    asyncio.run(sensor._handle_reset("test_entry"))
+    assert _rollover(sensor, "test_entry", "4h") == 1
     assert sensor._cycling_value == 0
     sensor.async_write_ha_state.assert_called_once()
 
@@ -531,47 +534,24 @@ async def test_yesterday_sensors_in_cycling_entities(mock_hass, mock_entry, mock
         assert "sensor.test_hp1_heating_cycling_yesterday" in cycling_entities
 
 
-# Tests für _update_yesterday_sensors Funktion
-@pytest.mark.asyncio
-async def test_update_yesterday_sensors_function(mock_hass, mock_entry):
-    """Test the _update_yesterday_sensors_async function from automations."""
-    from custom_components.lambda_heat_pumps.automations import _update_yesterday_sensors_async
-    
-    # Mock cycling entities - use proper entity_id format with hp1
+# Tests für den Yesterday-Snapshot
+def test_snapshot_yesterday_sensors(mock_hass):
+    """Der Rollover-Snapshot übernimmt den Daily-Wert in den Yesterday-Sensor (ohne State-Write)."""
+    from custom_components.lambda_heat_pumps.automations import snapshot_yesterday_sensors
+
     mock_daily_sensor = Mock()
-    mock_daily_sensor.entity_id = "sensor.test_hp1_heating_cycling_daily"
-    mock_daily_sensor._sensor_id = "heating_cycling_daily"
-    
     mock_yesterday_sensor = Mock()
-    mock_yesterday_sensor.entity_id = "sensor.test_hp1_heating_cycling_yesterday"
-    mock_yesterday_sensor._sensor_id = "heating_cycling_yesterday"
-    # set_cycling_value is async, so use AsyncMock
-    from unittest.mock import AsyncMock
-    mock_yesterday_sensor.set_cycling_value = AsyncMock()
-    
-    # Mock hass.data structure
-    mock_hass.data = {
-        "lambda_heat_pumps": {
-            mock_entry.entry_id: {
-                "cycling_entities": {
-                    "sensor.test_hp1_heating_cycling_daily": mock_daily_sensor,
-                    "sensor.test_hp1_heating_cycling_yesterday": mock_yesterday_sensor,
-                }
-            }
-        }
+    cycling_entities = {
+        "sensor.test_hp1_heating_cycling_daily": mock_daily_sensor,
+        "sensor.test_hp1_heating_cycling_yesterday": mock_yesterday_sensor,
     }
-    
-    # Mock hass.states.get to return a daily value
     mock_state = Mock()
     mock_state.state = "42"
     mock_hass.states.get.return_value = mock_state
-    
-    # Call the async function
-    await _update_yesterday_sensors_async(mock_hass, mock_entry.entry_id)
-    
-    # Verify that set_cycling_value was called on the yesterday sensor
-    mock_yesterday_sensor.set_cycling_value.assert_called_once_with(42)
 
+    assert snapshot_yesterday_sensors(mock_hass, cycling_entities) == [mock_yesterday_sensor]
+    mock_yesterday_sensor._set_yesterday_value.assert_called_once_with(42)
+    mock_yesterday_sensor.async_write_ha_state.assert_not_called()
 
 
 # Integration Test für das Yesterday-Sensor-Problem
@@ -0,0 +1,88 @@
+"""Tests für den Diagnose-Download (Performance-Snapshot, Redaction)."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.lambda_heat_pumps.connection_pool import ModbusConnectionPool
+from custom_components.lambda_heat_pumps.const import DOMAIN
+from custom_components.lambda_heat_pumps.diagnostics import async_get_config_entry_diagnostics
+from custom_components.lambda_heat_pumps.fleet_scheduler import FleetScheduler
+from custom_components.lambda_heat_pumps.perf_trace import PerfTrace
+
+
+def _coordinator():
+    coordinator = MagicMock()
+    coordinator.host = "192.168.1.100"
+    coordinator.port = 502
+    coordinator.slave_id = 1
+    coordinator._int32_register_order = "high_first"
+    coordinator.disabled_registers = {1004}
+    coordinator._enabled_addresses = {1000, 1001}
+    coordinator._max_batch_failures = 3
+    coordinator.startup_complete = True
+    coordinator._batch_failures = {(5000, 20): 2}
+    coordinator._individual_read_addresses = {(1050, 4)}
+    coordinator._persist_store = SimpleNamespace(
+        snapshot_path="/nonexistent/cycle_energy_persist.json",
+        journal_path="/nonexistent/cycle_energy_persist.json.journal",
+    )
+    coordinator._fleet = FleetScheduler()
+    coordinator._fleet_member = coordinator._fleet.register("eu08l@192.168.1.100:502")
+    coordinator._connection_pool = ModbusConnectionPool()
+    coordinator.perf_trace = PerfTrace()
+    coordinator.perf_trace.begin_cycle()
+    coordinator.perf_trace.record_batch(1000, 10, "batch", 12.5)
+    coordinator.perf_trace.end_cycle()
+    coordinator.perf_trace.record_persist_write("append", 1.2, 240)
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_snapshot_is_redacted():
+    entry = MagicMock()
+    entry.entry_id = "test_entry"
+    entry.version = 8
+    entry.data = {"host": "192.168.1.100", "port": 502, "slave_id": 1, "firmware_version": "V0.0.3-3K", "num_hps": 1}
+    entry.options = {"update_interval": 30}
+
+    async def run_sync(fn, *args):
+        return fn(*args)
+
+    hass = MagicMock()
+    hass.async_add_executor_job = run_sync
+    hass.data = {
+        DOMAIN: {
+            "test_entry": {
+                "coordinator": _coordinator(),
+                "cycling_entities": {"sensor.a": object()},
+                "platform_setup_ms": {"sensor": 120.0},
+            }
+        }
+    }
+    registry_entries = [
+        SimpleNamespace(domain="sensor", disabled_by=None, device_class=None, original_device_class="temperature"),
+        SimpleNamespace(domain="climate", disabled_by="user", device_class=None, original_device_class=None),
+    ]
+
+    with patch(
+        "custom_components.lambda_heat_pumps.diagnostics.er.async_get", return_value=MagicMock()
+    ), patch(
+        "custom_components.lambda_heat_pumps.diagnostics.er.async_entries_for_config_entry",
+        return_value=registry_entries,
+    ):
+        result = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert result["entry"]["data"]["host"] == "**REDACTED**"
+    assert "192.168.1.100" not in repr(result)
+    assert result["entities"]["by_platform"] == {"sensor": 1, "climate": 1}
+    assert result["entities"]["disabled"] == 1
+    assert result["read_plan"] == [{"start": 1000, "count": 10, "mode": "batch"}]
+    assert result["learned"]["batch_failures"] == [{"start": 5000, "count": 20, "failures": 2}]
+    assert result["learned"]["individual_read_batches"] == [{"start": 1050, "count": 4}]
+    assert result["performance"]["persist_writes"]["bytes_total"] == 240
+    assert result["persist_files"] == {"snapshot_bytes": None, "journal_bytes": None}
+    assert result["polling"]["update_interval"] == 30
+    assert result["polling"]["disabled_registers"] == [1004]
+    assert result["setup_ms"]["sensor"] == 120.0
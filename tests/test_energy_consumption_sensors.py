@@ -8,6 +8,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 
 from custom_components.lambda_heat_pumps.sensor import LambdaEnergyConsumptionSensor
+from custom_components.lambda_heat_pumps.reset_manager import ResetManager
 from custom_components.lambda_heat_pumps.const import (
     ENERGY_CONSUMPTION_SENSOR_TEMPLATES,
     ENERGY_CONSUMPTION_MODES,
@@ -229,7 +230,7 @@ class TestLambdaEnergyConsumptionSensor:
     async def test_async_added_to_hass(self, mock_hass, mock_entry):
         """Test async_added_to_hass method."""
         from unittest.mock import patch, MagicMock
-        # Create a daily sensor (total sensors don't register dispatcher)
+        # Create a daily sensor
         daily_sensor = LambdaEnergyConsumptionSensor(
             hass=mock_hass,
             entry=mock_entry,
@@ -256,14 +257,10 @@ class TestLambdaEnergyConsumptionSensor:
 
         # Patch async_write_ha_state to avoid integration issues
         with patch.object(daily_sensor, 'async_write_ha_state', new_callable=MagicMock):
-            # Mock dispatcher connect + Coordinator (kein Persist-State)
-            with patch('custom_components.lambda_heat_pumps.sensor.async_dispatcher_connect') as mock_connect:
-                with patch.object(daily_sensor, '_get_energy_sensor_persisted_state_from_coordinator', return_value=None):
-                    await daily_sensor.async_added_to_hass()
-            
-            # Verify dispatcher was connected (daily sensors register for reset signals)
-            mock_connect.assert_called_once()
-            
+            # Mock Coordinator (kein Persist-State)
+            with patch.object(daily_sensor, '_get_energy_sensor_persisted_state_from_coordinator', return_value=None):
+                await daily_sensor.async_added_to_hass()
+
             # Verify restore_state: ohne Total → _energy_value = yesterday + displayed = 0 + 50
             assert daily_sensor._energy_value == 50.0
 
@@ -275,8 +272,7 @@ class TestLambdaEnergyConsumptionSensor:
         
         # Patch async_write_ha_state to avoid integration issues
         with patch.object(energy_sensor, 'async_write_ha_state', new_callable=MagicMock):
-            with patch('custom_components.lambda_heat_pumps.sensor.async_dispatcher_connect'):
-                await energy_sensor.async_added_to_hass()
+            await energy_sensor.async_added_to_hass()
             
             # Verify default value
             assert energy_sensor._energy_value == 0.0
@@ -292,41 +288,19 @@ class TestLambdaEnergyConsumptionSensor:
         
         # Patch async_write_ha_state to avoid integration issues
         with patch.object(energy_sensor, 'async_write_ha_state', new_callable=MagicMock):
-            with patch('custom_components.lambda_heat_pumps.sensor.async_dispatcher_connect'):
-                await energy_sensor.async_added_to_hass()
+            await energy_sensor.async_added_to_hass()
             
             # Verify default value due to invalid state
             assert energy_sensor._energy_value == 0.0
 
-    @pytest.mark.asyncio
-    async def test_async_will_remove_from_hass(self, energy_sensor):
-        """Test async_will_remove_from_hass method."""
-        # Mock unsub dispatcher
-        mock_unsub = Mock()
-        energy_sensor._unsub_dispatcher = mock_unsub
-        
-        await energy_sensor.async_will_remove_from_hass()
-        
-        # Verify unsub was called
-        mock_unsub.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_async_will_remove_from_hass_no_unsub(self, energy_sensor):
-        """Test async_will_remove_from_hass method with no unsub."""
-        energy_sensor._unsub_dispatcher = None
-        
-        # Should not raise an exception
-        await energy_sensor.async_will_remove_from_hass()
-
-    @pytest.mark.asyncio
-    async def test_handle_reset_total(self, energy_sensor, mock_entry):
-        """Total-Sensor: _handle_reset ändert _energy_value nicht."""
+    def test_period_reset_total(self, energy_sensor):
+        """Total-Sensor: _apply_period_reset ändert _energy_value nicht."""
         energy_sensor._energy_value = 100.0
-        await energy_sensor._handle_reset(mock_entry.entry_id)
+        assert not energy_sensor._apply_period_reset()
         assert energy_sensor._energy_value == 100.0
 
     @pytest.mark.asyncio
-    async def test_handle_reset_daily_updates_yesterday_not_energy(self, mock_hass, mock_entry):
+    async def test_period_reset_daily_updates_yesterday_not_energy(self, mock_hass, mock_entry):
         """Daily-Sensor: Reset setzt yesterday_value = Total und synchronisiert _energy_value mit Total."""
         from unittest.mock import MagicMock
         sensor = LambdaEnergyConsumptionSensor(
@@ -350,13 +324,12 @@ class TestLambdaEnergyConsumptionSensor:
         total_state.state = "500.0"
         total_state.attributes = {}
         mock_hass.states.get = MagicMock(return_value=total_state)
-        with patch.object(sensor, "async_write_ha_state", MagicMock()):
-            await sensor._handle_reset(mock_entry.entry_id)
+        assert sensor._apply_period_reset()
         assert sensor._energy_value == 500.0, "Daily reset synchronisiert _energy_value mit Total"
         assert sensor._yesterday_value == 500.0, "yesterday_value soll auf Total gesetzt werden"
 
     @pytest.mark.asyncio
-    async def test_handle_reset_monthly_updates_previous_monthly_not_energy(self, mock_hass, mock_entry):
+    async def test_period_reset_monthly_updates_previous_monthly_not_energy(self, mock_hass, mock_entry):
         """Monthly-Sensor: Reset setzt previous_monthly_value = Total und synchronisiert _energy_value mit Total."""
         from unittest.mock import MagicMock, patch
         sensor = LambdaEnergyConsumptionSensor(
@@ -380,13 +353,12 @@ class TestLambdaEnergyConsumptionSensor:
         total_state.state = "2000.0"
         total_state.attributes = {}
         mock_hass.states.get = MagicMock(return_value=total_state)
-        with patch.object(sensor, "async_write_ha_state", MagicMock()):
-            await sensor._handle_reset(mock_entry.entry_id)
+        assert sensor._apply_period_reset()
         assert sensor._energy_value == 2000.0, "Monthly reset synchronisiert _energy_value mit Total"
         assert sensor._previous_monthly_value == 2000.0, "previous_monthly_value soll auf Total gesetzt werden"
 
     @pytest.mark.asyncio
-    async def test_handle_reset_yearly_updates_previous_yearly_not_energy(self, mock_hass, mock_entry):
+    async def test_period_reset_yearly_updates_previous_yearly_not_energy(self, mock_hass, mock_entry):
         """Yearly-Sensor: Reset setzt previous_yearly_value = Total und synchronisiert _energy_value mit Total."""
         from unittest.mock import MagicMock, patch
         sensor = LambdaEnergyConsumptionSensor(
@@ -410,8 +382,7 @@ class TestLambdaEnergyConsumptionSensor:
         total_state.state = "10000.0"
         total_state.attributes = {}
         mock_hass.states.get = MagicMock(return_value=total_state)
-        with patch.object(sensor, "async_write_ha_state", MagicMock()):
-            await sensor._handle_reset(mock_entry.entry_id)
+        assert sensor._apply_period_reset()
         assert sensor._energy_value == 10000.0, "Yearly reset synchronisiert _energy_value mit Total"
         assert sensor._previous_yearly_value == 10000.0, "previous_yearly_value soll auf Total gesetzt werden"
 
@@ -450,8 +421,8 @@ class TestLambdaEnergyConsumptionSensor:
             daily_sensor._yesterday_value = 0.0
             assert daily_sensor.native_value == 100.0, "Vor Reset: Tageswert soll 100 kWh sein"
 
-            # —— Mitternacht: Daily-Reset (Signal würde _handle_reset auslösen)
-            await daily_sensor._handle_reset(mock_entry.entry_id)
+            # —— Mitternacht: Daily-Reset (Rollover-Durchlauf des ResetManagers)
+            assert daily_sensor._apply_period_reset()
 
             # Nach Reset: yesterday_value = Total, Anzeige = 0
             assert daily_sensor._yesterday_value == 100.0, (
@@ -476,7 +447,7 @@ class TestLambdaEnergyConsumptionSensor:
 
     @pytest.mark.asyncio
     async def test_day_change_simulation_wrong_entry_id_ignored(self, mock_hass, mock_entry):
-        """Tageswechsel: _handle_reset mit falscher entry_id ändert nichts (anderer Config-Eintrag)."""
+        """Tageswechsel: Rollover eines anderen Config-Eintrags ändert nichts."""
         from unittest.mock import MagicMock
         daily_sensor = LambdaEnergyConsumptionSensor(
             hass=mock_hass,
@@ -495,8 +466,11 @@ class TestLambdaEnergyConsumptionSensor:
         )
         daily_sensor._energy_value = 80.0
         daily_sensor._yesterday_value = 20.0
+        mock_hass.data = {
+            "lambda_heat_pumps": {mock_entry.entry_id: {"energy_entities": {"daily": daily_sensor}}}
+        }
         with patch.object(daily_sensor, "async_write_ha_state", MagicMock()):
-            await daily_sensor._handle_reset("other_entry_id")
+            assert ResetManager(mock_hass, "other_entry_id").rollover({"daily"}) == 0
         assert daily_sensor._yesterday_value == 20.0, "Falsche entry_id: yesterday_value unverändert"
         assert daily_sensor._energy_value == 80.0
         assert daily_sensor.native_value == 60.0
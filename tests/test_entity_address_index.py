@@ -0,0 +1,47 @@
+"""Tests für den inkrementellen Entity->Adress-Index."""
+
+from custom_components.lambda_heat_pumps.entity_address_index import EntityAddressIndex
+
+
+def _index():
+    index = EntityAddressIndex()
+    index.add_candidate("sensor.eu08l_hp1_flow_line_temperature", 1004)
+    index.add_candidate("sensor.eu08l_HP1_flow_line_temperature", 1004)
+    index.add_candidate("eu08l_hp1_flow_line_temperature", 1004)
+    index.add_candidate("sensor.eu08l_hp1_return_line_temperature", 1005)
+    return index
+
+
+def test_apply_and_remove_track_enabled_address():
+    """Enabled-Bit pro Entity; Adresse bleibt aktiv, solange eine Entity aktiviert ist."""
+    index = _index()
+    assert index.resolve("sensor.eu08l_hp1_flow_line_temperature") == 1004
+    assert index.resolve("sensor.other") is None
+
+    assert index.apply("sensor.eu08l_hp1_flow_line_temperature", 1004, True)
+    assert index.apply("sensor.eu08l_HP1_flow_line_temperature", 1004, False)
+    assert index.is_address_enabled(1004)
+
+    assert not index.apply("sensor.eu08l_hp1_flow_line_temperature", 1004, False)
+    assert not index.is_address_enabled(1004)
+
+    index.apply("sensor.eu08l_hp1_flow_line_temperature", 1004, True)
+    assert index.remove("sensor.eu08l_hp1_flow_line_temperature") == (1004, False)
+    assert index.remove("sensor.unknown") == (None, False)
+
+
+def test_rename_and_unique_id_resolution():
+    """Umbenannte Entities behalten Adresse/Enabled-Bit; Zuordnung auch über die Unique-ID."""
+    index = _index()
+    index.apply("sensor.eu08l_hp1_flow_line_temperature", 1004, True)
+    index.rename("sensor.eu08l_hp1_flow_line_temperature", "sensor.vorlauf")
+    assert index.resolve("sensor.vorlauf") == 1004
+    assert index.is_address_enabled(1004)
+    assert "sensor.eu08l_hp1_flow_line_temperature" not in index.entity_addresses
+
+    assert index.resolve(None, "eu08l_hp1_flow_line_temperature") == 1004
+    assert sorted(index.candidate_entity_ids())[0].startswith("sensor.")
+
+    index.clear_entities()
+    assert not index.is_address_enabled(1004)
+    assert len(index) == 4
@@ -0,0 +1,111 @@
+"""Tests für den gemeinsamen Fleet-Scheduler mehrerer Controller."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.lambda_heat_pumps.fleet_scheduler import (
+    FleetScheduler,
+    get_fleet_scheduler,
+)
+
+
+def test_phase_offsets_are_spread_and_stable():
+    fleet = FleetScheduler()
+    members = [fleet.register(f"wp{i}") for i in range(4)]
+    offsets = [member.phase_offset(30) for member in members]
+
+    assert offsets[0] == 0.0
+    assert all(0 <= offset < 30 for offset in offsets)
+    # Paarweise mindestens 1/8 Intervall Abstand
+    ordered = sorted(offsets)
+    assert min(b - a for a, b in zip(ordered, ordered[1:])) > 30 / 8
+    # Ein weiterer Controller verschiebt die bestehenden Versätze nicht
+    fleet.register("wp4")
+    assert [member.phase_offset(30) for member in members] == offsets
+
+
+def test_unregister_frees_slot():
+    fleet = FleetScheduler()
+    first = fleet.register("a")
+    second = fleet.register("b")
+    fleet.unregister(first)
+    assert fleet.register("c").slot == first.slot
+    assert second.slot == 1
+    assert fleet.members == 2
+
+
+@pytest.mark.asyncio
+async def test_cycles_respect_global_limit_and_record_stats():
+    fleet = FleetScheduler(max_concurrent=2)
+    members = [fleet.register(f"wp{i}") for i in range(4)]
+    running = 0
+    peak = 0
+
+    async def run(member):
+        nonlocal running, peak
+        async with fleet.cycle(member, "full") as cycle:
+            await cycle.acquire()
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(run(member) for member in members))
+
+    assert peak == 2
+    stats = fleet.stats()
+    assert stats["members"] == 4
+    assert stats["in_flight"] == 0
+    assert stats["cycles"]["full"]["count"] == 4
+    assert stats["cycles"]["full"]["wait_max_ms"] > 0
+    assert stats["per_member"]["wp0"]["cycles"]["full"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_slot_released_after_max_hold():
+    """Ein hängender Controller (Timeouts/Retries) hält den Slot nur bis zur Deadline."""
+    fleet = FleetScheduler(max_concurrent=1, max_hold=0.02)
+    stuck = fleet.register("stuck")
+    other = fleet.register("other")
+    release_stuck = asyncio.Event()
+
+    async def run_stuck():
+        async with fleet.cycle(stuck, "full") as cycle:
+            await cycle.acquire()
+            await release_stuck.wait()
+
+    task = asyncio.create_task(run_stuck())
+    await asyncio.sleep(0)
+    async with fleet.cycle(other, "full") as cycle:
+        await asyncio.wait_for(cycle.acquire(), timeout=1)
+    release_stuck.set()
+    await task
+
+    stats = fleet.stats()
+    assert stats["in_flight"] == 0
+    assert stats["per_member"]["stuck"]["cycles"]["full"]["slot_expired"] == 1
+    assert stats["per_member"]["other"]["cycles"]["full"]["slot_expired"] == 0
+
+
+@pytest.mark.asyncio
+async def test_fast_poll_runs_while_fleet_saturated():
+    """Fast-Polls belegen keinen Slot und laufen auch bei voller Auslastung."""
+    fleet = FleetScheduler(max_concurrent=1)
+    busy = fleet.register("busy")
+    other = fleet.register("other")
+
+    async with fleet.cycle(busy, "full") as cycle:
+        await cycle.acquire()
+        async with fleet.cycle(other, "fast"):
+            pass
+
+    stats = fleet.stats()
+    assert stats["per_member"]["other"]["cycles"]["fast"]["count"] == 1
+    assert stats["cycles"]["fast"]["wait_max_ms"] == 0
+
+
+def test_scheduler_is_shared_per_hass():
+    hass = SimpleNamespace(data={})
+    assert get_fleet_scheduler(hass) is get_fleet_scheduler(hass)
@@ -0,0 +1,93 @@
+"""Tests für die gecachte Heizkurven-Berechnung (LambdaHeatingCurveCalcSensor)."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
+
+from custom_components.lambda_heat_pumps.template_sensor import (
+    LambdaHeatingCurveCalcSensor,
+    _HeatingCurveModel,
+)
+
+
+def test_heating_curve_model_piecewise_linear():
+    """Stützpunkte, Interpolation und Begrenzung außerhalb der Kurve."""
+    model = _HeatingCurveModel(50.0, 35.0, 25.0, -20.0, 0.0, 20.0)
+    assert model.evaluate(-30.0) == 50.0
+    assert model.evaluate(-10.0) == 42.5
+    assert model.evaluate(0.0) == 35.0
+    assert model.evaluate(10.0) == 30.0
+    assert model.evaluate(25.0) == 25.0
+
+
+def _sensor(states):
+    entry = Mock()
+    entry.entry_id = "test_entry"
+    entry.data = {"name": "eu08l", "use_legacy_modbus_names": True}
+    coordinator = MagicMock()
+    coordinator.data = {}
+    numbers = {
+        "heating_curve_cold_outside_temp": "number.eu08l_hc1_heating_curve_cold_outside_temp",
+        "heating_curve_mid_outside_temp": "number.eu08l_hc1_heating_curve_mid_outside_temp",
+        "heating_curve_warm_outside_temp": "number.eu08l_hc1_heating_curve_warm_outside_temp",
+    }
+    sensor = LambdaHeatingCurveCalcSensor(
+        coordinator=coordinator,
+        entry=entry,
+        sensor_id="hc1_heating_curve_flow_line_temperature_calc",
+        name="Heating Curve Flow Line Temperature",
+        unit="°C",
+        state_class="measurement",
+        device_class="temperature",
+        device_type="hc",
+        precision=1,
+        entity_id="sensor.eu08l_hc1_heating_curve_flow_line_temperature_calc",
+        unique_id="eu08l_hc1_heating_curve_flow_line_temperature_calc",
+        ambient_sensor="sensor.eu08l_ambient_temperature_calculated",
+        number_entities=numbers,
+        temp_points={"cold": -20.0, "mid": 0.0, "warm": 20.0},
+        defaults={
+            "heating_curve_cold_outside_temp": 50.0,
+            "heating_curve_mid_outside_temp": 35.0,
+            "heating_curve_warm_outside_temp": 25.0,
+        },
+        room_thermostat_enabled=False,
+    )
+    sensor.hass = MagicMock()
+    sensor.hass.states.get.side_effect = lambda entity_id: (
+        SimpleNamespace(state=states[entity_id]) if entity_id in states else None
+    )
+    sensor.async_write_ha_state = Mock()
+    return sensor
+
+
+def test_curve_model_cached_and_state_written_only_on_change():
+    """Number-Entities werden nur einmal gelesen; unveränderter Wert wird nicht erneut geschrieben."""
+    states = {"sensor.eu08l_ambient_temperature_calculated": "10"}
+    sensor = _sensor(states)
+
+    sensor._handle_coordinator_update()
+    assert sensor.native_value == 30.0
+    assert sensor.async_write_ha_state.call_count == 1
+    model = sensor._curve_model
+
+    sensor._handle_coordinator_update()
+    assert sensor._curve_model is model
+    assert sensor.async_write_ha_state.call_count == 1
+
+    states["sensor.eu08l_ambient_temperature_calculated"] = "-10"
+    sensor._handle_coordinator_update()
+    assert sensor.native_value == 42.5
+    assert sensor.async_write_ha_state.call_count == 2
+
+
+def test_curve_model_rebuilt_after_number_change():
+    """Nach Invalidierung (Number-Änderung) wird das Modell mit neuen Werten gebaut."""
+    states = {"sensor.eu08l_ambient_temperature_calculated": "20"}
+    sensor = _sensor(states)
+    sensor._handle_coordinator_update()
+    assert sensor.native_value == 25.0
+
+    states["number.eu08l_hc1_heating_curve_warm_outside_temp"] = "28"
+    sensor._curve_model = None
+    sensor._handle_coordinator_update()
+    assert sensor.native_value == 28.0
@@ -14,6 +14,7 @@ from custom_components.lambda_heat_pumps import (
     _entry_reload_flags,
     _previously_setup_entries,
 )
+from custom_components.lambda_heat_pumps.module_auto_detect import FALLBACK_MODULE_COUNTS
 
 
 def test_constants():
@@ -145,6 +146,7 @@ async def test_first_start_blocking_detect_waits_for_stable_connection():
     mock_coordinator = MagicMock()
     mock_coordinator.async_init = AsyncMock()
     mock_coordinator.async_refresh = AsyncMock()
+    mock_coordinator.async_startup_refresh = AsyncMock()
     mock_coordinator.client = MagicMock()
     mock_coordinator.client.connect = AsyncMock(return_value=True)
     mock_coordinator.slave_id = 1
@@ -175,6 +177,69 @@ async def test_first_start_blocking_detect_waits_for_stable_connection():
         _previously_setup_entries.discard(entry_id)
 
 
+@pytest.mark.asyncio
+async def test_first_start_detect_timeout_is_not_cached():
+    """Timeout der Erst-Erkennung: Fallback-Werte werden übernommen, aber nicht gecacht."""
+    from custom_components.lambda_heat_pumps import async_setup_entry, _previously_setup_entries
+
+    entry_id = "test_first_start_timeout"
+    entry = MagicMock()
+    entry.entry_id = entry_id
+    # Kein num_hps / num_hc → has_module_counts = False → else-Zweig
+    entry.data = {"host": "192.168.1.1", "port": 502, "slave_id": 1}
+    entry.options = {}
+    entry.add_update_listener = MagicMock(return_value=MagicMock())
+    entry.async_on_unload = MagicMock()
+
+    _previously_setup_entries.discard(entry_id)
+
+    hass = MagicMock()
+    hass.data = {}
+    hass.config_entries = MagicMock()
+    hass.config_entries.async_forward_entry_setups = AsyncMock(return_value=True)
+    hass.services = MagicMock()
+    hass.services.has_service = MagicMock(return_value=True)
+    hass.async_create_task = MagicMock()
+
+    mock_coordinator = MagicMock()
+    mock_coordinator.async_init = AsyncMock()
+    mock_coordinator.async_refresh = AsyncMock()
+    mock_coordinator.async_startup_refresh = AsyncMock()
+    mock_coordinator.client = MagicMock()
+    mock_coordinator.client.connect = AsyncMock(return_value=True)
+    mock_coordinator.slave_id = 1
+    mock_coordinator._int32_register_order = "high_first"
+    mock_coordinator._persist_dirty = False
+
+    mock_wait = AsyncMock()
+
+    with (
+        patch("custom_components.lambda_heat_pumps.ensure_lambda_config", new=AsyncMock()),
+        patch("custom_components.lambda_heat_pumps.LambdaDataUpdateCoordinator", return_value=mock_coordinator),
+        patch("custom_components.lambda_heat_pumps.wait_for_stable_connection", mock_wait),
+        patch("custom_components.lambda_heat_pumps.auto_detect_modules", new=AsyncMock(
+            side_effect=asyncio.TimeoutError
+        )),
+        patch("custom_components.lambda_heat_pumps._save_module_cache", new=AsyncMock()) as mock_save,
+        patch(
+            "custom_components.lambda_heat_pumps.update_entry_with_detected_modules",
+            new=AsyncMock(return_value=True),
+        ) as mock_update,
+        patch("custom_components.lambda_heat_pumps.async_remove_duplicate_entity_suffixes", new=AsyncMock()),
+        patch("custom_components.lambda_heat_pumps.modbus_utils.get_int32_register_order", new=AsyncMock(return_value="high_first")),
+        patch("custom_components.lambda_heat_pumps.ResetManager") as mock_rm,
+    ):
+        mock_rm.return_value.setup_reset_automations = MagicMock()
+        result = await async_setup_entry(hass, entry)
+
+    try:
+        assert result is True
+        mock_save.assert_not_called()
+        mock_update.assert_awaited_once_with(hass, entry, FALLBACK_MODULE_COUNTS)
+    finally:
+        _previously_setup_entries.discard(entry_id)
+
+
 # ---------------------------------------------------------------------------
 # Fix K-01: Template-Task wird beim Unload abgebrochen
 # ---------------------------------------------------------------------------
@@ -427,6 +492,7 @@ async def test_skip_auto_detect_does_not_schedule_background_task():
     mock_coordinator = MagicMock()
     mock_coordinator.async_init = AsyncMock()
     mock_coordinator.async_refresh = AsyncMock()
+    mock_coordinator.async_startup_refresh = AsyncMock()
     mock_coordinator.client = MagicMock()
     mock_coordinator.slave_id = 1
     mock_coordinator._int32_register_order = "high_first"
@@ -450,8 +516,9 @@ async def test_skip_auto_detect_does_not_schedule_background_task():
 
 @pytest.mark.asyncio
 async def test_unload_closes_modbus_client_early():
-    """Modbus-Client wird beim Unload sofort geschlossen (vor der Task-Cancellation),
-    damit in-flight Modbus-Reads sofort fehlschlagen statt den globalen Lock zu
+    """Modbus-Client wird beim Unload sofort freigegeben (vor der Task-Cancellation);
+    der Pool schließt die Verbindung, sobald kein anderer Entry sie nutzt, damit
+    in-flight Modbus-Reads sofort fehlschlagen statt den globalen Lock zu
     blockieren (siehe Root-Cause "Sensoren ohne Werte nach Config-Änderung")."""
     from custom_components.lambda_heat_pumps import async_unload_entry
 
@@ -482,7 +549,9 @@ async def test_unload_closes_modbus_client_early():
     ):
         await async_unload_entry(hass, entry)
 
-    original_client.close.assert_called_once()
+    # Geteilte Verbindung: Referenz freigeben, schließen übernimmt der Pool
+    mock_coordinator.release_client.assert_called_once()
+    original_client.close.assert_not_called()
     assert mock_coordinator.client is None
 
 
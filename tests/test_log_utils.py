@@ -0,0 +1,39 @@
+"""Tests für die Hot-Path-Logging-Fassade."""
+
+import logging
+from unittest.mock import Mock
+
+from custom_components.lambda_heat_pumps.log_utils import HotPathLogger, lazy
+
+
+def test_lazy_args_not_evaluated_when_debug_disabled():
+    """Argumente werden nur bei aktivem Level berechnet."""
+    logger = logging.getLogger("test_log_utils.lazy")
+    logger.setLevel(logging.INFO)
+    hot = HotPathLogger(logger)
+    func = Mock(return_value=["a", "b"])
+
+    hot.debug("Keys: %s", lazy(func))
+    assert not hot.debug_sampled("keys", "Keys: %s", lazy(func))
+    func.assert_not_called()
+
+    logger.setLevel(logging.DEBUG)
+    assert str(lazy(func)) == "['a', 'b']"
+    func.assert_called_once()
+
+
+def test_sampled_logging_rate_limited_per_key(caplog):
+    """Eine Zeile pro Schlüssel und Intervall, unterdrückte Zeilen werden mitgezählt."""
+    logger = logging.getLogger("test_log_utils.sampled")
+    logger.setLevel(logging.DEBUG)
+    hot = HotPathLogger(logger, interval=60)
+
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        assert hot.debug_sampled(1000, "Register %d", 1000, now=0.0)
+        assert not hot.debug_sampled(1000, "Register %d", 1000, now=10.0)
+        assert not hot.debug_sampled(1000, "Register %d", 1000, now=20.0)
+        assert hot.debug_sampled(1001, "Register %d", 1001, now=20.0)
+        assert hot.debug_sampled(1000, "Register %d", 1000, now=61.0)
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages == ["Register 1000", "Register 1001", "Register 1000 (+2 unterdrückt)"]
@@ -0,0 +1,83 @@
+"""Tests für Migrations-Fingerprint und Streaming-Backups."""
+
+import os
+
+from custom_components.lambda_heat_pumps.migration_fingerprint import (
+    build_fingerprint,
+    fingerprint_matches,
+    invalidate_fingerprint,
+    load_fingerprint,
+    save_fingerprint,
+    stream_copy,
+    stream_copy_files,
+)
+
+TEMPLATE = "template-sha"
+SCHEMA = "er1.16/dr1.8"
+
+
+def _setup(tmp_path):
+    config_path = tmp_path / "lambda_wp_config.yaml"
+    config_path.write_text("disabled_registers:\n  - 1004\n", encoding="utf-8")
+    fingerprint_path = str(tmp_path / "lambda_heat_pumps" / "migration_fingerprint.json")
+    save_fingerprint(fingerprint_path, build_fingerprint(8, str(config_path), TEMPLATE, SCHEMA))
+    return config_path, fingerprint_path
+
+
+def _matches(fingerprint_path, config_path, version=8, template=TEMPLATE, schema=SCHEMA):
+    return fingerprint_matches(load_fingerprint(fingerprint_path), version, str(config_path), template, schema)
+
+
+def test_unchanged_state_matches(tmp_path):
+    config_path, fingerprint_path = _setup(tmp_path)
+    assert _matches(fingerprint_path, config_path)
+
+
+def test_touch_without_content_change_still_matches(tmp_path):
+    config_path, fingerprint_path = _setup(tmp_path)
+    stat = os.stat(config_path)
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert _matches(fingerprint_path, config_path)
+
+
+def test_relevant_changes_miss(tmp_path):
+    config_path, fingerprint_path = _setup(tmp_path)
+    assert not _matches(fingerprint_path, config_path, version=9)
+    assert not _matches(fingerprint_path, config_path, template="other")
+    assert not _matches(fingerprint_path, config_path, schema="er1.17/dr1.8")
+
+    config_path.write_text("disabled_registers:\n  - 1005\n", encoding="utf-8")
+    assert not _matches(fingerprint_path, config_path)
+
+
+def test_missing_or_corrupt_fingerprint_misses(tmp_path):
+    config_path, fingerprint_path = _setup(tmp_path)
+    with open(fingerprint_path, "w", encoding="utf-8") as f:
+        f.write("{not json")
+    assert not _matches(fingerprint_path, config_path)
+
+    invalidate_fingerprint(fingerprint_path)
+    invalidate_fingerprint(fingerprint_path)
+    assert not _matches(fingerprint_path, config_path)
+
+
+def test_missing_config_file_misses(tmp_path):
+    config_path, fingerprint_path = _setup(tmp_path)
+    os.remove(config_path)
+    assert not _matches(fingerprint_path, config_path)
+
+
+def test_stream_copy_preserves_content_and_skips_missing(tmp_path):
+    source = tmp_path / "core.entity_registry"
+    source.write_bytes(os.urandom(3 * 1024 * 1024 + 17))
+    dest = tmp_path / "backup" / "core.entity_registry.v8"
+    dest.parent.mkdir()
+
+    stream_copy(str(source), str(dest), chunk_size=64 * 1024)
+    assert dest.read_bytes() == source.read_bytes()
+    assert not os.path.exists(str(dest) + ".tmp")
+
+    written = stream_copy_files(
+        [(str(source), str(dest)), (str(tmp_path / "missing"), str(tmp_path / "backup" / "missing"))]
+    )
+    assert written == [str(dest)]
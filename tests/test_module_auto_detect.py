@@ -0,0 +1,110 @@
+"""Tests für Probe-Plan und Cache der Modul-Auto-Detection."""
+
+import json
+import os
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from custom_components.lambda_heat_pumps.module_auto_detect import (
+    MAX_MODULE_COUNTS,
+    ModuleProbe,
+    build_probe_plan,
+    invalidate_detection_cache,
+    load_detection_cache,
+    module_cache_key,
+    save_detection_cache,
+)
+
+DETECTED = {"hp": 2, "boil": 1, "buff": 0, "sol": 0, "hc": 3}
+
+
+def _entry(host="10.0.0.5", firmware="V0.0.9-3K"):
+    """Config entry wie nach dem Config-Flow: Firmware in den Options, nicht in data."""
+    return SimpleNamespace(
+        data={"host": host, "port": 502, "slave_id": 1},
+        options={"firmware_version": firmware},
+    )
+
+
+def test_probe_plan_covers_every_slot():
+    """Ein Test-Register pro möglichem Slot (1000, 1100, … / 5000 … 6100)."""
+    plan = build_probe_plan()
+    assert len(plan) == sum(MAX_MODULE_COUNTS.values())
+    assert ("hp", 0, 1000) in plan
+    assert ("hp", 2, 1200) in plan
+    assert ("hc", 11, 6100) in plan
+
+
+def test_module_probe_stops_type_at_first_missing_slot():
+    """Der erste fehlende Slot beendet den Typ; weitere Slots werden nicht mehr geprüft."""
+    present = {("hp", 0), ("hp", 1), ("boil", 0), ("hc", 0), ("hc", 1), ("hc", 2)}
+    probe = ModuleProbe()
+    rounds = 0
+    while not probe.done:
+        batch = probe.next_probes(3)
+        assert 0 < len(batch) <= 3
+        assert len({module_type for module_type, _, _ in batch}) == len(batch)
+        for module_type, module_idx, _address in batch:
+            probe.record(module_type, module_idx, (module_type, module_idx) in present)
+        rounds += 1
+    assert probe.detected() == {"hp": 2, "boil": 1, "buff": 0, "sol": 0, "hc": 3}
+    assert rounds < len(build_probe_plan())
+
+
+def test_module_probe_assumes_one_heat_pump():
+    probe = ModuleProbe()
+    while not probe.done:
+        for module_type, module_idx, _address in probe.next_probes(8):
+            probe.record(module_type, module_idx, False)
+    assert probe.detected()["hp"] == 1
+
+
+def test_cache_roundtrip_and_key_isolation(tmp_path):
+    path = str(tmp_path / "module_detection_cache.json")
+    key = module_cache_key(_entry())
+    other = module_cache_key(_entry(host="10.0.0.6"))
+
+    assert load_detection_cache(path, key) is None
+    save_detection_cache(path, key, DETECTED, now=1000.0)
+    save_detection_cache(path, other, {**DETECTED, "hp": 1}, now=1000.0)
+
+    assert load_detection_cache(path, key, now=1001.0) == DETECTED
+    assert load_detection_cache(path, other, now=1001.0)["hp"] == 1
+
+    with patch(
+        "custom_components.lambda_heat_pumps.module_auto_detect.os.replace", wraps=os.replace
+    ) as replace_spy:
+        invalidate_detection_cache(path, key)
+    replace_spy.assert_called_once_with(path + ".tmp", path)  # atomar, nicht in-place
+    assert load_detection_cache(path, key, now=1001.0) is None
+    assert load_detection_cache(path, other, now=1001.0) is not None
+
+
+def test_cache_expires_and_firmware_change_misses(tmp_path):
+    path = str(tmp_path / "module_detection_cache.json")
+    key = module_cache_key(_entry(firmware="V0.0.8-3K"))
+    save_detection_cache(path, key, DETECTED, now=0.0)
+
+    assert load_detection_cache(path, key, now=31 * 24 * 3600) is None
+    upgraded = module_cache_key(_entry(firmware="V0.0.9-3K"))
+    assert upgraded != key
+    assert load_detection_cache(path, upgraded, now=1.0) is None
+
+
+def test_cache_key_falls_back_to_firmware_in_data():
+    """Ältere Entries mit Firmware in data erhalten denselben Schlüssel."""
+    legacy = SimpleNamespace(
+        data={"host": "10.0.0.5", "port": 502, "slave_id": 1, "firmware_version": "V0.0.9-3K"},
+        options={},
+    )
+    assert module_cache_key(legacy) == module_cache_key(_entry())
+    assert module_cache_key(legacy).endswith("/V0.0.9-3K")
+
+
+def test_cache_ignores_corrupt_file(tmp_path):
+    path = tmp_path / "module_detection_cache.json"
+    path.write_text("{not json", encoding="utf-8")
+    assert load_detection_cache(str(path), "key") is None
+
+    path.write_text(json.dumps({"key": {"detected": {"hp": 1}, "timestamp": 0}}), encoding="utf-8")
+    assert load_detection_cache(str(path), "key", now=1.0) is None
@@ -22,11 +22,7 @@ from custom_components.lambda_heat_pumps.utils import (
     get_all_reset_intervals,
     get_all_periods
 )
-from custom_components.lambda_heat_pumps.automations import (
-    SIGNAL_RESET_MONTHLY,
-    SIGNAL_RESET_YEARLY,
-)
-from custom_components.lambda_heat_pumps.reset_manager import ResetManager
+from custom_components.lambda_heat_pumps.reset_manager import ResetManager, due_periods
 
 
 class TestMonthlyYearlyEnergySensors(unittest.TestCase):
@@ -104,10 +100,11 @@ class TestMonthlyYearlyEnergySensors(unittest.TestCase):
         self.assertIn("monthly", all_periods)
         self.assertIn("yearly", all_periods)
     
-    def test_reset_signals_exist(self):
-        """Test: Reset-Signale sind definiert."""
-        self.assertEqual(SIGNAL_RESET_MONTHLY, "lambda_heat_pumps_reset_monthly")
-        self.assertEqual(SIGNAL_RESET_YEARLY, "lambda_heat_pumps_reset_yearly")
+    def test_monthly_yearly_rollover_due(self):
+        """Test: Monthly/Yearly-Rollover am Monats- bzw. Jahresanfang."""
+        self.assertIn("monthly", due_periods(datetime(2025, 3, 1, 0, 0)))
+        self.assertNotIn("yearly", due_periods(datetime(2025, 3, 1, 0, 0)))
+        self.assertIn("yearly", due_periods(datetime(2026, 1, 1, 0, 0)))
     
     def test_template_operating_states(self):
         """Test: Operating States sind korrekt zugeordnet."""
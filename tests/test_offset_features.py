@@ -435,7 +435,6 @@ class TestEnergyOffsetAppliedViaAsyncAddedToHass:
           - super().async_added_to_hass() → no-op
           - async_get_last_state() → last_state
           - _get_energy_sensor_persisted_state_from_coordinator() → coordinator_state
-          - async_dispatcher_connect → no-op (signal handler registration)
         """
         from unittest.mock import patch, AsyncMock, MagicMock
         from custom_components.lambda_heat_pumps.sensor import LambdaEnergyConsumptionSensor
@@ -459,10 +458,6 @@ class TestEnergyOffsetAppliedViaAsyncAddedToHass:
             "_get_energy_sensor_persisted_state_from_coordinator",
             return_value=coordinator_state,
         )
-        ctx_dispatcher = patch(
-            "custom_components.lambda_heat_pumps.sensor.async_dispatcher_connect",
-            return_value=Mock(),
-        )
         ctx_config = patch(
             "custom_components.lambda_heat_pumps.utils.load_lambda_config",
             return_value=config or {},
@@ -471,7 +466,7 @@ class TestEnergyOffsetAppliedViaAsyncAddedToHass:
         import asyncio
 
         async def _run():
-            async with ctx_super, ctx_last_state, ctx_coord_state, ctx_dispatcher, ctx_config:
+            async with ctx_super, ctx_last_state, ctx_coord_state, ctx_config:
                 await sensor.async_added_to_hass()
 
         return asyncio.get_event_loop().run_until_complete(_run())
@@ -492,9 +487,8 @@ class TestEnergyOffsetAppliedViaAsyncAddedToHass:
         with patch("homeassistant.helpers.entity.Entity.async_added_to_hass", new=AsyncMock()):
             with patch.object(sensor, "async_get_last_state", return_value=last_state):
                 with patch.object(sensor, "_get_energy_sensor_persisted_state_from_coordinator", return_value=None):
-                    with patch("custom_components.lambda_heat_pumps.sensor.async_dispatcher_connect", return_value=Mock()):
-                        with patch("custom_components.lambda_heat_pumps.utils.load_lambda_config", return_value=config):
-                            await sensor.async_added_to_hass()
+                    with patch("custom_components.lambda_heat_pumps.utils.load_lambda_config", return_value=config):
+                        await sensor.async_added_to_hass()
 
         assert abs(sensor._energy_value - 1500.541) < 0.001, (
             f"Expected 1500.541 (1000.0 restored + 500.541 offset) but got {sensor._energy_value}. "
@@ -517,9 +511,8 @@ class TestEnergyOffsetAppliedViaAsyncAddedToHass:
         with patch("homeassistant.helpers.entity.Entity.async_added_to_hass", new=AsyncMock()):
             with patch.object(sensor, "async_get_last_state", return_value=last_state):
                 with patch.object(sensor, "_get_energy_sensor_persisted_state_from_coordinator", return_value=None):
-                    with patch("custom_components.lambda_heat_pumps.sensor.async_dispatcher_connect", return_value=Mock()):
-                        with patch("custom_components.lambda_heat_pumps.utils.load_lambda_config", return_value=config):
-                            await sensor.async_added_to_hass()
+                    with patch("custom_components.lambda_heat_pumps.utils.load_lambda_config", return_value=config):
+                        await sensor.async_added_to_hass()
 
         assert abs(sensor._energy_value - 1500.541) < 0.001, (
             f"Expected 1500.541 (offset not re-applied) but got {sensor._energy_value}. "
@@ -544,9 +537,8 @@ class TestEnergyOffsetAppliedViaAsyncAddedToHass:
         with patch("homeassistant.helpers.entity.Entity.async_added_to_hass", new=AsyncMock()):
             with patch.object(sensor, "async_get_last_state", return_value=last_state):
                 with patch.object(sensor, "_get_energy_sensor_persisted_state_from_coordinator", return_value=coordinator_state):
-                    with patch("custom_components.lambda_heat_pumps.sensor.async_dispatcher_connect", return_value=Mock()):
-                        with patch("custom_components.lambda_heat_pumps.utils.load_lambda_config", return_value=config):
-                            await sensor.async_added_to_hass()
+                    with patch("custom_components.lambda_heat_pumps.utils.load_lambda_config", return_value=config):
+                        await sensor.async_added_to_hass()
 
         assert abs(sensor._energy_value - 1500.541) < 0.001, (
             f"Expected 1500.541 (coordinator raw 1000.0 + offset 500.541) but got {sensor._energy_value}. "
@@ -578,9 +570,8 @@ class TestEnergyOffsetAppliedViaAsyncAddedToHass:
         with patch("homeassistant.helpers.entity.Entity.async_added_to_hass", new=AsyncMock()):
             with patch.object(sensor, "async_get_last_state", return_value=last_state):
                 with patch.object(sensor, "_get_energy_sensor_persisted_state_from_coordinator", return_value=coordinator_state):
-                    with patch("custom_components.lambda_heat_pumps.sensor.async_dispatcher_connect", return_value=Mock()):
-                        with patch("custom_components.lambda_heat_pumps.utils.load_lambda_config", return_value=config):
-                            await sensor.async_added_to_hass()
+                    with patch("custom_components.lambda_heat_pumps.utils.load_lambda_config", return_value=config):
+                        await sensor.async_added_to_hass()
 
         assert abs(sensor._energy_value - 561.071) < 0.01, (
             f"Expected ~561.071 (coordinator raw 60.53 + offset 500.541) but got {sensor._energy_value}. "
@@ -601,10 +592,9 @@ class TestEnergyOffsetAppliedViaAsyncAddedToHass:
         with patch("homeassistant.helpers.entity.Entity.async_added_to_hass", new=AsyncMock()):
             with patch.object(sensor, "async_get_last_state", return_value=None):
                 with patch.object(sensor, "_get_energy_sensor_persisted_state_from_coordinator", return_value=None):
-                    with patch("custom_components.lambda_heat_pumps.sensor.async_dispatcher_connect", return_value=Mock()):
-                        with patch("custom_components.lambda_heat_pumps.utils.load_lambda_config", return_value={}):
-                            with patch.object(sensor, "_apply_energy_offset", new_callable=AsyncMock) as mock_apply:
-                                await sensor.async_added_to_hass()
+                    with patch("custom_components.lambda_heat_pumps.utils.load_lambda_config", return_value={}):
+                        with patch.object(sensor, "_apply_energy_offset", new_callable=AsyncMock) as mock_apply:
+                            await sensor.async_added_to_hass()
 
         mock_apply.assert_called_once(), (
             "Regression: _apply_energy_offset() was not called from async_added_to_hass(). "
@@ -622,13 +612,12 @@ class TestEnergyOffsetAppliedViaAsyncAddedToHass:
         with patch("homeassistant.helpers.entity.Entity.async_added_to_hass", new=AsyncMock()):
             with patch.object(sensor, "async_get_last_state", return_value=last_state):
                 with patch.object(sensor, "_get_energy_sensor_persisted_state_from_coordinator", return_value=None):
-                    with patch("custom_components.lambda_heat_pumps.sensor.async_dispatcher_connect", return_value=Mock()):
-                        with patch("custom_components.lambda_heat_pumps.utils.load_lambda_config", return_value={}):
-                            with patch.object(sensor, "_apply_energy_offset", new_callable=AsyncMock) as mock_apply:
-                                # Patch asyncio.sleep to avoid real delay in daily init path
-                                with patch("asyncio.sleep", new=AsyncMock()):
-                                    with patch.object(sensor, "_initialize_daily_yesterday_value", new=AsyncMock(return_value=False)):
-                                        await sensor.async_added_to_hass()
+                    with patch("custom_components.lambda_heat_pumps.utils.load_lambda_config", return_value={}):
+                        with patch.object(sensor, "_apply_energy_offset", new_callable=AsyncMock) as mock_apply:
+                            # Patch asyncio.sleep to avoid real delay in daily init path
+                            with patch("asyncio.sleep", new=AsyncMock()):
+                                with patch.object(sensor, "_initialize_daily_yesterday_value", new=AsyncMock(return_value=False)):
+                                    await sensor.async_added_to_hass()
 
         mock_apply.assert_not_called(), (
             "Regression: _apply_energy_offset() called on a daily sensor — "
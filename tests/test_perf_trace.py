@@ -0,0 +1,58 @@
+"""Tests für die Laufzeit-Messwerte (Diagnose-Snapshot)."""
+
+from custom_components.lambda_heat_pumps.perf_trace import (
+    BATCH_MODE_BATCH,
+    BATCH_MODE_INDIVIDUAL,
+    PerfTrace,
+)
+
+
+def test_last_cycle_is_read_plan_and_ring_is_bounded():
+    trace = PerfTrace(max_cycles=2)
+    for cycle in range(3):
+        trace.begin_cycle()
+        trace.record_batch(1000, 10, BATCH_MODE_BATCH, 12.0 + cycle)
+        trace.record_batch(1050, 2, BATCH_MODE_INDIVIDUAL, 30.0)
+        trace.end_cycle()
+
+    snapshot = trace.as_dict()
+    assert snapshot["read_plan"] == [
+        {"start": 1000, "count": 10, "mode": "batch"},
+        {"start": 1050, "count": 2, "mode": "individual"},
+    ]
+    assert len(snapshot["cycles"]) == 2
+    assert snapshot["cycles"][-1]["batches"][0]["ms"] == 14.0
+    assert snapshot["batch_duration"]["count"] == 4
+    assert snapshot["batch_duration"]["max_ms"] == 30.0
+
+
+def test_batches_outside_cycle_are_ignored():
+    trace = PerfTrace()
+    trace.record_batch(0, 1, BATCH_MODE_BATCH, 1.0)
+    trace.end_cycle()
+    assert trace.as_dict()["cycles"] == []
+
+
+def test_fast_poll_jitter():
+    trace = PerfTrace()
+    for now in (100.0, 102.05, 103.98, 106.0):
+        trace.record_fast_tick(2, now=now)
+    jitter = trace.as_dict()["fast_poll_jitter"]
+    assert jitter["count"] == 3
+    assert jitter["max_ms"] == 70.0
+    assert jitter["last_ms"] == [50.0, -70.0, 20.0]
+
+    trace.reset_fast_ticks()
+    trace.record_fast_tick(2, now=500.0)
+    assert trace.as_dict()["fast_poll_jitter"]["count"] == 3
+
+
+def test_persist_write_stats():
+    trace = PerfTrace()
+    trace.record_persist_write("append", 1.5, 300)
+    trace.record_persist_write("compact", 8.0, 12000)
+    writes = trace.as_dict()["persist_writes"]
+    assert writes["count"] == 2
+    assert writes["bytes_total"] == 12300
+    assert writes["bytes_max"] == 12000
+    assert writes["by_kind"] == {"append": 1, "compact": 1}
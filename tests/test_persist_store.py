@@ -0,0 +1,172 @@
+"""Tests for the journal-based cycle_energy_persist store."""
+
+import json
+import os
+
+from custom_components.lambda_heat_pumps.persist_store import (
+    GENERATION_KEY,
+    PersistJournalStore,
+    apply_journal_record,
+)
+
+
+def _state(energy=1.0):
+    return {
+        "version": 1,
+        "heating_cycles": {"hp1": 3},
+        "sensor_ids": {"hp1": "sensor.power"},
+        "energy_sensor_states": {
+            "sensor.a": {"state": energy, "attributes": {"energy_value": energy}},
+            "sensor.b": {"state": 2.0, "attributes": {"energy_value": 2.0}},
+        },
+    }
+
+
+def test_first_write_is_atomic_snapshot(tmp_path):
+    """Der erste Write erzeugt einen Snapshot, kein Journal."""
+    path = str(tmp_path / "cycle_energy_persist.json")
+    store = PersistJournalStore(path)
+
+    write = store.prepare_write(_state())
+    assert write.kind == "compact"
+    store.commit(write)
+
+    assert not os.path.exists(store.journal_path)
+    assert not os.path.exists(path + ".tmp")
+    with open(path) as f:
+        assert json.load(f) == {**_state(), GENERATION_KEY: 1}
+
+
+def test_delta_record_contains_only_changed_entities(tmp_path):
+    """Folgewrites hängen nur die geänderten Entities ans Journal an."""
+    path = str(tmp_path / "cycle_energy_persist.json")
+    store = PersistJournalStore(path)
+    store.commit(store.prepare_write(_state()))
+
+    write = store.prepare_write(_state(energy=1.5))
+    assert write.kind == "append"
+    record = json.loads(write.payload)
+    assert record == {
+        "upd": {
+            "energy_sensor_states": {
+                "sensor.a": {"state": 1.5, "attributes": {"energy_value": 1.5}}
+            }
+        },
+        "gen": 1,
+    }
+    store.commit(write)
+
+    # Unveränderter Stand erzeugt keinen Write
+    assert store.prepare_write(_state(energy=1.5)) is None
+
+
+def test_replay_snapshot_and_journal(tmp_path):
+    """Snapshot + Journal ergeben beim Laden den zuletzt geschriebenen Stand."""
+    path = str(tmp_path / "cycle_energy_persist.json")
+    store = PersistJournalStore(path)
+    store.commit(store.prepare_write(_state()))
+    final = _state(energy=4.0)
+    final["heating_cycles"] = {"hp1": 4}
+    del final["energy_sensor_states"]["sensor.b"]
+    store.commit(store.prepare_write(final))
+
+    loaded = PersistJournalStore(path).load()
+    assert loaded == final
+
+
+def test_truncated_journal_record_is_ignored(tmp_path):
+    """Ein beim Absturz abgeschnittener Record wird verworfen."""
+    path = str(tmp_path / "cycle_energy_persist.json")
+    store = PersistJournalStore(path)
+    store.commit(store.prepare_write(_state()))
+    store.commit(store.prepare_write(_state(energy=2.5)))
+    with open(store.journal_path, "a") as f:
+        f.write('{"upd": {"energy_sensor_states": {"sensor.a"')
+
+    reloaded = PersistJournalStore(path)
+    loaded = reloaded.load()
+    assert loaded["energy_sensor_states"]["sensor.a"]["state"] == 2.5
+
+    # Nach Replay wird beim nächsten Write kompaktiert und das Journal entfernt
+    write = reloaded.prepare_write(loaded)
+    assert write.kind == "compact"
+    reloaded.commit(write)
+    assert not os.path.exists(reloaded.journal_path)
+
+
+def test_stale_journal_after_crash_is_not_replayed(tmp_path):
+    """Absturz zwischen Snapshot-Tausch und Journal-Löschen: alte Records werden übersprungen."""
+    path = str(tmp_path / "cycle_energy_persist.json")
+    store = PersistJournalStore(path, max_records=2)
+    store.commit(store.prepare_write(_state()))
+    store.commit(store.prepare_write(_state(energy=2.0)))
+    with open(store.journal_path) as f:
+        old_journal = f.read()
+
+    write = store.prepare_write(_state(energy=3.0))
+    assert write.kind == "compact"
+    store.commit(write)
+    # Altes Journal liegt noch neben dem neuen Snapshot
+    with open(store.journal_path, "w") as f:
+        f.write(old_journal)
+
+    reloaded = PersistJournalStore(path)
+    loaded = reloaded.load()
+    assert loaded == _state(energy=3.0)
+
+    # Nächster Write kompaktiert und entfernt das überholte Journal
+    write = reloaded.prepare_write(loaded)
+    assert write.kind == "compact"
+    reloaded.commit(write)
+    assert not os.path.exists(reloaded.journal_path)
+
+
+def test_legacy_files_without_generation_are_replayed(tmp_path):
+    """Snapshot und Journal älterer Versionen (ohne Generation) werden weiter abgespielt."""
+    path = str(tmp_path / "cycle_energy_persist.json")
+    with open(path, "w") as f:
+        json.dump(_state(), f)
+    with open(path + ".journal", "w") as f:
+        f.write(json.dumps({"set": {"heating_cycles": {"hp1": 9}}}) + "\n")
+
+    loaded = PersistJournalStore(path).load()
+    assert loaded["heating_cycles"] == {"hp1": 9}
+
+
+def test_compaction_after_max_records(tmp_path):
+    """Nach max_records Delta-Records wird der Snapshot neu geschrieben."""
+    path = str(tmp_path / "cycle_energy_persist.json")
+    store = PersistJournalStore(path, max_records=3)
+    store.commit(store.prepare_write(_state()))
+
+    kinds = []
+    for i in range(1, 4):
+        write = store.prepare_write(_state(energy=float(i) + 1))
+        kinds.append(write.kind)
+        store.commit(write)
+
+    assert kinds == ["append", "append", "compact"]
+    assert not os.path.exists(store.journal_path)
+    with open(path) as f:
+        assert json.load(f)["energy_sensor_states"]["sensor.a"]["state"] == 4.0
+
+
+def test_get_section_returns_last_written_state(tmp_path):
+    """sensor_ids sind ohne erneutes Lesen der Datei verfügbar."""
+    path = str(tmp_path / "cycle_energy_persist.json")
+    store = PersistJournalStore(path)
+    store.commit(store.prepare_write(_state()))
+
+    assert PersistJournalStore(path).get_section("sensor_ids", {}) == {}
+    reloaded = PersistJournalStore(path)
+    reloaded.load()
+    assert reloaded.get_section("sensor_ids") == {"hp1": "sensor.power"}
+
+
+def test_apply_journal_record_set_upd_del():
+    """Record-Format: set ersetzt, upd ergänzt, del entfernt Unterschlüssel."""
+    data = {"a": 1, "s": {"x": 1, "y": 2}}
+    apply_journal_record(
+        data, {"set": {"a": 2}, "upd": {"s": {"x": 5}, "t": {"z": 1}}, "del": {"s": ["y"]}}
+    )
+    assert data == {"a": 2, "s": {"x": 5}, "t": {"z": 1}}
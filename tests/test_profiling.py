@@ -0,0 +1,121 @@
+"""Tests für den On-Demand-Profiler der Update-Zyklen."""
+
+import cProfile
+import os
+import pstats
+
+import pytest
+
+from custom_components.lambda_heat_pumps.profiling import CycleProfiler
+
+
+def _track_energy_consumption():
+    return sum(range(1000))
+
+
+def test_profiles_cycles_and_writes_report(tmp_path):
+    profiler = CycleProfiler(2, str(tmp_path), "eu08l@10.0.0.5")
+
+    for _ in range(2):
+        with profiler.capture():
+            with profiler.capture():  # verschachtelter Fast-Poll
+                _track_energy_consumption()
+        profiler.record_cycle("full")
+        assert profiler.done is (profiler.full_cycles == 2)
+    profiler.record_cycle("fast")
+
+    pstats_path, summary_path = profiler.write_report()
+
+    assert os.path.dirname(pstats_path) == str(tmp_path)
+    assert os.path.basename(pstats_path).startswith("profile_eu08l_10_0_0_5_")
+    stats = pstats.Stats(pstats_path)
+    assert any(func[2] == "_track_energy_consumption" for func in stats.stats)
+    with open(summary_path, encoding="utf-8") as f:
+        summary = f.read()
+    assert "Full cycles: 2, fast polls: 1" in summary
+    assert "_track_energy_consumption" in summary
+
+
+def test_not_done_while_capturing(tmp_path):
+    profiler = CycleProfiler(1, str(tmp_path), "eu08l")
+    with profiler.capture():
+        profiler.record_cycle("full")
+        assert not profiler.done
+        with pytest.raises(RuntimeError):
+            profiler.write_report()
+    assert profiler.done
+
+
+def test_other_active_profiler_aborts_session(tmp_path):
+    other = cProfile.Profile()
+    other.enable()
+    try:
+        profiler = CycleProfiler(5, str(tmp_path), "eu08l")
+        with profiler.capture():
+            pass
+    finally:
+        other.disable()
+
+    if profiler.error is None:
+        pytest.skip("Python < 3.12 erlaubt mehrere Profiler pro Thread")
+    assert profiler.done
+    _, summary_path = profiler.write_report()
+    with open(summary_path, encoding="utf-8") as f:
+        summary = f.read()
+    assert "Aborted:" in summary
+    assert "No samples recorded." in summary
+
+
+def test_shared_profiler_waits_for_every_coordinator(tmp_path):
+    """Mehrere Coordinators, ein Profiler: fertig erst, wenn alle ihre Zyklen haben."""
+    profiler = CycleProfiler(2, str(tmp_path), "all")
+    profiler.attach("wp1@10.0.0.5:502")
+    profiler.attach("wp2@10.0.0.6:502")
+
+    for _ in range(3):
+        with profiler.capture():
+            with profiler.capture():  # überlappender Zyklus des zweiten Coordinators
+                _track_energy_consumption()
+        profiler.record_cycle("full", "wp1@10.0.0.5:502")
+    assert not profiler.done
+    profiler.record_cycle("full", "wp2@10.0.0.6:502")
+    profiler.record_cycle("full", "wp2@10.0.0.6:502")
+    assert profiler.done
+
+    # Nur der erste fertige Coordinator schreibt den Report
+    assert profiler.claim_report()
+    assert not profiler.claim_report()
+    _, summary_path = profiler.write_report()
+    with open(summary_path, encoding="utf-8") as f:
+        summary = f.read()
+    assert "Full cycles: 5" in summary
+    assert "wp1@10.0.0.5:502 (3 full), wp2@10.0.0.6:502 (2 full)" in summary
+
+
+def test_unloaded_coordinator_is_detached(tmp_path):
+    """Während des Profilings entladener Coordinator blockiert ``done`` nicht."""
+    profiler = CycleProfiler(2, str(tmp_path), "all")
+    profiler.attach("wp1@10.0.0.5:502")
+    profiler.attach("wp2@10.0.0.6:502")
+
+    profiler.record_cycle("full", "wp1@10.0.0.5:502")
+    profiler.record_cycle("full", "wp1@10.0.0.5:502")
+    profiler.record_cycle("full", "wp2@10.0.0.6:502")
+    assert not profiler.done
+
+    profiler.detach("wp2@10.0.0.6:502")
+    assert profiler.done
+    _, summary_path = profiler.write_report()
+    with open(summary_path, encoding="utf-8") as f:
+        summary = f.read()
+    assert "wp2@10.0.0.6:502 (1 full, unloaded)" in summary
+
+
+def test_all_coordinators_unloaded_finishes(tmp_path):
+    """Letzter Coordinator entladen: Session endet mit den bisherigen Zyklen."""
+    profiler = CycleProfiler(5, str(tmp_path), "wp1")
+    profiler.attach("wp1@10.0.0.5:502")
+    profiler.record_cycle("full", "wp1@10.0.0.5:502")
+    assert not profiler.done
+    profiler.detach("wp1@10.0.0.5:502")
+    assert profiler.done
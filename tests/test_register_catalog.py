@@ -0,0 +1,90 @@
+"""Tests für den vorkompilierten Register-Katalog."""
+
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.lambda_heat_pumps.const import (
+    FIRMWARE_VERSION,
+    HC_SENSOR_TEMPLATES,
+    HP_SENSOR_TEMPLATES,
+    SENSOR_TYPES,
+)
+from custom_components.lambda_heat_pumps import register_catalog
+from custom_components.lambda_heat_pumps.register_catalog import (
+    MODULE_TEMPLATES,
+    get_register_catalog,
+    is_compatible,
+)
+
+
+def _filtered(templates, fw_version):
+    """Referenz: Filterregel von ``get_compatible_sensors``."""
+    return {
+        k: v
+        for k, v in templates.items()
+        if (isinstance(v.get("firmware_version"), (int, float)) and v.get("firmware_version", 1) <= fw_version)
+        or not isinstance(v.get("firmware_version"), (int, float))
+    }
+
+
+@pytest.mark.parametrize("fw_version", sorted(set(FIRMWARE_VERSION.values())))
+def test_catalog_matches_compatible_sensor_filter(fw_version):
+    catalog = get_register_catalog(fw_version)
+    assert dict(catalog.general) == _filtered(SENSOR_TYPES, fw_version)
+    for device_type, templates in MODULE_TEMPLATES.items():
+        assert dict(catalog.templates(device_type)) == _filtered(templates, fw_version)
+
+
+def test_catalog_is_built_once_per_firmware():
+    first = get_register_catalog(7)
+    assert get_register_catalog(7) is first
+    assert first.build_ms >= 0
+    assert first.slices("hc", 2) is first.slices("hc", 2)
+
+
+def test_cycle_lookups_do_not_refilter_templates():
+    """Nach dem ersten Aufbau filtert kein Zyklus mehr (vorher: jeder Zyklus pro Modul-Typ)."""
+    catalog = get_register_catalog(max(FIRMWARE_VERSION.values()))
+    counts = {"hp": 2, "boil": 1, "buff": 1, "sol": 1, "hc": 3}
+    for device_type, count in counts.items():
+        catalog.slices(device_type, count)
+    catalog.address_map(counts)
+
+    with patch.object(register_catalog, "is_compatible", wraps=is_compatible) as filter_spy:
+        for _ in range(10):
+            for device_type, count in counts.items():
+                catalog.templates(device_type)
+                catalog.slices(device_type, count)
+            catalog.address_map(counts)
+    assert filter_spy.call_count == 0
+
+
+def test_slices_use_absolute_addresses():
+    catalog = get_register_catalog(max(FIRMWARE_VERSION.values()))
+    hc_modules = catalog.slices("hc", 2)
+    assert [module.idx for module in hc_modules] == [1, 2]
+    assert [module.base_address for module in hc_modules] == [5000, 5100]
+    registers = {sensor_id: address for sensor_id, address, _ in hc_modules[1].registers}
+    assert registers["room_device_temperature"] == 5100 + HC_SENSOR_TEMPLATES["room_device_temperature"]["relative_address"]
+    assert catalog.slices("unknown", 3) == ()
+
+
+def test_address_map_and_immutability():
+    catalog = get_register_catalog(max(FIRMWARE_VERSION.values()))
+    address_map = catalog.address_map({"hp": 1, "hc": 1})
+    key, descriptor = address_map[1000 + HP_SENSOR_TEMPLATES["operating_state"]["relative_address"]]
+    assert key == "hp1_operating_state"
+    assert descriptor is HP_SENSOR_TEMPLATES["operating_state"]
+    assert catalog.address_map({"hc": 1, "hp": 1}) is address_map
+
+    with pytest.raises(TypeError):
+        address_map[1] = ("x", {})
+    with pytest.raises(TypeError):
+        catalog.templates("hp")["new"] = {}
+
+
+def test_is_compatible_without_numeric_firmware():
+    assert is_compatible({}, 1)
+    assert is_compatible({"firmware_version": "any"}, 1)
+    assert not is_compatible({"firmware_version": 3}, 2)
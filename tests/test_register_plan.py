@@ -0,0 +1,65 @@
+"""Tests für die Batch-Planung der Register-Reads."""
+
+from custom_components.lambda_heat_pumps.register_plan import (
+    plan_register_batches,
+    range_address_info,
+    template_address_info,
+)
+
+
+def test_plan_groups_consecutive_same_type_and_isolates_int32():
+    """Zusammenhängende Register gleichen Typs in einem Batch, INT32 als eigenes Paar."""
+    info = {
+        1000: {"data_type": "uint16"},
+        1001: {"data_type": "uint16"},
+        1002: {"data_type": "int16"},
+        1003: {"data_type": "int16"},
+        1005: {"data_type": "int16"},
+        1020: {"data_type": "int32"},
+        1022: {"data_type": "uint16"},
+    }
+    assert plan_register_batches(info) == [
+        [1000, 1001],
+        [1002, 1003],
+        [1005],
+        [1020, 1021],
+        [1022],
+    ]
+    block = {addr: {"data_type": "uint16"} for addr in range(0, 7)}
+    assert plan_register_batches(block, max_batch=3) == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_range_int32_on_last_address_stays_in_range():
+    """INT32 auf der letzten angefragten Adresse liest nicht über den Bereich hinaus."""
+    info = range_address_info(1018, 3, data_types={1020: "int32"})
+    assert info[1020] == {"data_type": "int16"}
+    assert max(addr for batch in plan_register_batches(info) for addr in batch) == 1020
+
+    info = range_address_info(65534, 2, data_type="int32")
+    assert info == {65534: {"data_type": "int32"}}
+    info = range_address_info(65535, 1, data_type="int32")
+    assert info == {65535: {"data_type": "int16"}}
+    assert plan_register_batches(info) == [[65535]]
+
+
+def test_range_and_template_address_info():
+    """Adressbereich mit Typ-Overrides und Modul-Block aus Templates."""
+    info = range_address_info(1018, 5, data_types={1020: "int32"})
+    assert info == {
+        1018: {"data_type": "uint16"},
+        1019: {"data_type": "uint16"},
+        1020: {"data_type": "int32"},
+        1022: {"data_type": "uint16"},
+    }
+
+    templates = {
+        "flow_line_temperature": {"relative_address": 4, "data_type": "int16", "scale": 0.01},
+        "energy": {"relative_address": 20, "data_type": "int32", "scale": 1},
+        "cop_calc": {"data_type": "calculated"},
+    }
+    info, names = template_address_info(templates, base_address=1100)
+    assert info == {
+        1104: {"data_type": "int16", "scale": 0.01},
+        1120: {"data_type": "int32", "scale": 1},
+    }
+    assert names == {1104: "flow_line_temperature", 1120: "energy"}
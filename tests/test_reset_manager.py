@@ -0,0 +1,106 @@
+"""Tests für den Perioden-Scheduler und den gebündelten Rollover des ResetManagers."""
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
+
+from custom_components.lambda_heat_pumps.reset_manager import ResetManager, due_periods
+
+
+def test_due_periods_per_boundary():
+    """Zur vollen Stunde wechseln nur die passenden Perioden."""
+    assert due_periods(datetime(2025, 3, 5, 13, 0)) == {"hourly"}
+    assert due_periods(datetime(2025, 3, 5, 14, 0)) == {"hourly", "2h"}
+    assert due_periods(datetime(2025, 3, 5, 8, 0)) == {"hourly", "2h", "4h"}
+    assert due_periods(datetime(2025, 3, 5, 0, 0)) == {"hourly", "2h", "4h", "daily"}
+    assert due_periods(datetime(2025, 3, 1, 0, 0)) == {"hourly", "2h", "4h", "daily", "monthly"}
+    assert due_periods(datetime(2026, 1, 1, 0, 0)) == {
+        "hourly", "2h", "4h", "daily", "monthly", "yearly",
+    }
+
+
+def test_rollover_single_ordered_pass():
+    """Yesterday-Snapshot, dann Zähler-, dann COP-Baselines, zuletzt die State-Writes."""
+    calls = []
+
+    def _entity(name, reset_interval=None, period=None):
+        entity = Mock()
+        entity.entity_id = name
+        entity._reset_interval = reset_interval
+        entity._period = period
+        entity._apply_period_reset.side_effect = lambda: calls.append(("reset", name)) or True
+        entity._set_yesterday_value.side_effect = lambda value: calls.append(("yesterday", name, value))
+        entity.async_write_ha_state.side_effect = lambda: calls.append(("write", name))
+        return entity
+
+    daily = _entity("sensor.test_hp1_heating_cycling_daily", "daily")
+    yesterday = _entity("sensor.test_hp1_heating_cycling_yesterday")
+    monthly = _entity("sensor.test_hp1_compressor_start_cycling_monthly", "monthly")
+    energy = _entity("sensor.test_hp1_heating_energy_daily", "daily", "daily")
+    cop = _entity("sensor.test_hp1_heating_cop_daily", None, "daily")
+
+    engine = MagicMock()
+    engine.sensors.return_value = [cop]
+    hass = MagicMock()
+    hass.states.get.return_value = SimpleNamespace(state="7")
+    hass.data = {
+        "lambda_heat_pumps": {
+            "entry": {
+                "cycling_entities": {
+                    daily.entity_id: daily,
+                    yesterday.entity_id: yesterday,
+                    monthly.entity_id: monthly,
+                },
+                "energy_entities": {energy.entity_id: energy},
+                "coordinator": SimpleNamespace(cop_engine=engine),
+            }
+        }
+    }
+
+    manager = ResetManager(hass, "entry")
+    assert manager.rollover(due_periods(datetime(2025, 3, 5, 0, 0))) == 4
+
+    assert calls == [
+        ("yesterday", yesterday.entity_id, 7),
+        ("reset", daily.entity_id),
+        ("reset", energy.entity_id),
+        ("reset", cop.entity_id),
+        ("write", yesterday.entity_id),
+        ("write", daily.entity_id),
+        ("write", energy.entity_id),
+        ("write", cop.entity_id),
+    ]
+    monthly._apply_period_reset.assert_not_called()
+    energy._publish_cop_source.assert_called_once()
+    engine.begin_batch.assert_called_once()
+    engine.end_batch.assert_called_once()
+
+
+def test_rollover_leaves_cycling_out_of_rollup_table():
+    """Cycling-Sensoren zählen selbst; die Rollup-Tabelle enthält nur Energy-Baselines."""
+    from custom_components.lambda_heat_pumps.rollup_table import RollupBaselineTable
+
+    total = Mock()
+    total.entity_id = "sensor.test_hp1_heating_cycling_total"
+    total._sensor_id = "heating_cycling_total"
+    total._reset_interval = "total"
+    total._hp_index = 1
+    total._cycling_value = 42
+
+    table = RollupBaselineTable()
+    hass = MagicMock()
+    hass.data = {
+        "lambda_heat_pumps": {
+            "entry": {
+                "cycling_entities": {total.entity_id: total},
+                "energy_entities": {},
+                "coordinator": SimpleNamespace(cop_engine=None, rollup_baselines=table),
+            }
+        }
+    }
+
+    ResetManager(hass, "entry").rollover({"hourly", "2h"})
+
+    assert len(table) == 0
+    assert not table.dirty
+    total._apply_period_reset.assert_not_called()
@@ -0,0 +1,38 @@
+"""Tests für die zentrale Perioden-Baseline-Tabelle."""
+
+from custom_components.lambda_heat_pumps.rollup_table import RollupBaselineTable
+
+
+def test_rollover_and_period_value():
+    """Rollover setzt Baseline = Total, Perioden-Wert ist Total − Baseline."""
+    table = RollupBaselineTable()
+    assert table.get(1, "heating", "electrical", "daily") is None
+    assert table.value(1, "heating", "electrical", "daily", 12.5) == 12.5
+
+    totals = [((1, "heating", "electrical"), 100.0), ((2, "hot_water", "thermal"), 55.0)]
+    assert table.rollover("daily", totals) == 2
+    assert table.dirty
+    assert table.value(1, "heating", "electrical", "daily", 103.25) == 3.25
+    assert table.value(2, "hot_water", "thermal", "daily", 50.0) == 0.0
+
+    # Unveränderter Total ändert nichts
+    table.dirty = False
+    assert table.rollover("daily", totals) == 0
+    assert not table.dirty
+
+
+def test_persist_roundtrip_skips_invalid_keys():
+    """to_dict/load: ein Dict für alle Baselines, ungültige Einträge werden ignoriert."""
+    table = RollupBaselineTable()
+    table.set(1, "heating", "electrical", "monthly", 1668.47)
+    table.set("2", "cooling", "cycling", "2h", 7)
+    data = table.to_dict()
+    assert data == {"1|heating|electrical|monthly": 1668.47, "2|cooling|cycling|2h": 7.0}
+
+    data["broken"] = 1.0
+    data["1|heating|thermal|daily"] = "n/a"
+    restored = RollupBaselineTable()
+    assert restored.load(data) == 2
+    assert not restored.dirty
+    assert restored.get(2, "cooling", "cycling", "2h") == 7.0
+    assert restored.has(1, "heating", "electrical", "monthly")
@@ -150,6 +150,96 @@ def test_txt_mapping_sensor_unit():
     assert sensor._is_state_sensor is True
 
 
+def test_state_sensor_mapping_resolved_at_construction():
+    """State-Text-Mapping, Override-Name und Data-Key werden einmalig aufgelöst."""
+    from homeassistant.config_entries import ConfigEntry
+    from custom_components.lambda_heat_pumps.const_mapping import HP_OPERATING_STATE
+
+    mock_entry = Mock(spec=ConfigEntry)
+    mock_entry.entry_id = "test_entry"
+    mock_entry.data = {"name": "test", "host": "192.168.1.100", "port": 502}
+
+    mock_coordinator = Mock()
+    mock_coordinator._entity_addresses = {}
+    mock_coordinator.entry = mock_entry
+    mock_coordinator.sensor_overrides = {"hp1_operating_state": "my_state"}
+    state_value = next(iter(HP_OPERATING_STATE))
+    mock_coordinator.data = {"my_state": state_value}
+
+    sensor = LambdaSensor(
+        coordinator=mock_coordinator,
+        entry=mock_entry,
+        sensor_id="hp1_operating_state",
+        name="Operating State",
+        unit="",
+        address=1003,
+        scale=1.0,
+        state_class="",
+        device_class=None,
+        relative_address=3,
+        data_type="uint16",
+        device_type="HP",
+        txt_mapping=True,
+        entity_id="sensor.test_hp1_operating_state",
+        unique_id="test_hp1_operating_state",
+        sensor_info={"name": "Operating State"},
+    )
+
+    assert sensor._state_mapping is HP_OPERATING_STATE
+    assert sensor.name == "my_state"
+    assert sensor.native_value == HP_OPERATING_STATE[state_value]
+    assert sensor.extra_state_attributes["options"] == list(HP_OPERATING_STATE.values())
+
+    mock_coordinator.data = {"my_state": 9999}
+    assert sensor.native_value == "Unknown state (9999)"
+
+
+def test_sensors_share_template_description_and_device_info():
+    """Sensoren desselben Templates teilen Description und device_info-Objekte."""
+    from homeassistant.config_entries import ConfigEntry
+
+    mock_entry = Mock(spec=ConfigEntry)
+    mock_entry.entry_id = "test_entry"
+    mock_entry.domain = DOMAIN
+    mock_entry.data = {"name": "test", "host": "192.168.1.100", "port": 502}
+    mock_entry.options = {}
+
+    mock_coordinator = Mock()
+    mock_coordinator._entity_addresses = {}
+    mock_coordinator.sensor_overrides = {}
+    mock_coordinator.data = {}
+    template = {"name": "Flow Line Temperature", "unit": "°C", "precision": 1}
+
+    def _make(idx):
+        return LambdaSensor(
+            coordinator=mock_coordinator,
+            entry=mock_entry,
+            sensor_id=f"hp{idx}_flow_line_temperature",
+            name="Flow Line Temperature",
+            unit="°C",
+            address=1000 + idx * 100 + 4,
+            scale=0.01,
+            state_class="measurement",
+            device_class="temperature",
+            relative_address=4,
+            data_type="int16",
+            device_type="Hp",
+            precision=1,
+            entity_id=f"sensor.test_hp{idx}_flow_line_temperature",
+            unique_id=f"test_hp{idx}_flow_line_temperature",
+            sensor_info=template,
+        )
+
+    hp1, hp2, hp1_again = _make(1), _make(2), _make(1)
+    assert hp1._desc is hp2._desc
+    assert hp1._unit == "°C"
+    assert hp1.state_class == SensorStateClass.MEASUREMENT
+    assert hp1.device_class == SensorDeviceClass.TEMPERATURE
+    assert hp1.device_info is hp1_again.device_info
+    assert hp1.device_info is not hp2.device_info
+    assert hp2.device_info["name"] == "test - HP2"
+
+
 def test_sensor_imports():
     """Test that all required sensor classes can be imported."""
     from custom_components.lambda_heat_pumps.sensor import (
@@ -182,6 +272,64 @@ def test_constants():
         assert template["name"] != ""
 
 
+def test_hp_sensor_spec_table_and_name_table_reuse():
+    """Abgeleitete HP-Sensoren kommen aus einer Tabelle; COP-Quellen nutzen die Energy-Namen."""
+    from custom_components.lambda_heat_pumps.sensor import (
+        _SensorNameTable,
+        _hp_sensor_specs,
+    )
+
+    specs = _hp_sensor_specs()
+    assert specs is _hp_sensor_specs()
+    ids = [spec.sensor_id for spec in specs]
+    assert len(ids) == len(set(ids))
+    # Total vor Daily (Daily-Init sucht den Total-Sensor)
+    assert ids.index("heating_energy_total") < ids.index("heating_energy_daily")
+    assert ids.index("heating_cycling_total") < ids.index("heating_cycling_yesterday")
+    assert "compressor_start_cycling_monthly" in ids
+    assert "hot_water_cop_hourly" not in ids
+
+    table = _SensorNameTable("eu08l", True, None)
+    energy = table.names("hp1", "Heating Energy Daily", "heating_energy_daily")
+    assert energy["entity_id"] == "sensor.eu08l_hp1_heating_energy_daily"
+    assert table.names("hp1", "ignored", "heating_energy_daily") is energy
+    assert len(table) == 1
+
+
+def test_max_module_setup_builds_each_name_once():
+    """Maximalkonfiguration: jede abgeleitete HP-Entity bekommt ihre Namen genau einmal."""
+    from unittest.mock import patch
+
+    from custom_components.lambda_heat_pumps import sensor as sensor_module
+    from custom_components.lambda_heat_pumps.const import MAX_NUM_HPS
+
+    specs = sensor_module._hp_sensor_specs()
+    table = sensor_module._SensorNameTable("eu08l", True, {})
+
+    def _build_all():
+        for hp_idx in range(1, MAX_NUM_HPS + 1):
+            device_prefix = f"hp{hp_idx}"
+            for spec in specs:
+                table.names(device_prefix, spec.name, spec.sensor_id)
+                if spec.kind == "cop":
+                    # COP-Quellen sind die Energy-Sensoren derselben Tabelle
+                    table.names(device_prefix, spec.thermal_name, spec.thermal_sensor_id)
+                    table.names(device_prefix, spec.electrical_name, spec.electrical_sensor_id)
+
+    with patch.object(
+        sensor_module, "generate_sensor_names", wraps=sensor_module.generate_sensor_names
+    ) as generate:
+        _build_all()
+        assert len(table) == MAX_NUM_HPS * len(specs)
+        assert generate.call_count == len(table)
+
+        # Zweiter Durchlauf (z. B. COP-Quellen, Reload der Plattform): nur Cache-Treffer
+        first = table.names("hp1", specs[0].name, specs[0].sensor_id)
+        _build_all()
+        assert generate.call_count == len(table)
+        assert table.names("hp1", specs[0].name, specs[0].sensor_id) is first
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
 
@@ -43,8 +43,62 @@ async def test_setup_services_async(mock_hass):
     mock_hass.services.async_register = AsyncMock()
 
     with patch(
-        "custom_components.lambda_heat_pumps.services.async_track_time_interval"
+        "custom_components.lambda_heat_pumps.services.async_track_state_change_event"
     ) as mock_track:
         await async_setup_services(mock_hass)
 
         mock_hass.services.async_register.assert_called()
+
+
+@pytest.mark.asyncio
+async def test_run_per_connection_isolates_slow_and_failing_entries():
+    """Verbindungen laufen parallel; Timeout/Fehler eines Controllers bleiben beim Entry."""
+    import asyncio
+
+    from custom_components.lambda_heat_pumps.services import _run_per_connection
+
+    def _entry(host):
+        return {"coordinator": Mock(host=host, port=502)}
+
+    entries = {
+        "a": _entry("10.0.0.1"),
+        "b": _entry("10.0.0.2"),
+        "c": _entry("10.0.0.3"),
+        "d": _entry("10.0.0.1"),  # gleiche Verbindung wie "a" → nach "a"
+    }
+    done = []
+
+    async def work(entry_id, entry_data):
+        if entry_id == "a":
+            await asyncio.sleep(1)  # nicht erreichbarer Controller
+        if entry_id == "c":
+            raise ConnectionError("offline")
+        done.append(entry_id)
+
+    results = await _run_per_connection(entries, work, deadline=0.05)
+
+    assert results == {"a": False, "b": True, "c": False, "d": True}
+    assert done == ["b", "d"]
+
+
+def test_range_read_names_registers_from_catalog():
+    """Adressbereich: bekannte Register tragen den Sensor-Schlüssel aus dem Katalog."""
+    from custom_components.lambda_heat_pumps.const import HP_SENSOR_TEMPLATES
+    from custom_components.lambda_heat_pumps.services import _resolve_register_block
+
+    entry = Mock()
+    entry.data = {"num_hps": 2, "num_hc": 1}
+    entry.options = {}
+    state_address = 1100 + HP_SENSOR_TEMPLATES["operating_state"]["relative_address"]
+
+    address_info, names = _resolve_register_block(
+        {"start_address": 1100, "count": 100, "data_type": "uint16", "data_types": {}}, entry
+    )
+    assert names[state_address] == "hp2_operating_state"
+    assert set(names) <= set(address_info)
+
+    # Nicht konfiguriertes Modul (hp3): keine Namen
+    _, names = _resolve_register_block(
+        {"start_address": 1200, "count": 10, "data_type": "uint16", "data_types": {}}, entry
+    )
+    assert names == {}
@@ -0,0 +1,81 @@
+"""Tests für das Value-Change-Gating von State-Writes."""
+
+from custom_components.lambda_heat_pumps.const_sensor import (
+    HC_SENSOR_TEMPLATES,
+    HP_SENSOR_TEMPLATES,
+)
+from custom_components.lambda_heat_pumps.state_gate import (
+    StateWriteGate,
+    create_state_gate,
+    resolve_precision,
+)
+
+
+def test_deadband_suppresses_noise_and_max_silence_forces_write():
+    """±0.1 °C Rauschen wird unterdrückt, Max-Silence erzwingt einen Write."""
+    gate = StateWriteGate(deadband=0.15, max_silence=300)
+    assert gate.check(21.0, now=0.0)
+    assert not gate.check(21.1, now=10.0)
+    assert not gate.check(20.9, now=20.0)
+    assert gate.check(21.2, now=30.0)
+    # Vergleich gegen den zuletzt geschriebenen Wert (21.2), nicht den letzten gesehenen
+    assert not gate.check(21.3, now=40.0)
+    assert gate.check(21.3, now=330.0)
+
+
+def test_availability_and_non_numeric_changes_always_written():
+    """Verfügbarkeitswechsel und Text-Änderungen werden sofort geschrieben."""
+    gate = StateWriteGate(deadband=1.0)
+    assert gate.check("Heizen", now=0.0)
+    assert not gate.check("Heizen", now=1.0)
+    assert gate.check("Standby", now=2.0)
+    assert gate.check("Standby", available=False, now=3.0)
+    assert gate.check(None, available=False, now=4.0)
+    assert not gate.check(None, available=False, now=5.0)
+
+
+def test_create_state_gate_resolution_order():
+    """YAML (volle ID vor Template-Key) > Template-"deadband" > Einheiten-Default."""
+    config = {
+        "max_silence_seconds": 60,
+        "deadband": {"hp1_flow_line_temperature": 0.5, "return_line_temperature": 0.3},
+        "precision": {"flow_line_temperature": 0},
+    }
+    gate = create_state_gate(config, "hp1_flow_line_temperature", unit="°C")
+    assert gate.deadband == 0.5
+    assert gate.max_silence == 60
+    assert create_state_gate(config, "hp2_return_line_temperature", unit="°C").deadband == 0.3
+    assert create_state_gate({}, "hp1_power", sensor_info={"deadband": 25}, unit="W").deadband == 25
+    assert create_state_gate(None, "hp1_ambient_temperature", unit="°C").deadband == 0.15
+    assert create_state_gate(None, "hp1_error_state").deadband == 0.0
+
+    assert resolve_precision(config, "hp1_flow_line_temperature", None, 1) == 0
+    assert resolve_precision(config, "hp1_ambient_temperature", None, 1) == 1
+
+
+def test_sensor_templates_declare_deadband_for_noisy_values():
+    """Messwerte (Temperatur, Leistung, Durchfluss) haben eine Deadband, Sollwerte 0."""
+    flow_temp = HP_SENSOR_TEMPLATES["flow_line_temperature"]
+    assert create_state_gate(None, "hp1_flow_line_temperature", sensor_info=flow_temp, unit="°C").deadband == 0.15
+    power = HP_SENSOR_TEMPLATES["inverter_power_consumption"]
+    assert create_state_gate(None, "hp1_inverter_power_consumption", sensor_info=power, unit="W").deadband == 20
+    assert HP_SENSOR_TEMPLATES["volume_flow_heat_sink"]["deadband"] > 0
+    # Sollwerte sollen jede Änderung sofort zeigen (kein °C-Default)
+    setpoint = HC_SENSOR_TEMPLATES["target_room_temperature"]
+    assert create_state_gate(None, "hc1_target_room_temperature", sensor_info=setpoint, unit="°C").deadband == 0.0
+
+
+def test_reconfigure_keeps_written_state():
+    """Hot-Reload: neue Deadband/Max-Silence, der zuletzt geschriebene Wert bleibt Referenz."""
+    registry = set()
+    gate = create_state_gate({}, "hp1_flow_line_temperature", unit="°C", registry=registry)
+    assert gate in registry
+    assert gate.check(21.0, now=0.0)
+    gate.reconfigure({"deadband": {"flow_line_temperature": 1.0}, "max_silence_seconds": 600})
+    assert gate.deadband == 1.0
+    assert gate.max_silence == 600
+    assert not gate.check(21.5, now=400.0)
+    assert gate.check(22.0, now=410.0)
+    # Ohne Override wieder Einheiten-Default
+    gate.reconfigure({})
+    assert gate.deadband == 0.15
@@ -0,0 +1,52 @@
+"""Tests for the native evaluator of built-in calculated sensor formulas."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.lambda_heat_pumps.const_calculated_sensors import (
+    CALCULATED_SENSOR_TEMPLATES,
+)
+from custom_components.lambda_heat_pumps.template_eval import compile_native_template
+
+
+def _hass(states):
+    hass = MagicMock()
+    hass.states.get.side_effect = lambda entity_id: (
+        SimpleNamespace(state=states[entity_id]) if entity_id in states else None
+    )
+    return hass
+
+
+def test_cop_calc_native_matches_template_formula():
+    """cop_calc nativ: thermal / power, 0 bei power <= 0, Defaults wie | float(...)."""
+    evaluator = compile_native_template(
+        CALCULATED_SENSOR_TEMPLATES["cop_calc"]["native"],
+        {"full_entity_prefix": "eu08l_hp1"},
+    )
+    thermal = "sensor.eu08l_hp1_compressor_thermal_energy_output_accumulated"
+    power = "sensor.eu08l_hp1_compressor_power_consumption_accumulated"
+    assert evaluator.entity_ids == [thermal, power]
+
+    assert evaluator.evaluate(_hass({thermal: "400", power: "100"})) == 4.0
+    assert evaluator.evaluate(_hass({thermal: "400", power: "0"})) == 0
+    # power fehlt -> Default 1, thermal unavailable -> Default 0
+    assert evaluator.evaluate(_hass({thermal: "7.5"})) == 7.5
+    assert evaluator.evaluate(_hass({thermal: "unavailable", power: "2"})) == 0
+
+
+def test_nested_expression_and_invalid_spec():
+    """Verschachtelte Ausdrücke werden kompiliert, unbekannte Operatoren abgelehnt."""
+    spec = {
+        "inputs": {"a": ("sensor.{p}_a", 0), "b": ("sensor.{p}_b", 0)},
+        "expr": ("max", ("sub", "a", "b"), 0),
+    }
+    evaluator = compile_native_template(spec, {"p": "x"})
+    assert evaluator.evaluate(_hass({"sensor.x_a": "5", "sensor.x_b": "2"})) == 3.0
+    assert evaluator.evaluate(_hass({"sensor.x_a": "1", "sensor.x_b": "2"})) == 0.0
+
+    with pytest.raises(ValueError):
+        compile_native_template({"inputs": {}, "expr": ("pow", 1, 2)}, {})
+    with pytest.raises(ValueError):
+        compile_native_template({"inputs": {}, "expr": "missing"}, {})
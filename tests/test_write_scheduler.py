@@ -0,0 +1,66 @@
+"""Tests für die ereignisgesteuerten Raumtemperatur-/PV-Writes."""
+
+from custom_components.lambda_heat_pumps.write_scheduler import (
+    PV_SURPLUS_ADDRESS,
+    RegisterWriteTarget,
+    collect_due,
+    next_deadline,
+    pv_surplus_raw,
+    room_temperature_address,
+    room_temperature_raw,
+)
+
+
+def test_threshold_min_interval_and_keepalive():
+    """Kleine Änderungen warten auf Keep-Alive, große auf den Mindestabstand."""
+    target = RegisterWriteTarget("pv_surplus", PV_SURPLUS_ADDRESS, "sensor.pv", threshold=50, min_interval=10, keepalive=30)
+    assert target.due_at() is None  # noch kein Quellwert
+
+    target.offer(1200)
+    assert target.is_due(0.0)
+    target.mark_written(1200, now=0.0)
+
+    target.offer(1220)  # unter der Schwelle
+    assert target.due_at() == 30.0
+    target.offer(1300)  # über der Schwelle → Mindestabstand
+    assert target.due_at() == 10.0
+    assert not target.is_due(5.0)
+    assert target.is_due(10.0)
+
+    target.mark_failed(now=10.0)
+    assert target.due_at() == 20.0
+
+    target.offer(None)  # Quelle nicht verfügbar → kein Write, auch kein Keep-Alive
+    assert target.due_at() is None
+
+
+def test_due_writes_collected_in_one_pass():
+    """Gleichzeitig fällige Writes werden gemeinsam (nach Adresse sortiert) geliefert."""
+    hc2 = RegisterWriteTarget("room_temperature_hc2", room_temperature_address(2), "sensor.r2")
+    hc1 = RegisterWriteTarget("room_temperature_hc1", room_temperature_address(1), "sensor.r1")
+    pv = RegisterWriteTarget("pv_surplus", PV_SURPLUS_ADDRESS, "sensor.pv", threshold=50)
+    hc2.offer(room_temperature_raw("21.5"))
+    hc1.offer(room_temperature_raw("20.04"))
+    pv.offer(pv_surplus_raw("1.5", "kW", "pos"))
+
+    due = collect_due([hc2, hc1, pv], now=0.0)
+    assert [(t.address, value) for t, value in due] == [(102, 1500), (5004, 200), (5104, 215)]
+    for target, value in due:
+        target.mark_written(value, now=0.0)
+    assert collect_due([hc2, hc1, pv], now=1.0) == []
+    assert next_deadline([hc2, hc1, pv]) == hc1.keepalive
+    assert pv_surplus_raw("-300", "W", "pos") == 0
+
+
+def test_signed_pv_surplus_threshold_uses_watts():
+    """Modus ``neg``: +1 W → -1 W ist eine Änderung um 2 W, nicht um ~65535."""
+    target = RegisterWriteTarget(
+        "pv_surplus", PV_SURPLUS_ADDRESS, "sensor.pv", threshold=50, min_interval=10, keepalive=30, signed=True
+    )
+    target.offer(1)
+    target.mark_written(1, now=0.0)
+
+    target.offer(-1 & 0xFFFF)  # Rohwert von pv_surplus_raw("-1", "W", "neg")
+    assert target.due_at() == 30.0  # unter der Schwelle → nur Keep-Alive
+    target.offer(-100 & 0xFFFF)
+    assert target.due_at() == 10.0